@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+Pages de l'application Streamlit, importées à leur première visite
+Le script principal ne charge que ce registre ; chaque module de page (et ses dépendances : pandas,
+Plotly, SciPy pour les résultats) n'est importé que lorsqu'un utilisateur l'affiche dans le processus.
+Le paquet ne s'appelle pas pages/ : Streamlit traiterait ce dossier comme une application multipage.
+"""
+
+import importlib
+
+# Libellé du menu -> (module de app_pages, identifiant d'URL ?page=)
+PAGES = {
+    "🏠 Accueil": ("home", "accueil"),
+    "📝 Passer le Test": ("test", "test"),
+    "📊 Résultats": ("results", "resultats"),
+    "ℹ️ À propos": ("about", "a-propos"),
+}
+DEFAULT_PAGE = "🏠 Accueil"
+
+PAGE_SLUGS = {slug: label for label, (_, slug) in PAGES.items()}
+
+def load_page(label):
+    """Module d'une page (importé une seule fois par processus) ; son point d'entrée est show()"""
+    return importlib.import_module(f"{__name__}.{PAGES[label][0]}")
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Page « À propos » : contenu statique, aucune dépendance graphique ou scientifique
+Le HTML est assemblé et minifié une fois à l'import ; chaque visite n'envoie qu'un bloc.
+"""
+
+import streamlit as st
+
+from neo_core.templates import minify
+
+from .theme import static_columns
+
+HEADER = """
+<div style="background: linear-gradient(90deg, #9b59b6, #8e44ad);
+            padding: 40px 25px; border-radius: 20px; margin-bottom: 35px; text-align: center;">
+    <h1 style="color: white; font-size: 2.8rem; margin-bottom: 15px;
+               text-shadow: 0 2px 4px rgba(0,0,0,0.3); font-weight: 600;">
+        ℹ️ À Propos du NEO PI-R
+    </h1>
+    <p style="color: rgba(255,255,255,0.95); font-size: 1.3rem;
+              max-width: 800px; margin: 0 auto; line-height: 1.6;">
+        Tout ce que vous devez savoir sur ce test de personnalité
+    </p>
+</div>
+"""
+
+HISTORY = """
+<div class="info-card">
+    <h2 style="color: #3498db; margin-bottom: 25px; font-size: 2.2rem;">
+        📚 Histoire et Développement
+    </h2>
+    <p style="font-size: 1.1rem; line-height: 1.8; color: #2c3e50; margin-bottom: 20px;">
+        Le NEO PI-R a été développé par <strong>Paul T. Costa Jr.</strong> et <strong>Robert R. McCrae</strong>
+        au National Institute on Aging (NIH) dans les années 1980-1990. Il s'agit de l'une des mesures
+        les plus utilisées et validées scientifiquement pour évaluer la personnalité selon le modèle
+        des Big Five.
+    </p>
+    <p style="font-size: 1.1rem; line-height: 1.8; color: #2c3e50;">
+        Ce modèle est le fruit de décennies de recherche en psychologie de la personnalité et
+        représente un consensus scientifique sur les dimensions fondamentales de la personnalité humaine.
+    </p>
+</div>
+"""
+
+# Validité scientifique, en deux colonnes
+RESEARCH = """
+<div style="background: #e8f4fd; padding: 20px; border-radius: 15px; margin-bottom: 20px;">
+    <h4 style="color: #2980b9; margin-top: 0;">📊 Recherche Extensive</h4>
+    <ul style="color: #34495e; padding-left: 20px; line-height: 1.6;">
+        <li>Plus de 2000 études publiées</li>
+        <li>Validé dans plus de 50 cultures</li>
+        <li>Traduit en plus de 40 langues</li>
+        <li>Utilisé dans la recherche depuis 30+ ans</li>
+    </ul>
+</div>
+"""
+
+CLINICAL_USES = """
+<div style="background: #fff3cd; padding: 20px; border-radius: 15px;">
+    <h4 style="color: #856404; margin-top: 0;">🎯 Applications Cliniques</h4>
+    <ul style="color: #856404; padding-left: 20px; line-height: 1.6;">
+        <li>Orientation professionnelle</li>
+        <li>Thérapie personnalisée</li>
+        <li>Recherche en psychologie</li>
+        <li>Développement personnel</li>
+    </ul>
+</div>
+"""
+
+RELIABILITY = """
+<div style="background: #d4edda; padding: 20px; border-radius: 15px; margin-bottom: 20px;">
+    <h4 style="color: #155724; margin-top: 0;">✅ Fiabilité Éprouvée</h4>
+    <ul style="color: #155724; padding-left: 20px; line-height: 1.6;">
+        <li>Consistance interne élevée (α > 0.85)</li>
+        <li>Stabilité temporelle démontrée</li>
+        <li>Validité convergente et discriminante</li>
+        <li>Corrélations inter-évaluateurs fortes</li>
+    </ul>
+</div>
+"""
+
+IMPACT = """
+<div style="background: #f8d7da; padding: 20px; border-radius: 15px;">
+    <h4 style="color: #721c24; margin-top: 0;">🌍 Impact International</h4>
+    <ul style="color: #721c24; padding-left: 20px; line-height: 1.6;">
+        <li>Standard mondial en personnalité</li>
+        <li>Référence pour autres tests</li>
+        <li>Utilisé par l'OMS</li>
+        <li>Intégré dans DSM et CIM</li>
+    </ul>
+</div>
+"""
+
+PERCENTILES = """
+<div class="info-card">
+    <h4 style="color: #2c3e50; margin-top: 0;">📊 Système de Percentiles</h4>
+    <p style="color: #34495e; line-height: 1.6; margin-bottom: 20px;">
+        Vos scores sont exprimés en <strong>percentiles</strong>, ce qui signifie le pourcentage
+        de personnes dans la population générale qui obtiennent un score inférieur au vôtre.
+    </p>
+
+    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+                gap: 15px; margin-top: 20px;">
+        <div style="background: #3498db; color: white; padding: 15px; border-radius: 10px; text-align: center;">
+            <h5 style="margin: 0 0 10px 0;">0-30e percentile</h5>
+            <p style="margin: 0; font-size: 0.9rem;">Score Faible</p>
+        </div>
+        <div style="background: #f39c12; color: white; padding: 15px; border-radius: 10px; text-align: center;">
+            <h5 style="margin: 0 0 10px 0;">30-70e percentile</h5>
+            <p style="margin: 0; font-size: 0.9rem;">Score Moyen</p>
+        </div>
+        <div style="background: #e74c3c; color: white; padding: 15px; border-radius: 10px; text-align: center;">
+            <h5 style="margin: 0 0 10px 0;">70-100e percentile</h5>
+            <p style="margin: 0; font-size: 0.9rem;">Score Élevé</p>
+        </div>
+    </div>
+</div>
+"""
+
+LIMITATIONS = """
+<div style="background: #fff3cd; padding: 20px; border-radius: 15px; margin: 20px 0;
+           border-left: 4px solid #ffc107;">
+    <h4 style="color: #856404; margin-top: 0;">🔍 Points Importants à Retenir</h4>
+    <ul style="color: #856404; padding-left: 25px; line-height: 1.8;">
+        <li><strong>Outil descriptif</strong> : Le test décrit votre personnalité, il ne la juge pas</li>
+        <li><strong>Pas de profil parfait</strong> : Chaque combinaison de traits a ses avantages</li>
+        <li><strong>Évolution possible</strong> : La personnalité peut changer avec l'âge et les expériences</li>
+        <li><strong>Contexte culturel</strong> : Les normes peuvent varier selon les cultures</li>
+        <li><strong>Complément d'information</strong> : À utiliser avec d'autres sources d'information</li>
+        <li><strong>But éducatif</strong> : Ne remplace pas une évaluation psychologique professionnelle</li>
+    </ul>
+</div>
+"""
+
+USES = [
+    {
+        "title": "💭 Développement Personnel",
+        "items": ["Mieux se comprendre", "Identifier ses forces", "Planifier sa croissance", "Améliorer ses relations"],
+        "color": "#3498db"
+    },
+    {
+        "title": "💼 Orientation Professionnelle",
+        "items": ["Choix de carrière", "Style de management", "Dynamique d'équipe", "Formation continue"],
+        "color": "#2ecc71"
+    },
+    {
+        "title": "🎓 Contexte Éducatif",
+        "items": ["Orientation scolaire", "Méthodes d'apprentissage", "Projets de groupe", "Développement étudiant"],
+        "color": "#9b59b6"
+    }
+]
+
+USE_CARD = """
+<div style="background: {color}; color: white;
+           padding: 25px; border-radius: 15px; height: 280px;">
+    <h4 style="margin: 0 0 20px 0; font-size: 1.2rem;
+              border-bottom: 2px solid rgba(255,255,255,0.3); padding-bottom: 10px;">
+        {title}
+    </h4>
+    <ul style="padding-left: 20px; margin: 0; line-height: 1.6;">
+        {items}
+    </ul>
+</div>
+"""
+
+RESOURCES = """
+<div class="info-card">
+    <h4 style="color: #2c3e50; margin-top: 0;">📖 Pour Aller Plus Loin</h4>
+    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+                gap: 20px; margin-top: 20px;">
+        <div style="background: #f8f9fa; padding: 20px; border-radius: 10px;">
+            <h5 style="color: #3498db; margin: 0 0 10px 0;">📚 Livres Recommandés</h5>
+            <ul style="color: #6c757d; font-size: 0.9rem; padding-left: 20px;">
+                <li>"Personality in Adulthood" - Costa & McCrae</li>
+                <li>"The Big Five Personality Dimensions" - Goldberg</li>
+                <li>"Personality Psychology" - Larsen & Buss</li>
+            </ul>
+        </div>
+        <div style="background: #f8f9fa; padding: 20px; border-radius: 10px;">
+            <h5 style="color: #3498db; margin: 0 0 10px 0;">🔗 Sites Web Utiles</h5>
+            <ul style="color: #6c757d; font-size: 0.9rem; padding-left: 20px;">
+                <li>American Psychological Association</li>
+                <li>International Personality Psychology</li>
+                <li>Research Gate Publications</li>
+            </ul>
+        </div>
+    </div>
+</div>
+"""
+
+CONTACT = """
+<div style="background: linear-gradient(135deg, #667eea, #764ba2);
+           color: white; padding: 30px; border-radius: 15px; text-align: center;">
+    <h4 style="margin: 0 0 20px 0; font-size: 1.5rem;">💬 Besoin d'Aide ?</h4>
+    <p style="margin: 0 0 15px 0; line-height: 1.6;">
+        Si vous avez des questions sur vos résultats ou souhaitez approfondir votre analyse,
+        n'hésitez pas à consulter un professionnel de la psychologie.
+    </p>
+    <p style="margin: 0; font-size: 0.9rem; opacity: 0.8;">
+        Ce test est fourni à des fins éducatives et de développement personnel uniquement.
+    </p>
+</div>
+"""
+
+# Page entière pré-rendue : aucun widget
+ABOUT_HTML = minify("".join([
+    HEADER,
+    HISTORY,
+    "<h2>🔬 Validité Scientifique</h2>",
+    static_columns(RESEARCH + CLINICAL_USES, RELIABILITY + IMPACT),
+    "<h2>📈 Comprendre Vos Scores</h2>",
+    PERCENTILES,
+    "<h2>⚠️ Limitations et Considérations</h2>",
+    LIMITATIONS,
+    "<h2>🎯 Utilisations Recommandées</h2>",
+    static_columns(*(
+        USE_CARD.format(color=use['color'], title=use['title'],
+                        items="".join(f"<li>{item}</li>" for item in use['items']))
+        for use in USES
+    )),
+    "<h2>📚 Ressources Supplémentaires</h2>",
+    RESOURCES,
+    "<h2>📞 Contact et Support</h2>",
+    CONTACT
+]))
+
+# Page autonome (python -m app_pages.prerender)
+STATIC_HTML = ABOUT_HTML
+
+def show_about_page():
+    """Page à propos du test NEO PI-R"""
+    st.markdown(ABOUT_HTML, unsafe_allow_html=True)
+
+show = show_about_page
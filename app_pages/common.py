@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+État de session partagé par toutes les pages : persistance, gestionnaire NEO PI-R, fin de test
+Chargé par le script principal ; ne dépend ni des graphiques ni de la pile scientifique.
+"""
+
+import atexit
+import logging
+import os
+import secrets
+import uuid
+from datetime import datetime, timezone
+
+import streamlit as st
+
+from neo_core import DEFAULT_BANK, DEFAULT_LOCALE, NEOPIRManager, get_registry
+from neo_core.adaptive_testing import AdaptiveModel
+from neo_core.longitudinal import history_record, user_key
+from neo_core.result_cache import ResultCache, build_result_bundle, response_fingerprint
+from neo_core.security import hash_user_data
+from neo_core.session_store import HISTORY_TTL, RESULT_TTL, SESSION_TTL, create_backend, encode_state
+
+from . import DEFAULT_PAGE, PAGE_SLUGS
+
+logger = logging.getLogger("neo_pir")
+
+# Répertoire de l'application (paramètres étalonnés à côté de NEO PI-R.py)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Clés de st.session_state partagées entre processus via le backend d'état
+PERSISTED_KEYS = [
+    'tool_choice', 'test_started', 'test_completed', 'responses', 'current_question',
+    'scores', 'facet_scores', 'percentiles', 'interpretations', 'confidence', 'facet_percentiles',
+    'facet_confidence', 'adaptive_mode', 'quick_answer', 'item_bank', 'result_fingerprint', 'user_session_id',
+    'respondent_key', 'adaptive_result'
+]
+
+# Un lien ?sid= reprend une session restée inchangée depuis au plus RESTORE_TTL secondes
+RESTORE_TTL = float(os.environ.get('NEO_PIR_RESTORE_TTL', 2 * 3600))
+
+@st.cache_resource
+def get_state_backend():
+    """Backend d'état du processus (NEO_PIR_STATE_BACKEND : 'memory' ou 'sqlite:///chemin.db')
+
+    Purgé en arrière-plan : sessions inactives, résultats et historique au-delà de leur durée de conservation
+    (NEO_PIR_SESSION_TTL, NEO_PIR_RESULT_TTL, NEO_PIR_HISTORY_TTL, en secondes).
+    """
+    backend = create_backend()
+    return backend.start_purge(
+        ttl=float(os.environ.get('NEO_PIR_SESSION_TTL', SESSION_TTL)),
+        result_ttl=float(os.environ.get('NEO_PIR_RESULT_TTL', RESULT_TTL)),
+        history_ttl=float(os.environ.get('NEO_PIR_HISTORY_TTL', HISTORY_TTL))
+    )
+
+def restore_session_state(state):
+    """Recharge dans st.session_state un état enregistré par un autre processus (ou une autre connexion)"""
+    for key in PERSISTED_KEYS:
+        if key in state:
+            st.session_state[key] = state[key]
+    st.session_state.item_bank = tuple(st.session_state.item_bank)
+    st.session_state.session_start = datetime.fromisoformat(state['session_start'])
+
+    adaptive_state = state.get('adaptive_session')
+    if adaptive_state is not None:
+        model = get_adaptive_model(*st.session_state.item_bank)
+        st.session_state.adaptive_session = model.restore_session(adaptive_state)
+
+def restore_key(token):
+    """Clé de stockage d'une session : empreinte du jeton de reprise (le jeton n'est jamais stocké)"""
+    return hash_user_data(f"restore:{token}")
+
+def persist_session_state():
+    """Enregistre l'état de la session dans le backend s'il a changé depuis la dernière exécution"""
+    state = {key: st.session_state[key] for key in PERSISTED_KEYS if key in st.session_state}
+    state['session_start'] = st.session_state.session_start.isoformat()
+    session = st.session_state.get('adaptive_session')
+    state['adaptive_session'] = session.to_state() if session is not None else None
+
+    data = encode_state(state)
+    if data != st.session_state.get('persisted_state'):
+        get_state_backend().save_session(restore_key(st.session_state.restore_token), state)
+        st.session_state.persisted_state = data
+
+def initialize_session_state():
+    """Initialise l'état de session, en reprenant la session désignée par ?sid= si elle existe
+
+    ?sid= porte un jeton de reprise aléatoire, distinct de l'identifiant de session (résultats, historique,
+    archive) : ni cet identifiant ni la clé de stockage n'apparaissent dans l'URL. Le lien reste un secret
+    au porteur : quiconque l'obtient (lien partagé, historique du navigateur, en-tête Referer) reprend la
+    session et ses résultats, d'où sa durée de validité courte (RESTORE_TTL, NEO_PIR_RESTORE_TTL).
+    Une nouvelle session s'ouvre sur la page désignée par ?page= (accueil par défaut).
+    """
+    if 'initialized' not in st.session_state:
+        st.session_state.initialized = True
+        st.session_state.user_session_id = str(uuid.uuid4())
+        st.session_state.session_start = datetime.now()
+        st.session_state.tool_choice = PAGE_SLUGS.get(st.query_params.get('page'), DEFAULT_PAGE)
+        st.session_state.test_started = False
+        st.session_state.test_completed = False
+        st.session_state.responses = {}
+        st.session_state.current_question = 0
+        st.session_state.scores = {}
+        st.session_state.interpretations = {}
+        st.session_state.adaptive_mode = False
+        st.session_state.adaptive_session = None
+        st.session_state.item_bank = (DEFAULT_BANK, DEFAULT_LOCALE)
+        st.session_state.respondent_key = None
+
+        token = st.query_params.get('sid')
+        state = get_state_backend().load_session(restore_key(token), max_age=RESTORE_TTL) if token else None
+        if state is not None:
+            restore_session_state(state)
+        else:
+            token = secrets.token_urlsafe(24)
+        # Le jeton dans l'URL permet à n'importe quel processus de reprendre la session
+        st.session_state.restore_token = token
+        st.query_params['sid'] = token
+
+@st.cache_resource
+def get_result_cache():
+    """Cache des résultats partagé par les sessions du processus (NEO_PIR_RESULT_CACHE_DIR : niveau disque)"""
+    return ResultCache(
+        max_entries=int(os.environ.get('NEO_PIR_RESULT_CACHE_SIZE', 4096)),
+        directory=os.environ.get('NEO_PIR_RESULT_CACHE_DIR')
+    )
+
+@st.cache_resource
+def get_response_archive():
+    """Archive Parquet des passations (NEO_PIR_ARCHIVE_DIR), écrite par lots en arrière-plan ; None sinon"""
+    root = os.environ.get('NEO_PIR_ARCHIVE_DIR')
+    if not root:
+        return None
+    from neo_core.response_archive import ArchiveWriter
+
+    writer = ArchiveWriter(root).start()
+    # Les tampons non écrits sont vidés à l'arrêt du serveur
+    atexit.register(writer.close)
+    return writer
+
+def history_key():
+    """Clé de l'historique du répondant : son code répondant s'il en a donné un, sinon la session seule"""
+    return st.session_state.get('respondent_key') or user_key(st.session_state.user_session_id)
+
+def record_results(neo_manager, responses, administered=None):
+    """Calcule (ou retrouve) et enregistre les résultats, et oriente la session vers la page des résultats
+
+    administered : réponses réellement données, si `responses` en complète d'autres (passation adaptative) ;
+    seules celles-ci sont archivées comme observations, et le résultat est marqué adaptatif (facettes
+    imputées : ni affichées, ni exportées, ni utilisées pour l'archétype).
+    Sans st.rerun() : utilisable comme rappel de bouton, la page des résultats s'affiche dans la même
+    exécution. L'avis de fin de test y est affiché une fois (completion_notice).
+    """
+    result_cache = get_result_cache()
+    fingerprint = response_fingerprint(neo_manager.item_bank, responses)
+    bundle = result_cache.get_or_compute(fingerprint, lambda: build_result_bundle(neo_manager, responses))
+    stats = result_cache.stats()
+    logger.info("Résultats %s : taux de succès du cache %.0f %% (%d consultations)",
+                fingerprint[:12], stats['hit_rate'] * 100, stats['lookups'])
+
+    # Les entrées du cache sont partagées entre sessions : elles ne sont jamais modifiées
+    scores = bundle['scores']
+    facet_scores = bundle['facet_scores']
+    percentiles = bundle['percentiles']
+    interpretations = bundle['interpretations']
+    details = {key: bundle[key] for key in ('confidence', 'facet_percentiles', 'facet_confidence')}
+
+    # Sauvegarde des résultats
+    st.session_state.scores = scores
+    st.session_state.facet_scores = facet_scores
+    st.session_state.percentiles = percentiles
+    st.session_state.interpretations = interpretations
+    st.session_state.update(details)
+    st.session_state.test_completed = True
+    st.session_state.result_fingerprint = fingerprint
+    st.session_state.adaptive_result = administered is not None
+    completed_at = datetime.now(timezone.utc)
+    result = {
+        'item_bank': list(st.session_state.item_bank),
+        'completed_at': completed_at.isoformat(),
+        'scores': scores,
+        'facet_scores': facet_scores,
+        'percentiles': percentiles,
+        'interpretations': interpretations,
+        **details,
+        'adaptive': administered is not None
+    }
+    backend = get_state_backend()
+    backend.save_result(st.session_state.user_session_id, result)
+    # Historique pseudonyme : « Refaire le Test » remplace le résultat de la session, pas l'historique ;
+    # avec un code répondant, les passations de sessions différentes se suivent
+    backend.save_history(history_key(), completed_at.timestamp(), history_record(result))
+    archive = get_response_archive()
+    if archive is not None:
+        item_bank = neo_manager.item_bank
+        scored = item_bank.response_vector(responses)
+        observed = scored if administered is None else item_bank.response_vector(administered)
+        # Pseudonyme du répondant (et non de la session) : l'archive apparie aussi les passations successives
+        archive.append(item_bank, history_key(), completed_at, observed, scored)
+
+    # Redirection vers les résultats
+    st.session_state.completion_notice = True
+    st.session_state.tool_choice = "📊 Résultats"
+
+def complete_test(neo_manager, responses, administered=None):
+    """Enregistre les résultats depuis le corps du script et relance l'exécution sur leur page"""
+    record_results(neo_manager, responses, administered)
+    st.rerun()
+
+def get_neo_manager():
+    """Gestionnaire NEO PI-R pour la banque d'items choisie dans la session"""
+    bank, locale = st.session_state.get('item_bank', (DEFAULT_BANK, DEFAULT_LOCALE))
+    return NEOPIRManager(bank, locale)
+
+@st.cache_resource
+def get_adaptive_model(bank=DEFAULT_BANK, locale=DEFAULT_LOCALE):
+    """Modèle adaptatif partagé : paramètres étalonnés s'ils existent, sinon par défaut"""
+    questions = get_registry().get(bank, locale).questions
+    params_dir = os.environ.get('NEO_PIR_IRT_DIR', APP_DIR)
+    params_path = os.path.join(params_dir, f"irt_params_{bank}.npz")
+    if os.path.exists(params_path):
+        return AdaptiveModel.load(questions, params_path)
+    return AdaptiveModel.default(questions)
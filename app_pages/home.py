@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Page d'accueil : contenu statique, aucune dépendance graphique ou scientifique
+Le HTML est assemblé et minifié une fois à l'import (une fois par processus) : chaque visite n'envoie
+que deux blocs et le bouton de démarrage. `python -m app_pages.prerender` en tire une page autonome
+compressée, servie sans Streamlit.
+"""
+
+import streamlit as st
+
+from neo_core.templates import minify
+
+from .theme import static_columns
+
+HEADER = """
+<div style="background: linear-gradient(90deg, #3498db, #2ecc71);
+            padding: 40px 25px; border-radius: 20px; margin-bottom: 35px; text-align: center;">
+    <h1 style="color: white; font-size: 2.8rem; margin-bottom: 15px;
+               text-shadow: 0 2px 4px rgba(0,0,0,0.3); font-weight: 600;">
+        🧠 Test de Personnalité NEO PI-R
+    </h1>
+    <p style="color: rgba(255,255,255,0.95); font-size: 1.3rem;
+              max-width: 800px; margin: 0 auto; line-height: 1.6;">
+        Découvrez votre profil de personnalité avec l'un des tests les plus fiables de la psychologie
+    </p>
+</div>
+"""
+
+INTRODUCTION = """
+<div class="info-card">
+    <h2 style="color: #3498db; margin-bottom: 25px; font-size: 2.2rem; text-align: center;">
+        🔬 Qu'est-ce que le NEO PI-R ?
+    </h2>
+    <p style="font-size: 1.2rem; line-height: 1.8; text-align: justify;
+              max-width: 900px; margin: 0 auto; color: #2c3e50;">
+        Le <strong>NEO PI-R (NEO Personality Inventory-Revised)</strong> est l'un des outils de mesure
+        de la personnalité les plus utilisés et respectés en psychologie. Développé par Paul Costa et
+        Robert McCrae, ce test évalue votre personnalité selon le modèle des <strong>Big Five</strong>,
+        considéré comme la référence internationale en matière de traits de personnalité.
+    </p>
+</div>
+"""
+
+DIMENSIONS_TITLE = """
+<h2 style="color: #3498db; margin: 45px 0 25px 0; text-align: center; font-size: 2.2rem;">
+    🌟 Les Cinq Grandes Dimensions de la Personnalité
+</h2>
+"""
+
+# Cartes des dimensions : colonne de gauche (N, O, C) puis de droite (E, A)
+DIMENSION_COLUMNS = [
+    [
+        {
+            "icon": "😰", "name": "Neuroticisme (N)",
+            "text": "Tendance à éprouver des émotions négatives comme l'anxiété, la dépression, "
+                    "l'hostilité. Mesure votre stabilité émotionnelle et votre gestion du stress.",
+            "gradient": "linear-gradient(135deg, #e74c3c, #c0392b)"
+        },
+        {
+            "icon": "🎨", "name": "Ouverture (O)",
+            "text": "Ouverture aux expériences nouvelles, à l'imagination, à l'art, aux émotions, "
+                    "aux idées et aux valeurs non conventionnelles.",
+            "gradient": "linear-gradient(135deg, #2ecc71, #27ae60)"
+        },
+        {
+            "icon": "📋", "name": "Conscienciosité (C)",
+            "text": "Organisation, persévérance, contrôle des impulses et orientation vers les objectifs. "
+                    "Mesure votre autodiscipline et votre fiabilité.",
+            "gradient": "linear-gradient(135deg, #9b59b6, #8e44ad)"
+        }
+    ],
+    [
+        {
+            "icon": "🎉", "name": "Extraversion (E)",
+            "text": "Niveau d'activité sociale, d'assertivité, d'émotions positives et de recherche "
+                    "de stimulation. Mesure votre sociabilité et votre énergie.",
+            "gradient": "linear-gradient(135deg, #f39c12, #e67e22)"
+        },
+        {
+            "icon": "🤝", "name": "Agréabilité (A)",
+            "text": "Coopération, confiance, altruisme et tendance à éviter les conflits. "
+                    "Mesure votre bienveillance envers les autres.",
+            "gradient": "linear-gradient(135deg, #3498db, #2980b9)"
+        }
+    ]
+]
+
+DIMENSION_CARD = """
+<div style="background: {gradient};
+           color: white; padding: 25px; border-radius: 15px; margin-bottom: 20px; height: 200px;">
+    <h3 style="margin-top: 0; display: flex; align-items: center;">
+        <span style="margin-right: 10px;">{icon}</span>
+        {name}
+    </h3>
+    <p style="line-height: 1.6; font-size: 0.95rem;">{text}</p>
+</div>
+"""
+
+BENEFITS_TITLE = """
+<h2 style="color: #3498db; margin: 45px 0 25px 0; text-align: center; font-size: 2.2rem;">
+    🎯 Pourquoi passer ce test ?
+</h2>
+"""
+
+BENEFITS = [
+    {
+        "title": "🔍 Connaissance de soi",
+        "items": ["Comprendre vos traits dominants", "Identifier vos forces et défis", "Mieux vous connaître", "Développement personnel"],
+        "gradient": "linear-gradient(135deg, #3498db, #2980b9)"
+    },
+    {
+        "title": "💼 Orientation professionnelle",
+        "items": ["Métiers adaptés à votre profil", "Style de management", "Environnement de travail", "Évolution de carrière"],
+        "gradient": "linear-gradient(135deg, #2ecc71, #27ae60)"
+    },
+    {
+        "title": "👥 Relations interpersonnelles",
+        "items": ["Améliorer vos relations", "Comprendre les autres", "Communication efficace", "Résolution de conflits"],
+        "gradient": "linear-gradient(135deg, #9b59b6, #8e44ad)"
+    }
+]
+
+BENEFIT_CARD = """
+<div style="background: {gradient}; color: white;
+           padding: 25px; border-radius: 15px; height: 280px;
+           box-shadow: 0 6px 20px rgba(0,0,0,0.15);">
+    <h3 style="border-bottom: 2px solid rgba(255,255,255,0.3);
+              padding-bottom: 12px; margin-bottom: 20px; font-size: 1.3rem;">
+        {title}
+    </h3>
+    <ul style="padding-left: 20px; margin: 0; line-height: 1.8;">
+        {items}
+    </ul>
+</div>
+"""
+
+FUNCTIONING_TITLE = """
+<h2 style="color: #3498db; margin: 45px 0 25px 0; text-align: center; font-size: 2.2rem;">
+    ⚙️ Comment fonctionne le test ?
+</h2>
+"""
+
+FUNCTIONING = """
+<div class="info-card">
+    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin-top: 20px;">
+        <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; text-align: center;">
+            <h4 style="color: #3498db; margin-top: 0;">📝 60 Questions</h4>
+            <p style="color: #2c3e50; margin: 0;">Questions soigneusement sélectionnées pour évaluer chaque dimension</p>
+        </div>
+        <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; text-align: center;">
+            <h4 style="color: #3498db; margin-top: 0;">⏱️ 10-15 minutes</h4>
+            <p style="color: #2c3e50; margin: 0;">Durée moyenne pour compléter le test en toute sérénité</p>
+        </div>
+        <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; text-align: center;">
+            <h4 style="color: #3498db; margin-top: 0;">📊 Analyse détaillée</h4>
+            <p style="color: #2c3e50; margin: 0;">Résultats complets avec interprétations personnalisées</p>
+        </div>
+        <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; text-align: center;">
+            <h4 style="color: #3498db; margin-top: 0;">🔒 Confidentialité</h4>
+            <p style="color: #2c3e50; margin: 0;">Vos données restent privées et sécurisées</p>
+        </div>
+    </div>
+</div>
+"""
+
+INSTRUCTIONS_TITLE = """
+<h2 style="color: #3498db; margin: 45px 0 25px 0; text-align: center; font-size: 2.2rem;">
+    📋 Instructions pour le test
+</h2>
+"""
+
+INSTRUCTIONS = """
+<div class="info-card">
+    <div style="background: #e8f4fd; padding: 20px; border-radius: 10px; margin-bottom: 20px;">
+        <h4 style="color: #2c3e50; margin-top: 0;">🎯 Conseils pour obtenir des résultats précis</h4>
+        <ul style="color: #34495e; padding-left: 25px; line-height: 1.8;">
+            <li><strong>Soyez honnête</strong> : Répondez selon ce que vous êtes vraiment, pas selon ce que vous aimeriez être</li>
+            <li><strong>Première impression</strong> : Choisissez la réponse qui vous vient spontanément à l'esprit</li>
+            <li><strong>Pas de "bonne" réponse</strong> : Il n'y a pas de profil idéal, chaque personnalité a ses forces</li>
+            <li><strong>Contexte général</strong> : Pensez à votre comportement habituel, pas à des situations exceptionnelles</li>
+            <li><strong>Prenez votre temps</strong> : Mais ne réfléchissez pas trop longtemps à chaque question</li>
+        </ul>
+    </div>
+
+    <div style="background: #fff3cd; padding: 20px; border-radius: 10px; margin-bottom: 20px;">
+        <h4 style="color: #856404; margin-top: 0;">⚠️ Important à savoir</h4>
+        <ul style="color: #856404; padding-left: 25px; line-height: 1.8;">
+            <li>Ce test est à des fins éducatives et de développement personnel</li>
+            <li>Il ne remplace pas une évaluation psychologique professionnelle</li>
+            <li>Vos résultats peuvent évoluer avec le temps et les expériences</li>
+            <li>Toutes les dimensions de personnalité ont leur valeur</li>
+        </ul>
+    </div>
+</div>
+"""
+
+FOOTER = """
+<div style="margin: 40px 0 30px 0; padding: 20px; border-radius: 12px;
+           border-left: 4px solid #3498db; background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+           box-shadow: 0 4px 12px rgba(52, 152, 219, 0.1);">
+    <p style="font-size: 1rem; color: #2c3e50; text-align: center; margin: 0; line-height: 1.6;">
+        <strong style="color: #3498db;">💡 Bon à savoir :</strong>
+        Le modèle des Big Five est utilisé dans de nombreux domaines : recrutement, coaching,
+        recherche en psychologie, et développement personnel.
+    </p>
+</div>
+"""
+
+# Blocs pré-rendus, de part et d'autre du bouton « Commencer le Test »
+HOME_HTML = minify("".join([
+    HEADER,
+    INTRODUCTION,
+    DIMENSIONS_TITLE,
+    static_columns(*(
+        "".join(DIMENSION_CARD.format(**card) for card in column)
+        for column in DIMENSION_COLUMNS
+    )),
+    BENEFITS_TITLE,
+    static_columns(*(
+        BENEFIT_CARD.format(gradient=benefit['gradient'], title=benefit['title'],
+                            items="".join(f"<li>{item}</li>" for item in benefit['items']))
+        for benefit in BENEFITS
+    )),
+    FUNCTIONING_TITLE,
+    FUNCTIONING,
+    INSTRUCTIONS_TITLE,
+    INSTRUCTIONS,
+    "<br>"
+]))
+HOME_FOOTER_HTML = minify(FOOTER)
+
+# Équivalent du bouton dans la page autonome : lien vers le test dans l'application
+START_LINK = minify("""
+<p style="text-align: center; margin: 30px 0;">
+    <a href="./?page=test" style="background: #3498db; color: white; padding: 14px 40px; border-radius: 10px;
+       text-decoration: none; font-weight: 600;">🚀 Commencer le Test NEO PI-R</a>
+</p>
+""")
+
+# Page autonome (python -m app_pages.prerender)
+STATIC_HTML = HOME_HTML + START_LINK + HOME_FOOTER_HTML
+
+def start_test():
+    """Rappel du bouton de démarrage : ouvre le test"""
+    st.session_state.tool_choice = "📝 Passer le Test"
+    st.session_state.test_started = True
+
+def show_home_page():
+    """Page d'accueil du test NEO PI-R"""
+    st.markdown(HOME_HTML, unsafe_allow_html=True)
+
+    # Bouton pour commencer
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.button("🚀 Commencer le Test NEO PI-R", type="primary", use_container_width=True,
+                  on_click=start_test)
+
+    st.markdown(HOME_FOOTER_HTML, unsafe_allow_html=True)
+
+show = show_home_page
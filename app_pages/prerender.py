@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Pré-rendu des pages statiques (accueil, « À propos ») en documents HTML autonomes
+Chaque page est écrite en clair et compressée (gzip, date fixe : le fichier ne change que si le contenu
+change), pour être servie directement par le proxy ou le CDN (gzip_static, cache HTTP) sans passer
+par Streamlit. Le bouton « Commencer le Test » devient un lien vers ?page=test de l'application.
+
+Usage : python -m app_pages.prerender [dossier] [--app-url URL]
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+
+from neo_core.templates import minify
+
+from . import PAGES, load_page
+from .theme import THEME_CSS
+
+PRERENDERED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prerendered")
+
+# Pages sans contenu dynamique : elles exposent leur HTML assemblé dans STATIC_HTML
+STATIC_PAGES = ["🏠 Accueil", "ℹ️ À propos"]
+
+DOCUMENT = minify("""
+<!DOCTYPE html>
+<html lang="fr">
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>{title} - Test NEO PI-R</title>
+    <base href="{app_url}">
+    {css}
+    <style>
+        body {{ margin: 0; background: #f8f9fa; font-family: "Source Sans Pro", sans-serif; color: #2c3e50; }}
+        .static-page {{ max-width: 1100px; margin: 0 auto; padding: 2rem 1rem; }}
+    </style>
+</head>
+<body><main class="static-page">{body}</main></body>
+</html>
+""")
+
+def render_page(label, app_url="./"):
+    """Document HTML autonome d'une page statique"""
+    title = label.split(" ", 1)[1]
+    return DOCUMENT.format(title=title, app_url=app_url, css=THEME_CSS, body=load_page(label).STATIC_HTML)
+
+def build(output_dir=PRERENDERED_DIR, app_url="./"):
+    """Écrit <page>.html et <page>.html.gz ; retourne (chemin, octets, octets compressés, empreinte)"""
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for label in STATIC_PAGES:
+        data = render_page(label, app_url).encode('utf-8')
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        path = os.path.join(output_dir, f"{PAGES[label][1]}.html")
+        with open(path, 'wb') as f:
+            f.write(data)
+        with open(path + ".gz", 'wb') as f:
+            f.write(compressed)
+        written.append((path, len(data), len(compressed), hashlib.sha256(data).hexdigest()[:16]))
+    return written
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pré-rendu des pages statiques en HTML compressé")
+    parser.add_argument("output", nargs="?", default=PRERENDERED_DIR)
+    parser.add_argument("--app-url", default="./", help="adresse de l'application Streamlit (liens ?page=)")
+    args = parser.parse_args()
+
+    for path, size, compressed_size, digest in build(args.output, args.app_url):
+        print(f"{path} : {size / 1024:.1f} Ko, {compressed_size / 1024:.1f} Ko compressé (ETag {digest})")
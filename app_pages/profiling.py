@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Profilage à la demande des réexécutions du script, en production
+Désactivé par défaut : ENABLED est évalué une fois à l'import et main() n'appelle rien d'autre.
+
+Variables d'environnement :
+- NEO_PIR_PROFILE : fraction des réexécutions profilées (0.05 = une sur vingt)
+- NEO_PIR_PROFILE_TOKEN : jeton d'administration ; ?profile=<jeton> profile la réexécution en cours
+- NEO_PIR_PROFILE_MODE : 'sample' (échantillonneur statistique, par défaut) ou 'cprofile'
+- NEO_PIR_PROFILE_INTERVAL : période d'échantillonnage en millisecondes (5 par défaut)
+- NEO_PIR_PROFILE_MEMORY : 1 pour un instantané tracemalloc par réexécution profilée
+- NEO_PIR_PROFILE_DIR : dossier des profils (profiles/ à côté de l'application par défaut)
+
+Fichiers écrits, par page (show_test_page, show_results_page...) et par processus :
+- <page>.<pid>.collapsed : piles repliées (« f1;f2;f3 n »), pour flamegraph.pl ou speedscope ;
+  les lignes de toutes les réexécutions s'ajoutent, les outils additionnent les piles identiques
+- <page>.<pid>.<n>.prof : statistiques cProfile (pstats, snakeviz) en mode 'cprofile'
+- <page>.<pid>.<n>.tracemalloc : instantané tracemalloc (tracemalloc.Snapshot.load)
+"""
+
+import cProfile
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from itertools import count
+
+import streamlit as st
+
+from .common import APP_DIR, logger
+
+SAMPLE_RATE = float(os.environ.get('NEO_PIR_PROFILE', 0) or 0)
+ADMIN_TOKEN = os.environ.get('NEO_PIR_PROFILE_TOKEN', "")
+MODE = os.environ.get('NEO_PIR_PROFILE_MODE', 'sample')
+INTERVAL = float(os.environ.get('NEO_PIR_PROFILE_INTERVAL', 5)) / 1000
+MEMORY = os.environ.get('NEO_PIR_PROFILE_MEMORY', "") not in ("", "0")
+PROFILE_DIR = os.environ.get('NEO_PIR_PROFILE_DIR', os.path.join(APP_DIR, "profiles"))
+
+ENABLED = SAMPLE_RATE > 0 or bool(ADMIN_TOKEN)
+
+MEMORY_FRAMES = 25
+MEMORY_TOP = 10
+
+_runs = count(1)
+# tracemalloc est global au processus et un seul cProfile peut être actif (Python 3.12+) :
+# une seule réexécution à la fois les utilise, les autres se contentent de l'échantillonneur
+_memory_lock = threading.Lock()
+_cprofile_lock = threading.Lock()
+
+def should_profile():
+    """Tirage de la réexécution, ou demande d'un administrateur (?profile=<jeton>)"""
+    if ADMIN_TOKEN and hmac.compare_digest(st.query_params.get('profile', ""), ADMIN_TOKEN):
+        return True
+    return random.random() < SAMPLE_RATE
+
+def frame_label(frame):
+    """Nom d'une frame dans une pile repliée (sans « ; » ni blancs en fin)"""
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+
+class StackSampler:
+    """Échantillonneur statistique : relève périodiquement la pile d'un thread depuis un thread voisin
+
+    Les piles s'arrêtent sous la frame de `root` (exclue), pour ne pas répéter celles de Streamlit.
+    """
+
+    def __init__(self, thread_id, root=None, interval=INTERVAL):
+        self.thread_id = thread_id
+        self.root = root
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="neo-pir-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and frame.f_code is not self.root:
+                # Relevé pris pendant l'arrêt de l'échantillonneur : la page est déjà terminée
+                if frame.f_code is StackSampler.__exit__.__code__:
+                    stack = []
+                    break
+                stack.append(frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+def _write_collapsed(path, stacks):
+    """Ajoute des piles repliées à un fichier (une ligne par pile distincte)"""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.writelines(f"{stack} {samples}\n" for stack, samples in stacks.items())
+
+def run_profiled(show):
+    """Exécute une page sous le profileur et écrit ses fichiers dans PROFILE_DIR"""
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    prefix = os.path.join(PROFILE_DIR, f"{show.__name__}.{os.getpid()}")
+    run = next(_runs)
+    memory = MEMORY and _memory_lock.acquire(blocking=False)
+    if memory:
+        tracemalloc.start(MEMORY_FRAMES)
+    profiler = cProfile.Profile() if MODE == 'cprofile' and _cprofile_lock.acquire(blocking=False) else None
+    sampler = None if profiler else StackSampler(threading.get_ident(), run_profiled.__code__)
+    start = time.perf_counter()
+    try:
+        if profiler:
+            profiler.runcall(show)
+        else:
+            with sampler:
+                show()
+    finally:
+        # st.rerun() interrompt la page par une exception : le profil est écrit quand même
+        elapsed = time.perf_counter() - start
+        written = []
+        if memory:
+            # Instantané avant l'écriture des profils, sans les allocations des outils eux-mêmes
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, cProfile.__file__),
+                tracemalloc.Filter(False, __file__)
+            ])
+            tracemalloc.stop()
+            _memory_lock.release()
+            snapshot.dump(f"{prefix}.{run}.tracemalloc")
+            written.append(f"{prefix}.{run}.tracemalloc")
+            for stat in snapshot.statistics('lineno')[:MEMORY_TOP]:
+                logger.info("Allocation %s : %s", show.__name__, stat)
+        if profiler:
+            _cprofile_lock.release()
+            profiler.dump_stats(f"{prefix}.{run}.prof")
+            written.append(f"{prefix}.{run}.prof")
+        else:
+            _write_collapsed(f"{prefix}.collapsed", sampler.stacks)
+            written.append(f"{prefix}.collapsed ({sum(sampler.stacks.values())} échantillons)")
+        logger.info("Profil %s : %.0f ms -> %s", show.__name__, elapsed * 1000, ", ".join(written))
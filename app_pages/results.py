@@ -0,0 +1,589 @@
+# -*- coding: utf-8 -*-
+"""
+Page des résultats : graphiques Plotly, rapports, profils similaires, archétypes et recommandations
+Seule page qui charge pandas, Plotly et SciPy, au premier affichage des résultats dans le processus.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from scipy import stats
+
+from neo_core import get_recommendation_engine, templates
+from neo_core.archetypes import facet_vector, get_archetypes
+from neo_core.item_banks import FACET_CODES
+from neo_core.longitudinal import RCI_THRESHOLD, classify, history_changes
+from neo_core.norms import PROVISIONAL_NOTE, get_norms
+from neo_core.result_cache import response_fingerprint
+from neo_core.similarity import SYNC_INTERVAL, ProfileIndex
+from report_export import REPORT_FORMATS, ReportExporter, build_report_payload
+
+from .common import get_neo_manager, get_state_backend, history_key
+
+def create_personality_chart(scores, interpretations):
+    """Crée un graphique radar de la personnalité"""
+    dimensions = list(scores.keys())
+    values = [interpretations[dim]['percentile'] for dim in dimensions]
+
+    # Ajout du premier point à la fin pour fermer le radar
+    dimensions_radar = dimensions + [dimensions[0]]
+    values_radar = values + [values[0]]
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatterpolar(
+        r=values_radar,
+        theta=dimensions_radar,
+        fill='toself',
+        name='Votre profil',
+        fillcolor='rgba(52, 152, 219, 0.3)',
+        line=dict(color='#3498db', width=3)
+    ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                tickvals=[20, 40, 60, 80, 100],
+                ticktext=['20%', '40%', '60%', '80%', '100%']
+            )
+        ),
+        showlegend=False,
+        title="Votre Profil de Personnalité NEO PI-R",
+        title_x=0.5,
+        height=500
+    )
+
+    return fig
+
+def create_facet_chart(facet_percentiles, facet_confidence, dimension):
+    """Crée un graphique des percentiles des facettes d'une dimension, avec intervalles de confiance"""
+    facets = list(facet_percentiles[dimension].keys())
+    values = list(facet_percentiles[dimension].values())
+    bounds = [facet_confidence[dimension][facet] for facet in facets]
+
+    fig = px.bar(
+        x=values,
+        y=facets,
+        orientation='h',
+        title=f"Facettes de {dimension}",
+        labels={'x': 'Percentile', 'y': 'Facettes'},
+        color=values,
+        color_continuous_scale='Blues',
+        error_x=[high - value for value, (_, high) in zip(values, bounds)],
+        error_x_minus=[value - low for value, (low, _) in zip(values, bounds)]
+    )
+
+    fig.add_vline(x=50, line_dash="dash", line_color="gray")
+    fig.update_layout(
+        height=400,
+        showlegend=False,
+        coloraxis_showscale=False,
+        xaxis_range=[0, 100]
+    )
+
+    return fig
+
+def create_percentile_chart(dimensions, percentiles):
+    """Crée le graphique en barres des percentiles par dimension"""
+    dimension_names = [dimensions[dim] for dim in ['N', 'E', 'O', 'A', 'C']]
+    values = [percentiles[dim] for dim in ['N', 'E', 'O', 'A', 'C']]
+
+    fig_bar = px.bar(
+        x=dimension_names,
+        y=values,
+        title="Vos Percentiles par Dimension",
+        labels={'x': 'Dimensions', 'y': 'Percentile'},
+        color=values,
+        color_continuous_scale='RdYlBu_r'
+    )
+
+    fig_bar.add_hline(y=50, line_dash="dash", line_color="gray",
+                     annotation_text="Moyenne (50e percentile)")
+    fig_bar.add_hline(y=70, line_dash="dash", line_color="red",
+                     annotation_text="Niveau élevé (70e percentile)")
+    fig_bar.add_hline(y=30, line_dash="dash", line_color="blue",
+                     annotation_text="Niveau faible (30e percentile)")
+
+    fig_bar.update_layout(showlegend=False, height=500)
+    return fig_bar
+
+def create_distribution_chart(dimensions, percentiles):
+    """Crée le graphique de position dans la distribution de la population"""
+    fig_dist = go.Figure()
+
+    x = np.linspace(0, 100, 100)
+    y = stats.norm.pdf(x, 50, 15)  # Distribution normale centrée sur 50
+
+    fig_dist.add_trace(go.Scatter(
+        x=x, y=y,
+        mode='lines',
+        name='Population générale',
+        fill='tozeroy',
+        fillcolor='rgba(52, 152, 219, 0.3)',
+        line=dict(color='#3498db')
+    ))
+
+    # Ajout des positions du participant
+    for dim in ['N', 'E', 'O', 'A', 'C']:
+        percentile = percentiles[dim]
+        y_pos = stats.norm.pdf(percentile, 50, 15)
+        fig_dist.add_trace(go.Scatter(
+            x=[percentile],
+            y=[y_pos],
+            mode='markers',
+            name=dimensions[dim],
+            marker=dict(size=12)
+        ))
+
+    fig_dist.update_layout(
+        title="Votre Position dans la Distribution",
+        xaxis_title="Percentile",
+        yaxis_title="Densité",
+        height=400
+    )
+    return fig_dist
+
+def create_level_chart(interpretations):
+    """Crée le graphique circulaire de répartition des niveaux"""
+    levels_count = {'Élevé': 0, 'Moyen': 0, 'Faible': 0}
+    for interp in interpretations.values():
+        levels_count[interp['level']] += 1
+
+    return px.pie(
+        values=list(levels_count.values()),
+        names=list(levels_count.keys()),
+        title="Répartition de vos niveaux",
+        color_discrete_map={'Élevé': '#e74c3c', 'Moyen': '#f39c12', 'Faible': '#3498db'}
+    )
+
+def create_trend_chart(dimensions, dates, history):
+    """Crée le graphique d'évolution des percentiles des dimensions au fil des passations"""
+    fig = go.Figure()
+    for dim in ['N', 'E', 'O', 'A', 'C']:
+        fig.add_trace(go.Scatter(
+            x=dates,
+            y=[entry['percentiles'][dim] for entry in history],
+            mode='lines+markers',
+            name=dimensions[dim]
+        ))
+
+    fig.add_hline(y=50, line_dash="dash", line_color="gray")
+    fig.update_layout(
+        title="Évolution de vos Percentiles",
+        xaxis_title="Passation",
+        yaxis=dict(title="Percentile", range=[0, 100]),
+        height=400
+    )
+    return fig
+
+@st.cache_resource(max_entries=256)
+def get_result_figures(fingerprint, _dimensions, _scores, _percentiles, _interpretations):
+    """Figures de la page des résultats, mémorisées par empreinte des réponses (partagées, jamais modifiées)"""
+    return {
+        'radar': create_personality_chart(_scores, _interpretations),
+        'bar': create_percentile_chart(_dimensions, _percentiles),
+        'distribution': create_distribution_chart(_dimensions, _percentiles),
+        'levels': create_level_chart(_interpretations)
+    }
+
+@st.cache_resource(max_entries=1024)
+def get_facet_figure(fingerprint, dimension, _facet_percentiles, _facet_confidence):
+    """Graphique des facettes d'une dimension, mémorisé par empreinte des réponses"""
+    return create_facet_chart(_facet_percentiles, _facet_confidence, dimension)
+
+SIMILAR_PROFILES = 20
+
+@st.cache_resource
+def get_profile_index():
+    """Index des profils enregistrés (percentiles des domaines), partagé par les sessions du processus
+
+    Synchronisé avec le backend d'état en arrière-plan (NEO_PIR_SIMILARITY_SYNC, en secondes) : une
+    réexécution de la page ne fait qu'interroger l'index.
+    """
+    index = ProfileIndex('domains')
+    return index.start_sync(get_state_backend(), float(os.environ.get('NEO_PIR_SIMILARITY_SYNC', SYNC_INTERVAL)))
+
+def find_similar_profiles(k=SIMILAR_PROFILES):
+    """Percentiles moyens des k profils enregistrés les plus proches de la session (None s'il y en a trop peu)
+
+    Mémorisés dans la session par (identifiant de session, empreinte du résultat) : les réexécutions de la
+    page ne relisent pas les résultats voisins. Tant qu'il y a trop peu de profils, la recherche est refaite.
+    Les voisins dont le résultat a été purgé sont retirés de l'index.
+    """
+    key = (st.session_state.user_session_id, st.session_state.get('result_fingerprint'))
+    cached = st.session_state.get('similar_profiles')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    backend = get_state_backend()
+    index = get_profile_index()
+    profile = [st.session_state.percentiles[dim] for dim in ['N', 'E', 'O', 'A', 'C']]
+    while True:
+        neighbours = index.query(profile, k=k, exclude=st.session_state.user_session_id)[0]
+        if len(neighbours) < k:
+            return None
+        loaded = [(sid, backend.load_result(sid)) for sid, _ in neighbours]
+        missing = [sid for sid, result in loaded if result is None]
+        if not missing:
+            break
+        # Résultats purgés (NEO_PIR_RESULT_TTL) depuis leur indexation : retirés, puis nouvelle recherche
+        index.remove(missing)
+    results = [result for _, result in loaded]
+    similar = {dim: float(np.mean([result['percentiles'][dim] for result in results]))
+               for dim in ['N', 'E', 'O', 'A', 'C']}
+    st.session_state.similar_profiles = (key, similar)
+    return similar
+
+CHANGE_LABELS = {1: "⬆️ Hausse fiable", 0: "Stable", -1: "⬇️ Baisse fiable"}
+
+@st.cache_resource(max_entries=256)
+def get_trend_figure(key, timestamps, _dimensions, _history):
+    """Graphique d'évolution, mémorisé par répondant et horodatages des passations"""
+    dates = pd.to_datetime(list(timestamps), unit='s', utc=True).tz_convert(None)
+    return create_trend_chart(_dimensions, dates, _history)
+
+def show_history(neo_manager):
+    """Évolution depuis les passations précédentes du répondant (même banque d'items)"""
+    key = history_key()
+    bank = list(st.session_state.item_bank)
+    history = [(t, entry) for t, entry in get_state_backend().load_history(key) if entry['item_bank'] == bank]
+    if len(history) < 2:
+        if not st.session_state.get('respondent_key'):
+            st.caption("📅 Pour suivre l'évolution de vos résultats d'une passation à l'autre, indiquez un code "
+                       "répondant au début du test (le même à chaque fois).")
+        return
+
+    st.markdown("### 📅 Évolution depuis vos passations précédentes")
+    figure = get_trend_figure(key, tuple(t for t, _ in history), neo_manager.dimensions,
+                              [entry for _, entry in history])
+    st.plotly_chart(figure, use_container_width=True)
+
+    # Indice de changement fiable entre les deux dernières passations
+    raw, rci = history_changes(history[-2:], get_norms(neo_manager.item_bank))
+    status = classify(rci[-1])
+    st.caption(f"Changement fiable : |RCI| ≥ {RCI_THRESHOLD} (au-delà de l'erreur de mesure, p < 0,05)")
+    st.dataframe(pd.DataFrame([
+        {
+            'Dimension': neo_manager.dimensions[dim],
+            'Précédent': f"{raw[0, i]:.0f}",
+            'Actuel': f"{raw[1, i]:.0f}",
+            'RCI': f"{rci[-1, i]:+.2f}",
+            'Changement': CHANGE_LABELS[status[i]]
+        }
+        for i, dim in enumerate(['N', 'E', 'O', 'A', 'C'])
+    ]), use_container_width=True, hide_index=True)
+
+    # Facettes d'une passation adaptative imputées : pas de changement de facette à rapporter
+    if any(entry.get('adaptive') for _, entry in history[-2:]):
+        return
+    offset = len(neo_manager.dimensions)
+    facet_changes = [
+        {
+            'Facette': f"{facet} ({dim})",
+            'RCI': f"{rci[-1, offset + i]:+.2f}",
+            'Changement': CHANGE_LABELS[status[offset + i]]
+        }
+        for i, (dim, facet) in enumerate(FACET_CODES) if status[offset + i]
+    ]
+    if facet_changes:
+        with st.expander(f"Facettes au changement fiable ({len(facet_changes)})"):
+            st.dataframe(pd.DataFrame(facet_changes), use_container_width=True, hide_index=True)
+
+@st.cache_resource
+def get_report_exporter():
+    """Pool de rendu des rapports partagé entre toutes les sessions"""
+    return ReportExporter()
+
+@st.fragment(run_every=1.0)
+def show_report_progress(key):
+    """Suit la génération du rapport sans bloquer le script principal"""
+    if get_report_exporter().status(key) != 'pending':
+        st.rerun()
+    st.info("⏳ Génération du rapport en cours...")
+
+def show_report_export(neo_manager):
+    """Section de téléchargement du rapport PDF/PNG"""
+    st.markdown("### 📥 Télécharger votre rapport")
+
+    if 'report_jobs' not in st.session_state:
+        st.session_state.report_jobs = {}
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        fmt = st.radio(
+            "Format du rapport :",
+            list(REPORT_FORMATS.keys()),
+            format_func=str.upper,
+            horizontal=True,
+            key="report_format"
+        )
+
+    with col2:
+        exporter = get_report_exporter()
+        key = st.session_state.report_jobs.get(fmt)
+        status = exporter.status(key) if key else 'missing'
+
+        if status == 'ready':
+            st.download_button(
+                f"📄 Télécharger le rapport {fmt.upper()}",
+                data=exporter.get(key),
+                file_name=f"rapport_neo_pir.{fmt}",
+                mime=REPORT_FORMATS[fmt],
+                use_container_width=True
+            )
+        elif status == 'pending':
+            show_report_progress(key)
+        else:
+            if status == 'failed':
+                st.error("Erreur lors de la génération du rapport. Veuillez réessayer.")
+            if st.button("🖨️ Générer le rapport", use_container_width=True):
+                # Facettes comme à l'écran : percentiles et intervalles (aucune en passation adaptative)
+                facets = not st.session_state.get('adaptive_result')
+                payload = build_report_payload(
+                    neo_manager.dimensions,
+                    st.session_state.scores,
+                    st.session_state.percentiles,
+                    st.session_state.interpretations,
+                    st.session_state.facet_percentiles if facets else None,
+                    st.session_state.facet_confidence if facets else None,
+                    PROVISIONAL_NOTE if get_norms(neo_manager.item_bank).provisional else None
+                )
+                key, _ = exporter.submit(payload, fmt)
+                st.session_state.report_jobs[fmt] = key
+                st.rerun()
+
+def show_results_page():
+    """Page des résultats du test NEO PI-R"""
+    if not st.session_state.test_completed:
+        st.warning("⚠️ Vous devez d'abord passer le test pour voir vos résultats.")
+        if st.button("📝 Passer le test"):
+            st.session_state.tool_choice = "📝 Passer le Test"
+            st.rerun()
+        return
+
+    # Avis de fin de test, une seule fois (plus d'attente sur la page du test)
+    if st.session_state.pop('completion_notice', False):
+        st.toast("🎉 Test terminé ! Voici vos résultats.")
+
+    neo_manager = get_neo_manager()
+    fingerprint = st.session_state.get('result_fingerprint') or response_fingerprint(
+        neo_manager.item_bank, st.session_state.responses
+    )
+    if 'facet_percentiles' not in st.session_state:
+        # Session enregistrée avant l'ajout des percentiles de facettes
+        st.session_state.update(neo_manager.calculate_details(st.session_state.responses))
+    if get_norms(neo_manager.item_bank).provisional:
+        st.warning(f"⚠️ {PROVISIONAL_NOTE}")
+    figures = get_result_figures(
+        fingerprint,
+        neo_manager.dimensions,
+        st.session_state.scores,
+        st.session_state.percentiles,
+        st.session_state.interpretations
+    )
+
+    # En-tête des résultats
+    st.markdown(templates.RESULTS_HEADER, unsafe_allow_html=True)
+
+    # Tabs pour organiser les résultats
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "🎯 Vue d'ensemble",
+        "📈 Profil détaillé",
+        "🔍 Analyse par dimension",
+        "💡 Recommandations"
+    ])
+
+    with tab1:
+        # Vue d'ensemble du profil
+        st.markdown("## 🎯 Votre Profil de Personnalité")
+
+        # Graphique radar
+        st.plotly_chart(figures['radar'], use_container_width=True)
+
+        # Résumé des scores
+        st.markdown("### 📊 Vos Scores par Dimension")
+
+        # Création du tableau de scores
+        results_data = []
+        for dim in ['N', 'E', 'O', 'A', 'C']:
+            dim_name = neo_manager.dimensions[dim]
+            interp = st.session_state.interpretations[dim]
+            low, high = st.session_state.confidence[dim]
+            results_data.append({
+                'Dimension': f"{dim_name} ({dim})",
+                'Percentile': f"{interp['percentile']:.0f}%",
+                'Intervalle (90 %)': f"{low:.0f}–{high:.0f}",
+                'Niveau': interp['level'],
+                'Score brut': st.session_state.scores[dim]
+            })
+
+        df_results = pd.DataFrame(results_data)
+        st.dataframe(df_results, use_container_width=True, hide_index=True)
+
+        # Interprétation générale
+        st.markdown("### 🔍 Interprétation Générale")
+
+        st.markdown(templates.overview_card(st.session_state.interpretations, neo_manager.dimensions),
+                    unsafe_allow_html=True)
+
+        # Archétype : centroïde le plus proche parmi ceux du job de regroupement hors ligne
+        archetypes = get_archetypes()
+        if archetypes is not None and not st.session_state.get('adaptive_result'):
+            archetype, _ = archetypes.assign(facet_vector(st.session_state.facet_percentiles))
+            st.markdown(templates.archetype_card(archetypes, archetype, neo_manager.dimensions),
+                        unsafe_allow_html=True)
+
+        show_report_export(neo_manager)
+
+    with tab2:
+        # Profil détaillé avec graphiques
+        st.markdown("## 📈 Analyse Détaillée de Votre Profil")
+
+        # Graphique en barres des percentiles
+        st.plotly_chart(figures['bar'], use_container_width=True)
+
+        # Comparaison avec la population générale
+        st.markdown("### 👥 Comparaison avec la Population Générale")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.plotly_chart(figures['distribution'], use_container_width=True)
+
+        with col2:
+            st.markdown("#### 📊 Répartition de vos scores")
+
+            # Comptage par niveau
+            levels_count = {'Élevé': 0, 'Moyen': 0, 'Faible': 0}
+            for interp in st.session_state.interpretations.values():
+                levels_count[interp['level']] += 1
+
+            st.plotly_chart(figures['levels'], use_container_width=True)
+
+            # Métriques
+            st.metric("Traits élevés", levels_count['Élevé'],
+                     f"{levels_count['Élevé']}/5 dimensions")
+            st.metric("Traits moyens", levels_count['Moyen'],
+                     f"{levels_count['Moyen']}/5 dimensions")
+            st.metric("Traits faibles", levels_count['Faible'],
+                     f"{levels_count['Faible']}/5 dimensions")
+
+        # Profils les plus proches parmi les résultats enregistrés (moyenne, jamais de profil individuel)
+        similar = find_similar_profiles()
+        if similar is not None:
+            st.markdown("### 🧭 Profils proches du vôtre")
+            st.caption(f"Moyenne des {SIMILAR_PROFILES} profils enregistrés les plus proches du vôtre")
+            st.dataframe(pd.DataFrame([
+                {
+                    'Dimension': neo_manager.dimensions[dim],
+                    'Vous': f"{st.session_state.percentiles[dim]:.0f}",
+                    'Profils proches': f"{similar[dim]:.0f}"
+                }
+                for dim in ['N', 'E', 'O', 'A', 'C']
+            ]), use_container_width=True, hide_index=True)
+
+        show_history(neo_manager)
+
+    with tab3:
+        # Analyse détaillée par dimension
+        st.markdown("## 🔍 Analyse Approfondie par Dimension")
+
+        # Sélecteur de dimension
+        selected_dim = st.selectbox(
+            "Choisissez une dimension à analyser en détail :",
+            options=['N', 'E', 'O', 'A', 'C'],
+            format_func=lambda x: f"{neo_manager.dimensions[x]} ({x})",
+            key="dimension_selector"
+        )
+
+        interp = st.session_state.interpretations[selected_dim]
+
+        # En-tête de la dimension et description détaillée (fragments mémorisés)
+        st.markdown(templates.dimension_header(selected_dim, interp['level'], round(interp['percentile'])),
+                    unsafe_allow_html=True)
+        st.markdown(templates.interpretation_card(selected_dim, interp['level']), unsafe_allow_html=True)
+
+        # Graphique des facettes (non estimées en passation adaptative : réponses imputées)
+        if st.session_state.get('adaptive_result'):
+            st.info("⚡ Passation adaptative : seuls les domaines sont estimés avec précision. Passez le test "
+                    "complet pour l'analyse des facettes.")
+        elif selected_dim in st.session_state.facet_scores:
+            st.markdown("### 🔍 Analyse des Facettes")
+
+            fig_facets = get_facet_figure(fingerprint, selected_dim, st.session_state.facet_percentiles,
+                                          st.session_state.facet_confidence)
+            st.plotly_chart(fig_facets, use_container_width=True)
+
+            # Explication des facettes
+            st.markdown("#### 📚 Explication des Facettes")
+
+            st.markdown(templates.facet_cards(selected_dim, st.session_state.facet_scores[selected_dim]),
+                        unsafe_allow_html=True)
+
+    with tab4:
+        # Recommandations personnalisées
+        st.markdown("## 💡 Recommandations Personnalisées")
+
+        # Recommandations précalculées pour le profil de niveaux (243 profils possibles)
+        recommendations = get_recommendation_engine().lookup(st.session_state.interpretations)
+        recommendations_html = recommendations['html']
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("### 🌟 Vos Forces")
+            if recommendations_html['forces']:
+                st.markdown(recommendations_html['forces'], unsafe_allow_html=True)
+            else:
+                st.info(get_recommendation_engine().empty['forces'])
+
+        with col2:
+            st.markdown("### 🎯 Axes de Développement")
+            if recommendations_html['defis']:
+                st.markdown(recommendations_html['defis'], unsafe_allow_html=True)
+            else:
+                st.info(get_recommendation_engine().empty['defis'])
+
+        # Recommandations par domaine
+        st.markdown("### 🎯 Recommandations par Domaine de Vie")
+
+        st.markdown("#### 💼 Orientation Professionnelle")
+        if recommendations_html['career']:
+            st.markdown(recommendations_html['career'], unsafe_allow_html=True)
+
+        # Relations interpersonnelles
+        st.markdown("#### 👥 Relations Interpersonnelles")
+        if recommendations_html['relationships']:
+            st.markdown(recommendations_html['relationships'], unsafe_allow_html=True)
+
+        # Développement personnel
+        st.markdown("#### 🌱 Développement Personnel")
+        if recommendations_html['development']:
+            st.markdown(recommendations_html['development'], unsafe_allow_html=True)
+
+        # Bouton pour refaire le test
+        st.markdown("<br><br>", unsafe_allow_html=True)
+
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            if st.button("🔄 Refaire le Test", use_container_width=True):
+                # Reset de l'état (le résultat reste dans l'historique de la session)
+                st.session_state.test_started = False
+                st.session_state.test_completed = False
+                st.session_state.responses = {}
+                st.session_state.current_question = 0
+                st.session_state.scores = {}
+                st.session_state.interpretations = {}
+                st.session_state.report_jobs = {}
+                st.session_state.adaptive_session = None
+                st.session_state.tool_choice = "📝 Passer le Test"
+                st.rerun()
+
+show = show_results_page
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Page du test : passation classique (réponse en un clic ou bouton radio) et passation adaptative
+"""
+
+import inspect
+
+import streamlit as st
+
+from neo_core import get_registry
+from neo_core.longitudinal import RESPONDENT_CODE_MIN, RespondentCodeError, respondent_key
+
+from .common import complete_test, get_adaptive_model, get_neo_manager, record_results
+
+# Raccourcis clavier des boutons (paramètre `shortcut`, versions récentes de Streamlit)
+BUTTON_SHORTCUTS = 'shortcut' in inspect.signature(st.button).parameters
+
+def record_answer(item_id, score, total_questions):
+    """Rappel d'un bouton de réponse : enregistre et passe à l'item suivant dans la même exécution"""
+    st.session_state.responses[item_id] = score
+    if st.session_state.current_question < total_questions - 1:
+        st.session_state.current_question += 1
+
+def record_choice(item_id, key, response_options):
+    """Rappel du bouton radio : enregistre le choix explicite de l'utilisateur"""
+    choice = st.session_state[key]
+    if choice is not None:
+        st.session_state.responses[item_id] = response_options.index(choice) + 1
+
+def set_respondent_code():
+    """Rappel du champ « Code répondant » : seule l'empreinte du code est gardée dans la session"""
+    code = st.session_state.pop('respondent_code', "")
+    st.session_state.respondent_code_error = None
+    if not code.strip():
+        st.session_state.respondent_key = None
+        return
+    try:
+        st.session_state.respondent_key = respondent_key(code)
+    except RespondentCodeError as e:
+        st.session_state.respondent_code_error = str(e)
+
+def go_to_question(step):
+    """Rappel des boutons de navigation : la question change avant l'exécution du script"""
+    st.session_state.current_question += step
+
+def finish_test(neo_manager):
+    """Rappel du bouton « Terminer » : les résultats sont calculés avant l'exécution qui les affiche"""
+    record_results(neo_manager, st.session_state.responses)
+
+def show_respondent_code():
+    """Code répondant facultatif : relie cette passation aux précédentes (évolution, changement fiable)"""
+    if st.session_state.get('respondent_key'):
+        st.caption("🔑 Code répondant enregistré : cette passation rejoindra votre historique.")
+    st.text_input(
+        "🔑 Code répondant (facultatif)",
+        key='respondent_code',
+        on_change=set_respondent_code,
+        type="password",
+        placeholder=f"au moins {RESPONDENT_CODE_MIN} caractères",
+        help="Choisissez un code personnel et saisissez le même à chaque passation, sur n'importe quel appareil : "
+             "vos résultats successifs sont alors comparés. Un coach peut aussi vous en attribuer un pour un "
+             "rapport d'équipe. Le code n'est pas conservé, seule son empreinte l'est."
+    )
+    if st.session_state.get('respondent_code_error'):
+        st.error(st.session_state.respondent_code_error)
+
+def show_test_page():
+    """Page du test NEO PI-R"""
+    neo_manager = get_neo_manager()
+
+    if not st.session_state.test_started:
+        st.session_state.test_started = True
+        st.session_state.current_question = 0
+        st.session_state.responses = {}
+
+    # Choix de la banque d'items et du mode de passation, uniquement sur la première question
+    if st.session_state.current_question == 0 and not st.session_state.get('adaptive_session'):
+        registry = get_registry()
+        available = registry.available()
+        if len(available) > 1:
+            current_bank = (neo_manager.item_bank.bank, neo_manager.item_bank.locale)
+            selected_bank = st.selectbox(
+                "Version du questionnaire :",
+                available,
+                index=available.index(current_bank),
+                format_func=lambda key: f"{registry.get(*key).title} — {key[1].upper()}"
+            )
+            if selected_bank != current_bank:
+                st.session_state.item_bank = selected_bank
+                st.session_state.responses = {}
+                st.rerun()
+
+        st.session_state.adaptive_mode = st.toggle(
+            "⚡ Mode adaptatif : moins de questions, même précision",
+            value=st.session_state.get('adaptive_mode', False)
+        )
+        st.session_state.quick_answer = st.toggle(
+            "⌨️ Réponse en un clic : passage automatique à la question suivante" +
+            (" (touches 1 à 5)" if BUTTON_SHORTCUTS else ""),
+            value=st.session_state.get('quick_answer', True)
+        )
+        show_respondent_code()
+
+    if st.session_state.get('adaptive_mode'):
+        show_adaptive_test(neo_manager)
+        return
+
+    total_questions = len(neo_manager.questions)
+    progress = st.session_state.current_question / total_questions
+
+    # En-tête avec progression
+    st.markdown(f"""
+    <div style="background: linear-gradient(90deg, #3498db, #2ecc71);
+                padding: 30px 25px; border-radius: 20px; margin-bottom: 25px; text-align: center;">
+        <h1 style="color: white; font-size: 2.5rem; margin-bottom: 10px;
+                   text-shadow: 0 2px 4px rgba(0,0,0,0.3); font-weight: 600;">
+            📝 Test NEO PI-R en cours
+        </h1>
+        <p style="color: rgba(255,255,255,0.95); font-size: 1.1rem; margin: 0;">
+            Question {st.session_state.current_question + 1} sur {total_questions}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Barre de progression
+    st.progress(progress)
+
+    if st.session_state.current_question < total_questions:
+        # Question actuelle
+        current_q = neo_manager.questions[st.session_state.current_question]
+
+        # Affichage de la question
+        st.markdown(f"""
+        <div class="question-card">
+            <h3 style="color: #2c3e50; margin-bottom: 20px; font-size: 1.4rem;">
+                Question {st.session_state.current_question + 1} / {total_questions}
+            </h3>
+            <p style="font-size: 1.2rem; line-height: 1.6; color: #34495e; margin-bottom: 25px;">
+                <strong>{current_q['text']}</strong>
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Options de réponse
+        st.markdown("### Votre réponse :")
+
+        response_options = list(neo_manager.item_bank.response_options)
+
+        # Réponse précédente (retour en arrière) ; aucune réponse n'est présélectionnée sinon
+        previous_response = st.session_state.responses.get(current_q['id'])
+
+        # Les réponses et la navigation passent par des rappels : un clic = une seule exécution du script
+        if st.session_state.get('quick_answer', True):
+            answer_columns = st.columns(len(response_options))
+            for score, (column, option) in enumerate(zip(answer_columns, response_options), start=1):
+                shortcut = {'shortcut': str(score)} if BUTTON_SHORTCUTS else {}
+                column.button(
+                    option,
+                    key=f"answer_{current_q['id']}_{score}",
+                    type="primary" if score == previous_response else "secondary",
+                    on_click=record_answer,
+                    args=(current_q['id'], score, total_questions),
+                    use_container_width=True,
+                    **shortcut
+                )
+        else:
+            key = f"question_{current_q['id']}"
+            st.radio(
+                "Choisissez votre niveau d'accord :",
+                response_options,
+                index=previous_response - 1 if previous_response else None,
+                key=key,
+                on_change=record_choice,
+                args=(current_q['id'], key, response_options),
+                label_visibility="collapsed"
+            )
+        answered = current_q['id'] in st.session_state.responses
+
+        # Boutons de navigation
+        col1, col2, col3 = st.columns([2, 1, 2])
+
+        with col1:
+            if st.session_state.current_question > 0:
+                st.button("⬅️ Question précédente", use_container_width=True,
+                          on_click=go_to_question, args=(-1,))
+
+        with col3:
+            if st.session_state.current_question < total_questions - 1:
+                st.button("Question suivante ➡️", type="primary", use_container_width=True,
+                          disabled=not answered, on_click=go_to_question, args=(1,))
+            else:
+                st.button("🎯 Terminer le test", type="primary", use_container_width=True,
+                          disabled=len(st.session_state.responses) < total_questions,
+                          on_click=finish_test, args=(neo_manager,))
+
+        # Informations sur la dimension actuelle
+        dimension = current_q['dimension']
+        dimension_name = neo_manager.dimensions[dimension]
+        facet = current_q['facet']
+
+        st.markdown(f"""
+        <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; margin-top: 20px;">
+            <p style="color: #6c757d; margin: 0; text-align: center;">
+                <strong>Dimension évaluée :</strong> {dimension_name} ({dimension}) - Facette : {facet}
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    else:
+        # Test terminé : redirection immédiate, l'avis s'affiche sur la page des résultats
+        st.session_state.completion_notice = True
+        st.session_state.tool_choice = "📊 Résultats"
+        st.rerun()
+
+def show_adaptive_test(neo_manager):
+    """Passation adaptative : l'item suivant maximise l'information sur le trait le moins précis"""
+    session = st.session_state.get('adaptive_session')
+    if session is None:
+        session = get_adaptive_model(neo_manager.item_bank.bank, neo_manager.item_bank.locale).new_session()
+        st.session_state.adaptive_session = session
+
+    item_id = session.next_item()
+    if item_id is None:
+        if session.recorded:
+            # Passation déjà enregistrée (retour sur la page) : pas de nouvel historique ni de ligne d'archive
+            st.session_state.tool_choice = "📊 Résultats"
+            st.rerun()
+        session.recorded = True
+        # Les items non posés sont cotés à leur réponse attendue, mais archivés sans réponse
+        complete_test(neo_manager, session.completed_responses(), session.responses)
+
+    total_questions = len(neo_manager.questions)
+    answered = len(session.responses)
+    current_q = next(q for q in neo_manager.questions if q['id'] == item_id)
+
+    # En-tête avec progression (le nombre d'items est un maximum)
+    st.markdown(f"""
+    <div style="background: linear-gradient(90deg, #3498db, #2ecc71);
+                padding: 30px 25px; border-radius: 20px; margin-bottom: 25px; text-align: center;">
+        <h1 style="color: white; font-size: 2.5rem; margin-bottom: 10px;
+                   text-shadow: 0 2px 4px rgba(0,0,0,0.3); font-weight: 600;">
+            ⚡ Test NEO PI-R adaptatif
+        </h1>
+        <p style="color: rgba(255,255,255,0.95); font-size: 1.1rem; margin: 0;">
+            Question {answered + 1} (au plus {total_questions})
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.progress(answered / total_questions)
+
+    st.markdown(f"""
+    <div class="question-card">
+        <h3 style="color: #2c3e50; margin-bottom: 20px; font-size: 1.4rem;">
+            Question {answered + 1}
+        </h3>
+        <p style="font-size: 1.2rem; line-height: 1.6; color: #34495e; margin-bottom: 25px;">
+            <strong>{current_q['text']}</strong>
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("### Votre réponse :")
+
+    response_options = list(neo_manager.item_bank.response_options)
+
+    # Aucune réponse présélectionnée : seul un choix explicite est enregistré
+    response = st.radio(
+        "Choisissez votre niveau d'accord :",
+        response_options,
+        index=None,
+        key=f"adaptive_question_{current_q['id']}",
+        label_visibility="collapsed"
+    )
+
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col3:
+        if st.button("Question suivante ➡️", type="primary", use_container_width=True, disabled=response is None):
+            session.record(current_q['id'], response_options.index(response) + 1)
+            st.rerun()
+
+show = show_test_page
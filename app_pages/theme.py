@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+Thème CSS commun à toutes les pages
+"""
+
+import streamlit as st
+
+from neo_core import templates
+
+# Feuille de style inspirée du site de référence ; blancs réduits une fois par processus
+THEME_CSS = templates.minify("""
+<style>
+/* Variables globales */
+:root {
+    --primary: #2c3e50 !important;
+    --secondary: #3498db !important;
+    --accent: #e74c3c !important;
+    --background: #f8f9fa !important;
+    --sidebar-bg: #ffffff !important;
+    --sidebar-border: #e9ecef !important;
+    --text-primary: #2c3e50 !important;
+    --text-secondary: #6c757d !important;
+    --sidebar-width-collapsed: 60px !important;
+    --sidebar-width-expanded: 240px !important;
+    --sidebar-transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+    --shadow-light: 0 2px 8px rgba(0,0,0,0.08) !important;
+    --shadow-medium: 0 4px 16px rgba(0,0,0,0.12) !important;
+}
+
+/* Structure principale */
+[data-testid="stAppViewContainer"] {
+    background-color: var(--background) !important;
+}
+
+/* Sidebar compacte */
+[data-testid="stSidebar"] {
+    width: var(--sidebar-width-collapsed) !important;
+    min-width: var(--sidebar-width-collapsed) !important;
+    max-width: var(--sidebar-width-collapsed) !important;
+    height: 100vh !important;
+    position: fixed !important;
+    left: 0 !important;
+    top: 0 !important;
+    z-index: 999999 !important;
+    background: var(--sidebar-bg) !important;
+    border-right: 1px solid var(--sidebar-border) !important;
+    box-shadow: var(--shadow-light) !important;
+    overflow: hidden !important;
+    padding: 0 !important;
+    transition: var(--sidebar-transition) !important;
+}
+
+[data-testid="stSidebar"]:hover {
+    width: var(--sidebar-width-expanded) !important;
+    min-width: var(--sidebar-width-expanded) !important;
+    max-width: var(--sidebar-width-expanded) !important;
+    box-shadow: var(--shadow-medium) !important;
+    overflow-y: auto !important;
+}
+
+[data-testid="stSidebar"] > div {
+    width: var(--sidebar-width-expanded) !important;
+    padding: 12px 8px !important;
+    height: 100vh !important;
+    overflow: hidden !important;
+}
+
+[data-testid="stSidebar"]:hover > div {
+    overflow-y: auto !important;
+    padding: 16px 12px !important;
+}
+
+/* En-tête de la sidebar */
+[data-testid="stSidebar"] h2 {
+    font-size: 0 !important;
+    margin: 0 0 20px 0 !important;
+    padding: 12px 0 !important;
+    border-bottom: 1px solid var(--sidebar-border) !important;
+    text-align: center !important;
+    transition: all 0.3s ease !important;
+    position: relative !important;
+    height: 60px !important;
+    display: flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+}
+
+[data-testid="stSidebar"] h2::before {
+    content: "🧠" !important;
+    font-size: 28px !important;
+    display: block !important;
+    margin: 0 !important;
+}
+
+[data-testid="stSidebar"]:hover h2 {
+    font-size: 1.4rem !important;
+    color: var(--primary) !important;
+    font-weight: 600 !important;
+}
+
+[data-testid="stSidebar"]:hover h2::before {
+    font-size: 20px !important;
+    margin-right: 8px !important;
+}
+
+/* Options de navigation */
+[data-testid="stSidebar"] .stRadio {
+    padding: 0 !important;
+    margin: 0 !important;
+}
+
+[data-testid="stSidebar"] .stRadio > div {
+    display: flex !important;
+    flex-direction: column !important;
+    gap: 4px !important;
+    padding: 0 !important;
+}
+
+[data-testid="stSidebar"] .stRadio label {
+    display: flex !important;
+    align-items: center !important;
+    padding: 10px 6px !important;
+    margin: 0 !important;
+    border-radius: 8px !important;
+    transition: all 0.3s ease !important;
+    cursor: pointer !important;
+    position: relative !important;
+    height: 44px !important;
+    overflow: hidden !important;
+    background: transparent !important;
+}
+
+[data-testid="stSidebar"] .stRadio label > div:first-child {
+    display: none !important;
+}
+
+[data-testid="stSidebar"] .stRadio label span {
+    font-size: 0 !important;
+    transition: all 0.3s ease !important;
+    width: 100% !important;
+    text-align: center !important;
+    position: relative !important;
+}
+
+[data-testid="stSidebar"] .stRadio label span::before {
+    font-size: 22px !important;
+    display: block !important;
+    width: 100% !important;
+    text-align: center !important;
+}
+
+/* Icônes pour chaque option */
+[data-testid="stSidebar"] .stRadio label:nth-child(1) span::before { content: "🏠" !important; }
+[data-testid="stSidebar"] .stRadio label:nth-child(2) span::before { content: "📝" !important; }
+[data-testid="stSidebar"] .stRadio label:nth-child(3) span::before { content: "📊" !important; }
+[data-testid="stSidebar"] .stRadio label:nth-child(4) span::before { content: "ℹ️" !important; }
+
+/* Mode étendu */
+[data-testid="stSidebar"]:hover .stRadio label span {
+    font-size: 14px !important;
+    font-weight: 500 !important;
+    text-align: left !important;
+    padding-left: 12px !important;
+}
+
+[data-testid="stSidebar"]:hover .stRadio label span::before {
+    font-size: 18px !important;
+    position: absolute !important;
+    left: -8px !important;
+    top: 50% !important;
+    transform: translateY(-50%) !important;
+    width: auto !important;
+}
+
+/* Effets de survol */
+[data-testid="stSidebar"] .stRadio label:hover {
+    background: linear-gradient(135deg, #f8f9fa, #e9ecef) !important;
+    transform: translateX(3px) !important;
+    box-shadow: var(--shadow-light) !important;
+}
+
+[data-testid="stSidebar"] .stRadio label[data-checked="true"] {
+    background: linear-gradient(135deg, var(--secondary), #2980b9) !important;
+    color: white !important;
+    box-shadow: var(--shadow-medium) !important;
+}
+
+/* Contenu principal */
+.main .block-container {
+    margin-left: calc(var(--sidebar-width-collapsed) + 16px) !important;
+    padding: 1.5rem !important;
+    max-width: calc(100vw - var(--sidebar-width-collapsed) - 32px) !important;
+    transition: var(--sidebar-transition) !important;
+}
+
+/* Boutons stylisés */
+.stButton > button {
+    background: linear-gradient(135deg, var(--secondary), #2980b9) !important;
+    color: white !important;
+    border-radius: 8px !important;
+    border: none !important;
+    padding: 10px 20px !important;
+    font-weight: 500 !important;
+    transition: all 0.3s ease !important;
+    box-shadow: var(--shadow-light) !important;
+}
+
+.stButton > button:hover {
+    transform: translateY(-2px) !important;
+    box-shadow: var(--shadow-medium) !important;
+    background: linear-gradient(135deg, #2980b9, var(--secondary)) !important;
+}
+
+/* Cards d'information */
+.info-card {
+    background: white;
+    border-radius: 15px;
+    padding: 25px;
+    margin: 15px 0;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.08);
+    border-left: 4px solid #3498db;
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+}
+
+.info-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+}
+
+/* Questions du test */
+.question-card {
+    background: white;
+    border-radius: 12px;
+    padding: 20px;
+    margin: 10px 0;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    border-left: 4px solid #2ecc71;
+}
+
+/* Cartes de résultats (gabarits de neo_core.templates) */
+.results-header {
+    background: linear-gradient(90deg, #27ae60, #2ecc71);
+    padding: 40px 25px;
+    border-radius: 20px;
+    margin-bottom: 35px;
+    text-align: center;
+}
+
+.results-header h1 {
+    color: white;
+    font-size: 2.8rem;
+    margin-bottom: 15px;
+    text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+    font-weight: 600;
+}
+
+.results-header p {
+    color: rgba(255,255,255,0.95);
+    font-size: 1.3rem;
+    max-width: 800px;
+    margin: 0 auto;
+    line-height: 1.6;
+}
+
+.info-card h4, .info-card h5 {
+    color: #2c3e50;
+    margin-top: 0;
+}
+
+.info-card .info-text, .info-card .info-lines {
+    color: #34495e;
+    line-height: 1.6;
+}
+
+.info-card .info-text.large {
+    line-height: 1.8;
+    font-size: 1.1rem;
+}
+
+.dimension-header {
+    color: white;
+    padding: 30px;
+    border-radius: 15px;
+    margin-bottom: 25px;
+}
+
+.dimension-header.eleve { background: linear-gradient(135deg, #e74c3c, #e74c3cdd); }
+.dimension-header.moyen { background: linear-gradient(135deg, #f39c12, #f39c12dd); }
+.dimension-header.faible { background: linear-gradient(135deg, #3498db, #3498dbdd); }
+
+.dimension-header h2 {
+    margin: 0 0 15px 0;
+    font-size: 2rem;
+}
+
+.dimension-header h3 {
+    margin: 0;
+    font-size: 1.5rem;
+}
+
+.dimension-header p {
+    margin: 5px 0 0 0;
+    font-size: 1.1rem;
+}
+
+.dimension-level {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.dimension-percentile {
+    font-size: 3rem;
+    opacity: 0.7;
+}
+
+.result-card {
+    padding: 15px;
+    border-radius: 8px;
+    margin: 10px 0;
+    border-left: 4px solid #3498db;
+}
+
+.result-card p {
+    margin: 0;
+    line-height: 1.5;
+}
+
+.result-card h5 {
+    color: #2c3e50;
+    margin: 0 0 8px 0;
+}
+
+.result-card.force { background: #d4edda; border-left-color: #28a745; }
+.result-card.force p { color: #155724; }
+.result-card.defi { background: #fff3cd; border-left-color: #ffc107; }
+.result-card.defi p { color: #856404; }
+.result-card.tip { background: #e8f4fd; }
+.result-card.tip p { color: #2c3e50; }
+.result-card.development { background: #f0f8ff; border-left-color: #4169e1; }
+.result-card.development p { color: #1e3a8a; }
+.result-card.facet { background: #f8f9fa; }
+.result-card.facet p { color: #6c757d; font-size: 0.95rem; line-height: normal; }
+
+/* Colonnes des pages pré-rendues (équivalent HTML de st.columns) */
+.static-columns {
+    display: grid;
+    grid-template-columns: repeat(var(--columns), minmax(0, 1fr));
+    gap: 1rem;
+}
+
+/* Responsive */
+@media (max-width: 640px) {
+    .static-columns { grid-template-columns: minmax(0, 1fr); }
+}
+
+@media (max-width: 768px) {
+    [data-testid="stSidebar"] {
+        transform: translateX(-100%) !important;
+    }
+
+    [data-testid="stSidebar"]:hover {
+        transform: translateX(0) !important;
+        width: 280px !important;
+        min-width: 280px !important;
+        max-width: 280px !important;
+    }
+
+    .main .block-container {
+        margin-left: 0 !important;
+        max-width: 100vw !important;
+        padding: 1rem !important;
+    }
+}
+</style>
+""")
+
+def set_custom_theme():
+    """Applique le thème personnalisé (feuille de style renvoyée à chaque réexécution)"""
+    st.markdown(THEME_CSS, unsafe_allow_html=True)
+
+def static_columns(*cells):
+    """Colonnes de largeur égale en HTML, pour le contenu pré-rendu"""
+    return (f'<div class="static-columns" style="--columns: {len(cells)}">'
+            + "".join(f"<div>{cell}</div>" for cell in cells) + "</div>")
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Chien de garde des réexécutions : budget de temps par réexécution et détection des appels bloquants
+Un thread de surveillance par processus relève la pile de toute réexécution qui dépasse son budget,
+pendant qu'elle s'exécute encore : le journal montre où elle est bloquée, pas seulement qu'elle a été lente.
+Une réexécution ne peut pas être interrompue sans risque : le budget est signalé, pas imposé par la force.
+
+Variables d'environnement :
+- NEO_PIR_RERUN_BUDGET_MS : budget par réexécution en millisecondes (1000 par défaut, 0 désactive)
+- NEO_PIR_DEBUG_BLOCKING : 1 pour signaler les primitives bloquantes appelées sur le thread du script
+  (time.sleep, dérivations de clés, ouvertures de fichiers, connexions réseau et SQLite, sous-processus)
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+
+from .common import logger
+
+BUDGET = float(os.environ.get('NEO_PIR_RERUN_BUDGET_MS', 1000)) / 1000
+DEBUG_BLOCKING = os.environ.get('NEO_PIR_DEBUG_BLOCKING', "") not in ("", "0")
+
+STACK_TAIL = 10
+# Période de surveillance : une réexécution lente est signalée au plus tard 1/4 de budget après
+POLL_FRACTION = 0.25
+
+# Événements d'audit (sys.addaudithook) considérés comme bloquants sur le thread du script
+BLOCKING_EVENTS = {'time.sleep', 'open', 'socket.connect', 'socket.getaddrinfo', 'sqlite3.connect',
+                   'subprocess.Popen', 'urllib.Request'}
+# Ouvertures de fichiers ignorées : imports de modules et fichiers de l'environnement Python
+IGNORED_OPEN_SUFFIXES = ('.py', '.pyc', '.so', '.pyd', '.pth', '.typed')
+
+class Rerun:
+    """Réexécution en cours sur un thread du script"""
+
+    def __init__(self, thread_id):
+        self.thread_id = thread_id
+        self.start = time.perf_counter()
+        self.page = None
+        self.reported = False
+
+_active = {}  # identifiant du thread du script -> Rerun
+_lock = threading.Lock()
+_monitor = None
+_flagged = set()  # (primitive, emplacement) déjà signalés
+
+def _is_application(filename):
+    """Fichier de l'application (ni bibliothèque installée, ni module figé de l'interpréteur)"""
+    return not filename.startswith(('<', sys.prefix, sys.base_prefix))
+
+def _stack(frame):
+    """Pile lisible : toutes les frames de l'application, puis les STACK_TAIL frames les plus récentes"""
+    summary = traceback.extract_stack(frame)
+    lines, skipped = [], 0
+    for position, entry in enumerate(summary):
+        if _is_application(entry.filename) or position >= len(summary) - STACK_TAIL:
+            if skipped:
+                lines.append(f"  ... {skipped} frames ...\n")
+                skipped = 0
+            lines.extend(traceback.format_list([entry]))
+        else:
+            skipped += 1
+    return "".join(lines)
+
+def _monitor_loop():
+    while True:
+        time.sleep(BUDGET * POLL_FRACTION)
+        now = time.perf_counter()
+        with _lock:
+            late = [rerun for rerun in _active.values() if not rerun.reported and now - rerun.start > BUDGET]
+        if not late:
+            continue
+        frames = sys._current_frames()
+        for rerun in late:
+            rerun.reported = True
+            frame = frames.get(rerun.thread_id)
+            logger.warning("Réexécution au-delà du budget (%s, %.0f ms > %.0f ms), pile actuelle :\n%s",
+                           rerun.page or "page inconnue", (now - rerun.start) * 1000, BUDGET * 1000,
+                           _stack(frame) if frame is not None else "(thread terminé)")
+
+def _start_monitor():
+    global _monitor
+    with _lock:
+        if _monitor is None:
+            _monitor = threading.Thread(target=_monitor_loop, name="neo-pir-watchdog", daemon=True)
+            _monitor.start()
+
+@contextmanager
+def watch_rerun():
+    """Surveille la réexécution du thread courant ; renseigner `page` une fois la page connue"""
+    if BUDGET <= 0 and not DEBUG_BLOCKING:
+        yield Rerun(None)
+        return
+    if BUDGET > 0:
+        _start_monitor()
+    rerun = Rerun(threading.get_ident())
+    with _lock:
+        _active[rerun.thread_id] = rerun
+    try:
+        yield rerun
+    finally:
+        with _lock:
+            _active.pop(rerun.thread_id, None)
+        elapsed = time.perf_counter() - rerun.start
+        if BUDGET > 0 and elapsed > BUDGET:
+            logger.warning("Réexécution lente : %s, %.0f ms (budget %.0f ms)",
+                           rerun.page or "page inconnue", elapsed * 1000, BUDGET * 1000)
+
+# ================= DÉTECTION DES APPELS BLOQUANTS (DÉBOGAGE) =================
+
+def _caller():
+    """Premier emplacement appelant dans l'application, hors de ce module"""
+    for frame, lineno in traceback.walk_stack(sys._getframe(2)):
+        filename = frame.f_code.co_filename
+        if filename != __file__ and _is_application(filename):
+            return f"{filename}:{lineno}"
+    return "?"
+
+def _flag(primitive, detail=""):
+    """Signale une primitive bloquante sur le thread d'une réexécution (une fois par emplacement)"""
+    rerun = _active.get(threading.get_ident())
+    if rerun is None:
+        return
+    location = _caller()
+    if (primitive, location) in _flagged:
+        return
+    _flagged.add((primitive, location))
+    logger.warning("Appel bloquant sur le thread du script (%s) : %s%s depuis %s",
+                   rerun.page or "page inconnue", primitive, f" {detail}" if detail else "", location)
+
+def _audit(event, args):
+    if event not in BLOCKING_EVENTS or threading.get_ident() not in _active:
+        return
+    if event == 'open':
+        path = str(args[0])
+        if path.endswith(IGNORED_OPEN_SUFFIXES) or path.startswith((sys.prefix, sys.base_prefix)):
+            return
+        _flag("open", path)
+    elif event == 'time.sleep':
+        _flag("time.sleep", f"({args[0]} s)")
+    else:
+        _flag(event)
+
+def _wrap_blocking(owner, name, label):
+    """Remplace une fonction bloquante sans événement d'audit par une version qui la signale"""
+    original = getattr(owner, name)
+
+    def wrapper(*args, **kwargs):
+        _flag(label)
+        return original(*args, **kwargs)
+
+    wrapper.__wrapped__ = original
+    setattr(owner, name, wrapper)
+
+def install_blocking_detector():
+    """Installe le crochet d'audit et les enveloppes (irréversible : mode débogage uniquement)"""
+    from neo_core import security
+
+    sys.addaudithook(_audit)
+    _wrap_blocking(hashlib, 'pbkdf2_hmac', "hashlib.pbkdf2_hmac")
+    _wrap_blocking(hashlib, 'scrypt', "hashlib.scrypt")
+    # Dérivation PBKDF2 de cryptography (classe native) : signalée à la construction
+    _wrap_blocking(security, 'PBKDF2HMAC', "PBKDF2HMAC (cryptography)")
+
+if DEBUG_BLOCKING:
+    install_blocking_detector()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Lecture de l'archive Parquet des réponses (neo_core.response_archive)
+Écrit des passations synthétiques réparties sur plusieurs jours, puis mesure :
+- la lecture des 12 items d'un domaine contre la lecture de toutes les colonnes (élagage des colonnes) ;
+- une lecture limitée à un jour (élagage des partitions) et un filtre sur un percentile (pushdown) ;
+- la même lecture d'un domaine depuis un CSV (pandas, usecols) ;
+- la lecture de centaines de petits fichiers avant et après compactage.
+
+Usage : python benchmarks/archive_scan.py [--rows 10000000] [--days 10] [--csv-rows 1000000]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from neo_core.item_banks import get_registry  # noqa: E402
+from neo_core.response_archive import (PSEUDONYM_BYTES, build_table, compact, dimension_items,  # noqa: E402
+                                       scan, write_table)
+
+CHUNK_ROWS = 1000000
+FIRST_DAY = date(2026, 1, 1)
+
+def synthetic_table(item_bank, rows, day, rng):
+    """Lot de passations d'un jour : réponses 1-5 uniformes, pseudonymes aléatoires"""
+    respondents = [bytes(r) for r in rng.integers(0, 256, (rows, PSEUDONYM_BYTES), dtype=np.uint8)]
+    completed_at = (np.datetime64(day, 'ms')
+                    + rng.integers(0, 86400 * 1000, rows).astype('timedelta64[ms]'))
+    responses = rng.integers(1, 6, (rows, len(item_bank)), dtype=np.int8)
+    return build_table(item_bank, respondents, completed_at, responses)
+
+def populate(root, item_bank, rows, days, rng):
+    """Écrit `rows` passations réparties sur `days` jours, par lots de CHUNK_ROWS"""
+    per_day = rows // days
+    for d in range(days):
+        day = FIRST_DAY + timedelta(days=d)
+        for start in range(0, per_day, CHUNK_ROWS):
+            table = synthetic_table(item_bank, min(CHUNK_ROWS, per_day - start), day, rng)
+            write_table(root, item_bank.bank, table)
+    return per_day * days
+
+def directory_size(root):
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(root) for f in files)
+
+def timed(function, repeat=3):
+    """Meilleur temps sur `repeat` exécutions, et le dernier résultat"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def row(label, seconds, table):
+    print(f"| {label} | {table.num_rows:,} | {table.num_columns} | {table.nbytes / 1e6:.0f} | {seconds * 1000:.0f} |")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lecture de l'archive Parquet des réponses")
+    parser.add_argument("--rows", type=int, default=10000000)
+    parser.add_argument("--days", type=int, default=10)
+    parser.add_argument("--csv-rows", type=int, default=1000000, help="passations du CSV de comparaison")
+    parser.add_argument("--small-files", type=int, default=500, help="petits fichiers avant compactage")
+    args = parser.parse_args()
+
+    item_bank = get_registry().get()
+    bank = item_bank.bank
+    rng = np.random.default_rng(0)
+    workdir = tempfile.mkdtemp(prefix="neo_archive_")
+    try:
+        root = os.path.join(workdir, "archive")
+        start = time.perf_counter()
+        rows = populate(root, item_bank, args.rows, args.days, rng)
+        print(f"Écriture : {rows:,} passations en {time.perf_counter() - start:.1f} s, "
+              f"{directory_size(root) / 1e6:.0f} Mo sur disque\n")
+
+        first_day = FIRST_DAY.isoformat()
+        print("| Lecture | Lignes | Colonnes | Mo décodés | Temps (ms) |")
+        print("|---|---|---|---|---|")
+        row("Toutes les colonnes", *timed(lambda: scan(root, bank), repeat=1))
+        row("Domaine N (12 items + score brut)", *timed(lambda: scan(root, bank, dimension='N')))
+        row(f"Domaine N, un jour ({first_day})",
+            *timed(lambda: scan(root, bank, dimension='N', start=first_day, end=first_day)))
+        row("Pseudonymes avec percentile N ≥ 95",
+            *timed(lambda: scan(root, bank, columns=['respondent'], where=ds.field('pct:N') >= 95)))
+
+        csv_path = os.path.join(workdir, "responses.csv")
+        csv_table = scan(root, bank, columns=list(item_bank.item_ids), start=first_day, end=first_day)
+        csv_table.slice(0, args.csv_rows).to_pandas().to_csv(csv_path, index=False)
+        items = dimension_items(bank, 'N')
+        seconds, df = timed(lambda: pd.read_csv(csv_path, usecols=items, dtype='int8'), repeat=1)
+        parquet_seconds, day_table = timed(lambda: scan(root, bank, dimension='N', start=first_day, end=first_day))
+        print(f"\nDomaine N, par passation : CSV avec usecols {seconds / len(df) * 1e9:.0f} ns "
+              f"({len(df):,} passations, {os.path.getsize(csv_path) / 1e6:.0f} Mo), "
+              f"Parquet {parquet_seconds / day_table.num_rows * 1e9:.0f} ns ({day_table.num_rows:,} passations)")
+
+        small_root = os.path.join(workdir, "small")
+        per_file = 1000
+        for i in range(args.small_files):
+            table = synthetic_table(item_bank, per_file, FIRST_DAY + timedelta(days=i % 2), rng)
+            write_table(small_root, bank, table)
+        before, _ = timed(lambda: scan(small_root, bank, dimension='N'))
+        start = time.perf_counter()
+        merged = compact(small_root, bank)
+        compaction = time.perf_counter() - start
+        after, table = timed(lambda: scan(small_root, bank, dimension='N'))
+        print(f"\nCompactage : {args.small_files} fichiers de {per_file} passations ({table.num_rows:,} en tout), "
+              f"domaine N {before * 1000:.0f} ms avant, {after * 1000:.0f} ms après "
+              f"({merged} fichiers fusionnés en {compaction:.1f} s)")
+    finally:
+        shutil.rmtree(workdir)
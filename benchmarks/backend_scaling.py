@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Test de charge multi-processus du backend d'état partagé (neo_core.session_store)
+Chaque processus reprend des sessions créées par un autre processus, comme derrière un répartiteur
+sans affinité, et rejoue une passation complète : 60 réexécutions (lecture, réponse, écriture) puis cotation.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from neo_core import NEOPIRManager  # noqa: E402
+from neo_core.session_store import create_backend  # noqa: E402
+
+def new_state():
+    """État initial d'une session, tel que l'enregistre l'application"""
+    return {
+        'tool_choice': "📝 Passer le Test",
+        'test_started': True,
+        'test_completed': False,
+        'responses': {},
+        'current_question': 0,
+        'scores': {},
+        'interpretations': {},
+        'adaptive_mode': False,
+        'adaptive_session': None,
+        'item_bank': ['neo_pir_short', 'fr'],
+        'session_start': '2026-01-01T00:00:00'
+    }
+
+def create_sessions(url, session_ids):
+    """Crée les sessions (phase d'arrivée des utilisateurs)"""
+    backend = create_backend(url)
+    for session_id in session_ids:
+        backend.save_session(session_id, new_state())
+
+def run_sessions(url, session_ids, seed):
+    """Rejoue des passations complètes ; retourne (début, fin, réexécutions)"""
+    backend = create_backend(url)
+    manager = NEOPIRManager()
+    reruns = 0
+
+    start = time.perf_counter()
+    for n, session_id in enumerate(session_ids):
+        for i, question in enumerate(manager.questions):
+            state = backend.load_session(session_id)
+            state['responses'][question['id']] = (seed + n + i) % 5 + 1
+            state['current_question'] = i + 1
+            backend.save_session(session_id, state)
+            reruns += 1
+
+        state = backend.load_session(session_id)
+        scores, facet_scores, percentiles = manager.calculate_scores(state['responses'])
+        state.update(scores=scores, facet_scores=facet_scores, percentiles=percentiles,
+                     interpretations=manager.get_interpretation(percentiles), test_completed=True)
+        backend.save_session(session_id, state)
+        backend.save_result(session_id, {'scores': scores, 'percentiles': percentiles})
+        reruns += 1
+    return start, time.perf_counter(), reruns
+
+def run(processes, users_per_process, directory):
+    """Un scénario : `processes` processus servent chacun `users_per_process` utilisateurs"""
+    url = f"sqlite:///{os.path.join(directory, f'state_{processes}.db')}"
+    create_backend(url)
+
+    ctx = multiprocessing.get_context('spawn')
+    shards = [[f"p{p}-u{u}" for u in range(users_per_process)] for p in range(processes)]
+    with ctx.Pool(processes) as pool:
+        pool.starmap(create_sessions, [(url, shard) for shard in shards])
+        # Le processus p sert les utilisateurs arrivés sur le processus p+1
+        results = pool.starmap(run_sessions, [
+            (url, shards[(p + 1) % processes], p) for p in range(processes)
+        ])
+
+    elapsed = max(end for _, end, _ in results) - min(start for start, _, _ in results)
+    reruns = sum(r for _, _, r in results)
+
+    # Vérification : chaque session est terminée, avec ses 60 réponses, quel que soit le processus
+    backend = create_backend(url)
+    for shard in shards:
+        for session_id in shard:
+            state = backend.load_session(session_id)
+            assert state['test_completed'] and len(state['responses']) == 60
+            assert backend.load_result(session_id) is not None
+
+    return {
+        'sessions_per_s': processes * users_per_process / elapsed,
+        'reruns_per_s': reruns / elapsed
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Montée en charge multi-processus du backend SQLite")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--users", type=int, default=100, help="utilisateurs par processus")
+    args = parser.parse_args()
+
+    print(f"CPU disponibles : {os.cpu_count()}\n")
+    print("| Processus | Sessions complètes/s | Réexécutions/s | Accélération | Efficacité |")
+    print("|---|---|---|---|---|")
+    with tempfile.TemporaryDirectory() as directory:
+        baseline = None
+        for processes in args.processes:
+            result = run(processes, args.users, directory)
+            # Référence : débit par processus du premier scénario
+            baseline = baseline or result['sessions_per_s'] / processes
+            speedup = result['sessions_per_s'] / baseline
+            print(f"| {processes} | {result['sessions_per_s']:.1f} | {result['reruns_per_s']:.0f} | "
+                  f"{speedup:.2f}x | {speedup / processes:.0%} |")
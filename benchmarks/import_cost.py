@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Coût d'import du cœur métier (neo_core) comparé au module Streamlit complet
+Chaque mesure s'exécute dans un processus neuf : temps d'import et RSS maximal
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'modules': len(sys.modules)
+}}))
+"""
+
+CASES = [
+    ("Interpréteur seul", "pass"),
+    ("neo_core", "import neo_core"),
+    ("neo_core + NEOPIRManager()", "import neo_core; neo_core.NEOPIRManager()"),
+    ("Module Streamlit (NEO PI-R.py)",
+     "import importlib.util; "
+     "spec = importlib.util.spec_from_file_location('app', {app!r}); "
+     "module = importlib.util.module_from_spec(spec); spec.loader.exec_module(module)"),
+]
+
+def measure(statement, runs=5):
+    """Médiane du temps d'import et RSS maximal sur plusieurs processus neufs"""
+    app = os.path.join(ROOT, "NEO PI-R.py")
+    code = PROBE.format(root=ROOT, statement=statement.format(app=app))
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    results.sort(key=lambda r: r['seconds'])
+    return results[len(results) // 2]
+
+if __name__ == "__main__":
+    print("| Import | Temps (ms, médiane) | RSS max (Mo) | Modules chargés |")
+    print("|---|---|---|---|")
+    for name, statement in CASES:
+        result = measure(statement)
+        print(f"| {name} | {result['seconds'] * 1000:.0f} | {result['max_rss_mb']:.0f} | {result['modules']} |")
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Test de charge de l'application Streamlit : utilisateurs simulés avec AppTest
+Chaque utilisateur passe par l'accueil, répond aux 60 items (avec retours en arrière),
+ouvre les résultats et parcourt l'analyse par dimension. Par défaut, les réponses passent par les
+boutons « réponse en un clic » ; --radio reprend le bouton radio suivi de « Question suivante ».
+
+AppTest n'est pas utilisable depuis plusieurs threads d'un même processus : chaque processus
+de charge entrelace donc les interactions de ses utilisateurs dans une file d'attente unique,
+comme un serveur dont les réexécutions se partagent un cœur. La latence mesurée va de la demande
+d'interaction à la fin de la réexécution (attente incluse). Plusieurs processus simulent plusieurs répliques.
+"""
+
+import argparse
+import heapq
+import multiprocessing
+import os
+import random
+import resource
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "NEO PI-R.py")
+
+DIMENSIONS = ['N', 'E', 'O', 'A', 'C']
+
+class SimulatedUser:
+    """Un utilisateur : génère ses interactions une par une (chacune provoque une réexécution)"""
+
+    def __init__(self, seed, back_probability=0.1, timeout=120, quick_answer=True):
+        from streamlit.testing.v1 import AppTest
+
+        self.app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.rng = random.Random(seed)
+        self.back_probability = back_probability
+        self.quick_answer = quick_answer
+
+    def _button(self, *labels):
+        return next(b for b in self.app.button if any(label in b.label for label in labels))
+
+    def interactions(self):
+        """Générateur d'actions ; chaque action est exécutée par l'ordonnanceur du processus"""
+        app = self.app
+        yield app.run
+        yield lambda: self._button("Commencer le Test").click().run()
+        if not self.quick_answer:
+            toggle = next(t for t in app.toggle if "Réponse en un clic" in t.label)
+            yield lambda: toggle.set_value(False).run()
+
+        question = 0
+        while not app.session_state.test_completed:
+            if self.quick_answer:
+                # Un clic enregistre la réponse et affiche la question suivante
+                answers = [b for b in app.button if b.key and b.key.startswith("answer_")]
+                answer = answers[self.rng.randrange(len(answers))]
+                yield lambda: answer.click().run()
+            else:
+                radio = next(r for r in app.radio if r.key and r.key.startswith("question_"))
+                yield lambda: radio.set_value(radio.options[self.rng.randrange(5)]).run()
+
+            if question > 0 and self.rng.random() < self.back_probability:
+                yield lambda: self._button("Question précédente").click().run()
+                yield lambda: self._button("Question suivante").click().run()
+
+            # Dernier item : la réponse n'avance pas, « Terminer le test » devient actif
+            if not self.quick_answer or any("Terminer le test" in b.label and not b.disabled for b in app.button):
+                yield lambda: self._button("Question suivante", "Terminer le test").click().run()
+            question += 1
+
+        # Page des résultats : les onglets sont rendus côté client, seul le sélecteur provoque une réexécution
+        for dim in self.rng.sample(DIMENSIONS, len(DIMENSIONS)):
+            yield lambda: app.selectbox(key="dimension_selector").set_value(dim).run()
+
+def run_users(users, think_time=0.0, seed=0):
+    """Ordonnanceur : exécute les interactions prêtes dans l'ordre d'arrivée
+
+    Retourne (latences en s, sessions terminées, erreurs).
+    """
+    rng = random.Random(seed)
+    latencies, errors, completed = [], [], 0
+    now = time.perf_counter()
+    # Les arrivées sont étalées sur le premier temps de réflexion
+    queue = [(now + rng.uniform(0, think_time), i, user.interactions()) for i, user in enumerate(users)]
+    heapq.heapify(queue)
+
+    while queue:
+        ready, i, steps = heapq.heappop(queue)
+        delay = ready - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            action = next(steps)
+            action()
+            if users[i].app.exception:
+                raise RuntimeError(users[i].app.exception[0].message)
+        except StopIteration:
+            completed += 1
+            continue
+        except Exception as e:
+            errors.append(repr(e))
+            continue
+        end = time.perf_counter()
+        latencies.append(end - ready)
+        pause = rng.expovariate(1.0 / think_time) if think_time else 0.0
+        heapq.heappush(queue, (end + pause, i, steps))
+
+    return latencies, completed, errors
+
+def current_rss_mb():
+    """Mémoire résidente actuelle du processus (Linux), sinon le maximum atteint"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_worker(worker_id, users, back_probability, think_time, quick_answer=True):
+    """Processus de charge : `users` sessions concurrentes ; retourne latences, CPU et mémoire"""
+    # Échauffement hors mesure : imports, caches de ressources, banque d'items
+    run_users([SimulatedUser(seed=-1 - worker_id, back_probability=0, quick_answer=quick_answer)])
+    baseline_rss = current_rss_mb()
+
+    sessions = [SimulatedUser(worker_id * 100000 + i, back_probability, quick_answer=quick_answer)
+                for i in range(users)]
+
+    cpu_start = sum(os.times()[:2])
+    wall_start = time.perf_counter()
+    latencies, completed, errors = run_users(sessions, think_time, seed=worker_id)
+    wall = time.perf_counter() - wall_start
+    cpu = sum(os.times()[:2]) - cpu_start
+
+    # Les sessions sont encore référencées : l'écart de RSS est la mémoire qu'elles retiennent
+    return {
+        'latencies': latencies,
+        'completed': completed,
+        'errors': errors[:5],
+        'cpu': cpu,
+        'wall': wall,
+        'rss_per_session_mb': (current_rss_mb() - baseline_rss) / users
+    }
+
+def run_scenario(processes, users, back_probability, think_time, quick_answer=True):
+    """Lance `processes` processus de `users` utilisateurs concurrents et agrège les mesures"""
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(processes) as pool:
+        results = pool.starmap(run_worker, [(p, users, back_probability, think_time, quick_answer)
+                                            for p in range(processes)])
+
+    latencies = np.array([latency for r in results for latency in r['latencies']]) * 1000
+    completed = sum(r['completed'] for r in results)
+    return {
+        'users': processes * users,
+        'completed': completed,
+        'errors': [e for r in results for e in r['errors']],
+        'reruns': latencies.size,
+        'p50': np.percentile(latencies, 50),
+        'p95': np.percentile(latencies, 95),
+        'p99': np.percentile(latencies, 99),
+        'tests_per_min': completed / max(r['wall'] for r in results) * 60,
+        'cpu_per_test': sum(r['cpu'] for r in results) / max(1, completed),
+        'rss_per_session_mb': np.mean([r['rss_per_session_mb'] for r in results])
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test de charge de l'application Streamlit (AppTest)")
+    parser.add_argument("--processes", type=int, default=1, help="processus de charge (répliques simulées)")
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 10, 50],
+                        help="utilisateurs concurrents par processus (un scénario par valeur)")
+    parser.add_argument("--back", type=float, default=0.1, help="probabilité de retour en arrière par item")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="temps de réflexion moyen entre interactions")
+    parser.add_argument("--radio", action="store_true", help="réponses par bouton radio + « Question suivante »")
+    args = parser.parse_args()
+
+    print(f"CPU disponibles : {os.cpu_count()}, processus de charge : {args.processes}\n")
+    print("| Utilisateurs concurrents | Tests terminés | Réexécutions | p50 (ms) | p95 (ms) | p99 (ms) "
+          "| Tests/min | CPU par test (s) | Mémoire par session (Mo) |")
+    print("|---|---|---|---|---|---|---|---|---|")
+    for users in args.users:
+        result = run_scenario(args.processes, users, args.back, args.think_ms / 1000, quick_answer=not args.radio)
+        print(f"| {result['users']} | {result['completed']} | {result['reruns']} | {result['p50']:.0f} | "
+              f"{result['p95']:.0f} | {result['p99']:.0f} | {result['tests_per_min']:.1f} | "
+              f"{result['cpu_per_test']:.2f} | {result['rss_per_session_mb']:.2f} |")
+        for error in result['errors']:
+            print(f"  erreur : {error}")
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Test de charge du service de cotation (scoring_service.py) sur localhost
+Mesure latences et débit pour des requêtes unitaires et des lots
+"""
+
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def wait_for_service(port, timeout=120):
+    """Attend que le service réponde sur /health"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("Le service de cotation n'a pas démarré")
+
+def get_json(port, path):
+    """Requête GET JSON"""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.request("GET", path)
+    return json.loads(conn.getresponse().read())
+
+def run_clients(port, clients, requests_per_client, batch_size, seed=0, details=False):
+    """Lance des clients concurrents (connexions persistantes) ; retourne latences et durée"""
+    rng = np.random.default_rng(seed)
+    latencies = []
+    lock = threading.Lock()
+
+    def client(client_id):
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        local = []
+        for _ in range(requests_per_client):
+            vectors = rng.integers(1, 6, size=(batch_size, 60)).tolist()
+            payload = {'responses': vectors if batch_size > 1 else vectors[0]}
+            if details:
+                payload['details'] = True
+            body = json.dumps(payload).encode()
+            start = time.perf_counter()
+            conn.request("POST", "/score", body, {"Content-Type": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            local.append(time.perf_counter() - start)
+            if response.status != 200:
+                raise RuntimeError(f"Statut inattendu : {response.status}")
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.array(latencies) * 1000, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Test de charge du service de cotation")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--requests", type=int, default=200, help="requêtes par client")
+    parser.add_argument("--details", action="store_true",
+                        help="demande aussi percentiles des facettes et intervalles de confiance")
+    args = parser.parse_args()
+
+    command = [sys.executable, os.path.join(ROOT, "scoring_service.py"), "--port", str(args.port)]
+    if args.workers:
+        command += ["--workers", str(args.workers)]
+    service = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    try:
+        started = time.perf_counter()
+        wait_for_service(args.port)
+        print(f"Démarrage à chaud du service : {time.perf_counter() - started:.1f} s\n")
+
+        print("| Scénario | Clients | Vecteurs/requête | p50 (ms) | p95 (ms) | p99 (ms) | Requêtes/s | Vecteurs/s | Taille moyenne des micro-lots |")
+        print("|---|---|---|---|---|---|---|---|---|")
+        for name, clients, batch_size, requests in [
+            ("Unitaire", 1, 1, args.requests),
+            ("Unitaire", 16, 1, args.requests),
+            ("Unitaire", 64, 1, args.requests // 2),
+            ("Lot", 4, 100, args.requests // 4),
+        ]:
+            before = get_json(args.port, "/metrics")
+            latencies, elapsed = run_clients(args.port, clients, requests, batch_size, details=args.details)
+            after = get_json(args.port, "/metrics")
+            batches = after['batches'] - before['batches']
+            vectors = after['vectors_scored'] - before['vectors_scored']
+            print(f"| {name} | {clients} | {batch_size} | "
+                  f"{np.percentile(latencies, 50):.2f} | {np.percentile(latencies, 95):.2f} | "
+                  f"{np.percentile(latencies, 99):.2f} | {len(latencies) / elapsed:.0f} | "
+                  f"{len(latencies) * batch_size / elapsed:.0f} | {vectors / max(1, batches):.1f} |")
+    finally:
+        service.terminate()
+        service.wait()
+
+if __name__ == "__main__":
+    main()
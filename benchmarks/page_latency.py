@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Démarrage à froid et latence de la première page, par page d'entrée (?page=)
+Chaque mesure s'exécute dans un processus neuf : import de Streamlit, première exécution du script
+(imports de l'application et de la page, rendu), puis des réexécutions à chaud (médiane). Le sondage
+relève aussi le Markdown envoyé et les bibliothèques lourdes présentes en mémoire après le premier rendu.
+
+Usage : python benchmarks/page_latency.py [--runs 5] [--reruns 20]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app_pages import PAGES  # noqa: E402
+
+HEAVY_MODULES = ['plotly.express', 'pandas', 'scipy', 'sklearn']
+
+PROBE = """
+import json, logging, resource, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+logging.disable(logging.WARNING)
+imported = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.query_params['page'] = {slug!r}
+at.run()
+first = time.perf_counter()
+assert not at.exception, at.exception
+reruns = []
+for _ in range({reruns}):
+    begin = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - begin)
+reruns.sort()
+print(json.dumps({{
+    'streamlit_s': imported - start,
+    'first_run_s': first - imported,
+    'rerun_s': reruns[len(reruns) // 2],
+    'markdown_kb': sum(len(element.body.encode('utf-8')) for element in at.markdown) / 1024,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'heavy': [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+def measure(slug, runs=5, reruns=20):
+    """Médiane de la première exécution sur plusieurs processus neufs"""
+    code = PROBE.format(root=ROOT, app=os.path.join(ROOT, "NEO PI-R.py"), slug=slug, heavy=HEAVY_MODULES,
+                        reruns=reruns)
+    env = dict(os.environ, NEO_PIR_STATE_BACKEND="memory")
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=ROOT, env=env)
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    results.sort(key=lambda r: r['first_run_s'])
+    return results[len(results) // 2]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latence de la première page par page d'entrée")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--reruns", type=int, default=20, help="réexécutions à chaud par processus (médiane)")
+    args = parser.parse_args()
+
+    print("| Page d'entrée | Import Streamlit (ms) | Première exécution (ms) | Démarrage à froid (ms) "
+          "| Réexécution (ms) | Markdown envoyé (Ko) | RSS max (Mo) | Bibliothèques lourdes chargées |")
+    print("|---|---|---|---|---|---|---|---|")
+    for label, (_, slug) in PAGES.items():
+        r = measure(slug, args.runs, args.reruns)
+        cold = r['streamlit_s'] + r['first_run_s']
+        print(f"| {label} | {r['streamlit_s'] * 1000:.0f} | {r['first_run_s'] * 1000:.0f} | {cold * 1000:.0f} "
+              f"| {r['rerun_s'] * 1000:.1f} | {r['markdown_kb']:.1f} | {r['max_rss_mb']:.0f} "
+              f"| {', '.join(r['heavy']) or '—'} |")
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Suivi longitudinal (neo_core.longitudinal) : lecture d'un historique et RCI d'une population
+- Historique d'un répondant dans un backend SQLite de plus en plus rempli : le temps de lecture
+  doit rester quasi constant (recherche par clé primaire (répondant, date)).
+- RCI entre passations successives de tous les répondants, en une passe vectorisée.
+
+Usage : python benchmarks/retest_changes.py [--histories 1000 10000 100000] [--population 2000000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from neo_core import NEOPIRManager  # noqa: E402
+from neo_core.longitudinal import history_changes, population_changes, user_key  # noqa: E402
+from neo_core.norms import SCALE_KEYS  # noqa: E402
+from neo_core.session_store import SQLiteBackend  # noqa: E402
+
+RETESTS = 3
+LOOKUPS = 1000
+
+def fill(backend, manager, users, rng):
+    """Enregistre RETESTS passations par répondant (résultats tirés au hasard)"""
+    responses = rng.integers(1, 6, (users * RETESTS, len(manager.item_bank)))
+    dimension_sums, facet_sums, percentiles = manager.calculate_scores_batch(responses)
+    conn = backend._connect()
+    conn.execute("BEGIN")
+    for row in range(users * RETESTS):
+        scores, facet_scores, dimension_percentiles = manager.scores_to_dicts(
+            dimension_sums[row], facet_sums[row], percentiles[row])
+        backend.save_history(user_key(f"user-{row // RETESTS}"), 1.7e9 + row, {
+            'item_bank': [manager.item_bank.bank, manager.item_bank.locale],
+            'scores': scores, 'facet_scores': facet_scores, 'percentiles': dimension_percentiles
+        })
+    conn.execute("COMMIT")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Historique et RCI des passations successives")
+    parser.add_argument("--histories", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="répondants enregistrés (3 passations chacun)")
+    parser.add_argument("--population", type=int, default=2000000, help="passations du calcul vectorisé")
+    args = parser.parse_args()
+
+    manager = NEOPIRManager()
+    rng = np.random.default_rng(0)
+
+    print("| Répondants | Passations | Lecture d'un historique (µs) | Historique + RCI (µs) |")
+    print("|---|---|---|---|")
+    with tempfile.TemporaryDirectory() as directory:
+        backend = SQLiteBackend(os.path.join(directory, "history.db"))
+        users = 0
+        for target in sorted(args.histories):
+            fill(backend, manager, target - users, rng)
+            users = target
+            keys = [user_key(f"user-{i}") for i in rng.integers(0, users, LOOKUPS)]
+            start = time.perf_counter()
+            histories = [backend.load_history(key) for key in keys]
+            lookup = (time.perf_counter() - start) / LOOKUPS
+            start = time.perf_counter()
+            for history in histories:
+                history_changes(history, manager.norms)
+            changes = (time.perf_counter() - start) / LOOKUPS
+            print(f"| {users:,} | {users * RETESTS:,} | {lookup * 1e6:.0f} | {(lookup + changes) * 1e6:.0f} |")
+
+    # Population : passations réparties au hasard entre n / RETESTS répondants
+    n = args.population
+    respondents = rng.integers(0, n // RETESTS, n)
+    completed_at = rng.integers(0, 10 ** 9, n)
+    raw = rng.integers(10, 60, (n, len(SCALE_KEYS))).astype(np.int16)
+    start = time.perf_counter()
+    before, _, rci = population_changes(respondents, completed_at, raw, manager.norms)
+    elapsed = time.perf_counter() - start
+    print(f"\nRCI de la population : {n:,} passations, {len(before):,} paires successives x {len(SCALE_KEYS)} "
+          f"échelles en {elapsed * 1000:.0f} ms ({elapsed / n * 1e9:.0f} ns par passation)")
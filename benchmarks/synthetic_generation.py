@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Débit du générateur de répondants synthétiques (neo_core.synthetic)
+Mesure séparément le tirage (traits, facettes, modèle de réponse graduée, motifs sans attention),
+la mise en forme CSV par octets (comparée à pandas.to_csv) et l'écriture Parquet, puis une génération
+complète en flux vers un fichier.
+
+Usage : python benchmarks/synthetic_generation.py [--rows 10000000] [--workers 1]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from neo_core.item_banks import get_registry  # noqa: E402
+from neo_core.synthetic import CHUNK_ROWS, SyntheticGenerator, csv_bytes, write_csv, write_parquet  # noqa: E402
+
+CARELESS = {'random': 0.03, 'straightline': 0.02, 'midpoint': 0.01, 'alternating': 0.01}
+PANDAS_ROWS = 200000
+
+def rate(rows, seconds):
+    return f"{rows / seconds / 1e6:.2f} M/s ({seconds * 1e9 / rows:.0f} ns par répondant)"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Débit du générateur de répondants synthétiques")
+    parser.add_argument("--rows", type=int, default=10000000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    item_bank = get_registry().get()
+    generator = SyntheticGenerator(item_bank, careless=CARELESS, seed=0)
+    generator.generate(1000)
+
+    start = time.perf_counter()
+    for responses, _, careless in generator.chunks(args.rows, CHUNK_ROWS, args.workers):
+        pass
+    print(f"Tirage seul, {args.rows:,} répondants : {rate(args.rows, time.perf_counter() - start)}")
+
+    start = time.perf_counter()
+    data = csv_bytes(responses, careless)
+    print(f"CSV par octets, {len(responses):,} répondants : {rate(len(responses), time.perf_counter() - start)}")
+    frame = pd.DataFrame(responses[:PANDAS_ROWS], columns=list(item_bank.item_ids))
+    frame['careless'] = careless[:PANDAS_ROWS]
+    start = time.perf_counter()
+    frame.to_csv(index=False)
+    print(f"pandas.to_csv, {PANDAS_ROWS:,} répondants : {rate(PANDAS_ROWS, time.perf_counter() - start)}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, writer in (("CSV", write_csv), ("Parquet", write_parquet)):
+            path = os.path.join(directory, f"synthetic.{name.lower()}")
+            start = time.perf_counter()
+            writer(path, SyntheticGenerator(item_bank, careless=CARELESS, seed=0), args.rows, CHUNK_ROWS,
+                   args.workers)
+            elapsed = time.perf_counter() - start
+            print(f"Génération complète vers {name} : {rate(args.rows, elapsed)}, {elapsed:.1f} s, "
+                  f"{os.path.getsize(path) / 1e6:.0f} Mo")
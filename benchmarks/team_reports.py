@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Rapports d'équipe (neo_core.team_report) : construction, ajout d'un membre et matrices par paires
+Compare le calcul matriciel des similarités et complémentarités à une double boucle Python, et l'ajout
+incrémental d'un membre à la reconstruction complète du profil d'équipe.
+
+Usage : python benchmarks/team_reports.py [--sizes 5 50 500]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from neo_core.team_report import (HIGH_THRESHOLD, LOW_THRESHOLD, MAX_DISTANCE, N_DOMAINS,  # noqa: E402
+                                  TeamProfile, pairwise)
+
+def pairwise_loops(vectors):
+    """Double boucle de référence : une paire à la fois"""
+    n = len(vectors)
+    similarity = [[0.0] * n for _ in range(n)]
+    complementarity = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            a, b = vectors[i][:N_DOMAINS], vectors[j][:N_DOMAINS]
+            similarity[i][j] = 1 - math.dist(a, b) / MAX_DISTANCE
+            complementarity[i][j] = sum(
+                (x >= HIGH_THRESHOLD and y < LOW_THRESHOLD) or (x < LOW_THRESHOLD and y >= HIGH_THRESHOLD)
+                for x, y in zip(a, b)
+            ) / N_DOMAINS
+    return similarity, complementarity
+
+def timed(function, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def build(ids, vectors):
+    team = TeamProfile()
+    team.add_vectors(ids, vectors)
+    return team
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rapports d'équipe : matrices par paires et ajouts incrémentaux")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 50, 500])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print("| Membres | Paires, double boucle (ms) | Paires, matriciel (ms) | Construction complète (ms) "
+          "| Ajout d'un membre (ms) | Rapport (ms) |")
+    print("|---|---|---|---|---|---|")
+    for size in args.sizes:
+        vectors = rng.integers(0, 101, (size + 1, 35)).astype(np.float32)
+        ids = [f"membre-{i}" for i in range(size + 1)]
+        as_lists = vectors[:size].tolist()
+        loops = timed(lambda: pairwise_loops(as_lists), repeat=1 if size > 100 else 5)
+        matrix = timed(lambda: pairwise(vectors[:size], vectors[:size]))
+        full = timed(lambda: build(ids, vectors))
+
+        def add_one():
+            team = build(ids[:size], vectors[:size])
+            start = time.perf_counter()
+            team.add_vectors(ids[size:], vectors[size:])
+            return time.perf_counter() - start
+
+        incremental = min(add_one() for _ in range(5))
+        team = build(ids, vectors)
+        report = timed(team.report)
+        print(f"| {size} | {loops * 1000:.2f} | {matrix * 1000:.3f} | {full * 1000:.2f} "
+              f"| {incremental * 1000:.3f} | {report * 1000:.2f} |")
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Cœur métier du NEO PI-R : cotation, normes, interprétation et chiffrement
+Importable sans Streamlit ni bibliothèques graphiques (jobs, workers, API)
+
+Les noms exportés sont résolus à leur premier accès (PEP 562) : `import neo_core` ne charge ni NumPy ni
+cryptography, chaque sous-module n'est importé que par le code qui s'en sert.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'DEFAULT_BANK': 'item_banks',
+    'DEFAULT_LOCALE': 'item_banks',
+    'DIMENSIONS': 'item_banks',
+    'FACETS': 'item_banks',
+    'NEOPIRManager': 'scoring',
+    'SecurityManager': 'security',
+    'get_dimension_description': 'interpretation',
+    'get_facet_description': 'interpretation',
+    'get_interpretation': 'interpretation',
+    'get_level': 'interpretation',
+    'get_recommendation_engine': 'recommendations',
+    'get_registry': 'item_banks',
+    'hash_user_data': 'security'
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    """Importe le sous-module qui définit `name` au premier accès"""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
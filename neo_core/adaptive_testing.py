@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+Passation adaptative (CAT) du NEO PI-R
+Modèle de réponse graduée (Samejima) par dimension, tables d'information précalculées
+
+La sélection et l'arrêt se font par domaine, pas par facette : une facette ne compte que 2 items dans la
+banque courte, et un critère d'arrêt par facette imposerait presque toujours les 60 items. Les items non
+posés reçoivent la réponse attendue au theta du domaine (completed_responses) pour coter les domaines ; ces
+réponses imputées ne mesurent pas les facettes, dont les scores, percentiles et intervalles ne sont pas
+rapportés pour une passation adaptative (voir 'adaptive' dans les résultats enregistrés).
+"""
+
+import math
+import sys
+
+import numpy as np
+
+N_CATEGORIES = 5
+THETA_GRID = np.linspace(-4, 4, 81)
+PRIOR = np.exp(-0.5 * THETA_GRID ** 2)
+PRIOR /= PRIOR.sum()
+LOG_PRIOR = np.log(PRIOR)
+
+# Paramètres par défaut tant qu'aucun étalonnage n'a été ajusté sur des réponses stockées
+DEFAULT_DISCRIMINATION = 1.7
+DEFAULT_THRESHOLDS = [-2.0, -0.75, 0.75, 2.0]
+
+DEFAULT_SE_THRESHOLD = 0.4
+DEFAULT_MIN_ITEMS = 3
+
+# ================= MODÈLE DE RÉPONSE GRADUÉE =================
+
+def response_to_category(response, reverse):
+    """Convertit une réponse 1-5 en catégorie 0-4 dans le sens du trait"""
+    return (5 - response) if reverse else (response - 1)
+
+def grm_probabilities(a, b, theta=THETA_GRID):
+    """Probabilités de chaque catégorie : tableau (len(theta), N_CATEGORIES)"""
+    theta = np.asarray(theta, dtype=float)[:, None]
+    cumulative = 1.0 / (1.0 + np.exp(-a * (theta - np.asarray(b)[None, :])))
+    ones = np.ones((theta.shape[0], 1))
+    zeros = np.zeros((theta.shape[0], 1))
+    cumulative = np.hstack([ones, cumulative, zeros])
+    return np.clip(cumulative[:, :-1] - cumulative[:, 1:], 1e-10, 1.0)
+
+def grm_information(a, b, theta=THETA_GRID):
+    """Information de Fisher d'un item sur la grille de theta"""
+    theta = np.asarray(theta, dtype=float)[:, None]
+    cumulative = 1.0 / (1.0 + np.exp(-a * (theta - np.asarray(b)[None, :])))
+    ones = np.ones((theta.shape[0], 1))
+    zeros = np.zeros((theta.shape[0], 1))
+    cumulative = np.hstack([ones, cumulative, zeros])
+    probs = np.clip(cumulative[:, :-1] - cumulative[:, 1:], 1e-10, 1.0)
+    slopes = cumulative * (1 - cumulative)
+    return a ** 2 * ((slopes[:, :-1] - slopes[:, 1:]) ** 2 / probs).sum(axis=1)
+
+def _unpack(params):
+    """Paramètres libres -> (a, seuils ordonnés)"""
+    a = math.exp(params[0])
+    b = params[1] + np.concatenate([[0.0], np.cumsum(np.exp(params[2:]))])
+    return a, b
+
+def _pack(a, b):
+    """(a, seuils ordonnés) -> paramètres libres"""
+    return np.concatenate([[math.log(a), b[0]], np.log(np.diff(b))])
+
+def fit_grm(categories, n_iter=30, tol=1e-4):
+    """Ajuste un GRM unidimensionnel par maximum de vraisemblance marginale (EM)
+
+    `categories` : tableau (personnes, items) de catégories 0-4, -1 si manquant.
+    Retourne (discriminations, seuils) de formes (items,) et (items, 4).
+    """
+    from scipy.optimize import minimize
+
+    categories = np.asarray(categories, dtype=int)
+    n_items = categories.shape[1]
+    a = np.full(n_items, DEFAULT_DISCRIMINATION)
+    b = np.tile(DEFAULT_THRESHOLDS, (n_items, 1)).astype(float)
+
+    # Indicatrices (personnes, items, catégories)
+    onehot = (categories[:, :, None] == np.arange(N_CATEGORIES)[None, None, :]).astype(float)
+
+    previous = -np.inf
+    for _ in range(n_iter):
+        # Étape E : a posteriori de chaque personne sur la grille
+        log_probs = np.stack([np.log(grm_probabilities(a[j], b[j])) for j in range(n_items)])
+        log_post = LOG_PRIOR[None, :] + np.einsum('pjk,jqk->pq', onehot, log_probs)
+        norm = log_post.max(axis=1, keepdims=True)
+        post = np.exp(log_post - norm)
+        total = post.sum(axis=1, keepdims=True)
+        loglik = float((np.log(total) + norm).sum())
+        post /= total
+
+        # Effectifs attendus (items, grille, catégories)
+        expected = np.einsum('pq,pjk->jqk', post, onehot)
+
+        # Étape M : maximisation item par item
+        for j in range(n_items):
+            counts = expected[j]
+
+            def objective(params):
+                item_a, item_b = _unpack(params)
+                return -(counts * np.log(grm_probabilities(item_a, item_b))).sum()
+
+            result = minimize(objective, _pack(a[j], b[j]), method='L-BFGS-B')
+            a[j], b[j] = _unpack(result.x)
+
+        if abs(loglik - previous) < tol * abs(loglik):
+            break
+        previous = loglik
+
+    return a, b
+
+# ================= MODÈLE ADAPTATIF =================
+
+class AdaptiveModel:
+    """Tables précalculées (log-probabilités, information) pour tous les items"""
+
+    def __init__(self, questions, discrimination, thresholds):
+        self.item_ids = [q['id'] for q in questions]
+        self.dimensions = sorted(set(q['dimension'] for q in questions), key=[q['dimension'] for q in questions].index)
+        self.item_dimension = np.array([self.dimensions.index(q['dimension']) for q in questions])
+        self.reverse = np.array([q['reverse'] for q in questions])
+        self.discrimination = np.asarray(discrimination, dtype=float)
+        self.thresholds = np.asarray(thresholds, dtype=float)
+
+        # (items, grille, catégories) et (items, grille)
+        self.log_probs = np.stack([
+            np.log(grm_probabilities(a, b)) for a, b in zip(self.discrimination, self.thresholds)
+        ])
+        self.information = np.stack([
+            grm_information(a, b) for a, b in zip(self.discrimination, self.thresholds)
+        ])
+        # Réponse attendue (1-5, dans le sens du trait) en chaque point de la grille
+        self.expected_category = np.exp(self.log_probs) @ np.arange(N_CATEGORIES)
+        self.dimension_items = [np.flatnonzero(self.item_dimension == d) for d in range(len(self.dimensions))]
+
+    @classmethod
+    def default(cls, questions):
+        """Modèle aux paramètres par défaut"""
+        n_items = len(questions)
+        return cls(questions, np.full(n_items, DEFAULT_DISCRIMINATION), np.tile(DEFAULT_THRESHOLDS, (n_items, 1)))
+
+    @classmethod
+    def fit(cls, questions, responses):
+        """Ajuste le modèle sur des réponses stockées (tableau personnes x items, 1-5, 0 si manquant)"""
+        responses = np.asarray(responses, dtype=int)
+        reverse = np.array([q['reverse'] for q in questions])
+        categories = np.where(reverse, 5 - responses, responses - 1)
+        categories[responses <= 0] = -1
+
+        n_items = len(questions)
+        discrimination = np.empty(n_items)
+        thresholds = np.empty((n_items, N_CATEGORIES - 1))
+        dims = [q['dimension'] for q in questions]
+        for dim in dict.fromkeys(dims):
+            items = [i for i, d in enumerate(dims) if d == dim]
+            discrimination[items], thresholds[items] = fit_grm(categories[:, items])
+        return cls(questions, discrimination, thresholds)
+
+    @classmethod
+    def load(cls, questions, path):
+        """Charge des paramètres sauvegardés (.npz) et les aligne sur les items"""
+        data = np.load(path)
+        index = {item_id: i for i, item_id in enumerate(data['item_ids'].tolist())}
+        rows = [index[q['id']] for q in questions]
+        return cls(questions, data['discrimination'][rows], data['thresholds'][rows])
+
+    def save(self, path):
+        """Sauvegarde les paramètres du modèle"""
+        np.savez(path, item_ids=np.array(self.item_ids), discrimination=self.discrimination, thresholds=self.thresholds)
+
+    def new_session(self, se_threshold=DEFAULT_SE_THRESHOLD, min_items=DEFAULT_MIN_ITEMS):
+        """Démarre une passation adaptative"""
+        return AdaptiveSession(self, se_threshold, min_items)
+
+    def restore_session(self, state):
+        """Reconstruit une passation à partir de son état sérialisé (voir AdaptiveSession.to_state)"""
+        session = self.new_session(state['se_threshold'], state['min_items'])
+        for item_id, response in state['responses'].items():
+            session.record(item_id, response)
+        session.recorded = state.get('recorded', False)
+        return session
+
+class AdaptiveSession:
+    """État d'une passation : log a posteriori par dimension et items administrés"""
+
+    def __init__(self, model, se_threshold=DEFAULT_SE_THRESHOLD, min_items=DEFAULT_MIN_ITEMS):
+        self.model = model
+        self.se_threshold = se_threshold
+        self.min_items = min_items
+        self.log_posterior = np.tile(LOG_PRIOR, (len(model.dimensions), 1))
+        self.administered = np.zeros(len(model.item_ids), dtype=bool)
+        self.responses = {}
+        self.pending = None
+        # Vrai une fois les résultats de la passation terminée enregistrés (une seule fois)
+        self.recorded = False
+
+    def _posterior(self, d):
+        """A posteriori normalisé d'une dimension"""
+        post = np.exp(self.log_posterior[d] - self.log_posterior[d].max())
+        return post / post.sum()
+
+    def estimate(self, d):
+        """Estimation EAP et erreur standard a posteriori d'une dimension"""
+        post = self._posterior(d)
+        theta = float(post @ THETA_GRID)
+        se = float(math.sqrt(post @ (THETA_GRID - theta) ** 2))
+        return theta, se
+
+    def record(self, item_id, response):
+        """Enregistre une réponse (1-5) et met à jour l'a posteriori"""
+        i = self.model.item_ids.index(item_id)
+        if self.administered[i]:
+            return
+        category = response_to_category(response, self.model.reverse[i])
+        self.log_posterior[self.model.item_dimension[i]] += self.model.log_probs[i, :, category]
+        self.administered[i] = True
+        self.responses[item_id] = response
+        self.pending = None
+
+    def next_item(self):
+        """Item suivant (information maximale) ou None si la passation est terminée"""
+        if self.pending is not None:
+            return self.pending
+
+        best_dim, best_se = None, -1.0
+        for d, items in enumerate(self.model.dimension_items):
+            remaining = items[~self.administered[items]]
+            if remaining.size == 0:
+                continue
+            _, se = self.estimate(d)
+            if (items.size - remaining.size) < self.min_items or se > self.se_threshold:
+                if se > best_se:
+                    best_dim, best_se = d, se
+        if best_dim is None:
+            return None
+
+        # Information de chaque item restant au point de la grille le plus proche de theta
+        theta, _ = self.estimate(best_dim)
+        q = int(np.abs(THETA_GRID - theta).argmin())
+        items = self.model.dimension_items[best_dim]
+        remaining = items[~self.administered[items]]
+        self.pending = self.model.item_ids[int(remaining[self.model.information[remaining, q].argmax()])]
+        return self.pending
+
+    def finished(self):
+        """Vrai si toutes les dimensions ont atteint le critère d'arrêt"""
+        return self.next_item() is None
+
+    def completed_responses(self):
+        """Réponses complètes : les items non administrés reçoivent la réponse attendue à theta
+
+        Valables pour les scores de domaine seulement : les facettes qui en découlent sont imputées.
+        """
+        completed = dict(self.responses)
+        for d, items in enumerate(self.model.dimension_items):
+            theta, _ = self.estimate(d)
+            q = int(np.abs(THETA_GRID - theta).argmin())
+            for i in items:
+                item_id = self.model.item_ids[i]
+                if item_id not in completed:
+                    category = int(round(self.model.expected_category[i, q]))
+                    completed[item_id] = (5 - category) if self.model.reverse[i] else (category + 1)
+        return completed
+
+    def to_state(self):
+        """État sérialisable : les réponses suffisent à recalculer l'a posteriori"""
+        return {
+            'se_threshold': self.se_threshold,
+            'min_items': self.min_items,
+            'responses': dict(self.responses),
+            'recorded': self.recorded
+        }
+
+# ================= ÉTALONNAGE HORS LIGNE =================
+
+def fit_from_csv(questions, csv_path, output_path):
+    """Ajuste le modèle sur un CSV de réponses (une colonne par item) et le sauvegarde"""
+    import pandas as pd
+
+    df = pd.read_csv(csv_path)
+    responses = df[[q['id'] for q in questions]].fillna(0).to_numpy(dtype=int)
+    model = AdaptiveModel.fit(questions, responses)
+    model.save(output_path)
+    return model
+
+if __name__ == "__main__":
+    from neo_core.item_banks import get_registry
+
+    if len(sys.argv) != 5:
+        print("Usage : python -m neo_core.adaptive_testing banque langue reponses.csv parametres.npz")
+        sys.exit(1)
+
+    bank, locale, csv_path, output_path = sys.argv[1:]
+    fit_from_csv(get_registry().get(bank, locale).questions, csv_path, output_path)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Archétypes de personnalité : regroupement hors ligne des profils de 30 facettes
+Le job (python -m neo_core.archetypes) essaie plusieurs nombres de groupes en parallèle avec MiniBatchKMeans
+et garde le meilleur selon la silhouette. Seuls les centroïdes sont conservés (quelques Ko) ; l'affectation
+d'un nouveau profil est une recherche du centroïde le plus proche.
+"""
+
+import argparse
+import os
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from .interpretation import get_level
+from .item_banks import DIMENSION_CODES, DIMENSIONS, FACET_CODES
+
+ARCHETYPES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "archetype_models")
+ARCHETYPES_FILE = "archetypes.npz"
+
+DEFAULT_CLUSTER_COUNTS = range(4, 13)
+SILHOUETTE_SAMPLE = 10000
+MAX_NAMED_DIMENSIONS = 3
+LEVEL_MARKS = {'Élevé': "↑", 'Faible': "↓"}
+
+def facet_vector(facet_percentiles):
+    """Vecteur des 30 percentiles de facettes (ordre FACET_CODES)"""
+    return np.array([facet_percentiles[dim][facet] for dim, facet in FACET_CODES], dtype=np.float32)
+
+def domain_means(centroids):
+    """Moyenne des facettes de chaque domaine : (groupes, 5)"""
+    facet_dimensions = np.array([dim for dim, _ in FACET_CODES])
+    return np.stack([centroids[:, facet_dimensions == dim].mean(axis=1) for dim in DIMENSION_CODES], axis=1)
+
+def archetype_name(domain_percentiles):
+    """Nom lisible d'un centroïde : ses domaines les plus éloignés de la moyenne"""
+    deviations = sorted(
+        ((abs(p - 50), dim, get_level(p)) for dim, p in zip(DIMENSION_CODES, domain_percentiles)),
+        reverse=True
+    )
+    marked = [f"{DIMENSIONS[dim]} {LEVEL_MARKS[level]}" for _, dim, level in deviations if level in LEVEL_MARKS]
+    return " · ".join(marked[:MAX_NAMED_DIMENSIONS]) or "Profil équilibré"
+
+class ArchetypeModel:
+    """Centroïdes des archétypes dans l'espace des percentiles de facettes"""
+
+    def __init__(self, centroids, sizes, names=None, silhouette=float('nan')):
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self.sizes = np.asarray(sizes, dtype=np.int64)
+        self.shares = self.sizes / max(1, self.sizes.sum())
+        self.domain_percentiles = domain_means(self.centroids)
+        self.names = list(names) if names is not None else [archetype_name(p) for p in self.domain_percentiles]
+        self.silhouette = float(silhouette)
+        self._squared_norms = np.einsum('ij,ij->i', self.centroids, self.centroids)
+
+    def __len__(self):
+        return len(self.centroids)
+
+    def assign_batch(self, vectors):
+        """Archétype le plus proche de chaque profil : (indices, distances)"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.centroids.shape[1])
+        distances = self._squared_norms[None, :] - 2 * (vectors @ self.centroids.T)
+        distances += np.einsum('ij,ij->i', vectors, vectors)[:, None]
+        nearest = distances.argmin(axis=1)
+        return nearest, np.sqrt(np.maximum(distances[np.arange(len(vectors)), nearest], 0))
+
+    def assign(self, vector):
+        """Archétype le plus proche d'un profil : (indice, distance)"""
+        nearest, distances = self.assign_batch(vector)
+        return int(nearest[0]), float(distances[0])
+
+    def save(self, path):
+        """Sauvegarde compacte : centroïdes en float16 (précision largement suffisante en percentiles)
+
+        Écrite à côté puis renommée : un processus qui recharge le modèle ne lit jamais un fichier partiel.
+        """
+        partial = f"{path}.{os.getpid()}.tmp"
+        with open(partial, 'wb') as file:
+            np.savez_compressed(file, centroids=self.centroids.astype(np.float16), sizes=self.sizes,
+                                names=np.array(self.names), silhouette=self.silhouette)
+        os.replace(partial, path)
+
+    @classmethod
+    def load(cls, path):
+        """Charge un modèle sauvegardé par save()"""
+        with np.load(path) as data:
+            return cls(data['centroids'], data['sizes'], data['names'].tolist(), float(data['silhouette']))
+
+def _fit_candidate(profiles, n_clusters, seed, sample):
+    """Ajuste MiniBatchKMeans pour un nombre de groupes ; retourne (silhouette, centroïdes, effectifs)"""
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.metrics import silhouette_score
+
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=4096, n_init=3, random_state=seed)
+    labels = kmeans.fit_predict(profiles)
+    rng = np.random.default_rng(seed)
+    rows = rng.choice(len(profiles), size=min(sample, len(profiles)), replace=False)
+    silhouette = silhouette_score(profiles[rows], labels[rows]) if len(np.unique(labels[rows])) > 1 else -1.0
+    return silhouette, kmeans.cluster_centers_, np.bincount(labels, minlength=n_clusters)
+
+def fit_archetypes(profiles, cluster_counts=DEFAULT_CLUSTER_COUNTS, n_jobs=-1, components=None, seed=0,
+                   sample=SILHOUETTE_SAMPLE):
+    """Regroupe des profils (sujets x 30 percentiles de facettes) et retourne le meilleur ArchetypeModel
+
+    Les nombres de groupes candidats sont ajustés en parallèle (joblib). Avec `components`, le regroupement
+    se fait dans l'espace d'une ACP et les centroïdes sont ramenés dans l'espace des facettes.
+    """
+    from joblib import Parallel, delayed
+
+    profiles = np.asarray(profiles, dtype=np.float32)
+    pca = None
+    features = profiles
+    if components:
+        from sklearn.decomposition import PCA
+
+        pca = PCA(n_components=components, random_state=seed)
+        features = pca.fit_transform(profiles).astype(np.float32)
+
+    candidates = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_candidate)(features, n_clusters, seed, sample) for n_clusters in cluster_counts
+    )
+    silhouette, centroids, sizes = max(candidates, key=lambda candidate: candidate[0])
+    if pca is not None:
+        centroids = pca.inverse_transform(centroids)
+    return ArchetypeModel(np.clip(centroids, 0, 100), sizes, silhouette=silhouette)
+
+@lru_cache(maxsize=4)
+def _load_archetypes(path, mtime):
+    """Modèle chargé, mémorisé par chemin et date de modification du fichier"""
+    return ArchetypeModel.load(path)
+
+def get_archetypes():
+    """Modèle d'archétypes du processus (NEO_PIR_ARCHETYPES_DIR), ou None si le job n'a pas encore tourné
+
+    L'absence de modèle n'est pas mémorisée, et un fichier réécrit par le job est rechargé : un processus
+    démarré avant le premier regroupement le prend en compte sans redémarrer.
+    """
+    path = os.path.join(os.environ.get('NEO_PIR_ARCHETYPES_DIR', ARCHETYPES_DIR), ARCHETYPES_FILE)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_archetypes(path, mtime)
+
+# ================= JOB HORS LIGNE =================
+
+def profiles_from_backend(backend):
+    """Percentiles de facettes des résultats enregistrés dans le backend d'état
+
+    Les passations adaptatives sont écartées : leurs facettes sont imputées.
+    """
+    from .similarity import profile_vectors
+
+    return np.array([profile_vectors(result)[1] for _, _, result in backend.iter_results()
+                     if not result.get('adaptive')], dtype=np.uint8).reshape(-1, len(FACET_CODES))
+
+def profiles_from_csv(csv_path, bank, locale, chunksize=100000):
+    """Percentiles de facettes d'un CSV de réponses (une colonne par item), coté par morceaux
+
+    Les lignes incomplètes (0 ou vide = sans réponse, items non posés d'une passation adaptative) sont écartées.
+    """
+    import pandas as pd
+
+    from .scoring import NEOPIRManager
+
+    manager = NEOPIRManager(bank, locale)
+    columns = list(manager.item_bank.item_ids)
+    chunks = []
+    for df in pd.read_csv(csv_path, usecols=columns, chunksize=chunksize):
+        responses = df[columns].fillna(0).to_numpy(dtype=np.int8)
+        responses = responses[(responses > 0).all(axis=1)]
+        dimension_sums, facet_sums = manager.item_bank.raw_scores(responses)
+        percentiles = manager.calculate_details_batch(dimension_sums, facet_sums)[0]
+        chunks.append(np.rint(percentiles[:, len(DIMENSION_CODES):]).astype(np.uint8))
+    return np.concatenate(chunks) if chunks else np.empty((0, len(FACET_CODES)), dtype=np.uint8)
+
+if __name__ == "__main__":
+    from neo_core.item_banks import DEFAULT_BANK, DEFAULT_LOCALE
+    from neo_core.session_store import create_backend
+
+    parser = argparse.ArgumentParser(description="Regroupement des profils en archétypes")
+    parser.add_argument("output", nargs="?", default=os.path.join(ARCHETYPES_DIR, ARCHETYPES_FILE))
+    parser.add_argument("--responses", help="CSV de réponses (sinon : résultats du backend NEO_PIR_STATE_BACKEND)")
+    parser.add_argument("--bank", default=DEFAULT_BANK)
+    parser.add_argument("--locale", default=DEFAULT_LOCALE)
+    parser.add_argument("--clusters", type=int, nargs="+", default=list(DEFAULT_CLUSTER_COUNTS),
+                        help="nombres de groupes candidats")
+    parser.add_argument("--jobs", type=int, default=-1, help="processus joblib (-1 : tous les cœurs)")
+    parser.add_argument("--pca", type=int, default=None, help="composantes d'ACP avant le regroupement")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.responses:
+        profiles = profiles_from_csv(args.responses, args.bank, args.locale)
+    else:
+        profiles = profiles_from_backend(create_backend())
+    if len(profiles) < max(args.clusters):
+        parser.error(f"{len(profiles)} profils : trop peu pour {max(args.clusters)} groupes")
+    loaded = time.perf_counter()
+
+    model = fit_archetypes(profiles, args.clusters, args.jobs, args.pca)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    model.save(args.output)
+
+    print(f"{len(profiles)} profils chargés en {loaded - start:.1f} s, "
+          f"regroupés en {time.perf_counter() - loaded:.1f} s")
+    print(f"{len(model)} archétypes (silhouette {model.silhouette:.3f}) -> {args.output}")
+    for name, share in sorted(zip(model.names, model.shares), key=lambda entry: -entry[1]):
+        print(f"  {share:6.1%}  {name}")
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Validation de la structure factorielle d'une banque d'items : les 5 domaines sont-ils retrouvés ?
+Un seul passage en flux sur les réponses stockées (archive Parquet, fichier Parquet ou CSV) accumule
+les moments de la matrice de covariance des items ; tout le reste travaille sur cette matrice :
+
+- analyse parallèle de Horn : valeurs propres observées comparées à celles de données aléatoires de
+  même taille (tirées par la décomposition de Bartlett, sans générer les données) ;
+- analyse factorielle exploratoire en axes principaux itérés, rotation oblique promax ;
+- bootstrap : les réponses sont réparties en blocs pendant le passage, un rééchantillon tire des
+  blocs avec remise et recombine leurs moments. Les ajustements des rééchantillons sont
+  répartis sur un pool de processus.
+
+Les items inversés sont recodés (signe de leur ligne et colonne) : une saturation attendue est positive.
+
+Usage : python -m neo_core.factor_structure <archive|fichier.parquet|fichier.csv> [--bootstrap 200]
+                                             [--workers 4] [--json rapport.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .adaptive_testing import N_CATEGORIES
+from .item_banks import DEFAULT_BANK, DEFAULT_LOCALE, DIMENSION_CODES, DIMENSIONS, get_registry
+
+N_FACTORS = len(DIMENSION_CODES)
+# Centrage sur le milieu de l'échelle : les produits restent des entiers exacts en float32
+MIDPOINT = (N_CATEGORIES + 1) // 2
+BATCH_ROWS = 256 * 1024
+
+BOOTSTRAP_BLOCKS = 200
+BOOTSTRAP_SAMPLES = 200
+BOOTSTRAP_CHUNK = 25
+PARALLEL_SAMPLES = 200
+PARALLEL_QUANTILE = 95
+PROMAX_POWER = 4
+SALIENT_LOADING = 0.30
+MAX_ITERATIONS = 500
+TOLERANCE = 1e-6
+
+class FactorStructureError(ValueError):
+    """Données insuffisantes ou matrice inexploitable"""
+
+# ================= MOMENTS EN FLUX =================
+
+class CovarianceAccumulator:
+    """Moments des réponses complètes (effectif, sommes, produits croisés), répartis en blocs
+
+    Les blocs servent au bootstrap ; la matrice de l'échantillon entier est la somme des blocs.
+    """
+
+    def __init__(self, n_items, blocks=BOOTSTRAP_BLOCKS, seed=None):
+        self.counts = np.zeros(blocks, dtype=np.int64)
+        self.sums = np.zeros((blocks, n_items))
+        self.products = np.zeros((blocks, n_items, n_items))
+        self.excluded = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def n(self):
+        return int(self.counts.sum())
+
+    def add(self, responses):
+        """Ajoute un lot de réponses (lignes x items, 0 = sans réponse) ; les lignes incomplètes sont écartées
+
+        Le lot est découpé en tranches contiguës, une par bloc (affectation tirée au hasard) : des
+        répondants voisins (même journée, même import) restent dans le même bloc, ce que le bootstrap
+        par blocs respecte. Une colonne de 1 ajoutée aux réponses centrées donne effectifs, sommes et
+        produits croisés en un seul produit matriciel float32, exact sur ces entiers (|x| <= 2) tant
+        qu'une tranche compte moins de quatre millions de lignes.
+        """
+        responses = np.asarray(responses)
+        complete = responses.min(axis=1) > 0
+        if not complete.all():
+            self.excluded += len(responses) - int(complete.sum())
+            responses = responses[complete]
+        if len(responses) == 0:
+            return
+        n_items = responses.shape[1]
+        augmented = np.empty((len(responses), n_items + 1), dtype=np.float32)
+        np.subtract(responses, MIDPOINT, out=augmented[:, :n_items], casting='unsafe')
+        augmented[:, n_items] = 1
+        bounds = np.linspace(0, len(responses), min(len(self.counts), len(responses)) + 1).astype(np.int64)
+        blocks = self._rng.permutation(len(self.counts))
+        for k, start, end in zip(blocks, bounds[:-1], bounds[1:]):
+            part = augmented[start:end]
+            moments = part.T @ part
+            self.products[k] += moments[:n_items, :n_items]
+            self.sums[k] += moments[n_items, :n_items]
+            self.counts[k] += int(moments[n_items, n_items])
+
+    def merge(self, other):
+        """Ajoute les moments d'un autre accumulateur (passages partiels en parallèle)"""
+        self.counts += other.counts
+        self.sums += other.sums
+        self.products += other.products
+        self.excluded += other.excluded
+
+    def covariance(self, weights=None):
+        """Matrice de covariance ; weights (rééchantillons x blocs) donne une matrice par rééchantillon"""
+        if weights is None:
+            weights = np.ones(len(self.counts))
+        n = weights @ self.counts
+        sums = weights @ self.sums
+        products = np.tensordot(weights, self.products, axes=1)
+        return (products - sums[..., :, None] * sums[..., None, :] / n[..., None, None]) / (n[..., None, None] - 1)
+
+def correlation(covariance):
+    """Matrice(s) de corrélation tirée(s) de covariance(s)"""
+    sd = np.sqrt(np.diagonal(covariance, axis1=-2, axis2=-1))
+    return covariance / (sd[..., :, None] * sd[..., None, :])
+
+def response_batches(source, item_bank, batch_rows=BATCH_ROWS, start=None, end=None):
+    """Réponses (lignes x items, int8) lues en flux : racine d'archive, fichier Parquet ou CSV"""
+    import pyarrow as pa
+
+    columns = list(item_bank.item_ids)
+    if os.path.isdir(source):
+        from .response_archive import scan_batches
+        batches = scan_batches(source, item_bank.bank, columns=columns, start=start, end=end,
+                               batch_size=batch_rows)
+    elif source.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(source).iter_batches(batch_size=batch_rows, columns=columns)
+    else:
+        import pyarrow.csv as pv
+        batches = pv.open_csv(source, read_options=pv.ReadOptions(block_size=batch_rows * 2 * len(columns)),
+                              convert_options=pv.ConvertOptions(include_columns=columns,
+                                                                column_types=dict.fromkeys(columns, pa.int8())))
+    for batch in batches:
+        if batch.num_rows:
+            yield np.column_stack([batch.column(item_id).fill_null(0).to_numpy() for item_id in columns])
+
+def accumulate(batches, n_items, blocks=BOOTSTRAP_BLOCKS, seed=None):
+    """Moments accumulés sur un flux de lots de réponses"""
+    accumulator = CovarianceAccumulator(n_items, blocks, seed)
+    for responses in batches:
+        accumulator.add(responses)
+    return accumulator
+
+# ================= ANALYSE PARALLÈLE =================
+
+def random_eigenvalues(n_obs, n_items, samples=PARALLEL_SAMPLES, rng=None):
+    """Valeurs propres (décroissantes) de corrélations de données normales aléatoires (n_obs x n_items)
+
+    La matrice des produits croisés suit une loi de Wishart, tirée par la décomposition de Bartlett :
+    le coût ne dépend pas de n_obs.
+    """
+    if n_obs <= n_items + 1:
+        raise FactorStructureError(f"{n_obs} répondants pour {n_items} items : analyse impossible")
+    rng = rng or np.random.default_rng()
+    factor = np.tril(rng.standard_normal((samples, n_items, n_items)), -1)
+    diagonal = np.arange(n_items)
+    factor[:, diagonal, diagonal] = np.sqrt(rng.chisquare(n_obs - 1 - diagonal, (samples, n_items)))
+    return np.linalg.eigvalsh(correlation(factor @ factor.transpose(0, 2, 1)))[:, ::-1]
+
+def parallel_analysis(corr, n_obs, samples=PARALLEL_SAMPLES, quantile=PARALLEL_QUANTILE, rng=None):
+    """Analyse parallèle de Horn : facteurs retenus tant que la valeur propre observée dépasse le quantile"""
+    observed = np.linalg.eigvalsh(corr)[::-1]
+    threshold = np.percentile(random_eigenvalues(n_obs, len(corr), samples, rng), quantile, axis=0)
+    above = observed > threshold
+    factors = len(above) if above.all() else int(np.argmin(above))
+    return {'observed': observed, 'threshold': threshold, 'factors': factors}
+
+# ================= ANALYSE FACTORIELLE =================
+
+def principal_axis(corr, n_factors=N_FACTORS, max_iterations=MAX_ITERATIONS, tolerance=TOLERANCE):
+    """Axes principaux itérés : saturations (items x facteurs) et communautés
+
+    Communautés initiales : corrélations multiples au carré ; bornées sous 1 (cas de Heywood).
+    """
+    communalities = 1 - 1 / np.diag(np.linalg.inv(corr))
+    reduced = corr.copy()
+    diagonal = np.arange(len(corr))
+    for _ in range(max_iterations):
+        reduced[diagonal, diagonal] = communalities
+        values, vectors = np.linalg.eigh(reduced)
+        values, vectors = values[::-1][:n_factors], vectors[:, ::-1][:, :n_factors]
+        loadings = vectors * np.sqrt(np.maximum(values, 0))
+        updated = np.minimum((loadings ** 2).sum(axis=1), 0.995)
+        converged = np.abs(updated - communalities).max() < tolerance
+        communalities = updated
+        if converged:
+            break
+    return loadings, communalities
+
+def varimax(loadings, max_iterations=MAX_ITERATIONS, tolerance=TOLERANCE):
+    """Rotation varimax (normalisation de Kaiser) : (saturations tournées, matrice de rotation)"""
+    norms = np.sqrt((loadings ** 2).sum(axis=1, keepdims=True))
+    normalized = loadings / norms
+    n_items, n_factors = loadings.shape
+    rotation = np.eye(n_factors)
+    criterion = 0
+    for _ in range(max_iterations):
+        rotated = normalized @ rotation
+        u, s, vt = np.linalg.svd(normalized.T @ (rotated ** 3 - rotated * (rotated ** 2).sum(axis=0) / n_items))
+        rotation = u @ vt
+        if s.sum() < criterion * (1 + tolerance):
+            break
+        criterion = s.sum()
+    return normalized @ rotation * norms, rotation
+
+def promax(loadings, power=PROMAX_POWER):
+    """Rotation oblique promax : (saturations du patron, corrélations entre facteurs)"""
+    rotated, _ = varimax(loadings)
+    target = rotated * np.abs(rotated) ** (power - 1)
+    transform = np.linalg.lstsq(rotated, target, rcond=None)[0]
+    transform *= np.sqrt(np.diag(np.linalg.inv(transform.T @ transform)))
+    inverse = np.linalg.inv(transform)
+    return rotated @ transform, inverse @ inverse.T
+
+def congruence(pattern, target):
+    """Coefficients de congruence de Tucker entre les colonnes de deux matrices (facteurs x cibles)"""
+    return (pattern.T @ target) / np.outer(np.linalg.norm(pattern, axis=0), np.linalg.norm(target, axis=0))
+
+def align(pattern, factor_correlations, target):
+    """Ordonne et oriente les facteurs sur les colonnes de la cible (appariement de congruence maximale)"""
+    from scipy.optimize import linear_sum_assignment
+
+    phi = congruence(pattern, target)
+    factors, columns = linear_sum_assignment(-np.abs(phi))
+    order = factors[np.argsort(columns)]
+    signs = np.sign(phi[order, np.arange(len(order))])
+    signs[signs == 0] = 1
+    pattern = pattern[:, order] * signs
+    factor_correlations = factor_correlations[np.ix_(order, order)] * np.outer(signs, signs)
+    return pattern, factor_correlations
+
+def fit(corr, target, n_factors=N_FACTORS):
+    """EFA d'une matrice de corrélation : patron et corrélations des facteurs, alignés sur la cible"""
+    loadings, _ = principal_axis(corr, n_factors)
+    return align(*promax(loadings), target)
+
+def _fit_chunk(correlations, target):
+    """Ajuste un bloc de rééchantillons (exécuté dans un processus du pool)"""
+    return np.stack([fit(corr, target)[0] for corr in correlations])
+
+def bootstrap(accumulator, sign, target, samples=BOOTSTRAP_SAMPLES, workers=None, rng=None):
+    """Patrons des rééchantillons (rééchantillons x items x facteurs), blocs tirés avec remise
+
+    Les matrices sont recombinées dans ce processus ; seuls les ajustements partent dans le pool.
+    """
+    rng = rng or np.random.default_rng()
+    blocks = len(accumulator.counts)
+    weights = rng.multinomial(blocks, np.full(blocks, 1 / blocks), size=samples).astype(np.float64)
+    covariances = accumulator.covariance(weights)
+    # Rééchantillon dont un item n'a pas de variance (blocs où il est constant) : écarté
+    covariances = covariances[(np.diagonal(covariances, axis1=-2, axis2=-1) > 0).all(axis=1)]
+    if not len(covariances):
+        raise FactorStructureError("Aucun rééchantillon bootstrap où tous les items varient")
+    correlations = correlation(covariances) * np.outer(sign, sign)
+    samples = len(correlations)
+    chunks = [correlations[start:start + BOOTSTRAP_CHUNK] for start in range(0, samples, BOOTSTRAP_CHUNK)]
+    workers = os.cpu_count() if workers is None else workers
+
+    # Peu de rééchantillons : le démarrage du pool coûterait plus que les ajustements
+    if workers <= 1 or len(chunks) <= 1:
+        return np.concatenate([_fit_chunk(chunk, target) for chunk in chunks])
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return np.concatenate(list(executor.map(_fit_chunk, chunks, [target] * len(chunks))))
+
+# ================= RAPPORT =================
+
+def structure_report(item_bank, accumulator, samples=BOOTSTRAP_SAMPLES, workers=None, seed=None):
+    """Analyse parallèle, EFA promax et intervalles bootstrap des saturations, item par item"""
+    if accumulator.n <= len(item_bank) + 1:
+        raise FactorStructureError(f"{accumulator.n} réponses complètes pour {len(item_bank)} items : "
+                                   "analyse impossible")
+    covariance = accumulator.covariance()
+    # Un item sans variance (toujours la même réponse) n'a pas de corrélation : la décomposition échouerait
+    constant = np.flatnonzero(np.diagonal(covariance) <= 0)
+    if len(constant):
+        raise FactorStructureError("Items sans variance (réponse constante) : "
+                                   + ", ".join(item_bank.item_ids[i] for i in constant))
+    rng = np.random.default_rng(seed)
+    sign = np.where(item_bank.reverse, -1.0, 1.0)
+    corr = correlation(covariance) * np.outer(sign, sign)
+    # Cible : appartenance de chaque item à son domaine (clé de cotation de la banque)
+    target = np.asarray(item_bank.dimension_key, dtype=np.float64)
+
+    parallel = parallel_analysis(corr, accumulator.n, rng=rng)
+    pattern, factor_correlations = fit(corr, target)
+    resamples = bootstrap(accumulator, sign, target, samples, workers, rng) if samples else None
+
+    rows = np.arange(len(item_bank))
+    intended = pattern[rows, item_bank.dimension_index]
+    primary = np.abs(pattern).argmax(axis=1)
+    others = np.abs(pattern).copy()
+    others[rows, item_bank.dimension_index] = 0
+    if resamples is not None:
+        low, high = np.percentile(resamples[:, rows, item_bank.dimension_index], [2.5, 97.5], axis=0)
+    items = []
+    for i, question in enumerate(item_bank.questions):
+        items.append({
+            'id': question['id'],
+            'dimension': question['dimension'],
+            'facet': question['facet'],
+            'reverse': question['reverse'],
+            'loadings': {dim: float(pattern[i, d]) for d, dim in enumerate(DIMENSION_CODES)},
+            'intended': float(intended[i]),
+            'interval': [float(low[i]), float(high[i])] if resamples is not None else None,
+            'primary': DIMENSION_CODES[primary[i]],
+            'cross_loading': float(others[i].max()),
+            'as_intended': bool(primary[i] == item_bank.dimension_index[i] and intended[i] >= SALIENT_LOADING)
+        })
+    phi = np.diag(congruence(pattern, target))
+    return {
+        'bank': item_bank.bank,
+        'locale': item_bank.locale,
+        'respondents': accumulator.n,
+        'excluded': accumulator.excluded,
+        'parallel_analysis': {
+            'factors': parallel['factors'],
+            'observed': parallel['observed'][:2 * N_FACTORS].tolist(),
+            'threshold': parallel['threshold'][:2 * N_FACTORS].tolist()
+        },
+        'congruence': {dim: float(phi[d]) for d, dim in enumerate(DIMENSION_CODES)},
+        'factor_correlations': {dim: dict(zip(DIMENSION_CODES, factor_correlations[d].tolist()))
+                                for d, dim in enumerate(DIMENSION_CODES)},
+        'bootstrap': samples,
+        'items': items,
+        'misfits': [item['id'] for item in items if not item['as_intended']]
+    }
+
+def validate_source(source, item_bank, samples=BOOTSTRAP_SAMPLES, workers=None, seed=None, start=None, end=None):
+    """Passage en flux sur les réponses stockées puis rapport de structure"""
+    accumulator = accumulate(response_batches(source, item_bank, start=start, end=end), len(item_bank),
+                             seed=seed)
+    return structure_report(item_bank, accumulator, samples, workers, seed)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Structure factorielle des réponses stockées "
+                                                 "(analyse parallèle, EFA oblique, bootstrap)")
+    parser.add_argument('source', help="racine de l'archive Parquet, fichier .parquet ou .csv (une colonne par item)")
+    parser.add_argument('--bank', default=DEFAULT_BANK)
+    parser.add_argument('--locale', default=DEFAULT_LOCALE)
+    parser.add_argument('--start', help="première date (archive, AAAA-MM-JJ)")
+    parser.add_argument('--end', help="dernière date (archive, AAAA-MM-JJ)")
+    parser.add_argument('--bootstrap', type=int, default=BOOTSTRAP_SAMPLES, help="rééchantillons (0 : aucun)")
+    parser.add_argument('--workers', type=int, help="processus du bootstrap (nombre de cœurs par défaut)")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--json', help="écrit le rapport complet dans ce fichier")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    item_bank = get_registry().get(args.bank, args.locale)
+    report = validate_source(args.source, item_bank, args.bootstrap, args.workers, args.seed, args.start, args.end)
+    parallel = report['parallel_analysis']
+    print(f"{report['respondents']} réponses complètes ({report['excluded']} incomplètes écartées), "
+          f"analysées en {time.perf_counter() - started:.1f} s")
+    print(f"Analyse parallèle : {parallel['factors']} facteur(s) retenu(s) pour {N_FACTORS} domaines attendus")
+    for dim, value in report['congruence'].items():
+        print(f"  {DIMENSIONS[dim]:<16} congruence avec la clé {value:.2f}")
+    misfits = [item for item in report['items'] if not item['as_intended']]
+    print(f"{len(report['items']) - len(misfits)} items sur {len(report['items'])} saturent leur domaine "
+          f"(>= {SALIENT_LOADING:.2f}, saturation principale)")
+    for item in misfits:
+        print(f"  {item['id']} ({item['dimension']}, {item['facet']}) : {item['intended']:.2f} sur son domaine, "
+              f"principale sur {item['primary']}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Interprétation des percentiles NEO PI-R : niveaux et descriptions par dimension
+"""
+
+LEVELS = ['Faible', 'Moyen', 'Élevé']
+
+DIMENSION_DESCRIPTIONS = {
+    'N': {
+        'Élevé': "Vous avez tendance à éprouver plus souvent des émotions négatives comme l'anxiété, la tristesse ou la colère. Vous pouvez être plus sensible au stress.",
+        'Moyen': "Vous maintenez un équilibre émotionnel relatif, avec des périodes de stress normal alternant avec des moments de sérénité.",
+        'Faible': "Vous êtes généralement calme, serein et émotionnellement stable. Vous gérez bien le stress et restez optimiste."
+    },
+    'E': {
+        'Élevé': "Vous êtes sociable, énergique et aimez être entouré. Vous cherchez la stimulation et êtes souvent de bonne humeur.",
+        'Moyen': "Vous appréciez la compagnie des autres tout en valorisant aussi les moments de solitude. Votre niveau d'énergie est équilibré.",
+        'Faible': "Vous préférez les interactions en petit groupe ou la solitude. Vous êtes plus réservé et réfléchi dans vos actions."
+    },
+    'O': {
+        'Élevé': "Vous êtes créatif, curieux et ouvert aux nouvelles expériences. Vous appréciez l'art, les idées abstraites et le changement.",
+        'Moyen': "Vous montrez un intérêt modéré pour les nouvelles expériences, combinant ouverture et pragmatisme.",
+        'Faible': "Vous préférez la familiarité et les méthodes éprouvées. Vous êtes pragmatique et moins attiré par l'abstraction."
+    },
+    'A': {
+        'Élevé': "Vous êtes coopératif, confiant et bienveillant envers les autres. Vous évitez les conflits et cherchez l'harmonie.",
+        'Moyen': "Vous équilibrez coopération et compétition, confiance et prudence selon les situations.",
+        'Faible': "Vous êtes plus compétitif et sceptique. Vous défendez vos intérêts et pouvez être plus direct dans vos interactions."
+    },
+    'C': {
+        'Élevé': "Vous êtes organisé, discipliné et persévérant. Vous planifiez soigneusement et atteignez vos objectifs méthodiquement.",
+        'Moyen': "Vous trouvez un équilibre entre organisation et flexibilité, planification et spontanéité.",
+        'Faible': "Vous êtes plus flexible et spontané. Vous préférez vous adapter aux situations plutôt que de tout planifier."
+    }
+}
+
+FACET_DESCRIPTIONS = {
+    'N': {
+        'Anxiété': "Tendance à s'inquiéter, à ressentir de la nervosité et de la tension",
+        'Hostilité': "Tendance à éprouver de la colère, de la frustration et de l'amertume",
+        'Dépression': "Tendance à se sentir triste, découragé et désespéré",
+        'Timidité sociale': "Tendance à se sentir mal à l'aise en présence d'autres personnes",
+        'Impulsivité': "Tendance à agir sans réfléchir aux conséquences",
+        'Vulnérabilité': "Tendance à se sentir incapable de gérer le stress"
+    },
+    'E': {
+        'Chaleur': "Capacité à établir des relations chaleureuses et amicales",
+        'Grégarité': "Préférence pour la compagnie des autres",
+        'Assertivité': "Tendance à être dominant, énergique et socialement visible",
+        'Activité': "Rythme de vie rapide et niveau d'énergie élevé",
+        'Recherche de sensations': "Besoin d'excitation et de stimulation",
+        'Émotions positives': "Tendance à éprouver de la joie, du bonheur et de l'optimisme"
+    },
+    'O': {
+        'Fantaisie': "Imagination active et vie intérieure riche",
+        'Esthétique': "Appréciation de l'art, de la beauté et de la poésie",
+        'Sentiments': "Réceptivité à ses propres émotions et celles des autres",
+        'Actions': "Volonté d'essayer de nouvelles activités et d'aller vers l'inconnu",
+        'Idées': "Curiosité intellectuelle et ouverture aux nouvelles idées",
+        'Valeurs': "Disposition à remettre en question les valeurs établies"
+    },
+    'A': {
+        'Confiance': "Disposition à croire que les autres sont honnêtes et bienveillants",
+        'Droiture': "Franchise et sincérité dans les relations avec autrui",
+        'Altruisme': "Préoccupation active pour le bien-être des autres",
+        'Compliance': "Tendance à éviter les conflits et à coopérer",
+        'Modestie': "Tendance à être humble et effacé",
+        'Sensibilité': "Attitude de sympathie et de compassion envers les autres"
+    },
+    'C': {
+        'Compétence': "Sentiment d'être capable, sensé et efficace",
+        'Ordre': "Tendance à être organisé, soigneux et bien structuré",
+        'Sens du devoir': "Respect des obligations sociales et morales",
+        'Recherche de réussite': "Effort pour exceller et réussir",
+        'Autodiscipline': "Capacité à persévérer dans des tâches difficiles",
+        'Délibération': "Tendance à réfléchir soigneusement avant d'agir"
+    }
+}
+
+def get_level(percentile):
+    """Niveau correspondant à un percentile"""
+    if percentile >= 70:
+        return "Élevé"
+    elif percentile >= 30:
+        return "Moyen"
+    return "Faible"
+
+def get_dimension_description(dimension, level):
+    """Retourne une description détaillée de chaque dimension selon le niveau"""
+    return DIMENSION_DESCRIPTIONS.get(dimension, {}).get(level, "Description non disponible")
+
+def get_facet_description(dimension, facet):
+    """Définition d'une facette"""
+    return FACET_DESCRIPTIONS.get(dimension, {}).get(facet, "Description non disponible")
+
+def get_interpretation(percentiles):
+    """Fournit une interprétation des scores"""
+    interpretations = {}
+
+    for dim, percentile in percentiles.items():
+        level = get_level(percentile)
+        interpretations[dim] = {
+            'level': level,
+            'percentile': percentile,
+            'description': get_dimension_description(dim, level)
+        }
+
+    return interpretations
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Registre des banques d'items du NEO PI-R
+Les fichiers banks/<banque>.<langue>.json sont validés et compilés une seule fois par processus
+"""
+
+import json
+import os
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+BANKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "banks")
+DEFAULT_BANK = "neo_pir_short"
+DEFAULT_LOCALE = "fr"
+
+DIMENSIONS = {
+    'N': 'Neuroticisme',
+    'E': 'Extraversion',
+    'O': 'Ouverture',
+    'A': 'Agréabilité',
+    'C': 'Conscienciosité'
+}
+
+FACETS = {
+    'N': ['Anxiété', 'Hostilité', 'Dépression', 'Timidité sociale', 'Impulsivité', 'Vulnérabilité'],
+    'E': ['Chaleur', 'Grégarité', 'Assertivité', 'Activité', 'Recherche de sensations', 'Émotions positives'],
+    'O': ['Fantaisie', 'Esthétique', 'Sentiments', 'Actions', 'Idées', 'Valeurs'],
+    'A': ['Confiance', 'Droiture', 'Altruisme', 'Compliance', 'Modestie', 'Sensibilité'],
+    'C': ['Compétence', 'Ordre', 'Sens du devoir', 'Recherche de réussite', 'Autodiscipline', 'Délibération']
+}
+
+DIMENSION_CODES = list(DIMENSIONS.keys())
+# Facettes à plat, dans l'ordre des dimensions : (dimension, facette)
+FACET_CODES = [(dim, facet) for dim in DIMENSION_CODES for facet in FACETS[dim]]
+
+REQUIRED_ITEM_FIELDS = {'id': str, 'text': str, 'dimension': str, 'facet': str, 'reverse': bool}
+
+class ItemBankError(ValueError):
+    """Fichier de banque d'items invalide"""
+
+class ItemBank:
+    """Banque d'items compilée : questions immuables et clé de cotation matricielle"""
+
+    def __init__(self, bank, locale, title, response_options, items):
+        self.bank = bank
+        self.locale = locale
+        self.title = title
+        self.response_options = tuple(response_options)
+        self.questions = tuple(MappingProxyType(dict(item)) for item in items)
+        self.item_ids = tuple(item['id'] for item in items)
+        self.item_index = MappingProxyType({item_id: i for i, item_id in enumerate(self.item_ids)})
+
+        # Clé de cotation : indices de dimension/facette et inversion, par item
+        self.dimension_index = np.array([DIMENSION_CODES.index(q['dimension']) for q in items], dtype=np.int8)
+        self.facet_index = np.array([FACET_CODES.index((q['dimension'], q['facet'])) for q in items], dtype=np.int8)
+        self.reverse = np.array([q['reverse'] for q in items], dtype=bool)
+
+        # Matrices d'appartenance (items x dimensions) et (items x facettes)
+        self.dimension_key = np.zeros((len(items), len(DIMENSION_CODES)), dtype=np.float32)
+        self.dimension_key[np.arange(len(items)), self.dimension_index] = 1
+        self.facet_key = np.zeros((len(items), len(FACET_CODES)), dtype=np.float32)
+        self.facet_key[np.arange(len(items)), self.facet_index] = 1
+        self.items_per_dimension = self.dimension_key.sum(axis=0)
+        self.items_per_facet = self.facet_key.sum(axis=0)
+
+        for array in (self.dimension_index, self.facet_index, self.reverse,
+                      self.dimension_key, self.facet_key, self.items_per_dimension, self.items_per_facet):
+            array.setflags(write=False)
+
+    def __len__(self):
+        return len(self.questions)
+
+    def item(self, item_id):
+        """Retourne un item par identifiant"""
+        return self.questions[self.item_index[item_id]]
+
+    def response_vector(self, responses):
+        """Convertit un dictionnaire {id: réponse} en vecteur aligné (0 = sans réponse)"""
+        vector = np.zeros(len(self.questions), dtype=np.int8)
+        for item_id, response in responses.items():
+            index = self.item_index.get(item_id)
+            if index is not None:
+                vector[index] = response
+        return vector
+
+    def keyed_responses(self, responses):
+        """Applique l'inversion des items ; accepte un vecteur ou une matrice (sujets x items)"""
+        responses = np.asarray(responses, dtype=np.float32)
+        keyed = np.where(self.reverse, 6 - responses, responses)
+        return np.where(responses > 0, keyed, 0)
+
+    def raw_scores(self, responses):
+        """Sommes brutes par dimension et par facette (vectorisé)"""
+        keyed = self.keyed_responses(responses)
+        return keyed @ self.dimension_key, keyed @ self.facet_key
+
+def validate_bank(data, source=""):
+    """Vérifie la structure d'une banque d'items ; lève ItemBankError"""
+    for field in ('bank', 'locale', 'title', 'response_options', 'items'):
+        if field not in data:
+            raise ItemBankError(f"{source} : champ manquant '{field}'")
+    if len(data['response_options']) != 5:
+        raise ItemBankError(f"{source} : 5 options de réponse attendues")
+
+    seen = set()
+    for position, item in enumerate(data['items']):
+        for field, expected in REQUIRED_ITEM_FIELDS.items():
+            if not isinstance(item.get(field), expected):
+                raise ItemBankError(f"{source} : item {position}, champ '{field}' invalide")
+        if item['id'] in seen:
+            raise ItemBankError(f"{source} : identifiant en double '{item['id']}'")
+        seen.add(item['id'])
+        if item['dimension'] not in DIMENSIONS:
+            raise ItemBankError(f"{source} : dimension inconnue '{item['dimension']}' ({item['id']})")
+        if item['facet'] not in FACETS[item['dimension']]:
+            raise ItemBankError(f"{source} : facette '{item['facet']}' hors de la dimension {item['dimension']} ({item['id']})")
+
+    covered = {(item['dimension'], item['facet']) for item in data['items']}
+    missing = [f"{dim}/{facet}" for dim, facet in FACET_CODES if (dim, facet) not in covered]
+    if missing:
+        raise ItemBankError(f"{source} : facettes sans item : {', '.join(missing)}")
+
+class ItemBankRegistry:
+    """Banques d'items indexées par (banque, langue), puis par identifiant d'item"""
+
+    def __init__(self):
+        self._banks = {}
+        self._lock = threading.Lock()
+
+    def register(self, data, source=""):
+        """Valide, compile et enregistre une banque"""
+        validate_bank(data, source)
+        bank = ItemBank(data['bank'], data['locale'], data['title'], data['response_options'], data['items'])
+        with self._lock:
+            self._banks[(bank.bank, bank.locale)] = bank
+        return bank
+
+    def load_directory(self, path=BANKS_DIR):
+        """Charge toutes les banques d'un répertoire"""
+        for filename in sorted(os.listdir(path)):
+            if filename.endswith(".json"):
+                with open(os.path.join(path, filename), encoding='utf-8') as f:
+                    self.register(json.load(f), filename)
+        return self
+
+    def get(self, bank=DEFAULT_BANK, locale=DEFAULT_LOCALE):
+        """Retourne une banque compilée"""
+        try:
+            return self._banks[(bank, locale)]
+        except KeyError:
+            raise KeyError(f"Banque d'items inconnue : {bank} ({locale})") from None
+
+    def item(self, bank, locale, item_id):
+        """Retourne un item par (banque, langue, identifiant)"""
+        return self.get(bank, locale).item(item_id)
+
+    def available(self):
+        """Liste des (banque, langue) disponibles"""
+        return sorted(self._banks.keys())
+
+@lru_cache(maxsize=1)
+def get_registry():
+    """Registre partagé par tout le processus, chargé une seule fois"""
+    directory = os.environ.get('NEO_PIR_BANKS_DIR', BANKS_DIR)
+    return ItemBankRegistry().load_directory(directory)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Suivi longitudinal : historique des passations d'un répondant et indice de changement fiable (RCI)
+RCI de Jacobson et Truax : différence des sommes brutes rapportée à l'erreur standard de la différence,
+sd * sqrt(2 * (1 - fidélité)), avec l'écart-type et la fidélité des normes de la banque. Au-delà de 1,96
+en valeur absolue, le changement dépasse l'erreur de mesure (p < 0,05).
+
+Un historique ne relie des passations que si elles partagent une clé stable. L'identifiant de session
+(uuid4 tiré à chaque nouvelle session du navigateur, jamais affiché) ne l'est pas : le répondant qui veut
+suivre son évolution choisit un code répondant (facultatif) et le saisit à chaque passation, sur n'importe
+quel appareil. L'historique est indexé par respondent_key(code), empreinte hash_user_data du code
+normalisé, jamais par le code lui-même ; il est distinct de l'identifiant de session (résultats, reprise
+?sid=). Sans code, l'historique se limite à la session (user_key). L'empreinte n'étant pas salée, le code
+compte au moins RESPONDENT_CODE_MIN caractères. Voir StateBackend.save_history et load_history.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from .item_banks import DIMENSION_CODES, FACET_CODES
+from .norms import SCALE_KEYS
+from .security import hash_user_data
+
+RCI_THRESHOLD = 1.96
+
+# Longueur minimale d'un code répondant (après normalisation)
+RESPONDENT_CODE_MIN = 8
+
+# Champs d'un résultat conservés dans l'historique (les interprétations se recalculent)
+HISTORY_FIELDS = ('item_bank', 'scores', 'facet_scores', 'percentiles')
+
+class RespondentCodeError(ValueError):
+    """Code répondant invalide"""
+
+def normalize_code(code):
+    """Code répondant sans espaces ni distinction de casse (« Marie Dupont 1984 » = « mariedupont1984 »)"""
+    return "".join(str(code).split()).casefold()
+
+def respondent_key(code):
+    """Clé pseudonyme et stable de l'historique d'un répondant, tirée de son code répondant"""
+    code = normalize_code(code)
+    if len(code) < RESPONDENT_CODE_MIN:
+        raise RespondentCodeError(f"Le code répondant doit compter au moins {RESPONDENT_CODE_MIN} caractères")
+    return hash_user_data(f"respondent:{code}")
+
+def user_key(session_id):
+    """Clé pseudonyme de l'historique d'une session sans code répondant (suivi limité à la session)"""
+    return hash_user_data(str(session_id))
+
+def history_record(result):
+    """Entrée d'historique tirée d'un résultat enregistré ('adaptive' : facettes imputées, non comparées)"""
+    return {**{field: result[field] for field in HISTORY_FIELDS}, 'adaptive': result.get('adaptive', False)}
+
+def scale_vector(scores, facet_scores):
+    """Sommes brutes des 35 échelles (domaines puis facettes, ordre de SCALE_KEYS)"""
+    return np.array([scores[dim] for dim in DIMENSION_CODES]
+                    + [facet_scores[dim][facet] for dim, facet in FACET_CODES], dtype=np.float64)
+
+def difference_se(norms):
+    """Erreur standard de la différence entre deux passations, par échelle"""
+    return norms.sd * np.sqrt(2.0 * (1.0 - norms.reliability))
+
+def reliable_change(before, after, norms):
+    """RCI de chaque échelle (vectorisé : vecteurs ou matrices sujets x 35)"""
+    return np.subtract(after, before, dtype=np.float64) / difference_se(norms)
+
+def classify(rci, threshold=RCI_THRESHOLD):
+    """-1 (baisse fiable), 0 (dans l'erreur de mesure) ou 1 (hausse fiable)"""
+    return np.where(np.abs(rci) >= threshold, np.sign(rci), 0).astype(np.int8)
+
+def history_changes(history, norms):
+    """Changements entre passations successives d'un historique [(horodatage, entrée)], par date
+
+    Retourne (sommes brutes (passations x 35), RCI entre passations successives (passations - 1, 35)).
+    """
+    raw = np.array([scale_vector(entry['scores'], entry['facet_scores']) for _, entry in history])
+    raw = raw.reshape(-1, len(SCALE_KEYS))
+    return raw, reliable_change(raw[:-1], raw[1:], norms)
+
+def population_changes(respondents, completed_at, raw, norms):
+    """Changements entre passations successives de tous les répondants, en une passe vectorisée
+
+    respondents : identifiants triables (n,), par exemple les pseudonymes 'S16' de l'archive ;
+    completed_at : instants (n,) ; raw : sommes brutes (n, 35).
+    Retourne (indices des passations antérieures, indices des suivantes, RCI (paires, 35)).
+    """
+    respondents = np.asarray(respondents)
+    order = np.lexsort((np.asarray(completed_at), respondents))
+    # Paires de passations consécutives d'un même répondant dans l'ordre (répondant, date)
+    same = respondents[order[1:]] == respondents[order[:-1]]
+    before, after = order[:-1][same], order[1:][same]
+    # Sélection dans le type d'origine (int16 de l'archive) : seules les paires sont converties
+    raw = np.asarray(raw)
+    return before, after, reliable_change(raw[before], raw[after], norms)
+
+def change_summary(rci, threshold=RCI_THRESHOLD):
+    """Part des hausses et baisses fiables par échelle : {échelle: (hausses, baisses)}"""
+    status = classify(rci, threshold)
+    pairs = max(len(status), 1)
+    return {scale: ((status[:, i] > 0).sum() / pairs, (status[:, i] < 0).sum() / pairs)
+            for i, scale in enumerate(SCALE_KEYS)}
+
+if __name__ == "__main__":
+    from neo_core.item_banks import DEFAULT_BANK, get_registry
+    from neo_core.norms import get_norms
+    from neo_core.response_archive import pseudonym_array, raw_column, scan
+
+    parser = argparse.ArgumentParser(description="Changements fiables entre passations, sur l'archive Parquet")
+    parser.add_argument('root', help="racine de l'archive (neo_core.response_archive)")
+    parser.add_argument('--bank', default=DEFAULT_BANK)
+    parser.add_argument('--start', help="première date (AAAA-MM-JJ)")
+    parser.add_argument('--end', help="dernière date (AAAA-MM-JJ)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    columns = ['respondent', 'completed_at'] + [raw_column(scale) for scale in SCALE_KEYS]
+    table = scan(args.root, args.bank, columns=columns, start=args.start, end=args.end)
+    locale = next(loc for bank, loc in get_registry().available() if bank == args.bank)
+    norms = get_norms(get_registry().get(args.bank, locale))
+    raw = np.column_stack([table[raw_column(scale)].to_numpy() for scale in SCALE_KEYS])
+    respondents = pseudonym_array(table['respondent'])
+    before, after, rci = population_changes(respondents, table['completed_at'].to_numpy(), raw, norms)
+    print(f"{table.num_rows} passations, {len(before)} paires de passations successives "
+          f"en {time.perf_counter() - start:.2f} s")
+    for scale, (up, down) in change_summary(rci).items():
+        if ':' not in scale:
+            print(f"  {scale} : hausses fiables {up:.1%}, baisses fiables {down:.1%}")
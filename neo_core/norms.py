@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Normes NEO PI-R : percentiles et intervalles de confiance des 5 domaines et 30 facettes
+Une table de normes (norm_tables/<banque>.json) donne moyenne, écart-type et fidélité de chaque échelle ;
+les sommes brutes étant entières, percentiles et bornes sont tabulés par (échelle, score brut) et la
+conversion d'un lot se réduit à une indexation.
+
+Une table théorique (from_assumptions, ou marquée "provisional" dans son JSON) ne repose sur aucun
+échantillon : ses percentiles et niveaux sont provisoires et signalés comme tels (PROVISIONAL_NOTE).
+"""
+
+import json
+import os
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+from .item_banks import DIMENSION_CODES, FACET_CODES
+
+NORMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "norm_tables")
+
+MAX_RESPONSE = 5  # échelle de Likert 1-5
+CONFIDENCE_LEVEL = 0.90
+Z_CRITICAL = {0.68: 0.994, 0.80: 1.282, 0.90: 1.645, 0.95: 1.960}
+
+# Hypothèses des normes théoriques (utilisées tant qu'aucune norme étalonnée n'est disponible)
+ITEM_MEAN = 3.0
+ITEM_SD = 1.1
+DOMAIN_ITEM_CORRELATION = 0.20
+FACET_ITEM_CORRELATION = 0.40
+
+PROVISIONAL_NOTE = ("Normes théoriques provisoires : percentiles et niveaux indicatifs, calculés à partir "
+                    "d'hypothèses et non d'un échantillon de référence, en attendant des normes étalonnées.")
+
+# Échelles dans l'ordre des colonnes : 5 domaines puis 30 facettes
+SCALE_KEYS = DIMENSION_CODES + [f"{dim}:{facet}" for dim, facet in FACET_CODES]
+
+def normal_cdf(z):
+    """Fonction de répartition de la loi normale, vectorisée (Abramowitz-Stegun 7.1.26, erreur < 1.5e-7)"""
+    z = np.asarray(z, dtype=np.float64)
+    x = np.abs(z) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-x * x)
+    return 0.5 * (1.0 + np.sign(z) * erf)
+
+class NormTableError(ValueError):
+    """Table de normes invalide"""
+
+class NormTable:
+    """Moyenne, écart-type et fidélité des 35 échelles (domaines puis facettes)"""
+
+    def __init__(self, mean, sd, reliability, bank=None, source="", provisional=False):
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.sd = np.asarray(sd, dtype=np.float64)
+        self.reliability = np.asarray(reliability, dtype=np.float64)
+        for name, array in (('mean', self.mean), ('sd', self.sd), ('reliability', self.reliability)):
+            if array.shape != (len(SCALE_KEYS),):
+                raise NormTableError(f"{name} : {len(SCALE_KEYS)} valeurs attendues, {array.size} reçues")
+        if (self.sd <= 0).any() or ((self.reliability < 0) | (self.reliability >= 1)).any():
+            raise NormTableError("Écarts-types positifs et fidélités dans [0, 1[ attendus")
+        self.bank = bank
+        self.source = source
+        # Vrai pour des normes théoriques, tant qu'aucun étalonnage ne les remplace
+        self.provisional = bool(provisional)
+        # Erreur standard de mesure, en unités z
+        self.sem_z = np.sqrt(1.0 - self.reliability)
+        self._lookup = {}
+
+    @classmethod
+    def from_assumptions(cls, item_bank):
+        """Normes théoriques dérivées du nombre d'items par échelle (formule de Spearman-Brown)"""
+        counts = np.concatenate([item_bank.items_per_dimension, item_bank.items_per_facet]).astype(np.float64)
+        correlation = np.where(np.arange(len(SCALE_KEYS)) < len(DIMENSION_CODES),
+                               DOMAIN_ITEM_CORRELATION, FACET_ITEM_CORRELATION)
+        mean = counts * ITEM_MEAN
+        sd = ITEM_SD * np.sqrt(counts + counts * (counts - 1) * correlation)
+        reliability = counts * correlation / (1 + (counts - 1) * correlation)
+        source = (f"Normes théoriques : moyenne d'item {ITEM_MEAN}, écart-type d'item {ITEM_SD}, "
+                  f"corrélations inter-items {DOMAIN_ITEM_CORRELATION} (domaines) et "
+                  f"{FACET_ITEM_CORRELATION} (facettes) ; à remplacer par des normes étalonnées")
+        return cls(mean, sd, reliability, item_bank.bank, source, provisional=True)
+
+    @classmethod
+    def fit(cls, item_bank, responses, source=""):
+        """Étalonne les normes sur un échantillon (sujets x items, 1-5) ; fidélité = alpha de Cronbach
+
+        Les sujets incomplets (0 = sans réponse, items non posés d'une passation adaptative) sont écartés.
+        """
+        responses = np.asarray(responses)
+        responses = responses[(responses > 0).all(axis=1)]
+        if len(responses) < 2:
+            raise NormTableError("Au moins deux sujets aux réponses complètes sont nécessaires")
+        keyed = item_bank.keyed_responses(responses).astype(np.float64)
+        key = np.hstack([item_bank.dimension_key, item_bank.facet_key]).astype(np.float64)
+        raw = keyed @ key
+
+        counts = key.sum(axis=0)
+        item_variance = keyed.var(axis=0, ddof=1)
+        total_variance = raw.var(axis=0, ddof=1)
+        alpha = counts / np.maximum(counts - 1, 1) * (1 - (item_variance @ key) / total_variance)
+        source = source or f"Étalonnage sur {raw.shape[0]} sujets"
+        return cls(raw.mean(axis=0), raw.std(axis=0, ddof=1), np.clip(alpha, 0, 0.99), item_bank.bank, source)
+
+    @classmethod
+    def load(cls, path):
+        """Charge une table de normes JSON"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        scales = data.get('scales', {})
+        missing = [key for key in SCALE_KEYS if key not in scales]
+        if missing:
+            raise NormTableError(f"{os.path.basename(path)} : échelles manquantes {missing[:5]}")
+        return cls(
+            [scales[key]['mean'] for key in SCALE_KEYS],
+            [scales[key]['sd'] for key in SCALE_KEYS],
+            [scales[key]['reliability'] for key in SCALE_KEYS],
+            data.get('bank'),
+            data.get('source', ""),
+            data.get('provisional', False)
+        )
+
+    def save(self, path):
+        """Sauvegarde la table au format JSON"""
+        data = {
+            'bank': self.bank,
+            'source': self.source,
+            'provisional': self.provisional,
+            'scales': {
+                key: {'mean': round(float(m), 4), 'sd': round(float(s), 4), 'reliability': round(float(r), 4)}
+                for key, m, s, r in zip(SCALE_KEYS, self.mean, self.sd, self.reliability)
+            }
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _convert(self, raw, columns, confidence):
+        """Percentile et bornes de confiance (3, ...) de sommes brutes quelconques"""
+        z = (raw - self.mean[:columns]) / self.sd[:columns]
+        half_width = Z_CRITICAL[confidence] * self.sem_z[:columns]
+        # Une seule évaluation de la loi normale pour les trois bornes
+        return normal_cdf(np.stack([z, z - half_width, z + half_width])) * 100
+
+    def _table(self, confidence, max_raw):
+        """Table (3, 35 * largeur) des conversions de chaque score brut entier 0..max_raw, par échelle"""
+        table = self._lookup.get(confidence)
+        if table is None or table.shape[1] < len(SCALE_KEYS) * (max_raw + 1):
+            width = max(max_raw + 1, 2 * int(self.mean.max()) + 1)
+            raw = np.broadcast_to(np.arange(width, dtype=np.float64)[:, None], (width, len(SCALE_KEYS)))
+            table = self._convert(raw, len(SCALE_KEYS), confidence).transpose(0, 2, 1).reshape(3, -1)
+            self._lookup[confidence] = table
+        return table
+
+    def score(self, dimension_sums, facet_sums=None, confidence=CONFIDENCE_LEVEL):
+        """Percentiles et bornes de l'intervalle de confiance (vectorisé)
+
+        dimension_sums : (sujets, 5) ; facet_sums : (sujets, 30) ou None pour les seuls domaines.
+        Retourne (percentiles, bas, haut), de forme (sujets, 5) ou (sujets, 35).
+        """
+        raw = np.asarray(dimension_sums)
+        if facet_sums is not None:
+            raw = np.hstack([raw, np.asarray(facet_sums)])
+        columns = raw.shape[-1]
+
+        index = raw.astype(np.intp)
+        if raw.size == 0 or (index != raw).any() or index.min() < 0:
+            # Sommes non entières (pondérations, imputations) : conversion directe
+            cdf = self._convert(raw.astype(np.float64), columns, confidence)
+            return cdf[0], cdf[1], cdf[2]
+
+        table = self._table(confidence, int(index.max()))
+        width = table.shape[1] // len(SCALE_KEYS)
+        flat = index + np.arange(columns) * width
+        return table[0][flat], table[1][flat], table[2][flat]
+
+    def percentiles(self, dimension_sums):
+        """Percentiles des 5 domaines"""
+        return self.score(dimension_sums)[0]
+
+@lru_cache(maxsize=None)
+def get_norms(item_bank):
+    """Table de normes d'une banque (norm_tables/<banque>.json), ou normes théoriques à défaut"""
+    directory = os.environ.get('NEO_PIR_NORMS_DIR', NORMS_DIR)
+    path = os.path.join(directory, f"{item_bank.bank}.json")
+    if os.path.exists(path):
+        return NormTable.load(path)
+    return NormTable.from_assumptions(item_bank)
+
+if __name__ == "__main__":
+    from neo_core.item_banks import DEFAULT_LOCALE, get_registry
+
+    if len(sys.argv) == 3:
+        # Normes théoriques : python -m neo_core.norms banque sortie.json
+        bank, output_path = sys.argv[1:]
+        NormTable.from_assumptions(get_registry().get(bank, DEFAULT_LOCALE)).save(output_path)
+    elif len(sys.argv) == 4:
+        # Étalonnage : python -m neo_core.norms banque reponses.csv sortie.json
+        import pandas as pd
+
+        bank, csv_path, output_path = sys.argv[1:]
+        item_bank = get_registry().get(bank, DEFAULT_LOCALE)
+        df = pd.read_csv(csv_path)
+        NormTable.fit(item_bank, df[list(item_bank.item_ids)].fillna(0).to_numpy(dtype=int)).save(output_path)
+    else:
+        print("Usage : python -m neo_core.norms banque [reponses.csv] normes.json")
+        sys.exit(1)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Moteur de recommandations NEO PI-R
+Les règles (rules/recommendations.<langue>.json) ne dépendent que des niveaux des 5 dimensions :
+les 3^5 = 243 profils possibles sont calculés et rendus en HTML une seule fois par processus.
+"""
+
+import json
+import os
+from functools import lru_cache
+
+from .interpretation import LEVELS, get_dimension_description
+from .item_banks import DIMENSION_CODES, DIMENSIONS
+from .templates import RECOMMENDATION_CARDS, career_card, recommendation_cards
+
+RULES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules")
+N_PROFILES = len(LEVELS) ** len(DIMENSION_CODES)
+
+class RecommendationRulesError(ValueError):
+    """Fichier de règles de recommandations invalide"""
+
+def profile_code(levels):
+    """Code en base 3 d'un profil (niveau par dimension, N poids faible)"""
+    code = 0
+    for weight, dim in enumerate(DIMENSION_CODES):
+        code += LEVELS.index(levels[dim]) * len(LEVELS) ** weight
+    return code
+
+def profile_levels(code):
+    """Niveaux par dimension correspondant à un code de profil"""
+    levels = {}
+    for dim in DIMENSION_CODES:
+        code, digit = divmod(code, len(LEVELS))
+        levels[dim] = LEVELS[digit]
+    return levels
+
+def validate_rules(data, source="<règles>"):
+    """Vérifie la structure d'un fichier de règles"""
+    sections = data.get('sections')
+    if not isinstance(sections, list) or not sections:
+        raise RecommendationRulesError(f"{source} : liste 'sections' manquante")
+    unknown = [section for section in sections if section not in RECOMMENDATION_CARDS and section != 'career']
+    if unknown:
+        raise RecommendationRulesError(f"{source} : sections sans gabarit HTML {unknown}")
+    for position, rule in enumerate(data.get('rules', [])):
+        where = f"{source}, règle {position}"
+        if rule.get('section') not in sections:
+            raise RecommendationRulesError(f"{where} : section inconnue {rule.get('section')!r}")
+        if rule.get('dimension') not in DIMENSIONS:
+            raise RecommendationRulesError(f"{where} : dimension inconnue {rule.get('dimension')!r}")
+        if rule.get('level') not in LEVELS:
+            raise RecommendationRulesError(f"{where} : niveau inconnu {rule.get('level')!r}")
+        if not isinstance(rule.get('text'), str):
+            raise RecommendationRulesError(f"{where} : texte manquant")
+
+class RecommendationEngine:
+    """Table des 243 profils : textes et HTML des recommandations, indexés par code de profil"""
+
+    def __init__(self, rules, dimensions=DIMENSIONS, source="<règles>"):
+        validate_rules(rules, source)
+        self.sections = list(rules['sections'])
+        self.empty = dict(rules.get('empty', {}))
+        self.rules = list(rules['rules'])
+        self.dimensions = dict(dimensions)
+        self.profiles = [self._build(profile_levels(code)) for code in range(N_PROFILES)]
+
+    @classmethod
+    def from_file(cls, path):
+        """Charge les règles depuis un fichier JSON"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data, source=os.path.basename(path))
+
+    def _build(self, levels):
+        """Recommandations d'un profil : textes par section et HTML prêt à afficher"""
+        texts = {section: [] for section in self.sections}
+        career_dimensions = []
+        for rule in self.rules:
+            dim = rule['dimension']
+            if levels[dim] != rule['level']:
+                continue
+            text = rule['text'].format(
+                dimension=self.dimensions[dim],
+                description=get_dimension_description(dim, rule['level'])
+            )
+            texts[rule['section']].append(text)
+            if rule['section'] == 'career':
+                career_dimensions.append(dim)
+
+        rendered = {}
+        for section, items in texts.items():
+            if not items:
+                rendered[section] = ""
+            elif section == 'career':
+                rendered[section] = career_card(
+                    (self.dimensions[dim], text) for dim, text in zip(career_dimensions, items)
+                )
+            else:
+                rendered[section] = recommendation_cards(section, items)
+
+        return {'levels': levels, 'texts': texts, 'html': rendered}
+
+    def lookup(self, interpretations):
+        """Recommandations d'un profil à partir des interprétations (niveau par dimension)"""
+        return self.profiles[profile_code({dim: interpretations[dim]['level'] for dim in DIMENSION_CODES})]
+
+@lru_cache(maxsize=None)
+def get_recommendation_engine(locale="fr"):
+    """Moteur partagé par tout le processus, construit une seule fois par langue"""
+    directory = os.environ.get('NEO_PIR_RULES_DIR', RULES_DIR)
+    return RecommendationEngine.from_file(os.path.join(directory, f"recommendations.{locale}.json"))
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+"""
+Archive en colonnes des réponses (Parquet), partitionnée par banque d'items et par date
+Disposition : <racine>/bank=<banque>/date=<AAAA-MM-JJ>/part-*.parquet. Chaque ligne contient le pseudonyme
+du répondant, l'heure de passation, une colonne int8 par item et les scores calculés (sommes brutes int16,
+percentiles des domaines uint8). Une lecture ne décode que les colonnes demandées et saute les partitions
+et groupes de lignes exclus par le filtre (statistiques min/max de Parquet).
+
+Seules les réponses données sont archivées : les items non posés d'une passation adaptative valent 0
+(sans réponse) et la colonne `adaptive` marque ces lignes. Leurs scores sont ceux de la session, calculés
+avec les réponses attendues des items non posés.
+
+Les écritures en ligne produisent de petits fichiers ; le compactage les fusionne en arrière-plan.
+"""
+
+import argparse
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .item_banks import DIMENSION_CODES, get_registry
+from .norms import SCALE_KEYS, get_norms
+from .security import hash_user_data
+
+logger = logging.getLogger(__name__)
+
+PSEUDONYM_BYTES = 16
+ROW_GROUP_ROWS = 256 * 1024
+COMPRESSION = 'zstd'
+
+# Écritures en ligne : un fichier par banque dès FLUSH_ROWS lignes ou après FLUSH_SECONDS
+FLUSH_ROWS = 10000
+FLUSH_SECONDS = 60.0
+
+# Compactage : fusion des fichiers de moins de TARGET_FILE_ROWS lignes d'une partition qui en compte
+# au moins COMPACT_MIN_FILES
+COMPACT_MIN_FILES = 4
+TARGET_FILE_ROWS = 4 * 1024 * 1024
+COMPACT_INTERVAL = 300.0
+# Verrou de compactage d'une partition : tous les processus qui partagent l'archive compactent
+COMPACT_LOCK = '.compact.lock'
+COMPACT_LOCK_TIMEOUT = 3600.0
+
+PARTITIONING = ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+
+class ArchiveError(ValueError):
+    """Archive ou requête d'archive invalide"""
+
+def pseudonym(respondent):
+    """Pseudonyme d'un répondant : empreinte SHA-256 (hash_user_data) tronquée à 16 octets"""
+    return bytes.fromhex(hash_user_data(str(respondent)))[:PSEUDONYM_BYTES]
+
+def pseudonym_array(column):
+    """Pseudonymes d'une colonne lue en tableau NumPy 'S16' (comparable, triable), sans objets Python"""
+    chunks = [np.frombuffer(chunk.buffers()[1], dtype=f'S{PSEUDONYM_BYTES}')[chunk.offset:chunk.offset + len(chunk)]
+              for chunk in column.chunks]
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=f'S{PSEUDONYM_BYTES}')
+
+def raw_column(scale):
+    """Nom de la colonne de somme brute d'une échelle ('N' ou 'N:Anxiété')"""
+    return f"raw:{scale}"
+
+def percentile_column(dimension):
+    """Nom de la colonne de percentile d'un domaine"""
+    return f"pct:{dimension}"
+
+def archive_schema(item_bank):
+    """Schéma des fichiers d'une banque (les colonnes de partition bank/date sont dans les chemins)"""
+    return pa.schema(
+        [('respondent', pa.binary(PSEUDONYM_BYTES)), ('completed_at', pa.timestamp('ms', tz='UTC')),
+         ('locale', pa.string()), ('adaptive', pa.bool_())]
+        + [(item_id, pa.int8()) for item_id in item_bank.item_ids]
+        + [(raw_column(scale), pa.int16()) for scale in SCALE_KEYS]
+        + [(percentile_column(dim), pa.uint8()) for dim in DIMENSION_CODES]
+    )
+
+def build_table(item_bank, respondents, completed_at, responses, scored=None):
+    """Table Arrow d'un lot : pseudonymes (16 octets), instants UTC, réponses données (sujets x items)
+
+    scored : réponses cotées, si elles diffèrent des réponses données (passation adaptative : réponses
+    attendues des items non posés) ; les scores sont calculés ici, en une passe vectorisée sur le lot.
+    """
+    responses = np.ascontiguousarray(responses, dtype=np.int8).reshape(-1, len(item_bank))
+    scored = responses if scored is None else np.asarray(scored, dtype=np.int8).reshape(responses.shape)
+    adaptive = ((responses == 0) & (scored > 0)).any(axis=1)
+    dimension_sums, facet_sums = item_bank.raw_scores(scored)
+    raw = np.rint(np.hstack([dimension_sums, facet_sums])).astype(np.int16)
+    percentiles = np.rint(get_norms(item_bank).percentiles(dimension_sums)).astype(np.uint8)
+
+    columns = [
+        pa.array(respondents, type=pa.binary(PSEUDONYM_BYTES)),
+        pa.array(np.asarray(completed_at, dtype='datetime64[ms]'), type=pa.timestamp('ms', tz='UTC')),
+        pa.array(np.full(len(responses), item_bank.locale, dtype=object), type=pa.string()),
+        pa.array(adaptive)
+    ]
+    # Colonnes contiguës (une transposition par matrice) : pa.array les adopte sans copie
+    for matrix in (responses, raw, percentiles):
+        columns += [pa.array(column) for column in np.ascontiguousarray(matrix.T)]
+    return pa.Table.from_arrays(columns, schema=archive_schema(item_bank))
+
+def partition_dir(root, bank, date):
+    """Dossier d'une partition (banque, date ISO)"""
+    return os.path.join(root, f"bank={bank}", f"date={date}")
+
+def _write_file(directory, table):
+    """Écrit un fichier sous un nom caché puis le renomme : les lecteurs ne voient que des fichiers complets"""
+    os.makedirs(directory, exist_ok=True)
+    name = f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+    hidden = os.path.join(directory, f".{name}")
+    pq.write_table(table, hidden, row_group_size=ROW_GROUP_ROWS, compression=COMPRESSION)
+    path = os.path.join(directory, name)
+    os.replace(hidden, path)
+    return path
+
+def write_table(root, bank, table):
+    """Répartit une table par date de passation et écrit un fichier par partition ; retourne les chemins"""
+    days = pc.strftime(table['completed_at'], format='%Y-%m-%d').to_numpy(zero_copy_only=False)
+    dates = np.unique(days)
+    paths = []
+    for date in dates:
+        part = table.filter(pa.array(days == date)) if len(dates) > 1 else table
+        paths.append(_write_file(partition_dir(root, bank, date), part))
+    return paths
+
+# ================= ÉCRITURES EN LIGNE =================
+
+class ArchiveWriter:
+    """Tampon des passations terminées, écrit par lots ; maintenance (vidage, compactage) en arrière-plan"""
+
+    def __init__(self, root, flush_rows=FLUSH_ROWS, flush_seconds=FLUSH_SECONDS):
+        self.root = root
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._buffers = {}  # (banque, langue) -> (item_bank, lignes, début du tampon)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def append(self, item_bank, respondent, completed_at, response_vector, scored_vector=None):
+        """Ajoute une passation ; le tampon de la banque est écrit dès qu'il est plein
+
+        respondent : identifiant stable du répondant (clé d'historique), archivé sous son pseudonyme ;
+        response_vector : réponses données (0 = item non posé) ; scored_vector : réponses cotées, si elles
+        diffèrent (passation adaptative).
+        """
+        key = (item_bank.bank, item_bank.locale)
+        instant = np.datetime64(completed_at.astimezone(timezone.utc).replace(tzinfo=None), 'ms')
+        response_vector = np.asarray(response_vector, dtype=np.int8)
+        scored_vector = response_vector if scored_vector is None else np.asarray(scored_vector, dtype=np.int8)
+        row = (pseudonym(respondent), instant, response_vector, scored_vector)
+        with self._lock:
+            rows = self._buffers.setdefault(key, (item_bank, [], time.monotonic()))[1]
+            rows.append(row)
+            full = len(rows) >= self.flush_rows
+        if full:
+            # Échec d'écriture : les lignes restent dans le tampon, la passation n'est pas interrompue
+            try:
+                self.flush(key)
+            except Exception:
+                logger.exception("Écriture de l'archive impossible dans %s ; nouvel essai au prochain vidage",
+                                 self.root)
+
+    def flush(self, key=None, older_than=None):
+        """Écrit les tampons (tous, celui d'une banque, ou ceux plus anciens que `older_than` secondes)
+
+        Les lignes d'un fichier dont l'écriture échoue retournent dans le tampon (écrites au vidage
+        suivant) et la première erreur est relevée après l'écriture des autres fichiers.
+        """
+        now = time.monotonic()
+        with self._lock:
+            keys = [key] if key is not None else list(self._buffers)
+            taken = [(k, self._buffers.pop(k)) for k in keys
+                     if k in self._buffers and (older_than is None or now - self._buffers[k][2] >= older_than)]
+        written = 0
+        error = None
+        # Écriture hors verrou : les passations suivantes remplissent un nouveau tampon
+        for k, (item_bank, rows, started) in taken:
+            # Un fichier par date de passation : un échec ne rend au tampon que les lignes non écrites
+            days = {}
+            for row in rows:
+                days.setdefault(row[1].astype('datetime64[D]'), []).append(row)
+            for day_rows in days.values():
+                respondents, completed_at, responses, scored = zip(*day_rows)
+                try:
+                    table = build_table(item_bank, list(respondents), np.array(completed_at), np.stack(responses),
+                                        np.stack(scored))
+                    write_table(self.root, item_bank.bank, table)
+                except Exception as e:
+                    self._restore(k, item_bank, day_rows, started)
+                    error = error or e
+                else:
+                    written += len(day_rows)
+        if error is not None:
+            raise error
+        return written
+
+    def _restore(self, key, item_bank, rows, started):
+        """Remet en tête du tampon des lignes dont l'écriture a échoué"""
+        with self._lock:
+            current = self._buffers.get(key)
+            if current is None:
+                self._buffers[key] = (item_bank, list(rows), started)
+            else:
+                self._buffers[key] = (item_bank, list(rows) + current[1], min(started, current[2]))
+
+    def _maintain(self, compact_interval):
+        last_compaction = time.monotonic()
+        while not self._stop.wait(min(self.flush_seconds, compact_interval) / 4):
+            # Une erreur (disque plein, archive inaccessible) est journalisée : la maintenance continue
+            try:
+                self.flush(older_than=self.flush_seconds)
+            except Exception:
+                logger.exception("Écriture de l'archive impossible dans %s ; nouvel essai au prochain vidage",
+                                 self.root)
+            if time.monotonic() - last_compaction >= compact_interval:
+                try:
+                    compact(self.root)
+                except Exception:
+                    logger.exception("Compactage de l'archive %s interrompu", self.root)
+                last_compaction = time.monotonic()
+
+    def start(self, compact_interval=COMPACT_INTERVAL):
+        """Démarre le thread de maintenance : vidage des tampons anciens et compactage périodique"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._maintain, args=(compact_interval,),
+                                            name="archive-maintenance", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Arrête la maintenance et écrit les tampons restants"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+# ================= LECTURE =================
+
+def open_dataset(root, bank):
+    """Jeu de données Arrow d'une banque (partitions de date découvertes dans les chemins)"""
+    directory = os.path.join(root, f"bank={bank}")
+    if not os.path.isdir(directory):
+        raise ArchiveError(f"Aucune archive pour la banque {bank} dans {root}")
+    return ds.dataset(directory, format='parquet', partitioning=PARTITIONING)
+
+def dimension_items(bank, dimension):
+    """Identifiants des items d'un domaine dans une banque"""
+    registry = get_registry()
+    locale = next((loc for b, loc in registry.available() if b == bank), None)
+    if locale is None:
+        raise ArchiveError(f"Banque d'items inconnue : {bank}")
+    return [q['id'] for q in registry.get(bank, locale).questions if q['dimension'] == dimension]
+
+def scan_expression(start=None, end=None, where=None):
+    """Filtre : intervalle de dates (élagage des partitions) et condition sur les colonnes (pushdown)"""
+    expression = None
+    for condition in (
+        ds.field('date') >= start if start else None,
+        ds.field('date') <= end if end else None,
+        where
+    ):
+        if condition is not None:
+            expression = condition if expression is None else expression & condition
+    return expression
+
+def scan_columns(bank, columns=None, dimension=None):
+    """Colonnes à lire : liste explicite, ou les items et scores d'un domaine"""
+    if dimension is not None:
+        columns = list(columns or []) + dimension_items(bank, dimension) + [raw_column(dimension)]
+    return columns
+
+def scan(root, bank, columns=None, dimension=None, start=None, end=None, where=None):
+    """Lit une table (seules les colonnes demandées ; `where` : expression pyarrow.dataset)"""
+    return open_dataset(root, bank).to_table(columns=scan_columns(bank, columns, dimension),
+                                             filter=scan_expression(start, end, where))
+
+def scan_batches(root, bank, columns=None, dimension=None, start=None, end=None, where=None,
+                 batch_size=ROW_GROUP_ROWS):
+    """Lit en flux (RecordBatch) : mémoire bornée par un lot, pour les parcours de millions de lignes"""
+    return open_dataset(root, bank).to_batches(columns=scan_columns(bank, columns, dimension),
+                                               filter=scan_expression(start, end, where),
+                                               batch_size=batch_size)
+
+# ================= COMPACTAGE =================
+
+def _acquire_compaction(directory, timeout=COMPACT_LOCK_TIMEOUT):
+    """Prend le verrou de compactage d'une partition (fichier créé avec O_EXCL)
+
+    Retourne un jeton, ou None si un autre processus compacte déjà la partition. Un verrou plus ancien
+    que `timeout` (processus arrêté en plein compactage) est repris.
+    """
+    path = os.path.join(directory, COMPACT_LOCK)
+    token = f"{os.getpid()}-{uuid.uuid4().hex}"
+    for _ in range(2):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) < timeout:
+                    return None
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            continue
+        with os.fdopen(fd, 'w') as f:
+            f.write(token)
+        return token
+    return None
+
+def _release_compaction(directory, token):
+    """Rend le verrou de compactage, s'il est toujours le nôtre"""
+    path = os.path.join(directory, COMPACT_LOCK)
+    try:
+        with open(path) as f:
+            if f.read() == token:
+                os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def compact_partition(directory, min_files=COMPACT_MIN_FILES, target_rows=TARGET_FILE_ROWS):
+    """Fusionne les petits fichiers d'une partition en un seul, trié par heure de passation
+
+    Un seul processus compacte une partition à la fois (verrou COMPACT_LOCK) ; les autres la sautent.
+    Seuls les fichiers lus par ce compactage sont supprimés : les écritures concurrentes sont conservées.
+    Entre le renommage du fichier fusionné et la suppression des anciens, une lecture peut voir des
+    doublons pendant quelques millisecondes.
+    """
+    token = _acquire_compaction(directory)
+    if token is None:
+        return 0
+    try:
+        small = []
+        for name in sorted(os.listdir(directory)):
+            if name.startswith('part-') and name.endswith('.parquet'):
+                path = os.path.join(directory, name)
+                if pq.ParquetFile(path).metadata.num_rows < target_rows:
+                    small.append(path)
+        if len(small) < min_files:
+            return 0
+        table = pa.concat_tables(pq.read_table(path) for path in small)
+        _write_file(directory, table.sort_by('completed_at'))
+        for path in small:
+            os.remove(path)
+        return len(small)
+    finally:
+        _release_compaction(directory, token)
+
+def compact(root, bank=None, min_files=COMPACT_MIN_FILES, target_rows=TARGET_FILE_ROWS):
+    """Compacte toutes les partitions (d'une banque ou de toutes) ; retourne le nombre de fichiers fusionnés"""
+    merged = 0
+    banks = [f"bank={bank}"] if bank else sorted(os.listdir(root)) if os.path.isdir(root) else []
+    for bank_dir in banks:
+        bank_path = os.path.join(root, bank_dir)
+        if not os.path.isdir(bank_path):
+            continue
+        for date_dir in sorted(os.listdir(bank_path)):
+            if date_dir.startswith('date='):
+                merged += compact_partition(os.path.join(bank_path, date_dir), min_files, target_rows)
+    return merged
+
+# ================= IMPORT =================
+
+def import_csv(root, csv_path, bank, locale, chunksize=100000):
+    """Importe un CSV de réponses (une colonne par item, `respondent` et `completed_at` facultatives)"""
+    import pandas as pd
+
+    item_bank = get_registry().get(bank, locale)
+    columns = list(item_bank.item_ids)
+    total = 0
+    for df in pd.read_csv(csv_path, chunksize=chunksize):
+        responses = df[columns].fillna(0).to_numpy(dtype=np.int8)
+        if 'respondent' in df:
+            respondents = [pseudonym(r) for r in df['respondent']]
+        else:
+            respondents = [pseudonym(f"{os.path.basename(csv_path)}:{total + i}") for i in range(len(df))]
+        if 'completed_at' in df:
+            completed_at = pd.to_datetime(df['completed_at'], utc=True).dt.tz_localize(None).to_numpy()
+        else:
+            completed_at = np.full(len(df), np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), 'ms'))
+        write_table(root, bank, build_table(item_bank, respondents, completed_at, responses))
+        total += len(df)
+    return total
+
+if __name__ == "__main__":
+    from neo_core.item_banks import DEFAULT_BANK, DEFAULT_LOCALE
+
+    parser = argparse.ArgumentParser(description="Archive Parquet des réponses NEO PI-R")
+    commands = parser.add_subparsers(dest='command', required=True)
+    importer = commands.add_parser('import', help="importe un CSV de réponses")
+    importer.add_argument('root')
+    importer.add_argument('csv')
+    importer.add_argument('--bank', default=DEFAULT_BANK)
+    importer.add_argument('--locale', default=DEFAULT_LOCALE)
+    scanner = commands.add_parser('scan', help="lit les items d'un domaine et résume son score brut")
+    scanner.add_argument('root')
+    scanner.add_argument('--bank', default=DEFAULT_BANK)
+    scanner.add_argument('--dimension', default='N', choices=DIMENSION_CODES)
+    scanner.add_argument('--start', help="première date (AAAA-MM-JJ)")
+    scanner.add_argument('--end', help="dernière date (AAAA-MM-JJ)")
+    compactor = commands.add_parser('compact', help="fusionne les petits fichiers")
+    compactor.add_argument('root')
+    compactor.add_argument('--bank')
+    compactor.add_argument('--min-files', type=int, default=COMPACT_MIN_FILES)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'import':
+        rows = import_csv(args.root, args.csv, args.bank, args.locale)
+        print(f"{rows} passations importées en {time.perf_counter() - start:.1f} s -> {args.root}")
+    elif args.command == 'scan':
+        table = scan(args.root, args.bank, dimension=args.dimension, start=args.start, end=args.end)
+        raw = table[raw_column(args.dimension)]
+        # Écart-type indéfini sous deux passations
+        spread = pc.stddev(raw, ddof=1).as_py() or 0.0
+        print(f"{table.num_rows} lignes, {table.num_columns} colonnes ({table.nbytes / 1e6:.1f} Mo) "
+              f"en {time.perf_counter() - start:.2f} s ; score brut {args.dimension} : "
+              f"moyenne {pc.mean(raw).as_py() or 0.0:.2f}, écart-type {spread:.2f}")
+    else:
+        merged = compact(args.root, args.bank, args.min_files)
+        print(f"{merged} fichiers fusionnés en {time.perf_counter() - start:.1f} s")
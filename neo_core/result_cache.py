@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Mémoïsation des résultats NEO PI-R par empreinte du vecteur de réponses
+Deux niveaux : LRU en mémoire (partagé par les sessions d'un processus) et répertoire optionnel partagé sur disque
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .security import hash_user_data
+
+logger = logging.getLogger(__name__)
+
+# À incrémenter quand la cotation ou l'interprétation change : les anciennes entrées deviennent inaccessibles
+RESULT_VERSION = 2
+
+def pack_responses(vector):
+    """Empaquette un vecteur de réponses (0-5) à raison de deux réponses par octet"""
+    vector = np.asarray(vector, dtype=np.uint8)
+    if vector.size % 2:
+        vector = np.append(vector, 0)
+    return ((vector[0::2] << 4) | vector[1::2]).astype(np.uint8).tobytes()
+
+def vector_fingerprint(item_bank, vector):
+    """Empreinte d'un vecteur de réponses (ordre des items de la banque)"""
+    packed = pack_responses(vector)
+    return hash_user_data(f"{RESULT_VERSION}:{item_bank.bank}:{item_bank.locale}:{packed.hex()}")
+
+def response_fingerprint(item_bank, responses):
+    """Empreinte des réponses d'une passation (dictionnaire item -> réponse)"""
+    return vector_fingerprint(item_bank, item_bank.response_vector(responses))
+
+class ResultCache:
+    """Cache borné des résultats complets (scores, facettes, percentiles, interprétations)"""
+
+    def __init__(self, max_entries=4096, directory=None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, fingerprint):
+        return os.path.join(self.directory, fingerprint[:2], f"{fingerprint}.json")
+
+    def _remember(self, fingerprint, bundle):
+        with self._lock:
+            self._entries[fingerprint] = bundle
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _read_disk(self, fingerprint):
+        """Lit une entrée du niveau disque (None si absente ou illisible)"""
+        try:
+            with open(self._path(fingerprint), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Entrée de cache illisible %s : %s", fingerprint, e)
+            return None
+
+    def _write_disk(self, fingerprint, bundle):
+        """Écriture atomique : un autre processus ne lit jamais un fichier partiel"""
+        path = self._path(fingerprint)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(bundle, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Écriture du cache impossible %s : %s", fingerprint, e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, fingerprint):
+        """Retourne le résultat mémorisé, ou None"""
+        with self._lock:
+            bundle = self._entries.get(fingerprint)
+            if bundle is not None:
+                self._entries.move_to_end(fingerprint)
+                self._counts['memory_hits'] += 1
+                return bundle
+
+        if self.directory:
+            bundle = self._read_disk(fingerprint)
+            if bundle is not None:
+                self._remember(fingerprint, bundle)
+                with self._lock:
+                    self._counts['disk_hits'] += 1
+                return bundle
+
+        with self._lock:
+            self._counts['misses'] += 1
+        return None
+
+    def put(self, fingerprint, bundle):
+        """Mémorise un résultat dans les deux niveaux"""
+        self._remember(fingerprint, bundle)
+        if self.directory:
+            self._write_disk(fingerprint, bundle)
+
+    def get_or_compute(self, fingerprint, compute):
+        """Retourne le résultat mémorisé ou le calcule avec compute() puis le mémorise"""
+        bundle = self.get(fingerprint)
+        if bundle is None:
+            bundle = compute()
+            self.put(fingerprint, bundle)
+        return bundle
+
+    def stats(self):
+        """Compteurs et taux de succès depuis le démarrage du processus"""
+        with self._lock:
+            counts = dict(self._counts)
+            entries = len(self._entries)
+        lookups = sum(counts.values())
+        hits = counts['memory_hits'] + counts['disk_hits']
+        return {
+            **counts,
+            'lookups': lookups,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'disk_tier': bool(self.directory)
+        }
+
+def build_result_bundle(neo_manager, responses):
+    """Calcule le résultat complet d'une passation (valeur mise en cache)"""
+    scores, facet_scores, percentiles = neo_manager.calculate_scores(responses)
+    return {
+        'scores': scores,
+        'facet_scores': facet_scores,
+        'percentiles': percentiles,
+        'interpretations': neo_manager.get_interpretation(percentiles),
+        **neo_manager.calculate_details(responses)
+    }
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Cotation du NEO PI-R : scores bruts par dimension et facette, percentiles, interprétation
+Les percentiles et intervalles de confiance viennent de la table de normes de la banque (voir norms.py).
+"""
+
+import numpy as np
+
+from .interpretation import get_dimension_description, get_interpretation
+from .item_banks import DEFAULT_BANK, DEFAULT_LOCALE, DIMENSIONS, FACETS, get_registry
+from .norms import CONFIDENCE_LEVEL, get_norms
+
+class NEOPIRManager:
+    """Gestionnaire principal du test NEO PI-R"""
+
+    def __init__(self, bank=DEFAULT_BANK, locale=DEFAULT_LOCALE):
+        self.dimensions = dict(DIMENSIONS)
+        self.facets = {dim: list(facets) for dim, facets in FACETS.items()}
+
+        self.load_questions(bank, locale)
+
+    def load_questions(self, bank=DEFAULT_BANK, locale=DEFAULT_LOCALE):
+        """Charge les questions depuis le registre des banques d'items (compilé au démarrage)"""
+        self.item_bank = get_registry().get(bank, locale)
+        self.questions = self.item_bank.questions
+        self.norms = get_norms(self.item_bank)
+
+    def calculate_scores(self, responses):
+        """Calcule les scores pour chaque dimension et facette"""
+        vector = self.item_bank.response_vector(responses)[None, :]
+        dimension_sums, facet_sums, percentiles = self.calculate_scores_batch(vector)
+        return self.scores_to_dicts(dimension_sums[0], facet_sums[0], percentiles[0])
+
+    def calculate_scores_batch(self, responses):
+        """Calcule les scores d'un lot (matrice sujets x items, 0 = sans réponse), vectorisé"""
+        # Cotation matricielle : inversion (6 - réponse) puis sommes par dimension et facette
+        dimension_sums, facet_sums = self.item_bank.raw_scores(responses)
+
+        # Conversion en percentiles selon les normes de la banque
+        percentiles = self.norms.percentiles(dimension_sums)
+
+        return dimension_sums, facet_sums, percentiles
+
+    def calculate_details(self, responses, confidence=CONFIDENCE_LEVEL):
+        """Percentiles des facettes et intervalles de confiance d'une passation"""
+        vector = self.item_bank.response_vector(responses)[None, :]
+        dimension_sums, facet_sums = self.item_bank.raw_scores(vector)
+        return self.details_to_dicts(*self.calculate_details_batch(dimension_sums, facet_sums, confidence))[0]
+
+    def calculate_details_batch(self, dimension_sums, facet_sums, confidence=CONFIDENCE_LEVEL):
+        """Percentiles et bornes de confiance des 5 domaines puis 30 facettes (matrices sujets x 35)"""
+        return self.norms.score(dimension_sums, facet_sums, confidence)
+
+    def details_to_dicts(self, percentile_values, low, high):
+        """Convertit les matrices de calculate_details_batch en un dictionnaire par sujet"""
+        # Percentiles entiers (comme dans les manuels de normes), convertis une seule fois pour tout le lot
+        percentile_values, low, high = (
+            np.rint(values).astype(np.int64).tolist() for values in (percentile_values, low, high)
+        )
+        n_dimensions = len(self.dimensions)
+        layout = []
+        position = n_dimensions
+        for dim in self.dimensions:
+            layout.append((dim, position, self.facets[dim]))
+            position += len(self.facets[dim])
+
+        rows = []
+        for row_percentiles, row_low, row_high in zip(percentile_values, low, high):
+            # Bornes (bas, haut) ; sérialisées en listes JSON
+            bounds = list(zip(row_low, row_high))
+            facet_percentiles = {}
+            facet_confidence = {}
+            for dim, start, facets in layout:
+                facet_percentiles[dim] = dict(zip(facets, row_percentiles[start:start + len(facets)]))
+                facet_confidence[dim] = dict(zip(facets, bounds[start:start + len(facets)]))
+            rows.append({
+                'confidence': dict(zip(self.dimensions, bounds[:n_dimensions])),
+                'facet_percentiles': facet_percentiles,
+                'facet_confidence': facet_confidence
+            })
+        return rows
+
+    def scores_to_dicts(self, dimension_sums, facet_sums, percentile_values):
+        """Convertit une ligne de scores vectorisés en dictionnaires par dimension et facette"""
+        scores = {}
+        facet_scores = {}
+        percentiles = {}
+        position = 0
+        for d, dim in enumerate(self.dimensions.keys()):
+            scores[dim] = int(dimension_sums[d])
+            percentiles[dim] = float(percentile_values[d])
+            facet_scores[dim] = {}
+            for facet in self.facets[dim]:
+                facet_scores[dim][facet] = int(facet_sums[position])
+                position += 1
+
+        return scores, facet_scores, percentiles
+
+    def get_interpretation(self, percentiles):
+        """Fournit une interprétation des scores"""
+        return get_interpretation(percentiles)
+
+    def get_dimension_description(self, dimension, level):
+        """Retourne une description détaillée de chaque dimension selon le niveau"""
+        return get_dimension_description(dimension, level)
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Archive chiffrée en flux pour l'export/import en masse des résultats NEO PI-R
+Chaque bloc d'enregistrements est un jeton Fernet indépendant (IV aléatoire par bloc)
+"""
+
+import json
+import multiprocessing
+import os
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from cryptography.fernet import InvalidToken
+
+from .secure_batch import make_cipher
+
+# Format :
+#   MAGIC | longueur (4 octets) | en-tête JSON
+#   puis une suite de trames : longueur (4 octets) | jeton Fernet
+# Le clair de chaque jeton commence par (index du bloc, drapeau dernier bloc)
+# afin de détecter réordonnancement, suppression et troncature.
+ARCHIVE_MAGIC = b"NEOARCH1"
+ARCHIVE_VERSION = 1
+DEFAULT_CHUNK_RECORDS = 1000
+
+_LENGTH = struct.Struct(">I")
+_CHUNK_HEADER = struct.Struct(">QB")
+
+class ArchiveError(Exception):
+    """Archive corrompue, tronquée ou déchiffrée avec une mauvaise clé"""
+
+# ================= ÉCRITURE =================
+
+def _encode_chunk(cipher, index, records, last):
+    """Sérialise puis chiffre un bloc d'enregistrements"""
+    body = b"\n".join(json.dumps(record, ensure_ascii=False).encode() for record in records)
+    return cipher.encrypt(_CHUNK_HEADER.pack(index, 1 if last else 0) + body)
+
+def _write_frame(fileobj, token):
+    """Écrit une trame préfixée par sa longueur"""
+    fileobj.write(_LENGTH.pack(len(token)))
+    fileobj.write(token)
+
+def write_archive(records, fileobj, key, chunk_records=DEFAULT_CHUNK_RECORDS):
+    """Écrit les enregistrements en flux ; la mémoire est bornée par un bloc
+
+    `key` peut être une clé ou une liste de clés (la première chiffre).
+    """
+    cipher = make_cipher(key)
+    header = json.dumps({'version': ARCHIVE_VERSION, 'chunk_records': chunk_records}).encode()
+    fileobj.write(ARCHIVE_MAGIC)
+    _write_frame(fileobj, header)
+
+    index = 0
+    total = 0
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_records:
+            _write_frame(fileobj, _encode_chunk(cipher, index, chunk, last=False))
+            total += len(chunk)
+            index += 1
+            chunk = []
+
+    # Le dernier bloc (éventuellement vide) marque la fin de l'archive
+    _write_frame(fileobj, _encode_chunk(cipher, index, chunk, last=True))
+    total += len(chunk)
+
+    return {'chunks': index + 1, 'records': total}
+
+# ================= LECTURE =================
+
+def _read_exact(fileobj, size):
+    """Lit exactement `size` octets ou lève ArchiveError"""
+    data = fileobj.read(size)
+    if len(data) != size:
+        raise ArchiveError("Archive tronquée")
+    return data
+
+def _read_frame(fileobj):
+    """Lit une trame ; retourne None en fin de fichier"""
+    prefix = fileobj.read(_LENGTH.size)
+    if not prefix:
+        return None
+    if len(prefix) != _LENGTH.size:
+        raise ArchiveError("Archive tronquée")
+    return _read_exact(fileobj, _LENGTH.unpack(prefix)[0])
+
+def _read_header(fileobj):
+    """Vérifie la signature et retourne l'en-tête de l'archive"""
+    if fileobj.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+        raise ArchiveError("Signature d'archive invalide")
+    header = _read_frame(fileobj)
+    if header is None:
+        raise ArchiveError("Archive tronquée")
+    header = json.loads(header)
+    if header.get('version') != ARCHIVE_VERSION:
+        raise ArchiveError(f"Version d'archive non supportée : {header.get('version')}")
+    return header
+
+_worker_cipher = None
+
+def _init_worker(key):
+    """Initialise le chiffreur d'un processus de déchiffrement"""
+    global _worker_cipher
+    _worker_cipher = make_cipher(key)
+
+def _decode_chunk(token, parse=True, cipher=None):
+    """Déchiffre un bloc ; retourne (index, dernier, enregistrements ou nombre)"""
+    if isinstance(token, tuple):
+        # Bloc désigné par (chemin, position, longueur) : lu directement par le worker
+        path, offset, length = token
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            token = _read_exact(f, length)
+    try:
+        plain = (cipher or _worker_cipher).decrypt(token)
+    except InvalidToken:
+        raise ArchiveError("Bloc illisible : clé invalide ou données altérées") from None
+
+    index, last = _CHUNK_HEADER.unpack_from(plain)
+    body = plain[_CHUNK_HEADER.size:]
+    lines = body.split(b"\n") if body else []
+    if parse:
+        return index, bool(last), [json.loads(line) for line in lines]
+    return index, bool(last), len(lines)
+
+def _skip_frame(fileobj, path):
+    """Repère une trame sans la lire ; retourne (chemin, position, longueur) ou None"""
+    prefix = fileobj.read(_LENGTH.size)
+    if not prefix:
+        return None
+    if len(prefix) != _LENGTH.size:
+        raise ArchiveError("Archive tronquée")
+    length = _LENGTH.unpack(prefix)[0]
+    offset = fileobj.tell()
+    if fileobj.seek(length, os.SEEK_CUR) > os.fstat(fileobj.fileno()).st_size:
+        raise ArchiveError("Archive tronquée")
+    return path, offset, length
+
+def _iter_chunks(fileobj, key, workers, parse):
+    """Déchiffre les blocs en parallèle, avec un nombre borné de blocs en vol"""
+    _read_header(fileobj)
+
+    # Sur un fichier disque, les workers relisent eux-mêmes leurs blocs :
+    # seules les positions transitent entre processus.
+    path = getattr(fileobj, 'name', None)
+    if isinstance(path, str) and os.path.isfile(path) and fileobj.seekable():
+        next_frame = lambda: _skip_frame(fileobj, path)
+    else:
+        next_frame = lambda: _read_frame(fileobj)
+
+    def check(expected, result):
+        index, last, _ = result
+        if index != expected:
+            raise ArchiveError(f"Bloc inattendu : {index} au lieu de {expected}")
+        return last
+
+    expected = 0
+    finished = False
+
+    if workers <= 1:
+        cipher = make_cipher(key)
+        while (token := _read_frame(fileobj)) is not None:
+            if finished:
+                raise ArchiveError("Données après le dernier bloc")
+            result = _decode_chunk(token, parse, cipher)
+            finished = check(expected, result)
+            expected += 1
+            yield result[2]
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(key,)
+        )
+        pending = deque()
+        try:
+            while True:
+                # Remplissage de la fenêtre de blocs en cours de déchiffrement
+                while len(pending) < 2 * workers:
+                    token = next_frame()
+                    if token is None:
+                        break
+                    pending.append(executor.submit(_decode_chunk, token, parse))
+                if not pending:
+                    break
+                if finished:
+                    raise ArchiveError("Données après le dernier bloc")
+                result = pending.popleft().result()
+                finished = check(expected, result)
+                expected += 1
+                yield result[2]
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    if not finished:
+        raise ArchiveError("Archive tronquée : dernier bloc absent")
+
+def read_archive(fileobj, key, workers=None):
+    """Itère sur les enregistrements de l'archive, dans l'ordre d'écriture"""
+    workers = os.cpu_count() if workers is None else workers
+    for records in _iter_chunks(fileobj, key, workers, parse=True):
+        yield from records
+
+def verify_archive(fileobj, key, workers=None):
+    """Vérifie l'intégrité complète de l'archive sans rapatrier les enregistrements"""
+    workers = os.cpu_count() if workers is None else workers
+    chunks = 0
+    records = 0
+    try:
+        for count in _iter_chunks(fileobj, key, workers, parse=False):
+            chunks += 1
+            records += count
+    except ArchiveError as e:
+        return {'ok': False, 'chunks': chunks, 'records': records, 'error': str(e)}
+    return {'ok': True, 'chunks': chunks, 'records': records, 'error': None}
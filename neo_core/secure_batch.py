@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Chiffrement, déchiffrement et rotation de clés en lot, sans dépendance à l'interface
+Les erreurs sont retournées élément par élément au lieu d'être affichées
+"""
+
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+DEFAULT_BATCH_CHUNK = 2000
+
+def make_cipher(keys):
+    """Construit un MultiFernet ; la première clé chiffre, toutes déchiffrent"""
+    if isinstance(keys, (bytes, str)):
+        keys = [keys]
+    return MultiFernet([Fernet(key) for key in keys])
+
+def serialize_payload(data):
+    """Met les données au format texte attendu par le chiffrement"""
+    if isinstance(data, dict):
+        return json.dumps(data)
+    if not isinstance(data, str):
+        return str(data)
+    return data
+
+# ================= TRAITEMENT D'UN BLOC =================
+
+_worker_cipher = None
+
+def _init_worker(keys):
+    """Initialise le chiffreur d'un processus du pool"""
+    global _worker_cipher
+    _worker_cipher = make_cipher(keys)
+
+def _result(index, value=None, error=None):
+    """Résultat structuré d'un élément du lot"""
+    return {'index': index, 'ok': error is None, 'value': value, 'error': error}
+
+def _process_chunk(operation, start, items, cipher=None):
+    """Applique l'opération à un bloc d'éléments"""
+    cipher = cipher or _worker_cipher
+    results = []
+    for offset, item in enumerate(items):
+        index = start + offset
+        try:
+            if operation == 'encrypt':
+                value = cipher.encrypt(serialize_payload(item).encode())
+            elif operation == 'decrypt':
+                value = cipher.decrypt(item).decode()
+            else:
+                value = cipher.rotate(item)
+            results.append(_result(index, value))
+        except InvalidToken:
+            results.append(_result(index, error="Jeton invalide ou clé inconnue"))
+        except (TypeError, ValueError, UnicodeDecodeError) as e:
+            results.append(_result(index, error=f"{type(e).__name__} : {e}"))
+    return results
+
+# ================= API EN LOT =================
+
+def _run_batch(operation, items, keys, workers=None, chunk_size=DEFAULT_BATCH_CHUNK):
+    """Découpe le lot en blocs et les traite dans un pool de processus"""
+    items = list(items)
+    workers = os.cpu_count() if workers is None else workers
+    chunks = [(start, items[start:start + chunk_size]) for start in range(0, len(items), chunk_size)]
+
+    # Petits lots : le démarrage du pool coûterait plus que le traitement
+    if workers <= 1 or len(chunks) <= 1:
+        cipher = make_cipher(keys)
+        return [r for start, chunk in chunks for r in _process_chunk(operation, start, chunk, cipher)]
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(list(keys),)
+    ) as executor:
+        futures = [executor.submit(_process_chunk, operation, start, chunk) for start, chunk in chunks]
+        return [r for future in futures for r in future.result()]
+
+def encrypt_batch(items, keys, workers=None, chunk_size=DEFAULT_BATCH_CHUNK):
+    """Chiffre un lot avec la clé primaire"""
+    return _run_batch('encrypt', items, keys, workers, chunk_size)
+
+def decrypt_batch(tokens, keys, workers=None, chunk_size=DEFAULT_BATCH_CHUNK):
+    """Déchiffre un lot avec n'importe laquelle des clés connues"""
+    return _run_batch('decrypt', tokens, keys, workers, chunk_size)
+
+def rotate_batch(tokens, keys, workers=None, chunk_size=DEFAULT_BATCH_CHUNK):
+    """Re-chiffre un lot avec la clé primaire (rotation MultiFernet)"""
+    return _run_batch('rotate', tokens, keys, workers, chunk_size)
+
+def summarize_batch(results):
+    """Résumé d'un lot : nombre de succès et liste des erreurs"""
+    errors = [r for r in results if not r['ok']]
+    return {'total': len(results), 'ok': len(results) - len(errors), 'errors': errors}
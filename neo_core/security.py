@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Chiffrement et pseudonymisation des données utilisateur NEO PI-R
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from .secure_archive import DEFAULT_CHUNK_RECORDS, read_archive, verify_archive, write_archive
+from .secure_batch import decrypt_batch, encrypt_batch, make_cipher, rotate_batch
+
+logger = logging.getLogger(__name__)
+
+PBKDF2_ITERATIONS = 100000
+
+@lru_cache(maxsize=None)
+def derive_key(password, salt, iterations=PBKDF2_ITERATIONS):
+    """Clé Fernet dérivée par PBKDF2-SHA256, une fois par processus (dérivation volontairement lente)"""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=iterations,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password))
+
+class SecurityManager:
+    """Gestionnaire de sécurité pour les données utilisateur"""
+
+    def __init__(self, keys=None):
+        # Clés de la plus récente (chiffrement) à la plus ancienne (déchiffrement seul).
+        # NEO_PIR_KEYS permet d'ajouter des clés séparées par des virgules pour la rotation.
+        if keys is None:
+            keys = [k.strip() for k in os.environ.get('NEO_PIR_KEYS', '').split(',') if k.strip()]
+        legacy_key = self._generate_key()
+        self.keys = [k.encode() if isinstance(k, str) else k for k in keys]
+        if legacy_key not in self.keys:
+            self.keys.append(legacy_key)
+        self.key = self.keys[0]
+        self.cipher_suite = make_cipher(self.keys)
+
+    def _generate_key(self):
+        """Génère une clé de chiffrement"""
+        return derive_key(b"NEO_PIR_SECURE_2024", b"neo_salt_2024")
+
+    def encrypt_data(self, data):
+        """Chiffre les données"""
+        if isinstance(data, dict):
+            data = json.dumps(data)
+        elif not isinstance(data, str):
+            data = str(data)
+        return self.cipher_suite.encrypt(data.encode())
+
+    def decrypt_data(self, encrypted_data):
+        """Déchiffre les données"""
+        try:
+            decrypted = self.cipher_suite.decrypt(encrypted_data)
+            return decrypted.decode()
+        except Exception as e:
+            logger.error("Erreur de déchiffrement : %s", e)
+            return None
+
+    def encrypt_batch(self, items, workers=None):
+        """Chiffre un lot ; retourne un résultat structuré par élément"""
+        return encrypt_batch(items, self.keys, workers)
+
+    def decrypt_batch(self, tokens, workers=None):
+        """Déchiffre un lot sans écrire dans la page ; erreurs retournées par élément"""
+        return decrypt_batch(tokens, self.keys, workers)
+
+    def rotate_batch(self, tokens, workers=None):
+        """Re-chiffre un lot avec la clé primaire"""
+        return rotate_batch(tokens, self.keys, workers)
+
+    def export_archive(self, records, fileobj, chunk_records=DEFAULT_CHUNK_RECORDS):
+        """Exporte un flux d'enregistrements dans une archive chiffrée par blocs"""
+        return write_archive(records, fileobj, self.keys, chunk_records)
+
+    def import_archive(self, fileobj, workers=None):
+        """Relit une archive chiffrée en flux (déchiffrement parallèle)"""
+        return read_archive(fileobj, self.keys, workers)
+
+    def verify_archive(self, fileobj, workers=None):
+        """Vérifie l'intégrité d'une archive chiffrée"""
+        return verify_archive(fileobj, self.keys, workers)
+
+def hash_user_data(data: str) -> str:
+    """Hache les données utilisateur pour la sécurité"""
+    return hashlib.sha256(data.encode()).hexdigest()
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+Stockage des sessions et des résultats hors du processus Streamlit
+Le backend mémoire convient à un seul processus ; SQLite est partagé entre les processus d'une même machine
+"""
+
+import bisect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Durées de conservation (secondes) : sessions inactives, résultats, historique des passations
+SESSION_TTL = 24 * 3600
+RESULT_TTL = 7 * 24 * 3600
+HISTORY_TTL = 365 * 24 * 3600
+PURGE_INTERVAL = 3600.0
+
+def encode_state(state):
+    """Sérialise un état de session (JSON compact, clés triées pour des écritures reproductibles)"""
+    return json.dumps(state, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+def decode_state(data):
+    """Désérialise un état de session"""
+    return json.loads(data)
+
+class StateBackend:
+    """Interface commune : états de session et résultats indexés par identifiant de session"""
+
+    def load_session(self, session_id, max_age=None):
+        """Retourne l'état enregistré de la session, ou None (aussi s'il date de plus de max_age secondes)"""
+        raise NotImplementedError
+
+    def save_session(self, session_id, state):
+        """Enregistre l'état complet de la session"""
+        raise NotImplementedError
+
+    def delete_session(self, session_id):
+        """Supprime l'état et le résultat d'une session"""
+        raise NotImplementedError
+
+    def save_result(self, session_id, result):
+        """Enregistre le résultat d'un test terminé"""
+        raise NotImplementedError
+
+    def load_result(self, session_id):
+        """Retourne le résultat enregistré, ou None"""
+        raise NotImplementedError
+
+    def iter_results(self, since=0.0):
+        """Parcourt les résultats enregistrés après `since` : (identifiant, horodatage, résultat), par date"""
+        raise NotImplementedError
+
+    def save_history(self, user_key, completed_at, record):
+        """Ajoute une passation à l'historique d'un répondant (clé pseudonyme, horodatage)"""
+        raise NotImplementedError
+
+    def load_history(self, user_key, start=None, end=None):
+        """Historique d'un répondant entre deux horodatages : [(horodatage, entrée)], par date
+
+        Coût logarithmique en la taille de l'historique global, plus le nombre d'entrées retournées.
+        """
+        raise NotImplementedError
+
+    def purge(self, ttl=SESSION_TTL, result_ttl=RESULT_TTL, history_ttl=HISTORY_TTL):
+        """Supprime les sessions inactives depuis plus de ttl secondes, les résultats et les entrées
+        d'historique plus anciens que result_ttl et history_ttl ; retourne le nombre de suppressions par table
+        """
+        raise NotImplementedError
+
+    def start_purge(self, interval=PURGE_INTERVAL, **ttls):
+        """Démarre un thread qui purge le backend toutes les `interval` secondes (durées : voir purge)"""
+        if getattr(self, '_purge_thread', None) is None:
+            self._purge_stop = threading.Event()
+            self._purge_thread = threading.Thread(target=self._purge_loop, args=(interval, ttls),
+                                                  name="state-purge", daemon=True)
+            self._purge_thread.start()
+        return self
+
+    def stop_purge(self):
+        """Arrête le thread de purge"""
+        thread = getattr(self, '_purge_thread', None)
+        if thread is not None:
+            self._purge_stop.set()
+            thread.join()
+            self._purge_thread = None
+
+    def _purge_loop(self, interval, ttls):
+        while not self._purge_stop.wait(interval):
+            # Une erreur (base verrouillée, disque plein) est journalisée : la purge suivante réessaie
+            try:
+                self.purge(**ttls)
+            except Exception:
+                logger.exception("Purge du backend d'état impossible")
+
+class MemoryBackend(StateBackend):
+    """Backend local au processus (comportement historique de st.session_state)"""
+
+    def __init__(self):
+        self._sessions = {}
+        self._results = {}
+        self._history = {}  # clé du répondant -> (horodatages triés, entrées sérialisées)
+        self._lock = threading.Lock()
+
+    def load_session(self, session_id, max_age=None):
+        with self._lock:
+            entry = self._sessions.get(session_id)
+        if entry is None or (max_age is not None and time.time() - entry[1] > max_age):
+            return None
+        return decode_state(entry[0])
+
+    def save_session(self, session_id, state):
+        data = encode_state(state)
+        with self._lock:
+            self._sessions[session_id] = (data, time.time())
+
+    def delete_session(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            self._results.pop(session_id, None)
+
+    def save_result(self, session_id, result):
+        data = encode_state(result)
+        with self._lock:
+            self._results.pop(session_id, None)
+            self._results[session_id] = (data, time.time())
+
+    def load_result(self, session_id):
+        with self._lock:
+            entry = self._results.get(session_id)
+        return decode_state(entry[0]) if entry else None
+
+    def iter_results(self, since=0.0):
+        # Dictionnaire ordonné par insertion : un résultat réenregistré passe en fin
+        with self._lock:
+            entries = [(sid, created, data) for sid, (data, created) in self._results.items() if created > since]
+        for sid, created, data in entries:
+            yield sid, created, decode_state(data)
+
+    def save_history(self, user_key, completed_at, record):
+        data = encode_state(record)
+        with self._lock:
+            times, entries = self._history.setdefault(user_key, ([], []))
+            position = bisect.bisect_right(times, completed_at)
+            times.insert(position, completed_at)
+            entries.insert(position, data)
+
+    def load_history(self, user_key, start=None, end=None):
+        with self._lock:
+            times, entries = self._history.get(user_key, ([], []))
+            low = bisect.bisect_left(times, start) if start is not None else 0
+            high = bisect.bisect_right(times, end) if end is not None else len(times)
+            selected = list(zip(times[low:high], entries[low:high]))
+        return [(completed_at, decode_state(data)) for completed_at, data in selected]
+
+    def purge(self, ttl=SESSION_TTL, result_ttl=RESULT_TTL, history_ttl=HISTORY_TTL):
+        now = time.time()
+        removed = {'sessions': 0, 'results': 0, 'history': 0}
+        with self._lock:
+            expired = [sid for sid, (_, updated) in self._sessions.items() if updated < now - ttl]
+            for sid in expired:
+                del self._sessions[sid]
+            removed['sessions'] = len(expired)
+            # Résultats dans l'ordre d'enregistrement : les plus anciens sont en tête
+            expired = []
+            for sid, (_, created) in self._results.items():
+                if created >= now - result_ttl:
+                    break
+                expired.append(sid)
+            for sid in expired:
+                del self._results[sid]
+            removed['results'] = len(expired)
+            for key in list(self._history):
+                times, entries = self._history[key]
+                position = bisect.bisect_left(times, now - history_ttl)
+                if position:
+                    del times[:position], entries[:position]
+                    removed['history'] += position
+                if not times:
+                    del self._history[key]
+        return removed
+
+class SQLiteBackend(StateBackend):
+    """Backend SQLite en mode WAL, partagé par tous les processus qui ouvrent le même fichier"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id TEXT PRIMARY KEY,
+        state TEXT NOT NULL,
+        updated REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated);
+    CREATE TABLE IF NOT EXISTS results (
+        session_id TEXT PRIMARY KEY,
+        result TEXT NOT NULL,
+        created REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS results_created ON results (created);
+    CREATE TABLE IF NOT EXISTS history (
+        user_key TEXT NOT NULL,
+        completed_at REAL NOT NULL,
+        record TEXT NOT NULL,
+        PRIMARY KEY (user_key, completed_at)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS history_completed ON history (completed_at);
+    """
+
+    def __init__(self, path, timeout=5.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self):
+        """Connexion propre au thread (sqlite3 interdit le partage entre threads)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            # WAL : les lecteurs ne bloquent pas l'écrivain ; NORMAL suffit en WAL (pas de fsync par écriture)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def load_session(self, session_id, max_age=None):
+        row = self._connect().execute(
+            "SELECT state, updated FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+        return decode_state(row[0])
+
+    def save_session(self, session_id, state):
+        self._connect().execute(
+            "INSERT INTO sessions (session_id, state, updated) VALUES (?, ?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET state = excluded.state, updated = excluded.updated",
+            (session_id, encode_state(state), time.time())
+        )
+
+    def delete_session(self, session_id):
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM results WHERE session_id = ?", (session_id,))
+
+    def save_result(self, session_id, result):
+        self._connect().execute(
+            "INSERT OR REPLACE INTO results (session_id, result, created) VALUES (?, ?, ?)",
+            (session_id, encode_state(result), time.time())
+        )
+
+    def load_result(self, session_id):
+        row = self._connect().execute(
+            "SELECT result FROM results WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return decode_state(row[0]) if row else None
+
+    def iter_results(self, since=0.0):
+        # Connexion dédiée : le curseur reste ouvert pendant le parcours sans bloquer la connexion du thread
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            for sid, created, data in conn.execute(
+                "SELECT session_id, created, result FROM results WHERE created > ? ORDER BY created", (since,)
+            ):
+                yield sid, created, decode_state(data)
+        finally:
+            conn.close()
+
+    def save_history(self, user_key, completed_at, record):
+        self._connect().execute(
+            "INSERT OR REPLACE INTO history (user_key, completed_at, record) VALUES (?, ?, ?)",
+            (user_key, completed_at, encode_state(record))
+        )
+
+    def load_history(self, user_key, start=None, end=None):
+        # Clé primaire (répondant, date) : recherche dans l'arbre B, puis parcours des seules entrées retournées
+        rows = self._connect().execute(
+            "SELECT completed_at, record FROM history WHERE user_key = ? AND completed_at BETWEEN ? AND ? "
+            "ORDER BY completed_at",
+            (user_key, float('-inf') if start is None else start, float('inf') if end is None else end)
+        ).fetchall()
+        return [(completed_at, decode_state(data)) for completed_at, data in rows]
+
+    def purge(self, ttl=SESSION_TTL, result_ttl=RESULT_TTL, history_ttl=HISTORY_TTL):
+        now = time.time()
+        conn = self._connect()
+        removed = {}
+        with conn:
+            conn.execute("BEGIN")
+            for table, column, age in (('sessions', 'updated', ttl), ('results', 'created', result_ttl),
+                                       ('history', 'completed_at', history_ttl)):
+                removed[table] = conn.execute(f"DELETE FROM {table} WHERE {column} < ?", (now - age,)).rowcount
+        return removed
+
+def create_backend(url=None):
+    """Crée le backend décrit par une URL ('memory' ou 'sqlite:///chemin.db')
+
+    Par défaut, lit la variable d'environnement NEO_PIR_STATE_BACKEND.
+    """
+    url = url or os.environ.get('NEO_PIR_STATE_BACKEND', 'memory')
+    if url == 'memory':
+        return MemoryBackend()
+    if url.startswith('sqlite:///'):
+        return SQLiteBackend(url[len('sqlite:///'):])
+    raise ValueError(f"Backend d'état inconnu : {url}")
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+Recherche de profils similaires parmi les résultats enregistrés
+Un profil est le vecteur des percentiles entiers (0-100) des 5 domaines ou des 30 facettes, stocké en uint8.
+L'index garde un segment principal (KD-tree pour les domaines, balayage plat pour les facettes) et un tampon
+des ajouts récents balayé à chaque requête ; le segment est reconstruit quand le tampon devient trop grand.
+"""
+
+import logging
+import sys
+import threading
+import time
+
+import numpy as np
+
+from .item_banks import DIMENSION_CODES, FACET_CODES, get_registry
+from .norms import get_norms
+
+# Espaces de recherche : nombre de colonnes du vecteur de profil
+SPACES = {'domains': len(DIMENSION_CODES), 'facets': len(FACET_CODES)}
+
+# En dessous de cette dimension, un KD-tree élague efficacement ; au-delà, le balayage plat est plus rapide
+KDTREE_MAX_DIMENSIONS = 10
+
+# Intervalle (secondes) entre deux synchronisations de l'index avec le backend d'état (start_sync)
+SYNC_INTERVAL = 30.0
+# Chaque synchronisation relit les SYNC_OVERLAP dernières secondes : un résultat horodaté avant un autre mais
+# validé après lui (écrivains SQLite concurrents) n'est pas manqué
+SYNC_OVERLAP = 60.0
+
+logger = logging.getLogger(__name__)
+
+def profile_vectors(result):
+    """Vecteurs (domaines, facettes) en percentiles uint8 d'un résultat enregistré"""
+    facet_percentiles = result.get('facet_percentiles')
+    if facet_percentiles is not None:
+        domains = [result['percentiles'][dim] for dim in DIMENSION_CODES]
+        facets = [facet_percentiles[dim][facet] for dim, facet in FACET_CODES]
+    else:
+        # Résultat enregistré avant les percentiles de facettes : conversion depuis les scores bruts
+        norms = get_norms(get_registry().get(*result['item_bank']))
+        dimension_sums = [[result['scores'][dim] for dim in DIMENSION_CODES]]
+        facet_sums = [[result['facet_scores'][dim][facet] for dim, facet in FACET_CODES]]
+        percentiles = norms.score(dimension_sums, facet_sums)[0][0]
+        domains, facets = percentiles[:len(DIMENSION_CODES)], percentiles[len(DIMENSION_CODES):]
+    return quantize(domains), quantize(facets)
+
+def quantize(percentiles):
+    """Percentiles -> entiers 0-100 sur un octet"""
+    return np.clip(np.rint(np.asarray(percentiles, dtype=np.float64)), 0, 100).astype(np.uint8)
+
+class _Segment:
+    """Profils figés d'un index : identifiants, numéros d'ajout, vecteurs et structure de recherche"""
+
+    def __init__(self, ids, sequences, vectors, use_tree):
+        self.ids = ids
+        self.sequences = sequences
+        self.vectors = vectors
+        self.tree = None
+        self.floats = None
+        self.squared_norms = None
+        if len(ids) == 0:
+            return
+        if use_tree:
+            from sklearn.neighbors import KDTree
+
+            self.tree = KDTree(vectors.astype(np.float32))
+        else:
+            # Distances par produit scalaire (BLAS) : |x - q|² = |x|² - 2 x.q + |q|²
+            self.floats = vectors.astype(np.float32)
+            self.squared_norms = np.einsum('ij,ij->i', self.floats, self.floats)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def search(self, queries, k):
+        """k plus proches voisins de chaque requête : (distances², positions), de forme (requêtes, k)"""
+        k = min(k, len(self))
+        if k == 0:
+            empty = np.empty((len(queries), 0))
+            return empty, empty.astype(np.intp)
+        if self.tree is not None:
+            distances, positions = self.tree.query(queries, k=k)
+            return distances ** 2, positions
+        queries = queries.astype(np.float32)
+        distances = self.squared_norms[None, :] - 2 * (queries @ self.floats.T)
+        distances += np.einsum('ij,ij->i', queries, queries)[:, None]
+        positions = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        nearest = np.take_along_axis(distances, positions, axis=1)
+        order = np.argsort(nearest, axis=1)
+        return np.take_along_axis(nearest, order, axis=1), np.take_along_axis(positions, order, axis=1)
+
+class ProfileIndex:
+    """Index k-NN incrémental des profils d'un espace ('domains' ou 'facets')
+
+    Un identifiant réenregistré (test repassé) remplace son profil précédent ; les lignes périmées
+    restent dans le segment jusqu'à la reconstruction et sont filtrées à la requête.
+    """
+
+    def __init__(self, space='domains', rebuild_ratio=0.1, min_rebuild=4096):
+        if space not in SPACES:
+            raise ValueError(f"Espace de recherche inconnu : {space}")
+        self.space = space
+        self.dimensions = SPACES[space]
+        self.use_tree = self.dimensions <= KDTREE_MAX_DIMENSIONS
+        self.rebuild_ratio = rebuild_ratio
+        self.min_rebuild = min_rebuild
+        self.synced_until = 0.0
+        self._synced = {}  # identifiant -> horodatage des résultats déjà indexés dans la fenêtre de relecture
+
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+        self._latest = {}  # identifiant vivant -> numéro de son dernier ajout
+        self._sequence = 0
+        self._stale = 0  # lignes périmées (remplacées ou retirées) encore présentes
+        self._segment = _Segment(np.empty(0, dtype=object), np.empty(0, dtype=np.int64),
+                                 np.empty((0, self.dimensions), dtype=np.uint8), self.use_tree)
+        self._buffer_ids, self._buffer_sequences, self._buffer_vectors = [], [], []
+
+    def __len__(self):
+        return len(self._latest)
+
+    def add(self, ids, vectors):
+        """Ajoute (ou remplace) des profils ; reconstruit le segment si le tampon dépasse le seuil"""
+        vectors = quantize(vectors).reshape(-1, self.dimensions)
+        with self._lock:
+            for profile_id, vector in zip(ids, vectors):
+                if profile_id in self._latest:
+                    self._stale += 1
+                self._sequence += 1
+                self._latest[profile_id] = self._sequence
+                self._buffer_ids.append(profile_id)
+                self._buffer_sequences.append(self._sequence)
+                self._buffer_vectors.append(vector)
+        self.maybe_rebuild()
+
+    def maybe_rebuild(self):
+        """Reconstruit le segment si le tampon et les lignes périmées dépassent le seuil"""
+        with self._lock:
+            pending = len(self._buffer_ids) + self._stale
+            threshold = max(self.min_rebuild, self.rebuild_ratio * len(self._segment))
+        if pending > threshold:
+            self.rebuild()
+
+    def remove(self, ids):
+        """Retire des profils (filtrés jusqu'à la prochaine reconstruction, voir maybe_rebuild)"""
+        with self._lock:
+            for profile_id in ids:
+                if self._latest.pop(profile_id, None) is not None:
+                    self._stale += 1
+
+    def rebuild(self):
+        """Fusionne le tampon dans un nouveau segment sans les lignes périmées ; les requêtes continuent"""
+        with self._rebuild_lock:
+            with self._lock:
+                segment = self._segment
+                taken = len(self._buffer_ids)
+                purged = self._stale
+                ids = np.concatenate([segment.ids, np.array(self._buffer_ids[:taken], dtype=object)])
+                sequences = np.concatenate([segment.sequences,
+                                            np.array(self._buffer_sequences[:taken], dtype=np.int64)])
+                vectors = np.concatenate([segment.vectors,
+                                          np.array(self._buffer_vectors[:taken], dtype=np.uint8)
+                                          .reshape(-1, self.dimensions)])
+                alive = np.fromiter((self._latest.get(i) == s for i, s in zip(ids, sequences)),
+                                    dtype=bool, count=len(ids))
+
+            # Construction hors verrou : les ajouts concurrents vont dans le tampon
+            rebuilt = _Segment(ids[alive], sequences[alive], vectors[alive], self.use_tree)
+
+            with self._lock:
+                self._segment = rebuilt
+                del self._buffer_ids[:taken], self._buffer_sequences[:taken], self._buffer_vectors[:taken]
+                # Les remplacements survenus pendant la construction restent à purger
+                self._stale -= purged
+
+    def query(self, vectors, k=10, exclude=None):
+        """k profils les plus proches (distance euclidienne en points de percentile)
+
+        Retourne une liste par requête de (identifiant, distance), du plus proche au plus lointain.
+        `exclude` : identifiant à ignorer (le profil de l'utilisateur lui-même).
+        """
+        queries = quantize(vectors).reshape(-1, self.dimensions).astype(np.float32)
+        with self._lock:
+            segment = self._segment
+            buffer_ids = list(self._buffer_ids)
+            buffer_sequences = list(self._buffer_sequences)
+            buffer_vectors = np.array(self._buffer_vectors, dtype=np.float32).reshape(-1, self.dimensions)
+            latest = self._latest
+            # Marge pour les lignes périmées et l'identifiant exclu
+            fetch = k + self._stale + (exclude is not None)
+
+        distances, positions = segment.search(queries, fetch)
+        if len(buffer_ids):
+            buffer_distances = ((buffer_vectors[None, :, :] - queries[:, None, :]) ** 2).sum(axis=2)
+
+        results = []
+        for row in range(len(queries)):
+            candidates = [
+                (float(d), segment.ids[p], segment.sequences[p]) for d, p in zip(distances[row], positions[row])
+            ]
+            if len(buffer_ids):
+                candidates += zip(buffer_distances[row].tolist(), buffer_ids, buffer_sequences)
+            candidates.sort(key=lambda candidate: candidate[0])
+            neighbours = []
+            for distance, profile_id, sequence in candidates:
+                if profile_id == exclude or latest.get(profile_id) != sequence:
+                    continue
+                neighbours.append((profile_id, float(np.sqrt(max(distance, 0.0)))))
+                if len(neighbours) == k:
+                    break
+            results.append(neighbours)
+        return results
+
+    def sync(self, backend):
+        """Ajoute les résultats enregistrés dans le backend d'état depuis la dernière synchronisation
+
+        Un résultat illisible est journalisé et ignoré. Les profils retirés (remove) depuis la dernière
+        synchronisation sont purgés du segment si le seuil de reconstruction est atteint.
+        """
+        ids, vectors = [], []
+        column = 0 if self.space == 'domains' else 1
+        synced_until, synced = self.synced_until, dict(self._synced)
+        for session_id, created, result in backend.iter_results(max(self.synced_until - SYNC_OVERLAP, 0.0)):
+            synced_until = max(synced_until, created)
+            if synced.get(session_id) == created:
+                continue  # déjà indexé lors d'une synchronisation précédente (fenêtre de relecture)
+            synced[session_id] = created
+            try:
+                vector = profile_vectors(result)[column]
+            except Exception:
+                logger.exception("Résultat %s illisible : ignoré par l'index des profils", session_id)
+                continue
+            ids.append(session_id)
+            vectors.append(vector)
+        if ids:
+            self.add(ids, np.array(vectors))
+        else:
+            self.maybe_rebuild()
+        # Le repère n'avance qu'une fois les profils ajoutés : une erreur de lecture les fera relire
+        self.synced_until = synced_until
+        self._synced = {sid: created for sid, created in synced.items() if created > synced_until - SYNC_OVERLAP}
+        return len(ids)
+
+    def start_sync(self, backend, interval=SYNC_INTERVAL):
+        """Démarre un thread qui synchronise l'index avec le backend, tout de suite puis toutes les `interval` s
+
+        Les ajouts et les reconstructions du segment se font sur ce thread, jamais sur celui des requêtes.
+        """
+        if getattr(self, '_sync_thread', None) is None:
+            self._sync_stop = threading.Event()
+            self._sync_thread = threading.Thread(target=self._sync_loop, args=(backend, interval),
+                                                 name="profile-index-sync", daemon=True)
+            self._sync_thread.start()
+        return self
+
+    def stop_sync(self):
+        """Arrête le thread de synchronisation"""
+        thread = getattr(self, '_sync_thread', None)
+        if thread is not None:
+            self._sync_stop.set()
+            thread.join()
+            self._sync_thread = None
+
+    def _sync_loop(self, backend, interval):
+        while True:
+            # Erreur (base verrouillée, résultat illisible) journalisée : la synchronisation suivante réessaie
+            try:
+                self.sync(backend)
+            except Exception:
+                logger.exception("Synchronisation de l'index des profils impossible")
+            if self._sync_stop.wait(interval):
+                return
+
+    def save(self, path):
+        """Sauvegarde les profils vivants (npz) ; la structure de recherche est reconstruite au chargement"""
+        self.rebuild()
+        with self._lock:
+            segment = self._segment
+            alive = np.fromiter((self._latest.get(i) == s for i, s in zip(segment.ids, segment.sequences)),
+                                dtype=bool, count=len(segment))
+            synced_until = self.synced_until
+        np.savez_compressed(path, space=self.space, ids=segment.ids[alive].astype(str),
+                            vectors=segment.vectors[alive], synced_until=synced_until)
+
+    @classmethod
+    def load(cls, path, **options):
+        """Charge un index sauvegardé par save()"""
+        with np.load(path) as data:
+            index = cls(str(data['space']), **options)
+            index.add(data['ids'].tolist(), data['vectors'])
+            index.synced_until = float(data['synced_until'])
+        index.rebuild()
+        return index
+
+if __name__ == "__main__":
+    from neo_core.session_store import create_backend
+
+    if len(sys.argv) != 3:
+        print("Usage : python -m neo_core.similarity domains|facets index.npz")
+        print("Construit l'index depuis le backend d'état (NEO_PIR_STATE_BACKEND)")
+        sys.exit(1)
+
+    space, output_path = sys.argv[1:]
+    start = time.perf_counter()
+    index = ProfileIndex(space)
+    added = index.sync(create_backend())
+    index.save(output_path)
+    print(f"{added} profils indexés en {time.perf_counter() - start:.1f} s -> {output_path}")
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""
+Générateur de répondants synthétiques, pour les tests de charge et le contrôle des normes
+Traits latents des 5 domaines tirés selon une matrice de corrélation, facettes = domaine + part propre,
+puis réponses de Likert par le modèle de réponse graduée (mêmes paramètres que la passation adaptative)
+en respectant l'inversion des items. Une part des répondants répond sans attention (motifs configurables).
+
+Tout est vectorisé par lots : une catégorie GRM se tire par un bruit logistique, z = theta + L / a,
+comparé aux seuils de l'item (P(z > b) est la probabilité cumulée du modèle). Les lots sont écrits
+au fil de l'eau en CSV ou en Parquet, sans jamais tenir tout l'échantillon en mémoire.
+
+Usage : python -m neo_core.synthetic sortie.csv|sortie.parquet [--rows 10000000] [--careless random=0.03,...]
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from statistics import NormalDist
+
+import numpy as np
+
+from .adaptive_testing import DEFAULT_DISCRIMINATION, DEFAULT_THRESHOLDS, N_CATEGORIES, AdaptiveModel
+from .item_banks import DEFAULT_BANK, DEFAULT_LOCALE, DIMENSION_CODES, FACET_CODES, get_registry
+
+# Intercorrélations des domaines (N, E, O, A, C), ordres de grandeur des méta-analyses
+DEFAULT_CORRELATIONS = np.array([
+    [1.00, -0.25, -0.10, -0.25, -0.30],
+    [-0.25, 1.00, 0.40, 0.15, 0.20],
+    [-0.10, 0.40, 1.00, 0.10, 0.05],
+    [-0.25, 0.15, 0.10, 1.00, 0.25],
+    [-0.30, 0.20, 0.05, 0.25, 1.00]
+])
+
+# Part de la variance d'une facette qui ne vient pas de son domaine
+FACET_SPECIFIC_VARIANCE = 0.3
+
+# Motifs de réponse sans attention (code de la colonne 'careless' ; 0 = répondant attentif)
+CARELESS_PATTERNS = {'random': 1, 'straightline': 2, 'midpoint': 3, 'alternating': 4}
+
+CHUNK_ROWS = 500000
+
+# Bruits tirés par quantiles tabulés : un entier de 16 bits indexe 65536 quantiles équiprobables.
+# Deux fois moins d'octets aléatoires et ni logarithme ni rejet ; écart aux lois exactes ≤ 1/65536
+# sur la fonction de répartition, queues tronquées à 4,3 (normale) et 11,8 (logistique).
+QUANTILE_LEVELS = 1 << 16
+
+@lru_cache(maxsize=None)
+def quantile_table(distribution):
+    """Quantiles (k + 0,5) / 65536 de la loi 'normal' ou 'logistic', en float32"""
+    levels = (np.arange(QUANTILE_LEVELS) + 0.5) / QUANTILE_LEVELS
+    if distribution == 'logistic':
+        table = np.log(levels / (1 - levels))
+    else:
+        inv_cdf = NormalDist().inv_cdf
+        table = np.array([inv_cdf(level) for level in levels])
+    table = table.astype(np.float32)
+    table.setflags(write=False)
+    return table
+
+class SyntheticDataError(ValueError):
+    """Paramètres de génération invalides"""
+
+def parse_careless(spec):
+    """'random=0.03,straightline=0.02' -> {'random': 0.03, 'straightline': 0.02}"""
+    careless = {}
+    for part in filter(None, (spec or "").split(',')):
+        name, _, fraction = part.partition('=')
+        if name not in CARELESS_PATTERNS:
+            raise SyntheticDataError(f"Motif inconnu : {name} (motifs : {', '.join(CARELESS_PATTERNS)})")
+        careless[name] = float(fraction)
+    return careless
+
+def noise(rng, distribution, shape):
+    """Bruit 'normal' ou 'logistic' (float32) tiré par quantiles tabulés"""
+    return quantile_table(distribution)[rng.integers(0, QUANTILE_LEVELS, shape, dtype=np.uint16)]
+
+class SyntheticGenerator:
+    """Tirage de répondants synthétiques pour une banque d'items"""
+
+    def __init__(self, item_bank, correlations=None, careless=None, missing_rate=0.0,
+                 facet_variance=FACET_SPECIFIC_VARIANCE, discrimination=None, thresholds=None, seed=None):
+        self.item_bank = item_bank
+        correlations = DEFAULT_CORRELATIONS if correlations is None else np.asarray(correlations, dtype=np.float64)
+        if correlations.shape != (len(DIMENSION_CODES), len(DIMENSION_CODES)):
+            raise SyntheticDataError(f"Matrice de corrélation {len(DIMENSION_CODES)}x{len(DIMENSION_CODES)} attendue")
+        try:
+            self.cholesky = np.linalg.cholesky(correlations).astype(np.float32)
+        except np.linalg.LinAlgError:
+            raise SyntheticDataError("La matrice de corrélation doit être définie positive") from None
+        self.correlations = correlations
+
+        self.careless = dict(careless or {})
+        total = sum(self.careless.values())
+        if any(fraction < 0 for fraction in self.careless.values()) or total > 1:
+            raise SyntheticDataError("Parts de répondants sans attention positives, de somme au plus 1")
+        # Tirage du motif de chaque répondant : 0 (attentif) puis les motifs demandés
+        self._codes = np.array([0] + [CARELESS_PATTERNS[name] for name in self.careless], dtype=np.int8)
+        self._probabilities = np.array([1 - total] + list(self.careless.values()))
+        self.missing_rate = missing_rate
+
+        n_items = len(item_bank)
+        discrimination = np.full(n_items, DEFAULT_DISCRIMINATION) if discrimination is None else discrimination
+        thresholds = np.tile(DEFAULT_THRESHOLDS, (n_items, 1)) if thresholds is None else thresholds
+        self.inverse_discrimination = (1 / np.asarray(discrimination, dtype=np.float32))[None, :]
+        # Items inversés : réponse - 1 = 4 - catégorie = nombre de seuils -b non dépassés par theta inversé.
+        # Le bruit logistique étant symétrique, il suffit d'inverser theta et les seuils de ces items :
+        # la réponse 1-5 est alors 1 + nombre de seuils dépassés, sans passage par les catégories.
+        self.item_sign = np.where(item_bank.reverse, -1, 1).astype(np.float32)[None, :]
+        thresholds = np.asarray(thresholds, dtype=np.float32)
+        thresholds = np.where(item_bank.reverse[:, None], -thresholds[:, ::-1], thresholds)
+        self.thresholds = thresholds.T[:, None, :]  # (seuils, 1, items)
+        self.facet_loading = np.float32(np.sqrt(1 - facet_variance))
+        self.facet_specific = np.float32(np.sqrt(facet_variance))
+        self.facet_dimension = np.array([DIMENSION_CODES.index(dim) for dim, _ in FACET_CODES])
+        self.item_facet = np.asarray(item_bank.facet_index, dtype=np.intp)
+        self.seed = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed)
+
+    @classmethod
+    def from_irt(cls, item_bank, path, **options):
+        """Générateur aux paramètres GRM étalonnés (irt_params_<banque>.npz de la passation adaptative)"""
+        model = AdaptiveModel.load(item_bank.questions, path)
+        return cls(item_bank, discrimination=model.discrimination, thresholds=model.thresholds, **options)
+
+    def traits(self, n, rng=None):
+        """Traits latents corrélés des 5 domaines (n, 5), en unités z"""
+        rng = rng or self.rng
+        return rng.standard_normal((n, len(DIMENSION_CODES)), dtype=np.float32) @ self.cholesky.T
+
+    def generate(self, n, rng=None):
+        """Tire n répondants : (réponses int8 (n, items), traits (n, 5), motif sans attention int8 (n,))"""
+        rng = rng or self.rng
+        traits = self.traits(n, rng)
+        facets = noise(rng, 'normal', (n, len(FACET_CODES)))
+        facets *= self.facet_specific
+        facets += traits[:, self.facet_dimension] * self.facet_loading
+
+        # Modèle de réponse graduée : z = ±theta + L / a, L logistique
+        z = noise(rng, 'logistic', (n, len(self.item_bank)))
+        z *= self.inverse_discrimination
+        z += facets[:, self.item_facet] * self.item_sign
+
+        # Réponse 1-5 = 1 + nombre de seuils dépassés (comparaisons accumulées en int8, sans copie)
+        responses = np.ones(z.shape, dtype=np.int8)
+        for threshold in self.thresholds:
+            responses += np.greater(z, threshold).view(np.int8)
+
+        careless = self._apply_careless(responses, rng)
+        if self.missing_rate > 0:
+            responses[rng.random(responses.shape, dtype=np.float32) < self.missing_rate] = 0
+        return responses, traits, careless
+
+    def _apply_careless(self, responses, rng):
+        """Remplace les réponses des répondants tirés sans attention par leur motif ; retourne les codes"""
+        n, n_items = responses.shape
+        if not self.careless:
+            return np.zeros(n, dtype=np.int8)
+        careless = rng.choice(self._codes, size=n, p=self._probabilities)
+        for name, code in CARELESS_PATTERNS.items():
+            rows = np.flatnonzero(careless == code)
+            if len(rows) == 0:
+                continue
+            if name == 'random':
+                responses[rows] = rng.integers(1, N_CATEGORIES + 1, (len(rows), n_items), dtype=np.int8)
+            elif name == 'straightline':
+                responses[rows] = rng.integers(1, N_CATEGORIES + 1, (len(rows), 1), dtype=np.int8)
+            elif name == 'midpoint':
+                responses[rows] = (N_CATEGORIES + 1) // 2
+            else:
+                # Alternance des extrêmes 1/5, en phase aléatoire
+                phase = rng.integers(0, 2, (len(rows), 1))
+                responses[rows] = np.where((np.arange(n_items)[None, :] + phase) % 2, N_CATEGORIES, 1)
+        return careless
+
+    def chunks(self, n, chunk_rows=CHUNK_ROWS, workers=1):
+        """Tire n répondants par lots de chunk_rows (flux de triplets de generate, dans l'ordre)
+
+        Chaque lot a son propre générateur, issu de la graine : le résultat ne dépend pas de `workers`.
+        Avec workers > 1, les lots sont tirés sur des threads (NumPy libère le GIL pendant les tirages
+        et les calculs), au plus 2 * workers lots d'avance pour borner la mémoire.
+        """
+        sizes = [min(chunk_rows, n - start) for start in range(0, n, chunk_rows)]
+        seeds = self.seed.spawn(len(sizes))
+        tasks = ((size, np.random.default_rng(seed)) for size, seed in zip(sizes, seeds))
+        if workers <= 1:
+            for size, rng in tasks:
+                yield self.generate(size, rng)
+            return
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="synthetic") as executor:
+            pending = deque()
+            for size, rng in tasks:
+                pending.append(executor.submit(self.generate, size, rng))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+# ================= ÉCRITURE EN FLUX =================
+
+def csv_bytes(responses, careless):
+    """Lignes CSV d'un lot, formées octet par octet : réponses (un chiffre) puis code du motif"""
+    n, n_items = responses.shape
+    # Largeur fixe : « r,r,...,r,c\n » ; deux octets par colonne
+    row = np.empty((n, 2 * (n_items + 1)), dtype=np.uint8)
+    row[:, 0:-2:2] = responses + ord('0')
+    row[:, 1:-2:2] = ord(',')
+    row[:, -2] = careless + ord('0')
+    row[:, -1] = ord('\n')
+    return row.tobytes()
+
+def write_csv(path, generator, n, chunk_rows=CHUNK_ROWS, workers=1):
+    """Écrit n répondants en CSV (colonnes : items de la banque, puis 'careless')"""
+    header = ",".join(list(generator.item_bank.item_ids) + ['careless']) + "\n"
+    with open(path, 'wb') as f:
+        f.write(header.encode('ascii'))
+        for responses, _, careless in generator.chunks(n, chunk_rows, workers):
+            f.write(csv_bytes(responses, careless))
+
+def write_parquet(path, generator, n, chunk_rows=CHUNK_ROWS, workers=1):
+    """Écrit n répondants en Parquet (items int8, traits latents 'theta:<domaine>' float32, 'careless')"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    names = (list(generator.item_bank.item_ids) + [f"theta:{dim}" for dim in DIMENSION_CODES] + ['careless'])
+    writer = None
+    try:
+        for responses, traits, careless in generator.chunks(n, chunk_rows, workers):
+            # Colonnes contiguës (une transposition par lot) : pa.array les adopte sans copie
+            columns = ([pa.array(column) for column in np.ascontiguousarray(responses.T)]
+                       + [pa.array(column) for column in np.ascontiguousarray(traits.T)] + [pa.array(careless)])
+            table = pa.Table.from_arrays(columns, names=names)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression='zstd')
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+def norm_check(item_bank, responses):
+    """Normes étalonnées sur un échantillon attentif comparées aux normes de la banque, par échelle"""
+    from .norms import SCALE_KEYS, NormTable, get_norms
+
+    fitted = NormTable.fit(item_bank, responses)
+    reference = get_norms(item_bank)
+    return {
+        scale: {
+            'mean': (float(fitted.mean[i]), float(reference.mean[i])),
+            'sd': (float(fitted.sd[i]), float(reference.sd[i])),
+            'reliability': (float(fitted.reliability[i]), float(reference.reliability[i]))
+        }
+        for i, scale in enumerate(SCALE_KEYS)
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génère des répondants synthétiques (CSV ou Parquet)")
+    parser.add_argument('output', help="fichier de sortie (.csv ou .parquet)")
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--bank', default=DEFAULT_BANK)
+    parser.add_argument('--locale', default=DEFAULT_LOCALE)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="threads de tirage")
+    parser.add_argument('--careless', default="", help="parts par motif, ex. random=0.03,straightline=0.02")
+    parser.add_argument('--missing', type=float, default=0.0, help="part des réponses manquantes (0)")
+    parser.add_argument('--correlations', help="matrice 5x5 des corrélations des domaines (JSON)")
+    parser.add_argument('--irt', help="paramètres GRM étalonnés (.npz de la passation adaptative)")
+    parser.add_argument('--check-norms', type=int, metavar='N', default=0,
+                        help="compare les normes de la banque à celles de N répondants attentifs")
+    args = parser.parse_args()
+
+    item_bank = get_registry().get(args.bank, args.locale)
+    options = {'careless': parse_careless(args.careless), 'missing_rate': args.missing, 'seed': args.seed}
+    if args.correlations:
+        with open(args.correlations, encoding='utf-8') as f:
+            options['correlations'] = json.load(f)
+    generator = (SyntheticGenerator.from_irt(item_bank, args.irt, **options) if args.irt
+                 else SyntheticGenerator(item_bank, **options))
+
+    start = time.perf_counter()
+    if args.output.endswith('.parquet'):
+        write_parquet(args.output, generator, args.rows, args.chunk_rows, args.workers)
+    else:
+        write_csv(args.output, generator, args.rows, args.chunk_rows, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{args.rows} répondants en {elapsed:.1f} s ({args.rows / elapsed / 1e6:.2f} M/s) -> {args.output} "
+          f"({os.path.getsize(args.output) / 1e6:.0f} Mo)")
+
+    if args.check_norms:
+        attentive = SyntheticGenerator(item_bank, correlations=options.get('correlations'), seed=args.seed)
+        for scale, values in norm_check(item_bank, attentive.generate(args.check_norms)[0]).items():
+            if ':' not in scale:
+                (mean, ref_mean), (sd, ref_sd), (alpha, ref_alpha) = values.values()
+                print(f"  {scale} : moyenne {mean:.1f} (normes {ref_mean:.1f}), écart-type {sd:.1f} "
+                      f"({ref_sd:.1f}), alpha {alpha:.2f} ({ref_alpha:.2f})")
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+Rapports d'équipe : composition d'un groupe de 5 à 500 personnes
+Chaque membre est décrit par ses percentiles des 5 domaines puis des 30 facettes (profile_vectors).
+Le profil d'équipe tient à jour, à chaque ajout, les moyennes et variances (fusion par lots de Chan et al.,
+un retrait applique la mise à jour inverse), la répartition des niveaux par échelle et les matrices de
+similarité et de complémentarité entre membres : un ajout ne calcule que la ligne du nouveau membre, en une
+opération matricielle.
+
+- Similarité : 1 - distance euclidienne des percentiles des domaines / distance maximale (0 à 1).
+- Complémentarité : part des domaines où l'un est « Élevé » et l'autre « Faible » (0 à 1).
+- Diversité : entropie normalisée de la répartition Faible / Moyen / Élevé (0 : tous au même niveau).
+
+Les membres sont désignés par leur code répondant (neo_core.longitudinal), seule clé stable d'une personne :
+les identifiants de session ne sont jamais affichés et les résultats de session sont purgés. Le coach
+attribue un code à chaque membre (ou chacun lui communique le sien) et lui demande de le saisir au début du
+test ; le rapport lit la dernière passation de l'historique de chaque code (conservé NEO_PIR_HISTORY_TTL).
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+from .interpretation import get_level
+from .item_banks import DIMENSION_CODES, DIMENSIONS
+from .longitudinal import respondent_key
+from .norms import SCALE_KEYS
+from .similarity import profile_vectors
+
+LEVELS = ("Faible", "Moyen", "Élevé")
+LOW_THRESHOLD = 30
+HIGH_THRESHOLD = 70
+
+N_DOMAINS = len(DIMENSION_CODES)
+MAX_DISTANCE = 100 * np.sqrt(N_DOMAINS)
+INITIAL_CAPACITY = 16
+
+class TeamReportError(ValueError):
+    """Équipe ou membre invalide"""
+
+def member_vector(result):
+    """Percentiles des 35 échelles d'un résultat enregistré (domaines puis facettes)"""
+    domains, facets = profile_vectors(result)
+    return np.concatenate([domains, facets]).astype(np.float32)
+
+def level_indices(vectors):
+    """Niveau de chaque percentile : 0 (Faible), 1 (Moyen) ou 2 (Élevé), mêmes seuils que get_level"""
+    return (vectors >= LOW_THRESHOLD).astype(np.int8) + (vectors >= HIGH_THRESHOLD)
+
+def pairwise(vectors, others):
+    """Similarité et complémentarité des domaines entre deux lots de membres, matrices (lot, autres)"""
+    x, y = vectors[:, :N_DOMAINS], others[:, :N_DOMAINS]
+    squared = np.einsum('ij,ij->i', x, x)[:, None] + np.einsum('ij,ij->i', y, y)[None, :] - 2 * (x @ y.T)
+    similarity = 1 - np.sqrt(np.maximum(squared, 0)) / MAX_DISTANCE
+    x_high, x_low = (x >= HIGH_THRESHOLD).astype(np.float32), (x < LOW_THRESHOLD).astype(np.float32)
+    y_high, y_low = (y >= HIGH_THRESHOLD).astype(np.float32), (y < LOW_THRESHOLD).astype(np.float32)
+    complementarity = (x_high @ y_low.T + x_low @ y_high.T) / N_DOMAINS
+    return similarity.astype(np.float32), complementarity.astype(np.float32)
+
+class TeamProfile:
+    """Profil d'une équipe, mis à jour à chaque ajout de membre"""
+
+    def __init__(self, name=""):
+        self.name = name
+        self.members = []
+        self._positions = {}
+        self._vectors = np.zeros((INITIAL_CAPACITY, len(SCALE_KEYS)), dtype=np.float32)
+        self._similarity = np.zeros((INITIAL_CAPACITY, INITIAL_CAPACITY), dtype=np.float32)
+        self._complementarity = np.zeros((INITIAL_CAPACITY, INITIAL_CAPACITY), dtype=np.float32)
+        # Agrégats : moyenne et somme des carrés des écarts (fusion par lots de Chan), effectifs par niveau
+        self._mean = np.zeros(len(SCALE_KEYS))
+        self._m2 = np.zeros(len(SCALE_KEYS))
+        self._level_counts = np.zeros((len(LEVELS), len(SCALE_KEYS)), dtype=np.int64)
+
+    def __len__(self):
+        return len(self.members)
+
+    @property
+    def vectors(self):
+        return self._vectors[:len(self)]
+
+    @property
+    def similarity(self):
+        return self._similarity[:len(self), :len(self)]
+
+    @property
+    def complementarity(self):
+        return self._complementarity[:len(self), :len(self)]
+
+    def _reserve(self, size):
+        """Agrandit les tableaux (capacité doublée) : ajouts en temps amorti constant"""
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        vectors = np.zeros((capacity, len(SCALE_KEYS)), dtype=np.float32)
+        vectors[:len(self)] = self.vectors
+        self._vectors = vectors
+        for name in ('_similarity', '_complementarity'):
+            matrix = np.zeros((capacity, capacity), dtype=np.float32)
+            matrix[:len(self), :len(self)] = getattr(self, name)[:len(self), :len(self)]
+            setattr(self, name, matrix)
+
+    def _merge_stats(self, vectors, count):
+        """Ajoute un lot de membres aux moyennes, variances (formule de Chan) et effectifs par niveau
+
+        count : effectif avant l'ajout.
+        """
+        vectors = vectors.astype(np.float64)
+        added = len(vectors)
+        mean = vectors.mean(axis=0)
+        delta = mean - self._mean
+        total = count + added
+        self._m2 += ((vectors - mean) ** 2).sum(axis=0) + delta ** 2 * count * added / total
+        self._mean += delta * added / total
+        levels = level_indices(vectors)
+        for j in range(len(LEVELS)):
+            self._level_counts[j] += (levels == j).sum(axis=0)
+
+    def _remove_stats(self, vector, count):
+        """Retire un membre des moyennes, variances et effectifs par niveau (count : effectif avant)"""
+        vector = vector.astype(np.float64)
+        if count > 1:
+            mean = (self._mean * count - vector) / (count - 1)
+            self._m2 -= (vector - mean) * (vector - self._mean)
+            self._mean = mean
+        else:
+            self._mean[:] = 0
+            self._m2[:] = 0
+        self._level_counts[level_indices(vector), np.arange(len(SCALE_KEYS))] -= 1
+
+    def add(self, member_id, result):
+        """Ajoute un membre (ou remplace son profil) à partir de son résultat enregistré"""
+        self.add_vectors([member_id], member_vector(result)[None, :])
+
+    def add_vectors(self, member_ids, vectors):
+        """Ajoute des membres : percentiles (membres x 35) ; seules les lignes des nouveaux sont calculées"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, len(SCALE_KEYS))
+        if len(member_ids) != len(vectors) or len(set(member_ids)) != len(member_ids):
+            raise TeamReportError("Un vecteur par membre, sans doublon, est attendu")
+        positions = [self._positions.get(member_id) for member_id in member_ids]
+        # Profils remplacés (test repassé) : l'ancienne contribution est retirée puis la nouvelle ajoutée
+        for row, position in enumerate(positions):
+            if position is not None:
+                self._remove_stats(self._vectors[position], len(self))
+                self._merge_stats(vectors[row:row + 1], len(self) - 1)
+                self._vectors[position] = vectors[row]
+        # Nouveaux membres : agrégats fusionnés en une opération pour tout le lot
+        new_rows = [row for row, position in enumerate(positions) if position is None]
+        if new_rows:
+            start = len(self)
+            self._reserve(start + len(new_rows))
+            self._merge_stats(vectors[new_rows], start)
+            self._vectors[start:start + len(new_rows)] = vectors[new_rows]
+            for offset, row in enumerate(new_rows):
+                positions[row] = start + offset
+                self._positions[member_ids[row]] = start + offset
+                self.members.append(member_ids[row])
+
+        # Lignes et colonnes des membres ajoutés, en une opération pour tout le lot
+        positions = np.array(positions)
+        similarity, complementarity = pairwise(self._vectors[positions], self.vectors)
+        for matrix, block in ((self._similarity, similarity), (self._complementarity, complementarity)):
+            matrix[positions, :len(self)] = block
+            matrix[:len(self), positions] = block.T
+
+    def summary(self):
+        """Statistiques par échelle : moyenne, écart-type, part de chaque niveau et diversité"""
+        count = len(self)
+        if count == 0:
+            raise TeamReportError("Équipe vide")
+        sd = np.sqrt(np.maximum(self._m2, 0) / max(count - 1, 1))
+        shares = self._level_counts / count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entropy = -np.where(shares > 0, shares * np.log(shares), 0).sum(axis=0)
+        diversity = entropy / np.log(len(LEVELS))
+        return {
+            scale: {
+                'mean': float(self._mean[i]),
+                'sd': float(sd[i]),
+                'level': get_level(self._mean[i]),
+                'levels': {level: float(shares[j, i]) for j, level in enumerate(LEVELS)},
+                'diversity': float(diversity[i])
+            }
+            for i, scale in enumerate(SCALE_KEYS)
+        }
+
+    def top_pairs(self, kind='similarity', count=5):
+        """Paires de membres les plus similaires ou complémentaires : [(membre, membre, valeur)]"""
+        matrix = self.similarity if kind == 'similarity' else self.complementarity
+        rows, columns = np.triu_indices(len(self), k=1)
+        values = matrix[rows, columns]
+        if len(values) > count:
+            top = np.argpartition(values, len(values) - count)[len(values) - count:]
+        else:
+            top = np.arange(len(values))
+        order = top[np.argsort(values[top], kind='stable')[::-1]]
+        return [(self.members[rows[i]], self.members[columns[i]], float(values[i])) for i in order]
+
+    def report(self, pairs=5):
+        """Rapport d'équipe sérialisable (JSON)"""
+        summary = self.summary()
+        upper = np.triu_indices(len(self), k=1)
+        return {
+            'team': self.name,
+            'members': len(self),
+            'domains': {dim: {'name': DIMENSIONS[dim], **summary[dim]} for dim in DIMENSION_CODES},
+            'facets': {scale: values for scale, values in summary.items() if ':' in scale},
+            'mean_similarity': float(self.similarity[upper].mean()) if len(self) > 1 else None,
+            'mean_complementarity': float(self.complementarity[upper].mean()) if len(self) > 1 else None,
+            'most_similar': self.top_pairs('similarity', pairs),
+            'most_complementary': self.top_pairs('complementarity', pairs)
+        }
+
+def load_team(backend, codes, name="", labels=None):
+    """Profil d'équipe à partir de la dernière passation de chaque code répondant (codes sans passation ignorés)
+
+    labels : noms des membres dans le rapport, dans l'ordre des codes (les codes eux-mêmes par défaut).
+    """
+    labels = list(codes) if labels is None else list(labels)
+    if len(labels) != len(codes):
+        raise TeamReportError("Un nom par code répondant est attendu")
+    members, vectors = [], []
+    for code, label in dict(zip(codes, labels)).items():
+        history = backend.load_history(respondent_key(code))
+        if history:
+            members.append(label)
+            vectors.append(member_vector(history[-1][1]))
+    team = TeamProfile(name)
+    if members:
+        team.add_vectors(members, np.stack(vectors))
+    return team
+
+def read_members(path):
+    """Fichier des membres : une ligne par membre, « code » ou « nom ; code » -> (codes, noms)"""
+    codes, labels = [], []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            label, _, code = line.rpartition(';')
+            codes.append(code.strip())
+            labels.append(label.strip() or code.strip())
+    return codes, labels
+
+if __name__ == "__main__":
+    from neo_core.session_store import create_backend
+
+    parser = argparse.ArgumentParser(description="Rapport de composition d'une équipe")
+    parser.add_argument('members', help="fichier des membres, une ligne par membre : « code » ou « nom ; code »")
+    parser.add_argument('--backend', help="backend d'état (sqlite:///chemin.db ; NEO_PIR_STATE_BACKEND par défaut)")
+    parser.add_argument('--name', default="")
+    parser.add_argument('--json', help="écrit le rapport complet dans ce fichier")
+    args = parser.parse_args()
+
+    codes, labels = read_members(args.members)
+    try:
+        team = load_team(create_backend(args.backend), codes, args.name, labels)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    if len(team) < 2:
+        raise SystemExit(f"{len(team)} membre(s) avec une passation enregistrée : au moins 2 sont nécessaires")
+
+    report = team.report()
+    print(f"Équipe {args.name or '(sans nom)'} : {len(team)} membres sur {len(codes)} codes répondant")
+    for dim, values in report['domains'].items():
+        print(f"  {values['name']:<16} moyenne {values['mean']:5.1f}  écart-type {values['sd']:5.1f}  "
+              f"diversité {values['diversity']:.2f}")
+    print(f"Similarité moyenne {report['mean_similarity']:.2f}, "
+          f"complémentarité moyenne {report['mean_complementarity']:.2f}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
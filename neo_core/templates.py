@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+Gabarits HTML des cartes de résultats
+Les gabarits sont compilés une fois à l'import ; les styles sont dans les classes CSS du thème
+(voir set_custom_theme) et les fragments récurrents sont mémorisés par (dimension, facette, niveau).
+"""
+
+import html
+from functools import lru_cache
+from string import Formatter
+
+from .interpretation import get_dimension_description, get_facet_description
+from .item_banks import DIMENSIONS
+
+LEVEL_CLASSES = {'Élevé': 'eleve', 'Moyen': 'moyen', 'Faible': 'faible'}
+
+@lru_cache(maxsize=16)
+def minify(source):
+    """Réduit les blancs d'un bloc HTML/CSS à des espaces simples, sur une seule ligne"""
+    return " ".join(source.split())
+
+class HTMLTemplate:
+    """Gabarit compilé : morceaux littéraux et champs pré-analysés, blancs superflus retirés"""
+
+    def __init__(self, source, raw=()):
+        # Une seule ligne : le bloc HTML reste intact pour le rendu Markdown
+        self.source = minify(source)
+        self.raw = frozenset(raw)
+        self._parts = [(literal, field, spec) for literal, field, spec, _ in Formatter().parse(self.source)]
+
+    def render(self, **fields):
+        """Rend le gabarit ; les champs sont échappés sauf ceux déclarés bruts"""
+        out = []
+        for literal, field, spec in self._parts:
+            out.append(literal)
+            if field is None:
+                continue
+            value = fields[field]
+            if spec:
+                value = format(value, spec)
+            out.append(str(value) if field in self.raw else html.escape(str(value), quote=False))
+        return "".join(out)
+
+RESULTS_HEADER = HTMLTemplate("""
+<div class="results-header">
+    <h1>📊 Vos Résultats NEO PI-R</h1>
+    <p>Découvrez votre profil de personnalité unique</p>
+</div>
+""").render()
+
+OVERVIEW_CARD = HTMLTemplate("""
+<div class="info-card">
+    <h4>🌟 Votre profil en un coup d'œil</h4>
+    <p class="info-text">
+        Votre trait de personnalité le plus marqué est <strong>{dominant_name}</strong>
+        ({dominant_percentile:.0f}e percentile), ce qui suggère que {dominant_description}
+    </p>
+    <p class="info-text">
+        Votre score le plus modéré concerne <strong>{lowest_name}</strong>
+        ({lowest_percentile:.0f}e percentile), indiquant que {lowest_description}
+    </p>
+</div>
+""")
+
+ARCHETYPE_CARD = HTMLTemplate("""
+<div class="info-card">
+    <h4>🧩 Votre archétype : {name}</h4>
+    <p class="info-text">
+        {share:.0f} % des profils étudiés appartiennent à cet archétype.
+        Profil type du groupe : {profile}.
+    </p>
+</div>
+""")
+
+DIMENSION_HEADER = HTMLTemplate("""
+<div class="dimension-header {level_class}">
+    <h2>{name} ({dimension})</h2>
+    <div class="dimension-level">
+        <div>
+            <h3>Niveau : {level}</h3>
+            <p>{percentile}e percentile</p>
+        </div>
+        <div class="dimension-percentile">{percentile}%</div>
+    </div>
+</div>
+""")
+
+INTERPRETATION_CARD = HTMLTemplate("""
+<div class="info-card">
+    <h4>📝 Interprétation de votre score</h4>
+    <p class="info-text large">{description}</p>
+</div>
+""")
+
+FACET_CARD = HTMLTemplate("""
+<div class="result-card facet">
+    <h5>{facet} (Score: {score})</h5>
+    <p>{description}</p>
+</div>
+""")
+
+# Cartes de recommandations (une par texte) ; l'orientation est une seule carte à plusieurs lignes
+RECOMMENDATION_CARDS = {
+    'forces': HTMLTemplate('<div class="result-card force"><p>✅ {text}</p></div>'),
+    'defis': HTMLTemplate('<div class="result-card defi"><p>🔄 {text}</p></div>'),
+    'relationships': HTMLTemplate('<div class="result-card tip"><p>💭 {text}</p></div>'),
+    'development': HTMLTemplate('<div class="result-card development"><p>🚀 {text}</p></div>')
+}
+
+CAREER_CARD = HTMLTemplate("""
+<div class="info-card">
+    <h5>🎯 Suggestions d'orientation</h5>
+    <div class="info-lines">{lines}</div>
+</div>
+""", raw=('lines',))
+CAREER_LINE = HTMLTemplate("• <strong>{dimension}</strong> : {text}<br>")
+
+def overview_card(interpretations, dimensions=DIMENSIONS):
+    """Carte de synthèse : trait le plus marqué et trait le plus modéré"""
+    percentiles = {dim: interp['percentile'] for dim, interp in interpretations.items()}
+    dominant = max(percentiles, key=percentiles.get)
+    lowest = min(percentiles, key=percentiles.get)
+    return OVERVIEW_CARD.render(
+        dominant_name=dimensions[dominant],
+        dominant_percentile=percentiles[dominant],
+        dominant_description=interpretations[dominant]['description'].lower(),
+        lowest_name=dimensions[lowest],
+        lowest_percentile=percentiles[lowest],
+        lowest_description=interpretations[lowest]['description'].lower()
+    )
+
+def archetype_card(model, archetype, dimensions=DIMENSIONS):
+    """Carte de l'archétype le plus proche (centroïde résumé par domaine)"""
+    profile = ", ".join(
+        f"{dimensions[dim]} {percentile:.0f}e"
+        for dim, percentile in zip(dimensions, model.domain_percentiles[archetype])
+    )
+    return ARCHETYPE_CARD.render(name=model.names[archetype], share=model.shares[archetype] * 100, profile=profile)
+
+@lru_cache(maxsize=1024)
+def dimension_header(dimension, level, percentile):
+    """En-tête d'une dimension (percentile arrondi à l'entier)"""
+    return DIMENSION_HEADER.render(
+        level_class=LEVEL_CLASSES[level],
+        name=DIMENSIONS[dimension],
+        dimension=dimension,
+        level=level,
+        percentile=percentile
+    )
+
+@lru_cache(maxsize=64)
+def interpretation_card(dimension, level):
+    """Carte d'interprétation d'une dimension à un niveau donné"""
+    return INTERPRETATION_CARD.render(description=get_dimension_description(dimension, level))
+
+@lru_cache(maxsize=1024)
+def facet_card(dimension, facet, score):
+    """Carte d'explication d'une facette"""
+    return FACET_CARD.render(facet=facet, score=score, description=get_facet_description(dimension, facet))
+
+def facet_cards(dimension, facet_scores):
+    """Cartes de toutes les facettes d'une dimension, en un seul bloc"""
+    return "\n".join(facet_card(dimension, facet, score) for facet, score in facet_scores.items())
+
+def recommendation_cards(section, texts):
+    """Cartes d'une section de recommandations, en un seul bloc"""
+    return "\n".join(RECOMMENDATION_CARDS[section].render(text=text) for text in texts)
+
+def career_card(lines):
+    """Carte d'orientation : lignes (nom de dimension, recommandation)"""
+    return CAREER_CARD.render(lines="".join(CAREER_LINE.render(dimension=name, text=text) for name, text in lines))
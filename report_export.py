@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Export des rapports NEO PI-R (PDF/PNG)
+Le rendu matplotlib s'exécute dans un pool de processus, hors du thread Streamlit
+"""
+
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+REPORT_VERSION = 2
+REPORT_FORMATS = {
+    'pdf': 'application/pdf',
+    'png': 'image/png'
+}
+
+DIMENSION_ORDER = ['N', 'E', 'O', 'A', 'C']
+LEVEL_COLORS = {'Élevé': '#e74c3c', 'Moyen': '#f39c12', 'Faible': '#3498db'}
+
+# ================= RENDU (EXÉCUTÉ DANS LES WORKERS) =================
+
+def _draw_radar(ax, payload):
+    """Dessine le graphique radar des percentiles"""
+    import numpy as np
+
+    values = [payload['interpretations'][dim]['percentile'] for dim in DIMENSION_ORDER]
+    angles = np.linspace(0, 2 * np.pi, len(DIMENSION_ORDER), endpoint=False).tolist()
+
+    # Fermeture du radar
+    values_radar = values + [values[0]]
+    angles_radar = angles + [angles[0]]
+
+    ax.plot(angles_radar, values_radar, color='#3498db', linewidth=3)
+    ax.fill(angles_radar, values_radar, color='#3498db', alpha=0.3)
+    ax.set_xticks(angles)
+    ax.set_xticklabels(DIMENSION_ORDER)
+    ax.set_ylim(0, 100)
+    ax.set_yticks([20, 40, 60, 80, 100])
+    ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'], fontsize=8)
+    ax.set_title("Votre Profil de Personnalité NEO PI-R", pad=20)
+
+def _draw_facets(ax, payload, dimension):
+    """Dessine les percentiles des facettes d'une dimension, avec leurs intervalles de confiance (écran)"""
+    facets = list(payload['facet_percentiles'][dimension].keys())
+    values = list(payload['facet_percentiles'][dimension].values())
+    bounds = [payload['facet_confidence'][dimension][facet] for facet in facets]
+    errors = [[value - low for value, (low, _) in zip(values, bounds)],
+              [high - value for value, (_, high) in zip(values, bounds)]]
+
+    ax.barh(facets, values, xerr=errors, color='#3498db', ecolor='#2c3e50', capsize=3)
+    ax.axvline(50, color='#95a5a6', linewidth=0.8, linestyle='--')
+    ax.invert_yaxis()
+    ax.set_xlim(0, 100)
+    ax.set_title(f"Facettes de {payload['dimensions'][dimension]} ({dimension}), en percentiles", fontsize=10)
+    ax.tick_params(labelsize=8)
+
+def _draw_norms_note(fig, payload):
+    """Avertissement en pied de page quand les normes sont théoriques (provisoires)"""
+    if payload.get('norms_note'):
+        fig.text(0.08, 0.015, payload['norms_note'], fontsize=7, style='italic', color='#7f8c8d', wrap=True)
+
+def _draw_interpretation(fig, payload, top=0.95):
+    """Écrit le texte d'interprétation par dimension"""
+    import textwrap
+
+    # Interlignes exprimés pour une page A4, ramenés à la hauteur de la figure
+    scale = 11.69 / fig.get_figheight()
+    y = top
+    for dim in DIMENSION_ORDER:
+        interp = payload['interpretations'][dim]
+        title = f"{payload['dimensions'][dim]} ({dim}) — {interp['level']}, {interp['percentile']:.0f}e percentile"
+        fig.text(0.08, y, title, fontsize=11, weight='bold', color=LEVEL_COLORS.get(interp['level'], '#2c3e50'))
+        y -= 0.03 * scale
+        for line in textwrap.wrap(interp['description'], 95):
+            fig.text(0.08, y, line, fontsize=9, color='#34495e')
+            y -= 0.022 * scale
+        y -= 0.02 * scale
+
+def render_report(payload, fmt='pdf'):
+    """Rend le rapport complet (radar, facettes, interprétation) et retourne les octets"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    buffer = io.BytesIO()
+
+    if fmt == 'pdf':
+        with PdfPages(buffer) as pdf:
+            # Page 1 : profil et interprétation
+            fig = plt.figure(figsize=(8.27, 11.69))
+            ax = fig.add_axes([0.2, 0.55, 0.6, 0.38], projection='polar')
+            _draw_radar(ax, payload)
+            _draw_interpretation(fig, payload, top=0.47)
+            _draw_norms_note(fig, payload)
+            pdf.savefig(fig)
+            plt.close(fig)
+
+            # Page 2 : facettes (absente pour une passation adaptative, dont les facettes sont imputées)
+            if payload['facet_percentiles'] is not None:
+                fig, axes = plt.subplots(5, 1, figsize=(8.27, 11.69))
+                for ax, dim in zip(axes, DIMENSION_ORDER):
+                    _draw_facets(ax, payload, dim)
+                fig.tight_layout(rect=(0, 0.03, 1, 1))
+                _draw_norms_note(fig, payload)
+                pdf.savefig(fig)
+                plt.close(fig)
+    elif fmt == 'png':
+        fig = plt.figure(figsize=(10, 22))
+        ax = fig.add_axes([0.25, 0.78, 0.5, 0.19], projection='polar')
+        _draw_radar(ax, payload)
+        for i, dim in enumerate(DIMENSION_ORDER if payload['facet_percentiles'] is not None else ()):
+            ax = fig.add_axes([0.3, 0.66 - i * 0.075, 0.6, 0.055])
+            _draw_facets(ax, payload, dim)
+        _draw_interpretation(fig, payload, top=0.3)
+        _draw_norms_note(fig, payload)
+        fig.savefig(buffer, format='png', dpi=100)
+        plt.close(fig)
+    else:
+        raise ValueError(f"Format de rapport inconnu : {fmt}")
+
+    return buffer.getvalue()
+
+# ================= PLANIFICATION ET CACHE =================
+
+def build_report_payload(dimensions, scores, percentiles, interpretations, facet_percentiles=None,
+                         facet_confidence=None, norms_note=None):
+    """Construit la charge utile sérialisable transmise aux workers
+
+    facet_percentiles / facet_confidence : percentiles des facettes et bornes (basse, haute) de leur
+    intervalle de confiance, comme à l'écran ; None : rapport sans facettes (passation adaptative).
+    norms_note : avertissement imprimé en pied de page (normes théoriques provisoires).
+    """
+    facets = facet_percentiles is not None
+    return {
+        'dimensions': dict(dimensions),
+        'scores': {dim: scores[dim] for dim in DIMENSION_ORDER},
+        'facet_percentiles': {dim: {facet: float(value) for facet, value in facet_percentiles[dim].items()}
+                              for dim in DIMENSION_ORDER} if facets else None,
+        'facet_confidence': {dim: {facet: [float(low), float(high)]
+                                   for facet, (low, high) in facet_confidence[dim].items()}
+                             for dim in DIMENSION_ORDER} if facets else None,
+        'norms_note': norms_note,
+        'percentiles': {dim: float(percentiles[dim]) for dim in DIMENSION_ORDER},
+        'interpretations': {
+            dim: {
+                'level': interpretations[dim]['level'],
+                'percentile': float(interpretations[dim]['percentile']),
+                'description': interpretations[dim]['description']
+            }
+            for dim in DIMENSION_ORDER
+        }
+    }
+
+def report_fingerprint(payload, fmt):
+    """Empreinte de contenu d'un rapport (profils identiques => même clé)"""
+    canonical = json.dumps([REPORT_VERSION, fmt, payload], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+class ReportExporter:
+    """Pool de rendu des rapports avec cache adressé par contenu"""
+
+    def __init__(self, max_workers=None, max_entries=256):
+        self.max_workers = max_workers or int(os.environ.get('NEO_PIR_REPORT_WORKERS', 2))
+        self.max_entries = max_entries
+        self._executor = None
+        self._futures = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        """Démarre le pool à la première demande (contexte spawn, sûr dans un serveur multi-thread)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._executor
+
+    def submit(self, payload, fmt='pdf'):
+        """Planifie le rendu sans bloquer ; retourne (clé, future)"""
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Format de rapport inconnu : {fmt}")
+
+        key = report_fingerprint(payload, fmt)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None and not (future.done() and future.exception() is not None):
+                self._futures.move_to_end(key)
+                return key, future
+
+            future = self._get_executor().submit(render_report, payload, fmt)
+            self._futures[key] = future
+            while len(self._futures) > self.max_entries:
+                self._futures.popitem(last=False)
+
+        return key, future
+
+    def status(self, key):
+        """État d'un rendu : 'ready', 'pending', 'failed' ou 'missing'"""
+        with self._lock:
+            future = self._futures.get(key)
+        if future is None:
+            return 'missing'
+        if not future.done():
+            return 'pending'
+        return 'failed' if future.exception() is not None else 'ready'
+
+    def get(self, key):
+        """Retourne les octets du rapport s'il est prêt, sinon None"""
+        with self._lock:
+            future = self._futures.get(key)
+        if future is None or not future.done() or future.exception() is not None:
+            return None
+        return future.result()
+
+    def shutdown(self):
+        """Arrête le pool de rendu"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
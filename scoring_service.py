@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""
+Service HTTP de cotation NEO PI-R, sans interface Streamlit
+Les requêtes concurrentes sont regroupées en micro-lots cotés dans un pool de processus
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from neo_core import DEFAULT_BANK, DEFAULT_LOCALE, NEOPIRManager, get_registry
+from neo_core.result_cache import ResultCache, vector_fingerprint
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+# ================= COTATION (EXÉCUTÉE DANS LES WORKERS) =================
+
+_managers = {}
+
+def _get_manager(bank, locale):
+    """Gestionnaire NEO PI-R mis en cache par banque d'items"""
+    if (bank, locale) not in _managers:
+        _managers[(bank, locale)] = NEOPIRManager(bank, locale)
+    return _managers[(bank, locale)]
+
+def _warm_up():
+    """Pré-charge le cœur métier et la banque par défaut dans le worker"""
+    _get_manager(DEFAULT_BANK, DEFAULT_LOCALE)
+    return os.getpid()
+
+def score_matrix(bank, locale, responses, details=False):
+    """Cote une matrice de réponses (sujets x items) et retourne un résultat par ligne
+
+    details : ajoute percentiles des facettes et intervalles de confiance (un seul calcul vectorisé par lot).
+    """
+    manager = _get_manager(bank, locale)
+    dimension_sums, facet_sums, percentiles = manager.calculate_scores_batch(responses)
+    if details:
+        detail_rows = manager.details_to_dicts(*manager.calculate_details_batch(dimension_sums, facet_sums))
+
+    results = []
+    for row in range(responses.shape[0]):
+        scores, facet_scores, row_percentiles = manager.scores_to_dicts(
+            dimension_sums[row], facet_sums[row], percentiles[row]
+        )
+        results.append({
+            'scores': scores,
+            'facet_scores': facet_scores,
+            'percentiles': row_percentiles,
+            'interpretations': manager.get_interpretation(row_percentiles)
+        })
+        if details:
+            results[-1].update(detail_rows[row])
+    return results
+
+# ================= MICRO-LOTS =================
+
+class MicroBatcher:
+    """Regroupe les vecteurs de réponses concurrents en appels de cotation vectorisés"""
+
+    def __init__(self, workers=None, max_batch=256, max_wait_ms=2.0):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.workers = workers or os.cpu_count()
+        self._queue = queue.Queue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        # Pool chaud : chaque worker charge le module avant la première requête
+        for future in [self._executor.submit(_warm_up) for _ in range(self.workers)]:
+            future.result()
+
+        self.stats = {'vectors': 0, 'batches': 0}
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, bank, locale, vectors, details=False):
+        """Planifie la cotation d'un ou plusieurs vecteurs ; retourne une Future par vecteur"""
+        futures = []
+        for vector in vectors:
+            future = Future()
+            self._queue.put((bank, locale, details, vector, future))
+            futures.append(future)
+        return futures
+
+    def _run(self):
+        """Boucle de regroupement : attend au plus max_wait après le premier vecteur"""
+        while self._running:
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            groups = defaultdict(list)
+            for bank, locale, details, vector, future in batch:
+                groups[(bank, locale, details)].append((vector, future))
+
+            for (bank, locale, details), entries in groups.items():
+                matrix = np.stack([vector for vector, _ in entries])
+                pool_future = self._executor.submit(score_matrix, bank, locale, matrix, details)
+                pool_future.add_done_callback(lambda f, entries=entries: self._dispatch(f, entries))
+                self.stats['batches'] += 1
+                self.stats['vectors'] += len(entries)
+
+    @staticmethod
+    def _dispatch(pool_future, entries):
+        """Distribue les résultats d'un lot aux requêtes en attente"""
+        error = pool_future.exception()
+        for i, (_, future) in enumerate(entries):
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(pool_future.result()[i])
+
+    def shutdown(self):
+        """Arrête la boucle et le pool"""
+        self._running = False
+        self._thread.join()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+# ================= HTTP =================
+
+class ServiceMetrics:
+    """Compteurs et latences récentes du service"""
+
+    def __init__(self, window=10000):
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency, ok=True):
+        with self._lock:
+            self.requests += 1
+            self.errors += 0 if ok else 1
+            self.latencies.append(latency)
+
+    def snapshot(self, batcher, result_cache):
+        with self._lock:
+            latencies = np.array(self.latencies) * 1000 if self.latencies else np.zeros(1)
+            return {
+                'uptime_s': round(time.time() - self.started, 1),
+                'requests': self.requests,
+                'errors': self.errors,
+                'latency_ms': {
+                    'p50': round(float(np.percentile(latencies, 50)), 3),
+                    'p95': round(float(np.percentile(latencies, 95)), 3),
+                    'p99': round(float(np.percentile(latencies, 99)), 3)
+                },
+                'vectors_scored': batcher.stats['vectors'],
+                'batches': batcher.stats['batches'],
+                'mean_batch_size': round(batcher.stats['vectors'] / max(1, batcher.stats['batches']), 2),
+                'result_cache': result_cache.stats()
+            }
+
+class RequestError(ValueError):
+    """Requête de cotation invalide (réponse HTTP 400)"""
+
+def _response_values(position, values):
+    """Réponses d'un vecteur validées avant conversion : entiers de 0 à 5 (les booléens JSON sont refusés)"""
+    values = list(values)
+    if not all(type(value) is int and 0 <= value <= 5 for value in values):
+        raise RequestError(f"Vecteur {position} : réponses attendues entre 1 et 5 (0 = sans réponse)")
+    return values
+
+def parse_vectors(item_bank, payload):
+    """Valide la charge utile et retourne (vecteurs, lot ?)"""
+    if not isinstance(payload, dict) or 'responses' not in payload:
+        raise RequestError("Champ 'responses' manquant")
+
+    responses = payload['responses']
+    batched = isinstance(responses, list) and (not responses or not isinstance(responses[0], int))
+    entries = responses if batched else [responses]
+
+    vectors = []
+    for position, entry in enumerate(entries):
+        if isinstance(entry, dict):
+            unknown = [item_id for item_id in entry if item_id not in item_bank.item_index]
+            if unknown:
+                raise RequestError(f"Vecteur {position} : items inconnus {unknown[:5]}")
+            vector = item_bank.response_vector(dict(zip(entry, _response_values(position, entry.values()))))
+        elif isinstance(entry, list) and len(entry) == len(item_bank):
+            vector = np.array(_response_values(position, entry), dtype=np.int8)
+        else:
+            raise RequestError(f"Vecteur {position} : dictionnaire ou liste de {len(item_bank)} réponses attendu")
+        vectors.append(vector)
+
+    return vectors, batched
+
+def score_vectors(batcher, result_cache, item_bank, vectors, details=False):
+    """Cote des vecteurs : les réponses déjà vues sont servies par le cache, les autres par le micro-batcher"""
+    # Les résultats détaillés sont mémorisés sous une clé distincte
+    suffix = "-details" if details else ""
+    fingerprints = [vector_fingerprint(item_bank, vector) + suffix for vector in vectors]
+    results = [result_cache.get(fingerprint) for fingerprint in fingerprints]
+    missing = [i for i, result in enumerate(results) if result is None]
+
+    futures = batcher.submit(item_bank.bank, item_bank.locale, [vectors[i] for i in missing], details)
+    for i, future in zip(missing, futures):
+        results[i] = future.result()
+        result_cache.put(fingerprints[i], results[i])
+    return results
+
+def make_handler(batcher, metrics, result_cache):
+    """Construit le gestionnaire de requêtes lié au micro-batcher et au cache de résultats"""
+
+    class ScoringHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # En-têtes et corps partent en écritures séparées : sans ceci, Nagle + ACK différé ajoutent ~40 ms
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send_json(200, {'status': 'ok'})
+            elif self.path == "/metrics":
+                self._send_json(200, metrics.snapshot(batcher, result_cache))
+            else:
+                self._send_json(404, {'error': "Ressource inconnue"})
+
+        def do_POST(self):
+            if self.path != "/score":
+                self._send_json(404, {'error': "Ressource inconnue"})
+                return
+
+            start = time.perf_counter()
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                if length > MAX_BODY_BYTES:
+                    raise RequestError("Requête trop volumineuse")
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(payload, dict):
+                    raise RequestError("Objet JSON attendu")
+                bank = payload.get('bank', DEFAULT_BANK)
+                locale = payload.get('locale', DEFAULT_LOCALE)
+                if not isinstance(bank, str) or not isinstance(locale, str):
+                    raise RequestError("'bank' et 'locale' doivent être des chaînes")
+                try:
+                    item_bank = get_registry().get(bank, locale)
+                except KeyError as e:
+                    raise RequestError(str(e.args[0])) from None
+
+                vectors, batched = parse_vectors(item_bank, payload)
+                results = score_vectors(batcher, result_cache, item_bank, vectors, bool(payload.get('details')))
+            # Toute autre donnée mal formée (types, dépassements) reste une erreur du client
+            except (RequestError, json.JSONDecodeError, ValueError, TypeError, OverflowError) as e:
+                metrics.record(time.perf_counter() - start, ok=False)
+                self._send_json(400, {'error': str(e)})
+                return
+            # Panne côté serveur (pool de workers cassé, erreur de cotation) : la connexion reste utilisable
+            except Exception:
+                logger.exception("Échec de la cotation")
+                metrics.record(time.perf_counter() - start, ok=False)
+                self._send_json(500, {'error': "Erreur interne du service de cotation"})
+                return
+
+            metrics.record(time.perf_counter() - start)
+            self._send_json(200, {'results': results} if batched else results[0])
+
+    return ScoringHandler
+
+class ScoringServer(ThreadingHTTPServer):
+    """Serveur multi-thread avec une file d'attente de connexions adaptée aux pics"""
+    request_queue_size = 128
+    daemon_threads = True
+
+def create_server(host="127.0.0.1", port=8502, workers=None, max_batch=256, max_wait_ms=2.0,
+                  cache_entries=65536, cache_dir=None):
+    """Crée le serveur HTTP, son pool de cotation (démarrés à chaud) et son cache de résultats"""
+    batcher = MicroBatcher(workers, max_batch, max_wait_ms)
+    metrics = ServiceMetrics()
+    result_cache = ResultCache(cache_entries, cache_dir)
+    server = ScoringServer((host, port), make_handler(batcher, metrics, result_cache))
+    server.batcher = batcher
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Service de cotation NEO PI-R")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--cache-entries", type=int, default=65536)
+    parser.add_argument("--cache-dir", default=None, help="niveau disque partagé du cache de résultats")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.workers, args.max_batch, args.max_wait_ms,
+                           args.cache_entries, args.cache_dir)
+    print(f"Service de cotation à l'écoute sur http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.shutdown()
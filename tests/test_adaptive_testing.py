@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Passation adaptative : ajustement du GRM, critère d'arrêt par domaine, reprise d'une passation et résultats
+marqués adaptatifs (facettes imputées)
+"""
+
+import unittest
+
+import numpy as np
+
+from neo_core.adaptive_testing import (THETA_GRID, AdaptiveModel, fit_grm, grm_probabilities,
+                                       response_to_category)
+from neo_core.item_banks import get_registry
+from neo_core.longitudinal import history_record
+
+def simulate(a, b, theta, rng):
+    """Catégories 0-4 tirées du GRM pour chaque personne et item"""
+    categories = np.empty((len(theta), len(a)), dtype=int)
+    for j in range(len(a)):
+        probs = grm_probabilities(a[j], b[j], theta)
+        cumulative = probs.cumsum(axis=1)
+        categories[:, j] = (rng.random(len(theta))[:, None] > cumulative[:, :-1]).sum(axis=1)
+    return categories
+
+class GRMFitTests(unittest.TestCase):
+
+    def test_recovers_discrimination_and_thresholds(self):
+        rng = np.random.default_rng(0)
+        a = np.array([0.8, 1.4, 2.0, 2.6])
+        b = np.array([[-2.0, -1.0, 0.5, 1.5], [-1.5, -0.5, 0.5, 1.5], [-1.0, 0.0, 1.0, 2.0], [-2.5, -1.0, 0.0, 1.0]])
+        categories = simulate(a, b, rng.standard_normal(3000), rng)
+        categories[rng.random(categories.shape) < 0.05] = -1  # réponses manquantes
+
+        fitted_a, fitted_b = fit_grm(categories)
+        np.testing.assert_allclose(fitted_a, a, rtol=0.25)
+        np.testing.assert_allclose(fitted_b, b, atol=0.3)
+        self.assertTrue((np.diff(fitted_b, axis=1) > 0).all())
+
+class AdaptiveSessionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.item_bank = get_registry().get()
+        self.model = AdaptiveModel.default(self.item_bank.questions)
+
+    def administer(self, session, trait, rng):
+        """Répond selon le modèle pour un répondant de traits `trait` (un theta par domaine)"""
+        while (item_id := session.next_item()) is not None:
+            i = self.model.item_ids.index(item_id)
+            q = int(np.abs(THETA_GRID - trait[self.model.item_dimension[i]]).argmin())
+            category = rng.choice(5, p=np.exp(self.model.log_probs[i, q]) / np.exp(self.model.log_probs[i, q]).sum())
+            session.record(item_id, (5 - category) if self.model.reverse[i] else (category + 1))
+
+    def test_stops_when_every_domain_is_precise(self):
+        rng = np.random.default_rng(1)
+        session = self.model.new_session(se_threshold=0.5, min_items=3)
+        self.administer(session, rng.standard_normal(5), rng)
+
+        self.assertLess(len(session.responses), len(self.item_bank))
+        for d, items in enumerate(self.model.dimension_items):
+            asked = session.administered[items].sum()
+            self.assertGreaterEqual(asked, 3)
+            # Arrêt d'un domaine : erreur standard sous le seuil, ou tous ses items posés
+            self.assertTrue(session.estimate(d)[1] <= 0.5 or asked == len(items))
+
+    def test_estimate_follows_answers(self):
+        high, low = self.model.new_session(), self.model.new_session()
+        for session, answer in ((high, 5), (low, 1)):
+            for item_id in self.model.item_ids[:12]:
+                i = self.model.item_ids.index(item_id)
+                session.record(item_id, (6 - answer) if self.model.reverse[i] else answer)
+        d = self.model.item_dimension[0]
+        self.assertGreater(high.estimate(d)[0], 1.0)
+        self.assertLess(low.estimate(d)[0], -1.0)
+        self.assertEqual(response_to_category(5, False), 4)
+        self.assertEqual(response_to_category(5, True), 0)
+
+    def test_restore_session(self):
+        rng = np.random.default_rng(2)
+        session = self.model.new_session()
+        self.administer(session, rng.standard_normal(5), rng)
+        session.recorded = True
+
+        restored = self.model.restore_session(session.to_state())
+        self.assertEqual(restored.responses, session.responses)
+        self.assertTrue(restored.recorded)
+        self.assertIsNone(restored.next_item())
+        np.testing.assert_allclose(restored.log_posterior, session.log_posterior)
+
+    def test_completed_responses_marked_adaptive(self):
+        rng = np.random.default_rng(3)
+        session = self.model.new_session()
+        self.administer(session, rng.standard_normal(5), rng)
+        completed = session.completed_responses()
+
+        self.assertEqual(set(completed), set(self.model.item_ids))
+        self.assertTrue(all(completed[item_id] == response for item_id, response in session.responses.items()))
+        # Les facettes imputées ne sont pas comparées d'une passation à l'autre
+        entry = history_record({'item_bank': [], 'scores': {}, 'facet_scores': {}, 'percentiles': {},
+                                'adaptive': True})
+        self.assertTrue(entry['adaptive'])
+
+if __name__ == "__main__":
+    unittest.main()
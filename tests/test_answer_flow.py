@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Passation classique dans l'application : un clic enregistre la réponse et affiche la question suivante, retour
+en arrière avec la réponse précédente mise en avant, mode bouton radio et fin du test
+"""
+
+import importlib.util
+import os
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "NEO PI-R.py")
+
+@unittest.skipIf(importlib.util.find_spec('streamlit') is None, "Streamlit non installé")
+class AnswerFlowTests(unittest.TestCase):
+
+    def setUp(self):
+        from streamlit.testing.v1 import AppTest
+
+        self.app = AppTest.from_file(APP_PATH, default_timeout=60)
+        self.app.run()
+        self.app.radio(key="main_navigation").set_value("📝 Passer le Test").run()
+        self.assert_no_exception()
+
+    def assert_no_exception(self):
+        self.assertFalse(self.app.exception, self.app.exception and self.app.exception[0].message)
+
+    def answer_buttons(self):
+        return [b for b in self.app.button if b.key and b.key.startswith("answer_")]
+
+    def button(self, label):
+        return next(b for b in self.app.button if label in b.label)
+
+    def test_click_records_and_advances(self):
+        state = self.app.session_state
+        first = self.answer_buttons()[3]
+        first.click().run()
+        self.assert_no_exception()
+        self.assertEqual(state.current_question, 1)
+        self.assertEqual(list(state.responses.values()), [4])
+        # Même exécution : les boutons affichés sont déjà ceux de la question suivante
+        self.assertNotIn(first.key, [b.key for b in self.answer_buttons()])
+
+        # Retour : la réponse donnée est mise en avant, « Question suivante » est active
+        self.button("Question précédente").click().run()
+        self.assertEqual(state.current_question, 0)
+        self.assertEqual([b.proto.type for b in self.answer_buttons()].index("primary"), 3)
+        self.assertFalse(self.button("Question suivante").disabled)
+
+    def test_radio_mode(self):
+        state = self.app.session_state
+        next(t for t in self.app.toggle if "Réponse en un clic" in t.label).set_value(False).run()
+        self.assertTrue(self.button("Question suivante").disabled)
+        radio = next(r for r in self.app.radio if r.key and r.key.startswith("question_"))
+        radio.set_value(radio.options[1]).run()
+        # Le choix est enregistré sans changer de question
+        self.assertEqual(state.current_question, 0)
+        self.assertEqual(list(state.responses.values()), [2])
+        self.button("Question suivante").click().run()
+        self.assertEqual(state.current_question, 1)
+
+    def test_last_item_then_finish(self):
+        state = self.app.session_state
+        for i in range(60):
+            self.answer_buttons()[i % 5].click().run()
+        self.assert_no_exception()
+        # Le dernier item n'avance pas : « Terminer le test » devient actif
+        self.assertEqual(state.current_question, 59)
+        self.assertEqual(len(state.responses), 60)
+        self.button("Terminer le test").click().run()
+        self.assert_no_exception()
+        self.assertTrue(state.test_completed)
+
+if __name__ == "__main__":
+    unittest.main()
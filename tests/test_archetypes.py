@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Archétypes : groupes simulés retrouvés par le job, affectation au centroïde le plus proche, modèle rechargé
+quand le job le réécrit, passations adaptatives écartées
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from neo_core.archetypes import ARCHETYPES_FILE, ArchetypeModel, fit_archetypes, get_archetypes, profiles_from_backend
+from neo_core.item_banks import DIMENSION_CODES, FACET_CODES
+from neo_core.session_store import MemoryBackend
+
+def simulated_profiles(centers, per_group, rng):
+    """Profils de facettes dispersés autour de centres connus"""
+    profiles = np.concatenate([center + rng.normal(0, 5, (per_group, len(FACET_CODES))) for center in centers])
+    return np.clip(profiles, 0, 100)
+
+class FitTests(unittest.TestCase):
+
+    def test_recovers_groups(self):
+        rng = np.random.default_rng(0)
+        centers = np.array([[20] * 30, [80] * 30, [20] * 12 + [80] * 18], dtype=float)
+        profiles = simulated_profiles(centers, 300, rng)
+        model = fit_archetypes(profiles, cluster_counts=[2, 3, 5], n_jobs=1)
+
+        self.assertEqual(len(model), 3)
+        self.assertGreater(model.silhouette, 0.5)
+        for center in centers:
+            index, distance = model.assign(center)
+            self.assertLess(np.abs(model.centroids[index] - center).max(), 3)
+            self.assertLess(distance, 10)
+        np.testing.assert_allclose(model.shares, [1 / 3] * 3, atol=0.01)
+        # Affectation par lot identique à l'affectation unitaire
+        nearest, _ = model.assign_batch(profiles[::50])
+        self.assertEqual(nearest.tolist(), [model.assign(p)[0] for p in profiles[::50]])
+
+    def test_names(self):
+        model = ArchetypeModel([[85] * 6 + [50] * 24, [50] * 30], [10, 30])
+        self.assertTrue(model.names[0].startswith("Neuroticisme ↑"))
+        self.assertEqual(model.names[1], "Profil équilibré")
+
+class ModelFileTests(unittest.TestCase):
+
+    def test_reloaded_after_rewrite(self):
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.dict(os.environ, {'NEO_PIR_ARCHETYPES_DIR': directory}):
+            self.assertIsNone(get_archetypes())
+            path = os.path.join(directory, ARCHETYPES_FILE)
+            ArchetypeModel([[30] * 30, [70] * 30], [5, 5]).save(path)
+            first = get_archetypes()
+            self.assertIs(get_archetypes(), first)
+            np.testing.assert_allclose(first.centroids, [[30] * 30, [70] * 30])
+
+            ArchetypeModel([[10] * 30, [50] * 30, [90] * 30], [1, 2, 3]).save(path)
+            os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+            self.assertEqual(len(get_archetypes()), 3)
+            self.assertEqual([name for name in os.listdir(directory)], [ARCHETYPES_FILE])
+
+    def test_adaptive_results_skipped(self):
+        backend = MemoryBackend()
+        facets = {dim: {facet: 60.0 for d, facet in FACET_CODES if d == dim} for dim in DIMENSION_CODES}
+        result = {'item_bank': ['neo_pir_short', 'fr'], 'percentiles': {dim: 60.0 for dim in DIMENSION_CODES},
+                  'facet_percentiles': facets}
+        backend.save_result('complet', result)
+        backend.save_result('adaptatif', dict(result, adaptive=True))
+        profiles = profiles_from_backend(backend)
+        self.assertEqual(profiles.shape, (1, len(FACET_CODES)))
+        self.assertTrue((profiles == 60).all())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Structure factorielle : les 5 domaines de répondants synthétiques retrouvés depuis un fichier lu en flux,
+moments accumulés par parties égaux au calcul direct, items constants et échantillons trop petits refusés
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from neo_core.factor_structure import (CovarianceAccumulator, FactorStructureError, accumulate, structure_report,
+                                       validate_source)
+from neo_core.item_banks import DIMENSION_CODES, get_registry
+from neo_core.synthetic import SyntheticGenerator, write_csv
+
+class FactorStructureTests(unittest.TestCase):
+
+    def setUp(self):
+        self.item_bank = get_registry().get()
+
+    def test_recovers_domains_from_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "reponses.csv")
+            write_csv(path, SyntheticGenerator(self.item_bank, seed=0), 8000, chunk_rows=2000)
+            report = validate_source(path, self.item_bank, samples=20, workers=1, seed=0)
+
+        self.assertEqual(report['respondents'], 8000)
+        self.assertEqual(report['parallel_analysis']['factors'], len(DIMENSION_CODES))
+        for dim, value in report['congruence'].items():
+            self.assertGreater(value, 0.95, dim)
+        self.assertEqual(report['misfits'], [])
+        for item in report['items']:
+            # Items inversés recodés : saturation attendue positive, dans son intervalle bootstrap
+            self.assertGreater(item['intended'], 0.3)
+            low, high = item['interval']
+            self.assertLessEqual(low, item['intended'])
+            self.assertLessEqual(item['intended'], high)
+
+    def test_partial_passes_merge(self):
+        rng = np.random.default_rng(1)
+        responses = rng.integers(1, 6, (3000, 12))
+        responses[:100, 0] = 0  # réponses incomplètes écartées
+
+        merged = CovarianceAccumulator(12, blocks=10, seed=0)
+        for part in np.array_split(responses, 3):
+            partial = CovarianceAccumulator(12, blocks=10, seed=1)
+            partial.add(part)
+            merged.merge(partial)
+        self.assertEqual((merged.n, merged.excluded), (2900, 100))
+        np.testing.assert_allclose(merged.covariance(), np.cov(responses[100:].T), atol=1e-9)
+        np.testing.assert_allclose(accumulate(np.array_split(responses, 7), 12, blocks=10).covariance(),
+                                   merged.covariance(), atol=1e-9)
+
+    def test_degenerate_samples(self):
+        responses, _, _ = SyntheticGenerator(self.item_bank, seed=2).generate(2000)
+        constant = responses.copy()
+        constant[:, 4] = 3
+        with self.assertRaisesRegex(FactorStructureError, self.item_bank.item_ids[4]):
+            structure_report(self.item_bank, accumulate([constant], len(self.item_bank)), samples=0)
+        with self.assertRaises(FactorStructureError):
+            structure_report(self.item_bank, accumulate([responses[:40]], len(self.item_bank)), samples=0)
+
+if __name__ == "__main__":
+    unittest.main()
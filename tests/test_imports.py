@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Coût d'import : `import neo_core` ne charge ni NumPy ni cryptography, les noms exportés restent accessibles ;
+aucun module du cœur métier ne dépend de Streamlit ni des bibliothèques graphiques
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import neo_core
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def loaded_modules(statement, modules):
+    """Modules parmi `modules` chargés après `statement`, dans un processus neuf"""
+    code = f"import json, sys\n{statement}\nprint(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+class LazyPackageTests(unittest.TestCase):
+
+    def test_import_loads_nothing_heavy(self):
+        self.assertEqual(loaded_modules("import neo_core", ['numpy', 'cryptography', 'neo_core.scoring']), [])
+        self.assertEqual(loaded_modules("from neo_core import get_level", ['numpy', 'cryptography']), [])
+        self.assertEqual(loaded_modules("from neo_core import NEOPIRManager", ['numpy', 'cryptography']),
+                         ['numpy'])
+
+    def test_exports_resolve(self):
+        for name in neo_core.__all__:
+            self.assertIsNotNone(getattr(neo_core, name))
+        self.assertIn('SecurityManager', dir(neo_core))
+        with self.assertRaises(AttributeError):
+            neo_core.undefined_name
+        from neo_core import templates
+        self.assertEqual(templates.__name__, 'neo_core.templates')
+
+class DecouplingTests(unittest.TestCase):
+
+    def test_core_without_ui(self):
+        statement = ("import importlib, pkgutil, neo_core\n"
+                     "for module in pkgutil.iter_modules(neo_core.__path__):\n"
+                     "    importlib.import_module(f'neo_core.{module.name}')\n"
+                     "neo_core.NEOPIRManager().calculate_scores({})")
+        self.assertEqual(loaded_modules(statement, ['streamlit', 'plotly', 'matplotlib']), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Registre des banques d'items : chargement unique, index par identifiant, langues alignées, clé de cotation
+matricielle égale au calcul item par item, validation des banques
+"""
+
+import copy
+import json
+import os
+import unittest
+
+import numpy as np
+
+from neo_core.item_banks import (BANKS_DIR, DEFAULT_BANK, DIMENSION_CODES, FACET_CODES, ItemBankError,
+                                 ItemBankRegistry, get_registry)
+
+def bank_data(locale="fr"):
+    with open(os.path.join(BANKS_DIR, f"{DEFAULT_BANK}.{locale}.json"), encoding='utf-8') as f:
+        return json.load(f)
+
+class RegistryTests(unittest.TestCase):
+
+    def test_loaded_once_and_indexed(self):
+        registry = get_registry()
+        self.assertIs(get_registry(), registry)
+        self.assertIn((DEFAULT_BANK, 'fr'), registry.available())
+        item_bank = registry.get()
+        self.assertIs(registry.get(DEFAULT_BANK, 'fr'), item_bank)
+        for position, item_id in enumerate(item_bank.item_ids):
+            self.assertIs(registry.item(DEFAULT_BANK, 'fr', item_id), item_bank.questions[position])
+        with self.assertRaises(KeyError):
+            registry.get(DEFAULT_BANK, 'xx')
+        # Questions et clé de cotation en lecture seule : partagées par toutes les sessions
+        with self.assertRaises(TypeError):
+            item_bank.questions[0]['reverse'] = True
+        with self.assertRaises(ValueError):
+            item_bank.reverse[0] = True
+
+    def test_locales_share_scoring_key(self):
+        registry = get_registry()
+        if (DEFAULT_BANK, 'en') not in registry.available():
+            self.skipTest("banque anglaise absente")
+        fr, en = registry.get(DEFAULT_BANK, 'fr'), registry.get(DEFAULT_BANK, 'en')
+        self.assertEqual(fr.item_ids, en.item_ids)
+        np.testing.assert_array_equal(fr.facet_index, en.facet_index)
+        np.testing.assert_array_equal(fr.reverse, en.reverse)
+
+    def test_raw_scores_match_item_loop(self):
+        item_bank = get_registry().get()
+        rng = np.random.default_rng(0)
+        responses = rng.integers(0, 6, (20, len(item_bank)))
+        dimension_sums, facet_sums = item_bank.raw_scores(responses)
+        for row in range(len(responses)):
+            expected_dimensions = np.zeros(len(DIMENSION_CODES))
+            expected_facets = np.zeros(len(FACET_CODES))
+            for question, response in zip(item_bank.questions, responses[row]):
+                if response == 0:
+                    continue
+                keyed = 6 - response if question['reverse'] else response
+                expected_dimensions[DIMENSION_CODES.index(question['dimension'])] += keyed
+                expected_facets[FACET_CODES.index((question['dimension'], question['facet']))] += keyed
+            np.testing.assert_array_equal(dimension_sums[row], expected_dimensions)
+            np.testing.assert_array_equal(facet_sums[row], expected_facets)
+
+        vector = item_bank.response_vector({item_bank.item_ids[0]: 4, 'inconnu': 5})
+        self.assertEqual(vector[0], 4)
+        self.assertEqual(int(vector.sum()), 4)
+
+class ValidationTests(unittest.TestCase):
+
+    def assert_invalid(self, change):
+        data = copy.deepcopy(bank_data())
+        change(data)
+        with self.assertRaises(ItemBankError):
+            ItemBankRegistry().register(data, "test.json")
+
+    def test_invalid_banks(self):
+        self.assert_invalid(lambda data: data.pop('title'))
+        self.assert_invalid(lambda data: data['items'][1].update(id=data['items'][0]['id']))
+        self.assert_invalid(lambda data: data['items'][0].update(dimension='X'))
+        self.assert_invalid(lambda data: data['items'][0].update(reverse="non"))
+        self.assert_invalid(lambda data: data.update(items=[item for item in data['items']
+                                                            if item['facet'] != data['items'][0]['facet']]))
+
+    def test_register_custom_bank(self):
+        data = bank_data()
+        data['bank'] = "variante"
+        registry = ItemBankRegistry()
+        registry.register(data, "variante.json")
+        self.assertEqual(registry.available(), [("variante", 'fr')])
+        self.assertEqual(len(registry.get("variante", 'fr')), len(data['items']))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Harnais de charge de l'application : deux utilisateurs simulés entrelacés (un clic et bouton radio, avec retours
+en arrière) terminent le test sans erreur, une latence mesurée par réexécution
+"""
+
+import importlib.util
+import os
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_harness():
+    spec = importlib.util.spec_from_file_location("loadtest_app", os.path.join(ROOT, "benchmarks", "loadtest_app.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@unittest.skipIf(importlib.util.find_spec('streamlit') is None, "Streamlit non installé")
+class LoadHarnessTests(unittest.TestCase):
+
+    def test_interleaved_users_complete(self):
+        harness = load_harness()
+        users = [harness.SimulatedUser(1, back_probability=0.2),
+                 harness.SimulatedUser(2, back_probability=0.2, quick_answer=False)]
+        latencies, completed, errors = harness.run_users(users)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(completed, 2)
+        for user in users:
+            self.assertTrue(user.app.session_state.test_completed)
+            self.assertEqual(len(user.app.session_state.responses), 60)
+        # Au moins une réexécution par item et par utilisateur
+        self.assertGreaterEqual(len(latencies), 2 * 60)
+        self.assertTrue(all(latency > 0 for latency in latencies))
+
+if __name__ == "__main__":
+    unittest.main()
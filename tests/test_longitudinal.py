@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Suivi longitudinal : deux passations de sessions différentes sous le même code répondant forment un historique
+et donnent un indice de changement fiable (RCI)
+"""
+
+import unittest
+import uuid
+
+import numpy as np
+
+from neo_core import NEOPIRManager
+from neo_core.longitudinal import (RespondentCodeError, classify, history_changes, history_record,
+                                   population_changes, respondent_key, user_key)
+from neo_core.norms import SCALE_KEYS, get_norms
+from neo_core.result_cache import build_result_bundle
+from neo_core.session_store import MemoryBackend
+
+class RespondentHistoryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = NEOPIRManager()
+        self.backend = MemoryBackend()
+
+    def complete(self, session_id, code, answer, when):
+        """Passation terminée dans une session : même enregistrement que record_results"""
+        # Même tendance sur tous les items : réponse inversée pour les items inversés
+        responses = {question['id']: 6 - answer if question['reverse'] else answer
+                     for question in self.manager.questions}
+        result = {'item_bank': [self.manager.item_bank.bank, self.manager.item_bank.locale],
+                  **build_result_bundle(self.manager, responses)}
+        key = respondent_key(code) if code else user_key(session_id)
+        self.backend.save_history(key, when, history_record(result))
+        return key
+
+    def test_two_sessions_same_respondent(self):
+        first = self.complete(str(uuid.uuid4()), "Equipe Ventes 07", 2, 1.7e9)
+        second = self.complete(str(uuid.uuid4()), "equipeventes07", 4, 1.7e9 + 90 * 24 * 3600)
+        self.assertEqual(first, second)
+
+        history = self.backend.load_history(first)
+        self.assertEqual(len(history), 2)
+        raw, rci = history_changes(history, get_norms(self.manager.item_bank))
+        self.assertEqual(rci.shape, (1, len(SCALE_KEYS)))
+        self.assertTrue(np.isfinite(rci).all())
+        # De « désaccord » à « accord » sur tous les items : hausse fiable de chaque domaine
+        self.assertTrue((raw[1] > raw[0]).all())
+        self.assertTrue((classify(rci[0, :5]) == 1).all())
+
+    def test_sessions_without_code_are_not_linked(self):
+        first = self.complete(str(uuid.uuid4()), None, 2, 1.7e9)
+        second = self.complete(str(uuid.uuid4()), None, 4, 1.7e9 + 1)
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(self.backend.load_history(first)), 1)
+
+    def test_short_code_rejected(self):
+        with self.assertRaises(RespondentCodeError):
+            respondent_key("ab 12")
+
+    def test_population_changes_pairs_by_respondent(self):
+        respondents = np.array([b'a', b'b', b'a', b'b', b'c'])
+        completed_at = np.array([1, 1, 2, 3, 1])
+        raw = np.arange(5 * len(SCALE_KEYS), dtype=np.int16).reshape(5, -1)
+        before, after, rci = population_changes(respondents, completed_at, raw,
+                                                get_norms(self.manager.item_bank))
+        self.assertEqual(sorted(zip(before.tolist(), after.tolist())), [(0, 2), (1, 3)])
+        self.assertEqual(rci.shape, (2, len(SCALE_KEYS)))
+
+if __name__ == "__main__":
+    unittest.main()
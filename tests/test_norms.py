@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Normes : percentiles et intervalles de confiance des 35 échelles (tabulés et directs, unitaires et par lot),
+étalonnage et normes théoriques marquées provisoires
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from neo_core import NEOPIRManager
+from neo_core.item_banks import get_registry
+from neo_core.norms import SCALE_KEYS, NormTable, NormTableError, get_norms, normal_cdf
+
+class NormTableTests(unittest.TestCase):
+
+    def setUp(self):
+        self.item_bank = get_registry().get()
+        self.norms = NormTable.from_assumptions(self.item_bank)
+
+    def test_percentile_at_mean_and_monotone(self):
+        mean = np.rint(self.norms.mean).astype(int)
+        percentiles, low, high = self.norms.score(mean[None, :5], mean[None, 5:])
+        np.testing.assert_allclose(percentiles[0], 50, atol=1e-6)
+        # Intervalle symétrique autour de la moyenne, plus large pour les facettes (fidélité plus faible)
+        width = high[0] - low[0]
+        self.assertTrue((width[5:] > width[:5].max()).all())
+        raw = np.arange(12, 61)[:, None].repeat(5, axis=1)
+        self.assertTrue((np.diff(self.norms.score(raw)[0], axis=0) > 0).all())
+
+    def test_interval_contains_percentile(self):
+        rng = np.random.default_rng(0)
+        dimension_sums, facet_sums = self.item_bank.raw_scores(rng.integers(1, 6, (500, len(self.item_bank))))
+        percentiles, low, high = self.norms.score(dimension_sums, facet_sums)
+        self.assertEqual(percentiles.shape, (500, len(SCALE_KEYS)))
+        self.assertTrue(((low <= percentiles) & (percentiles <= high)).all())
+        self.assertTrue(((low >= 0) & (high <= 100)).all())
+        # Table des scores entiers identique à la conversion directe
+        direct = self.norms.score(dimension_sums + 1e-9, facet_sums + 1e-9)
+        np.testing.assert_allclose(percentiles, direct[0], atol=1e-4)
+        np.testing.assert_allclose(high, direct[2], atol=1e-4)
+
+    def test_normal_cdf(self):
+        np.testing.assert_allclose(normal_cdf([-1.96, 0, 1.0]), [0.025, 0.5, 0.8413], atol=1e-4)
+
+    def test_fit_drops_incomplete_rows(self):
+        rng = np.random.default_rng(1)
+        responses = rng.integers(1, 6, (300, len(self.item_bank)))
+        responses[:50, :10] = 0
+        fitted = NormTable.fit(self.item_bank, responses)
+        dimension_sums, facet_sums = self.item_bank.raw_scores(responses[50:])
+        np.testing.assert_allclose(fitted.mean, np.hstack([dimension_sums, facet_sums]).mean(axis=0))
+        self.assertFalse(fitted.provisional)
+        with self.assertRaises(NormTableError):
+            NormTable.fit(self.item_bank, responses[:50])
+
+    def test_provisional_round_trip(self):
+        self.assertTrue(self.norms.provisional)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "normes.json")
+            self.norms.save(path)
+            loaded = NormTable.load(path)
+        self.assertTrue(loaded.provisional)
+        np.testing.assert_allclose(loaded.sd, self.norms.sd, atol=1e-4)
+        # Table livrée avec la banque : théorique, donc signalée comme provisoire
+        self.assertTrue(get_norms(self.item_bank).provisional)
+
+class ScoringDetailsTests(unittest.TestCase):
+
+    def test_single_matches_batch(self):
+        manager = NEOPIRManager()
+        rng = np.random.default_rng(2)
+        vectors = rng.integers(1, 6, (3, len(manager.item_bank)))
+        dimension_sums, facet_sums = manager.item_bank.raw_scores(vectors)
+        rows = manager.details_to_dicts(*manager.calculate_details_batch(dimension_sums, facet_sums))
+        for vector, row in zip(vectors, rows):
+            responses = dict(zip(manager.item_bank.item_ids, vector.tolist()))
+            details = manager.calculate_details(responses)
+            self.assertEqual(details, row)
+            self.assertEqual(sum(len(facets) for facets in details['facet_percentiles'].values()), 30)
+            low, high = details['confidence']['N']
+            self.assertLessEqual(low, manager.calculate_scores(responses)[2]['N'] + 0.5)
+            self.assertGreaterEqual(high, manager.calculate_scores(responses)[2]['N'] - 0.5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Pages pré-rendues : les fichiers livrés correspondent au contenu actuel des pages (à régénérer avec
+`python -m app_pages.prerender` sinon), compression reproductible, lien de démarrage vers l'application
+"""
+
+import gzip
+import importlib.util
+import os
+import tempfile
+import unittest
+
+@unittest.skipIf(importlib.util.find_spec('streamlit') is None, "Streamlit non installé")
+class PrerenderTests(unittest.TestCase):
+
+    def test_shipped_pages_up_to_date(self):
+        from app_pages.prerender import PRERENDERED_DIR, build
+
+        with tempfile.TemporaryDirectory() as directory:
+            written = build(directory)
+            again = build(directory)
+            self.assertEqual([entry[3] for entry in written], [entry[3] for entry in again])
+            for path, size, _, _ in written:
+                name = os.path.basename(path)
+                with self.subTest(page=name):
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                    with open(path + ".gz", 'rb') as f:
+                        compressed = f.read()
+                    self.assertEqual(len(data), size)
+                    self.assertEqual(gzip.decompress(compressed), data)
+                    self.assertTrue(data.startswith(b"<!DOCTYPE html>"))
+                    with open(os.path.join(PRERENDERED_DIR, name), 'rb') as f:
+                        self.assertEqual(f.read(), data, "page pré-rendue périmée : python -m app_pages.prerender")
+                    with open(os.path.join(PRERENDERED_DIR, name + ".gz"), 'rb') as f:
+                        self.assertEqual(f.read(), compressed)
+
+    def test_start_link(self):
+        from app_pages.prerender import render_page
+
+        page = render_page("🏠 Accueil", app_url="https://neo.example/")
+        self.assertIn('<base href="https://neo.example/">', page)
+        self.assertIn('?page=test', page)
+        self.assertNotIn("\n", page)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Profilage à la demande : piles repliées de l'échantillonneur (sans les frames de l'appelant), statistiques
+cProfile, instantané mémoire, profil écrit même quand la page est interrompue par st.rerun()
+"""
+
+import importlib.util
+import os
+import pstats
+import tempfile
+import time
+import tracemalloc
+import unittest
+from unittest import mock
+
+def busy_page(duration=0.1):
+    """Page factice : calcul pur pendant `duration` secondes"""
+    end = time.perf_counter() + duration
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(200))
+    return total
+
+class RerunRequested(Exception):
+    """Interruption de la page, comme st.rerun()"""
+
+def interrupted_page():
+    busy_page(0.05)
+    raise RerunRequested()
+
+@unittest.skipIf(importlib.util.find_spec('streamlit') is None, "Streamlit non installé")
+class ProfilingTests(unittest.TestCase):
+
+    def setUp(self):
+        from app_pages import profiling
+
+        self.profiling = profiling
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        patcher = mock.patch.multiple(profiling, PROFILE_DIR=self.directory, MODE='sample', MEMORY=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def collapsed(self, page):
+        path = os.path.join(self.directory, f"{page.__name__}.{os.getpid()}.collapsed")
+        with open(path, encoding='utf-8') as f:
+            return [line.rsplit(" ", 1) for line in f.read().splitlines()]
+
+    def test_sampler_writes_collapsed_stacks(self):
+        for _ in range(5):
+            self.profiling.run_profiled(busy_page)
+        stacks = self.collapsed(busy_page)
+        self.assertGreater(sum(int(samples) for _, samples in stacks), 5)
+        for stack, _ in stacks:
+            # Les piles commencent à la page : ni run_profiled, ni le lanceur de tests, ni l'arrêt du relevé
+            self.assertTrue(stack.startswith("busy_page (test_profiling.py:"), stack)
+
+    def test_cprofile_and_memory(self):
+        with mock.patch.multiple(self.profiling, MODE='cprofile', MEMORY=True):
+            self.profiling.run_profiled(busy_page)
+        files = sorted(os.listdir(self.directory))
+        prof = next(name for name in files if name.endswith(".prof"))
+        stats = pstats.Stats(os.path.join(self.directory, prof))
+        self.assertTrue(any(function == 'busy_page' for _, _, function in stats.stats))
+        snapshot = next(name for name in files if name.endswith(".tracemalloc"))
+        self.assertIsInstance(tracemalloc.Snapshot.load(os.path.join(self.directory, snapshot)), tracemalloc.Snapshot)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_interrupted_page_still_profiled(self):
+        with self.assertRaises(RerunRequested):
+            self.profiling.run_profiled(interrupted_page)
+        self.assertTrue(self.collapsed(interrupted_page))
+
+    def test_sampling_rate(self):
+        with mock.patch.multiple(self.profiling, ADMIN_TOKEN="", SAMPLE_RATE=0.0):
+            self.assertFalse(self.profiling.should_profile())
+        with mock.patch.multiple(self.profiling, ADMIN_TOKEN="", SAMPLE_RATE=1.0):
+            self.assertTrue(self.profiling.should_profile())
+
+if __name__ == "__main__":
+    unittest.main()
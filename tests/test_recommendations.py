@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Recommandations précalculées : les 3^5 profils de niveaux comparés aux règles if/elif de la version d'origine
+(onglet « Recommandations » de NEO PI-R.py)
+"""
+
+import itertools
+import unittest
+
+from neo_core.interpretation import LEVELS, get_dimension_description
+from neo_core.item_banks import DIMENSION_CODES
+from neo_core.recommendations import (N_PROFILES, RecommendationRulesError, RecommendationEngine,
+                                      get_recommendation_engine, profile_code, profile_levels)
+
+DIMENSION_NAMES = {
+    'N': 'Neuroticisme',
+    'E': 'Extraversion',
+    'O': 'Ouverture',
+    'A': 'Agréabilité',
+    'C': 'Conscienciosité'
+}
+
+CAREER_RECOMMENDATIONS = {
+    'N': {
+        'Élevé': ("Envisagez des environnements de travail structurés et prévisibles. "
+                  "Les métiers d'aide peuvent vous convenir."),
+        'Faible': "Vous pourriez exceller dans des postes à haute responsabilité ou des environnements stressants."
+    },
+    'E': {
+        'Élevé': "Les métiers commerciaux, de management ou de relations publiques pourraient vous épanouir.",
+        'Faible': "Vous pourriez préférer des métiers techniques, de recherche ou de création en autonomie."
+    },
+    'O': {
+        'Élevé': "Les domaines créatifs, artistiques ou de recherche correspondent à votre profil.",
+        'Faible': "Vous pourriez exceller dans des domaines nécessitant rigueur et méthode traditionnelle."
+    },
+    'A': {
+        'Élevé': "Les métiers d'aide, d'enseignement ou de collaboration d'équipe vous conviendront.",
+        'Faible': "Vous pourriez réussir dans des postes de négociation ou de leadership compétitif."
+    },
+    'C': {
+        'Élevé': "Les métiers nécessitant organisation et persévérance correspondent à vos forces.",
+        'Faible': "Privilégiez des environnements flexibles permettant la créativité et l'adaptation."
+    }
+}
+
+def baseline_recommendations(interpretations):
+    """Règles d'origine, recopiées telles quelles (ordre des dimensions des interprétations)"""
+    forces, defis = [], []
+    for dim, interp in interpretations.items():
+        dim_name = DIMENSION_NAMES[dim]
+        if interp['level'] == 'Élevé':
+            if dim in ['E', 'O', 'A', 'C']:
+                forces.append(f"{dim_name} : {interp['description']}")
+            else:
+                defis.append(f"{dim_name} : {interp['description']}")
+        elif interp['level'] == 'Faible':
+            if dim == 'N':
+                forces.append(f"{dim_name} faible : {interp['description']}")
+            else:
+                defis.append(f"{dim_name} : {interp['description']}")
+
+    career = []
+    for dim, interp in interpretations.items():
+        if interp['level'] in ['Élevé', 'Faible']:
+            recommendation = CAREER_RECOMMENDATIONS[dim].get(interp['level'], "")
+            if recommendation:
+                career.append(recommendation)
+
+    relationships = []
+    if interpretations['E']['level'] == 'Élevé':
+        relationships.append("Votre nature sociable est un atout. Veillez à laisser de l'espace aux personnes plus "
+                             "introverties.")
+    elif interpretations['E']['level'] == 'Faible':
+        relationships.append("Votre préférence pour l'intimité est précieuse. "
+                             "N'hésitez pas à communiquer vos besoins d'espace.")
+    if interpretations['A']['level'] == 'Élevé':
+        relationships.append("Votre bienveillance naturelle est appréciée. Attention à ne pas vous oublier.")
+    elif interpretations['A']['level'] == 'Faible':
+        relationships.append("Votre franc-parler peut être rafraîchissant. Travaillez sur l'empathie pour renforcer "
+                             "vos relations.")
+    if interpretations['N']['level'] == 'Élevé':
+        relationships.append("Votre sensibilité émotionnelle peut enrichir vos relations. "
+                             "Partagez vos besoins avec vos proches.")
+
+    development = []
+    for dim, interp in interpretations.items():
+        if dim == 'N' and interp['level'] == 'Élevé':
+            development.append("Pratiquez la méditation ou la relaxation pour gérer le stress")
+        elif dim == 'E' and interp['level'] == 'Faible':
+            development.append("Fixez-vous des objectifs sociaux progressifs pour élargir votre réseau")
+        elif dim == 'O' and interp['level'] == 'Faible':
+            development.append("Essayez une nouvelle activité créative ou culturelle chaque mois")
+        elif dim == 'A' and interp['level'] == 'Faible':
+            development.append("Pratiquez l'écoute active et l'empathie dans vos interactions")
+        elif dim == 'C' and interp['level'] == 'Faible':
+            development.append("Utilisez des outils d'organisation pour structurer vos projets")
+
+    return {'forces': forces, 'defis': defis, 'career': career, 'relationships': relationships,
+            'development': development}
+
+class RecommendationEngineTests(unittest.TestCase):
+
+    def test_all_profiles_match_baseline(self):
+        engine = get_recommendation_engine()
+        combinations = list(itertools.product(LEVELS, repeat=len(DIMENSION_CODES)))
+        self.assertEqual(len(combinations), N_PROFILES)
+        for combination in combinations:
+            interpretations = {
+                dim: {'level': level, 'description': get_dimension_description(dim, level)}
+                for dim, level in zip(DIMENSION_CODES, combination)
+            }
+            with self.subTest(levels=combination):
+                profile = engine.lookup(interpretations)
+                self.assertEqual(profile['texts'], baseline_recommendations(interpretations))
+                for section, items in profile['texts'].items():
+                    self.assertEqual(bool(profile['html'][section]), bool(items))
+
+    def test_profile_code_round_trip(self):
+        codes = {profile_code(profile_levels(code)) for code in range(N_PROFILES)}
+        self.assertEqual(codes, set(range(N_PROFILES)))
+        self.assertEqual(profile_code({dim: LEVELS[0] for dim in DIMENSION_CODES}), 0)
+
+    def test_invalid_rules(self):
+        rules = {'sections': ['forces'], 'rules': [{'section': 'forces', 'dimension': 'X', 'level': 'Élevé',
+                                                    'text': ""}]}
+        with self.assertRaises(RecommendationRulesError):
+            RecommendationEngine(rules)
+
+if __name__ == "__main__":
+    unittest.main()
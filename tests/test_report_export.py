@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Export des rapports : charge utile identique à l'écran (percentiles des facettes et intervalles), rendu
+PDF/PNG, avertissement des normes provisoires ; pool de rendu hors du thread de requête et cache par empreinte
+"""
+
+import unittest
+
+from neo_core import NEOPIRManager
+from neo_core.norms import PROVISIONAL_NOTE
+from neo_core.result_cache import build_result_bundle
+from report_export import ReportExporter, build_report_payload, render_report, report_fingerprint
+
+def payload_for(answer, facets=True):
+    manager = NEOPIRManager()
+    # Même tendance sur tous les items : réponse inversée pour les items inversés
+    responses = {question['id']: 6 - answer if question['reverse'] else answer for question in manager.questions}
+    bundle = build_result_bundle(manager, responses)
+    return build_report_payload(
+        manager.dimensions, bundle['scores'], bundle['percentiles'], bundle['interpretations'],
+        bundle['facet_percentiles'] if facets else None, bundle['facet_confidence'] if facets else None,
+        PROVISIONAL_NOTE
+    ), bundle
+
+class ReportPayloadTests(unittest.TestCase):
+
+    def test_facets_match_screen(self):
+        payload, bundle = payload_for(4)
+        for dim, facets in bundle['facet_percentiles'].items():
+            for facet, value in facets.items():
+                self.assertEqual(payload['facet_percentiles'][dim][facet], value)
+                self.assertEqual(payload['facet_confidence'][dim][facet], list(bundle['facet_confidence'][dim][facet]))
+                self.assertTrue(0 <= value <= 100)
+        self.assertEqual(payload['norms_note'], PROVISIONAL_NOTE)
+
+    def test_render_formats(self):
+        payload, _ = payload_for(2)
+        self.assertTrue(render_report(payload, 'pdf').startswith(b'%PDF'))
+        self.assertTrue(render_report(payload, 'png').startswith(b'\x89PNG'))
+        # Passation adaptative : rapport sans facettes
+        payload, _ = payload_for(2, facets=False)
+        self.assertIsNone(payload['facet_percentiles'])
+        self.assertTrue(render_report(payload, 'pdf').startswith(b'%PDF'))
+        with self.assertRaises(ValueError):
+            render_report(payload, 'svg')
+
+class ReportExporterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = ReportExporter(max_workers=1, max_entries=2)
+        self.addCleanup(self.exporter.shutdown)
+
+    def test_render_in_pool_and_reuse(self):
+        payload, _ = payload_for(3)
+        key, future = self.exporter.submit(payload, 'png')
+        self.assertEqual(key, report_fingerprint(payload, 'png'))
+        self.assertIn(self.exporter.status(key), ('pending', 'ready'))
+        data = future.result(timeout=120)
+        self.assertEqual(self.exporter.status(key), 'ready')
+        self.assertEqual(self.exporter.get(key), data)
+        # Même profil : même clé, rendu non relancé
+        self.assertIs(self.exporter.submit(payload, 'png')[1], future)
+        self.assertNotEqual(self.exporter.submit(payload, 'pdf')[0], key)
+
+    def test_bounded_cache_and_unknown_format(self):
+        keys = [self.exporter.submit(payload_for(answer)[0], 'png')[0] for answer in (1, 2, 3)]
+        self.assertEqual(self.exporter.status(keys[0]), 'missing')
+        self.assertIsNone(self.exporter.get(keys[0]))
+        with self.assertRaises(ValueError):
+            self.exporter.submit(payload_for(1)[0], 'svg')
+
+if __name__ == "__main__":
+    unittest.main()
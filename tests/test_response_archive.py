@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Archive Parquet des réponses : aller-retour tampon -> partitions de date -> lecture filtrée, lignes rendues
+au tampon après un échec d'écriture, compactage sous verrou (partition déjà verrouillée, verrou abandonné)
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import numpy as np
+import pyarrow.dataset as ds
+
+from neo_core import NEOPIRManager, response_archive
+from neo_core.response_archive import (COMPACT_LOCK, ArchiveWriter, compact, partition_dir, percentile_column,
+                                       pseudonym, raw_column, scan)
+
+DAY_1 = datetime(2024, 3, 1, 9, 30, tzinfo=timezone.utc)
+
+class ArchiveTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+        self.manager = NEOPIRManager()
+        self.item_bank = self.manager.item_bank
+        self.rng = np.random.default_rng(0)
+
+    def write(self, writer, count, day=DAY_1):
+        vectors = self.rng.integers(1, 6, (count, len(self.item_bank)))
+        for i, vector in enumerate(vectors):
+            writer.append(self.item_bank, f"répondant-{i}", day + timedelta(minutes=i), vector)
+        return vectors
+
+    def partition(self, day=DAY_1):
+        return partition_dir(self.root, self.item_bank.bank, day.date().isoformat())
+
+    def test_round_trip(self):
+        writer = ArchiveWriter(self.root, flush_rows=5)
+        vectors = self.write(writer, 12)
+        # Deux tampons pleins déjà écrits, le reste au vidage suivant
+        self.assertEqual(len(os.listdir(self.partition())), 2)
+        self.write(writer, 4, DAY_1 + timedelta(days=1))
+        writer.close()
+        self.assertTrue(os.listdir(self.partition(DAY_1 + timedelta(days=1))))
+
+        table = scan(self.root, self.item_bank.bank, start=DAY_1.date().isoformat(),
+                     end=DAY_1.date().isoformat()).sort_by('completed_at')
+        self.assertEqual(table.num_rows, 12)
+        self.assertEqual(table['respondent'][0].as_py(), pseudonym("répondant-0"))
+        self.assertFalse(any(table['adaptive'].to_pylist()))
+        for row in (0, 11):
+            responses = dict(zip(self.item_bank.item_ids, vectors[row].tolist()))
+            self.assertEqual([table[item_id][row].as_py() for item_id in self.item_bank.item_ids],
+                             vectors[row].tolist())
+            scores, _, percentiles = self.manager.calculate_scores(responses)
+            self.assertEqual(table[raw_column('N')][row].as_py(), scores['N'])
+            self.assertAlmostEqual(table[percentile_column('N')][row].as_py(), percentiles['N'], delta=1)
+
+        # Lecture d'un domaine : ses items et sa somme brute seulement
+        neuroticism = scan(self.root, self.item_bank.bank, dimension='N', where=ds.field(raw_column('N')) > 0)
+        self.assertEqual(neuroticism.num_rows, 16)
+        self.assertEqual(neuroticism.num_columns, 13)
+
+    def test_failed_write_keeps_rows(self):
+        writer = ArchiveWriter(self.root, flush_rows=100)
+        self.write(writer, 4)
+        with mock.patch.object(response_archive, 'write_table', side_effect=OSError("disque plein")):
+            with self.assertRaises(OSError):
+                writer.flush()
+        self.assertEqual(writer.flush(), 4)
+        self.assertEqual(scan(self.root, self.item_bank.bank).num_rows, 4)
+
+    def test_compaction_and_lock(self):
+        writer = ArchiveWriter(self.root, flush_rows=2)
+        self.write(writer, 10)
+        writer.close()
+        self.assertEqual(len(os.listdir(self.partition())), 5)
+
+        # Partition verrouillée par un autre processus : sautée
+        lock = os.path.join(self.partition(), COMPACT_LOCK)
+        with open(lock, 'w') as f:
+            f.write("autre-processus")
+        self.assertEqual(compact(self.root), 0)
+        self.assertEqual(len([n for n in os.listdir(self.partition()) if n.endswith('.parquet')]), 5)
+
+        # Verrou abandonné (processus arrêté en plein compactage) : repris
+        stale = time.time() - response_archive.COMPACT_LOCK_TIMEOUT - 60
+        os.utime(lock, (stale, stale))
+        self.assertEqual(compact(self.root), 5)
+        self.assertEqual(len(os.listdir(self.partition())), 1)
+        table = scan(self.root, self.item_bank.bank)
+        self.assertEqual(table.num_rows, 10)
+        completed = table['completed_at'].to_pylist()
+        self.assertEqual(completed, sorted(completed))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Mémoïsation des résultats : empreinte des réponses (ordre et réponses manquantes), LRU en mémoire, niveau disque
+partagé entre processus, entrée illisible traitée comme absente
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from neo_core import NEOPIRManager
+from neo_core.result_cache import (ResultCache, build_result_bundle, pack_responses, response_fingerprint,
+                                   vector_fingerprint)
+
+class FingerprintTests(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = NEOPIRManager()
+        self.item_bank = self.manager.item_bank
+
+    def test_same_answers_same_fingerprint(self):
+        responses = {item_id: 1 + i % 5 for i, item_id in enumerate(self.item_bank.item_ids)}
+        reordered = dict(reversed(list(responses.items())))
+        fingerprint = response_fingerprint(self.item_bank, responses)
+        self.assertEqual(response_fingerprint(self.item_bank, reordered), fingerprint)
+        self.assertEqual(vector_fingerprint(self.item_bank, self.item_bank.response_vector(responses)), fingerprint)
+
+        last = self.item_bank.item_ids[-1]
+        changed = dict(responses, **{last: 6 - responses[last] if responses[last] != 3 else 4})
+        self.assertNotEqual(response_fingerprint(self.item_bank, changed), fingerprint)
+        # Une réponse manquante (0) n'est pas confondue avec une autre valeur
+        missing = dict(responses)
+        del missing[self.item_bank.item_ids[0]]
+        self.assertNotEqual(response_fingerprint(self.item_bank, missing), fingerprint)
+
+    def test_pack_responses(self):
+        self.assertEqual(pack_responses([1, 5, 3]), bytes([0x15, 0x30]))
+        rng = np.random.default_rng(0)
+        vectors = rng.integers(0, 6, (200, len(self.item_bank)))
+        self.assertEqual(len({pack_responses(v) for v in vectors}), len({v.tobytes() for v in vectors}))
+
+class ResultCacheTests(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        cache.put('a', {'n': 1})
+        cache.put('b', {'n': 2})
+        cache.get('a')  # 'a' devient la plus récente : 'b' sort la première
+        cache.put('c', {'n': 3})
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), {'n': 1})
+        stats = cache.stats()
+        self.assertEqual((stats['memory_hits'], stats['misses'], stats['entries']), (2, 1, 2))
+
+    def test_get_or_compute_runs_once(self):
+        manager = NEOPIRManager()
+        responses = {item_id: 3 for item_id in manager.item_bank.item_ids}
+        fingerprint = response_fingerprint(manager.item_bank, responses)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return build_result_bundle(manager, responses)
+
+        cache = ResultCache()
+        first = cache.get_or_compute(fingerprint, compute)
+        self.assertIs(cache.get_or_compute(fingerprint, compute), first)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first['scores'], manager.calculate_scores(responses)[0])
+
+    def test_disk_tier_shared(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ResultCache(directory=directory).put('ab12', {'scores': {'N': 30}})
+            # Autre processus : mémoire vide, entrée retrouvée sur disque puis servie depuis la mémoire
+            other = ResultCache(directory=directory)
+            self.assertEqual(other.get('ab12'), {'scores': {'N': 30}})
+            self.assertEqual(other.get('ab12'), {'scores': {'N': 30}})
+            stats = other.stats()
+            self.assertEqual((stats['disk_hits'], stats['memory_hits']), (1, 1))
+            self.assertEqual([name for name in os.listdir(os.path.join(directory, 'ab')) if name.endswith('.tmp')], [])
+
+            # Fichier tronqué : entrée absente, le résultat sera recalculé
+            with open(os.path.join(directory, 'ab', 'ab12.json'), 'w', encoding='utf-8') as f:
+                f.write('{"scores": ')
+            with self.assertLogs('neo_core.result_cache', 'WARNING'):
+                self.assertIsNone(ResultCache(directory=directory).get('ab12'))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Service HTTP de cotation : réponses 200 (unitaire et par lot, identiques au cœur métier), 400 pour une requête
+invalide, 500 avec corps JSON quand la cotation échoue côté serveur
+"""
+
+import http.client
+import json
+import threading
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+from neo_core import NEOPIRManager
+from scoring_service import create_server
+
+class ScoringServiceTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = create_server(port=0, workers=1, cache_entries=64)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.manager = NEOPIRManager()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.server.batcher.shutdown()
+
+    def post(self, payload):
+        connection = http.client.HTTPConnection(*self.server.server_address, timeout=30)
+        try:
+            connection.request("POST", "/score", json.dumps(payload), {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    def metrics(self):
+        connection = http.client.HTTPConnection(*self.server.server_address, timeout=30)
+        try:
+            connection.request("GET", "/metrics")
+            return json.loads(connection.getresponse().read())
+        finally:
+            connection.close()
+
+    def test_scores_match_core(self):
+        responses = {item_id: 1 + i % 5 for i, item_id in enumerate(self.manager.item_bank.item_ids)}
+        status, body = self.post({'responses': responses})
+        self.assertEqual(status, 200)
+        scores, _, percentiles = self.manager.calculate_scores(responses)
+        self.assertEqual(body['scores'], scores)
+        self.assertEqual(body['percentiles'], percentiles)
+
+        status, body = self.post({'responses': [list(responses.values()), [3] * len(responses)]})
+        self.assertEqual(status, 200)
+        self.assertEqual(len(body['results']), 2)
+
+    def test_invalid_request(self):
+        errors = self.metrics()['errors']
+        for payload in ({}, {'responses': [7] * len(self.manager.item_bank)}, {'responses': {'X999': 3}},
+                        {'responses': [True] * len(self.manager.item_bank)}, {'bank': 'inconnue', 'responses': []}):
+            with self.subTest(payload=str(payload)[:40]):
+                status, body = self.post(payload)
+                self.assertEqual(status, 400)
+                self.assertIn('error', body)
+        self.assertEqual(self.metrics()['errors'], errors + 5)
+
+    def test_worker_failure(self):
+        def broken_submit(bank, locale, vectors, details=False):
+            futures = [Future() for _ in vectors]
+            for future in futures:
+                future.set_exception(BrokenProcessPool("worker arrêté"))
+            return futures
+
+        errors = self.metrics()['errors']
+        with mock.patch.object(self.server.batcher, 'submit', broken_submit), \
+                self.assertLogs('scoring_service', 'ERROR'):
+            status, body = self.post({'responses': [2] * len(self.manager.item_bank)})
+        self.assertEqual(status, 500)
+        self.assertIn('error', body)
+        self.assertEqual(self.metrics()['errors'], errors + 1)
+
+if __name__ == "__main__":
+    unittest.main()
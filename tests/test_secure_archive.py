@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Archives chiffrées en flux : aller-retour par blocs (mémoire et fichier, avec ou sans pool), vérification
+d'intégrité, archives tronquées ou déchiffrées avec une mauvaise clé
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+from cryptography.fernet import Fernet
+
+from neo_core.secure_archive import ArchiveError, read_archive, verify_archive, write_archive
+from neo_core.security import SecurityManager
+
+def records(count):
+    return ({'id': i, 'réponses': [1 + (i + j) % 5 for j in range(12)]} for i in range(count))
+
+class SecureArchiveTests(unittest.TestCase):
+
+    def setUp(self):
+        self.key = Fernet.generate_key()
+
+    def test_round_trip_in_memory(self):
+        buffer = io.BytesIO()
+        self.assertEqual(write_archive(records(25), buffer, self.key, chunk_records=10),
+                         {'chunks': 3, 'records': 25})
+        buffer.seek(0)
+        self.assertEqual(list(read_archive(buffer, self.key, workers=1)), list(records(25)))
+        buffer.seek(0)
+        self.assertEqual(verify_archive(buffer, self.key, workers=1),
+                         {'ok': True, 'chunks': 3, 'records': 25, 'error': None})
+
+    def test_round_trip_file_with_pool(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "export.neoarch")
+            with open(path, 'wb') as f:
+                write_archive(records(50), f, self.key, chunk_records=7)
+            with open(path, 'rb') as f:
+                self.assertEqual(list(read_archive(f, self.key, workers=2)), list(records(50)))
+            with open(path, 'rb') as f:
+                self.assertTrue(verify_archive(f, self.key, workers=2)['ok'])
+
+    def test_empty_archive(self):
+        buffer = io.BytesIO()
+        self.assertEqual(write_archive([], buffer, self.key), {'chunks': 1, 'records': 0})
+        buffer.seek(0)
+        self.assertEqual(list(read_archive(buffer, self.key, workers=1)), [])
+
+    def test_truncated_and_wrong_key(self):
+        buffer = io.BytesIO()
+        write_archive(records(30), buffer, self.key, chunk_records=10)
+        data = buffer.getvalue()
+        with self.assertRaises(ArchiveError):
+            list(read_archive(io.BytesIO(data[:len(data) // 2]), self.key, workers=1))
+
+        report = verify_archive(io.BytesIO(data), Fernet.generate_key(), workers=1)
+        self.assertFalse(report['ok'])
+        self.assertEqual(report['records'], 0)
+
+    def test_manager_reads_archive_of_previous_key(self):
+        old_key, new_key = Fernet.generate_key(), Fernet.generate_key()
+        buffer = io.BytesIO()
+        SecurityManager([old_key]).export_archive(records(5), buffer)
+        buffer.seek(0)
+        self.assertEqual(list(SecurityManager([new_key, old_key]).import_archive(buffer, workers=1)),
+                         list(records(5)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Chiffrement en lot : aller-retour (en processus et dans le pool), erreurs par élément sans interrompre le lot,
+rotation MultiFernet vers la clé primaire
+"""
+
+import json
+import unittest
+
+from cryptography.fernet import Fernet
+
+from neo_core.secure_batch import decrypt_batch, encrypt_batch, summarize_batch
+from neo_core.security import SecurityManager
+
+ITEMS = [{'session': i, 'scores': {'N': 30 + i}} for i in range(10)] + ["texte libre"]
+
+class SecureBatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.old_key, self.new_key = Fernet.generate_key(), Fernet.generate_key()
+
+    def test_round_trip(self):
+        keys = [self.new_key]
+        for workers, chunk_size in ((1, 2000), (2, 3)):
+            with self.subTest(workers=workers):
+                encrypted = encrypt_batch(ITEMS, keys, workers, chunk_size)
+                self.assertEqual([r['index'] for r in encrypted], list(range(len(ITEMS))))
+                decrypted = decrypt_batch([r['value'] for r in encrypted], keys, workers, chunk_size)
+                self.assertEqual([r['value'] for r in decrypted[:-1]], [json.dumps(item) for item in ITEMS[:-1]])
+                self.assertEqual(decrypted[-1]['value'], "texte libre")
+
+    def test_errors_reported_per_item(self):
+        manager = SecurityManager([self.new_key])
+        tokens = [r['value'] for r in manager.encrypt_batch(ITEMS[:3], workers=1)]
+        tokens.insert(1, b"jeton-corrompu")
+        summary = summarize_batch(manager.decrypt_batch(tokens, workers=1))
+        self.assertEqual((summary['total'], summary['ok']), (4, 3))
+        self.assertEqual([error['index'] for error in summary['errors']], [1])
+
+    def test_rotation_to_primary_key(self):
+        old_tokens = [r['value'] for r in SecurityManager([self.old_key]).encrypt_batch(ITEMS, workers=1)]
+        # Sans l'ancienne clé, les jetons sont illisibles
+        self.assertEqual(summarize_batch(SecurityManager([self.new_key]).decrypt_batch(old_tokens, workers=1))['ok'], 0)
+
+        rotated = SecurityManager([self.new_key, self.old_key]).rotate_batch(old_tokens, workers=1)
+        self.assertTrue(all(r['ok'] for r in rotated))
+        decrypted = SecurityManager([self.new_key]).decrypt_batch([r['value'] for r in rotated], workers=1)
+        self.assertEqual(summarize_batch(decrypted)['ok'], len(ITEMS))
+        self.assertEqual(Fernet(self.new_key).decrypt(rotated[0]['value']).decode(), json.dumps(ITEMS[0]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Purge des backends d'état : une session expirée disparaît, avec les résultats et l'historique anciens ;
+une session trop ancienne n'est plus reprise (max_age) ; état SQLite partagé entre processus
+Usage : python -m pytest tests (ou python -m unittest discover tests)
+"""
+
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from neo_core import session_store
+from neo_core.session_store import MemoryBackend, SQLiteBackend, create_backend
+
+DAY = 24 * 3600
+
+def write_sessions(url, worker, count):
+    """Processus applicatif : enregistre ses sessions et résultats dans le backend partagé"""
+    backend = create_backend(url)
+    for i in range(count):
+        backend.save_session(f"w{worker}-{i}", {'worker': worker, 'current_question': i})
+        backend.save_result(f"w{worker}-{i}", {'scores': {'N': i}})
+        backend.save_history("respondent", worker * 1000.0 + i, {'worker': worker})
+    return count
+
+class PurgeTests:
+    """Tests communs aux backends (create_backend est fourni par chaque sous-classe)"""
+
+    def save_at(self, backend, when, session_id):
+        """Enregistre session, résultat et historique comme s'ils dataient de `when`"""
+        with mock.patch.object(session_store.time, 'time', return_value=when):
+            backend.save_session(session_id, {'step': 1})
+            backend.save_result(session_id, {'scores': {}})
+        backend.save_history(f"key-{session_id}", when, {'scores': {}})
+
+    def test_expired_session_goes_away(self):
+        backend = self.create_backend()
+        now = time.time()
+        self.save_at(backend, now - 2 * DAY, 'old')
+        self.save_at(backend, now, 'new')
+
+        removed = backend.purge(ttl=DAY, result_ttl=DAY, history_ttl=DAY)
+
+        self.assertEqual(removed, {'sessions': 1, 'results': 1, 'history': 1})
+        self.assertIsNone(backend.load_session('old'))
+        self.assertIsNone(backend.load_result('old'))
+        self.assertEqual(backend.load_history('key-old'), [])
+        self.assertEqual(backend.load_session('new'), {'step': 1})
+        self.assertIsNotNone(backend.load_result('new'))
+        self.assertEqual(len(backend.load_history('key-new')), 1)
+
+    def test_restore_window(self):
+        backend = self.create_backend()
+        self.save_at(backend, time.time() - 3 * 3600, 'idle')
+        self.assertIsNone(backend.load_session('idle', max_age=2 * 3600))
+        self.assertEqual(backend.load_session('idle'), {'step': 1})
+
+    def test_purge_thread(self):
+        backend = self.create_backend()
+        self.save_at(backend, time.time() - 2 * DAY, 'old')
+        backend.start_purge(interval=0.01, ttl=DAY)
+        try:
+            deadline = time.monotonic() + 5
+            while backend.load_session('old') is not None and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            backend.stop_purge()
+        self.assertIsNone(backend.load_session('old'))
+
+class MemoryBackendTests(PurgeTests, unittest.TestCase):
+
+    def create_backend(self):
+        return MemoryBackend()
+
+class SQLiteBackendTests(PurgeTests, unittest.TestCase):
+
+    def create_backend(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return SQLiteBackend(os.path.join(directory.name, "state.db"))
+
+class SharedStateTests(unittest.TestCase):
+
+    def test_sessions_visible_across_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            url = f"sqlite:///{os.path.join(directory, 'state.db')}"
+            create_backend(url)  # schéma créé avant les écritures concurrentes
+            with multiprocessing.get_context('spawn').Pool(3) as pool:
+                self.assertEqual(pool.starmap(write_sessions, [(url, worker, 20) for worker in range(3)]), [20] * 3)
+
+            # Une requête servie par un autre processus retrouve la session et le résultat
+            backend = create_backend(url)
+            self.assertEqual(backend.load_session('w2-7'), {'current_question': 7, 'worker': 2})
+            self.assertEqual(backend.load_result('w1-19'), {'scores': {'N': 19}})
+            self.assertEqual(len(list(backend.iter_results())), 60)
+            history = backend.load_history("respondent", start=1000.0, end=1999.0)
+            self.assertEqual([when for when, _ in history], [1000.0 + i for i in range(20)])
+
+    def test_backend_url(self):
+        self.assertIsInstance(create_backend('memory'), MemoryBackend)
+        with self.assertRaises(ValueError):
+            create_backend('redis://localhost')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Index k-NN des profils : ajout, remplacement, retrait et reconstruction ; synchronisation avec le backend
+(résultat illisible, résultat validé en retard, résultat purgé)
+"""
+
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from neo_core import session_store
+from neo_core.item_banks import DIMENSION_CODES, FACET_CODES
+from neo_core.session_store import MemoryBackend
+from neo_core.similarity import SYNC_OVERLAP, ProfileIndex
+
+def result(level):
+    """Résultat enregistré dont tous les percentiles valent `level`"""
+    return {
+        'item_bank': ['neo_pir_short', 'fr'],
+        'percentiles': {dim: float(level) for dim in DIMENSION_CODES},
+        'facet_percentiles': {dim: {facet: float(level) for d, facet in FACET_CODES if d == dim}
+                              for dim in DIMENSION_CODES}
+    }
+
+class ProfileIndexTests(unittest.TestCase):
+
+    def test_nearest_and_exclude(self):
+        index = ProfileIndex('domains', min_rebuild=2)
+        index.add(['a', 'b', 'c'], np.array([[10] * 5, [50] * 5, [90] * 5]))
+        self.assertEqual([sid for sid, _ in index.query([45] * 5, k=2)[0]], ['b', 'a'])
+        self.assertEqual(index.query([50] * 5, k=1, exclude='b')[0][0][0], 'a')
+        distance = index.query([50] * 5, k=1)[0][0][1]
+        self.assertAlmostEqual(distance, 0.0)
+
+    def test_replace_remove_rebuild(self):
+        index = ProfileIndex('facets', min_rebuild=1000)
+        index.add(['a', 'b'], np.array([[10] * 30, [90] * 30]))
+        index.rebuild()
+        index.add(['a'], np.array([[90] * 30]))  # test repassé : l'ancien profil est périmé
+        index.remove(['b'])
+        self.assertEqual(len(index), 1)
+        neighbours = index.query([10] * 30, k=5)[0]
+        self.assertEqual([sid for sid, _ in neighbours], ['a'])
+        self.assertAlmostEqual(neighbours[0][1], 80 * np.sqrt(30), places=3)
+        index.rebuild()
+        self.assertEqual(len(index._segment), 1)
+        self.assertEqual(index._stale, 0)
+
+    def test_buffer_triggers_rebuild(self):
+        index = ProfileIndex('domains', min_rebuild=4)
+        index.add([str(i) for i in range(5)], np.full((5, 5), 50))
+        self.assertEqual(len(index._segment), 5)
+        self.assertEqual(index._buffer_ids, [])
+
+class SyncTests(unittest.TestCase):
+
+    def save_at(self, backend, when, session_id, value):
+        with mock.patch.object(session_store.time, 'time', return_value=when):
+            backend.save_result(session_id, value)
+
+    def test_malformed_result_is_skipped(self):
+        backend = MemoryBackend()
+        now = time.time()
+        self.save_at(backend, now - 2, 'good', result(40))
+        self.save_at(backend, now - 1, 'broken', {'percentiles': {}})
+        index = ProfileIndex('domains')
+        with self.assertLogs('neo_core.similarity', 'ERROR'):
+            self.assertEqual(index.sync(backend), 1)
+        self.save_at(backend, now, 'later', result(60))
+        self.assertEqual(index.sync(backend), 1)
+        self.assertEqual(len(index), 2)
+
+    def test_late_commit_is_not_missed(self):
+        backend = MemoryBackend()
+        now = time.time()
+        self.save_at(backend, now, 'first', result(40))
+        index = ProfileIndex('domains')
+        index.sync(backend)
+        # Horodaté avant `first` mais visible après la synchronisation
+        self.save_at(backend, now - SYNC_OVERLAP / 2, 'late', result(60))
+        self.assertEqual(index.sync(backend), 1)
+        # Les résultats de la fenêtre de relecture ne sont pas réindexés
+        self.assertEqual(index.sync(backend), 0)
+        self.assertEqual(index._stale, 0)
+        self.assertEqual(len(index), 2)
+
+    def test_purged_result_is_removed(self):
+        backend = MemoryBackend()
+        now = time.time()
+        self.save_at(backend, now - 10 * 24 * 3600, 'old', result(50))
+        self.save_at(backend, now, 'new', result(55))
+        index = ProfileIndex('domains')
+        index.sync(backend)
+        backend.purge(ttl=3600, result_ttl=7 * 24 * 3600, history_ttl=3600)
+
+        neighbours = index.query([50] * 5, k=2)[0]
+        missing = [sid for sid, _ in neighbours if backend.load_result(sid) is None]
+        self.assertEqual(missing, ['old'])
+        index.remove(missing)
+        self.assertEqual([sid for sid, _ in index.query([50] * 5, k=2)[0]], ['new'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Répondants synthétiques : sens des items inversés, domaines cotés liés aux traits latents, intercorrélations
+des traits, lots reproductibles quel que soit le nombre de threads, motifs sans attention, CSV en flux
+"""
+
+import io
+import unittest
+
+import numpy as np
+
+from neo_core.item_banks import DIMENSION_CODES, get_registry
+from neo_core.synthetic import (DEFAULT_CORRELATIONS, SyntheticDataError, SyntheticGenerator, csv_bytes,
+                                parse_careless)
+
+class GeneratorTests(unittest.TestCase):
+
+    def setUp(self):
+        self.item_bank = get_registry().get()
+
+    def test_reverse_keying(self):
+        responses, traits, _ = SyntheticGenerator(self.item_bank, seed=0).generate(20000)
+        self.assertEqual(responses.min(), 1)
+        self.assertEqual(responses.max(), 5)
+        for i, question in enumerate(self.item_bank.questions):
+            trait = traits[:, DIMENSION_CODES.index(question['dimension'])]
+            r = np.corrcoef(responses[:, i], trait)[0, 1]
+            # Item inversé : d'accord quand le trait est faible
+            with self.subTest(item=question['id']):
+                if question['reverse']:
+                    self.assertLess(r, -0.3)
+                else:
+                    self.assertGreater(r, 0.3)
+
+        # Une fois l'inversion appliquée par la cotation, chaque domaine suit son trait
+        dimension_sums, _ = self.item_bank.raw_scores(responses)
+        for d in range(len(DIMENSION_CODES)):
+            self.assertGreater(np.corrcoef(dimension_sums[:, d], traits[:, d])[0, 1], 0.8)
+
+    def test_trait_correlations(self):
+        traits = SyntheticGenerator(self.item_bank, seed=1).traits(50000)
+        np.testing.assert_allclose(np.corrcoef(traits.T), DEFAULT_CORRELATIONS, atol=0.02)
+        with self.assertRaises(SyntheticDataError):
+            SyntheticGenerator(self.item_bank, correlations=-np.ones((5, 5)))
+
+    def test_chunks_independent_of_workers(self):
+        generator = SyntheticGenerator(self.item_bank, seed=2)
+        single = [chunk[0] for chunk in generator.chunks(2500, chunk_rows=1000)]
+        threaded = [chunk[0] for chunk in SyntheticGenerator(self.item_bank, seed=2).chunks(2500, 1000, workers=3)]
+        self.assertEqual([len(chunk) for chunk in single], [1000, 1000, 500])
+        for a, b in zip(single, threaded):
+            np.testing.assert_array_equal(a, b)
+
+    def test_careless_and_missing(self):
+        careless = parse_careless("straightline=0.1,midpoint=0.05")
+        generator = SyntheticGenerator(self.item_bank, careless=careless, missing_rate=0.02, seed=3)
+        responses, _, codes = generator.generate(20000)
+        self.assertAlmostEqual((codes == 2).mean(), 0.1, delta=0.01)
+        self.assertAlmostEqual((codes == 3).mean(), 0.05, delta=0.01)
+        self.assertAlmostEqual((responses == 0).mean(), 0.02, delta=0.003)
+        midpoint = responses[codes == 3]
+        self.assertTrue(((midpoint == 3) | (midpoint == 0)).all())
+        with self.assertRaises(SyntheticDataError):
+            parse_careless("distrait=0.1")
+
+    def test_csv_bytes(self):
+        responses, _, codes = SyntheticGenerator(self.item_bank, careless={'random': 0.5}, seed=4).generate(20)
+        rows = np.loadtxt(io.BytesIO(csv_bytes(responses, codes)), delimiter=',', dtype=np.int8)
+        np.testing.assert_array_equal(rows[:, :-1], responses)
+        np.testing.assert_array_equal(rows[:, -1], codes)
+
+if __name__ == "__main__":
+    unittest.main()
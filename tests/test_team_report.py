@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Rapports d'équipe : agrégats incrémentaux (fusion par lots de Chan, retrait, remplacement) égaux au calcul
+direct ; équipe chargée par codes répondant depuis l'historique
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from neo_core.item_banks import DIMENSION_CODES, FACET_CODES
+from neo_core.longitudinal import respondent_key
+from neo_core.norms import SCALE_KEYS
+from neo_core.session_store import MemoryBackend
+from neo_core.team_report import TeamProfile, TeamReportError, load_team, read_members
+
+class TeamStatisticsTests(unittest.TestCase):
+
+    def assert_matches(self, team, vectors):
+        summary = team.summary()
+        for i, scale in enumerate(SCALE_KEYS):
+            self.assertAlmostEqual(summary[scale]['mean'], vectors[:, i].mean(), places=4)
+            self.assertAlmostEqual(summary[scale]['sd'], vectors[:, i].std(ddof=1), places=4)
+
+    def test_batches_merge_like_one_pass(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.uniform(0, 100, (40, len(SCALE_KEYS))).astype(np.float32)
+        team = TeamProfile()
+        for start, stop in ((0, 1), (1, 7), (7, 25), (25, 40)):
+            team.add_vectors([f"m{i}" for i in range(start, stop)], vectors[start:stop])
+        self.assert_matches(team, vectors.astype(np.float64))
+        levels = team.summary()['N']['levels']
+        self.assertAlmostEqual(levels['Faible'], (vectors[:, 0] < 30).mean(), places=6)
+
+    def test_replaced_member(self):
+        rng = np.random.default_rng(1)
+        vectors = rng.uniform(0, 100, (10, len(SCALE_KEYS))).astype(np.float32)
+        team = TeamProfile()
+        team.add_vectors([f"m{i}" for i in range(10)], vectors)
+        vectors[3] = rng.uniform(0, 100, len(SCALE_KEYS))
+        team.add_vectors(["m3"], vectors[3:4])
+        self.assertEqual(len(team), 10)
+        self.assert_matches(team, vectors.astype(np.float64))
+        self.assertAlmostEqual(float(team.similarity[3, 3]), 1.0, places=5)
+
+    def test_duplicate_ids_rejected(self):
+        with self.assertRaises(TeamReportError):
+            TeamProfile().add_vectors(["a", "a"], np.zeros((2, len(SCALE_KEYS))))
+
+class LoadTeamTests(unittest.TestCase):
+
+    def record(self, facet_sum):
+        """Entrée d'historique (sans percentiles de facettes : recalculés depuis les sommes brutes)"""
+        return {
+            'item_bank': ['neo_pir_short', 'fr'],
+            'scores': {dim: 6 * facet_sum for dim in DIMENSION_CODES},
+            'facet_scores': {dim: {facet: facet_sum for d, facet in FACET_CODES if d == dim}
+                             for dim in DIMENSION_CODES}
+        }
+
+    def test_members_by_respondent_code(self):
+        backend = MemoryBackend()
+        backend.save_history(respondent_key("alice-2024"), 1.0, self.record(3))
+        backend.save_history(respondent_key("alice-2024"), 2.0, self.record(9))
+        backend.save_history(respondent_key("bruno-2024"), 1.5, self.record(6))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "membres.txt")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("Alice ; Alice-2024\nbruno-2024\n\ncamille-2024\n")
+            codes, labels = read_members(path)
+        self.assertEqual(labels, ["Alice", "bruno-2024", "camille-2024"])
+
+        team = load_team(backend, codes, "Ventes", labels)
+        # Sans passation, camille est ignorée ; alice compte pour sa dernière passation
+        self.assertEqual(team.members, ["Alice", "bruno-2024"])
+        self.assertGreater(team.vectors[0, 0], team.vectors[1, 0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Gabarits HTML : rendu sur une ligne égal au formatage direct, échappement des champs non bruts, fragments
+récurrents mémorisés
+"""
+
+import html
+import unittest
+
+from neo_core import templates
+from neo_core.interpretation import get_interpretation
+from neo_core.templates import HTMLTemplate, minify
+
+class HTMLTemplateTests(unittest.TestCase):
+
+    def test_render_matches_format(self):
+        source = """
+        <div class="card">
+            <h4>{name}</h4>
+            <p>{value:.1f} %</p>
+        </div>
+        """
+        rendered = HTMLTemplate(source).render(name="Ouverture", value=72.345)
+        self.assertEqual(rendered, minify(source).format(name="Ouverture", value=72.345))
+        self.assertNotIn("\n", rendered)
+
+    def test_escaping(self):
+        template = HTMLTemplate("<p>{text}</p><div>{lines}</div>", raw=('lines',))
+        rendered = template.render(text="<script>x</script> & co", lines="<br>")
+        self.assertEqual(rendered, f"<p>{html.escape('<script>x</script> & co', quote=False)}</p><div><br></div>")
+
+    def test_cards(self):
+        interpretations = get_interpretation({'N': 20, 'E': 85, 'O': 50, 'A': 64, 'C': 31})
+        card = templates.overview_card(interpretations)
+        self.assertIn("<strong>Extraversion</strong> (85e percentile)", card)
+        self.assertIn("<strong>Neuroticisme</strong> (20e percentile)", card)
+
+        header = templates.dimension_header('E', 'Élevé', 85)
+        self.assertIn('class="dimension-header eleve"', header)
+        self.assertIs(templates.dimension_header('E', 'Élevé', 85), header)
+
+        lines = templates.career_card([("Extraversion", "Métiers <commerciaux>")])
+        self.assertIn("• <strong>Extraversion</strong> : Métiers &lt;commerciaux&gt;<br>", lines)
+        cards = templates.recommendation_cards('forces', ["a", "b"])
+        self.assertEqual(cards.count('class="result-card force"'), 2)
+
+    def test_facet_cards_memoized(self):
+        templates.facet_card.cache_clear()
+        facet_scores = {'Anxiété': 6, 'Colère-Hostilité': 4}
+        first = templates.facet_cards('N', facet_scores)
+        self.assertEqual(first, templates.facet_cards('N', facet_scores))
+        info = templates.facet_card.cache_info()
+        self.assertEqual((info.misses, info.hits), (2, 2))
+        self.assertIn("Anxiété (Score: 6)", first)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Chien de garde : une réexécution au-delà du budget est signalée pendant qu'elle s'exécute, avec sa pile ;
+les appels bloquants du thread du script sont signalés une fois par emplacement, et seulement pendant une
+réexécution
+"""
+
+import importlib.util
+import time
+import types
+import unittest
+from unittest import mock
+
+def slow_page(duration):
+    """Page factice bloquée dans un calcul"""
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        sum(range(100))
+
+@unittest.skipIf(importlib.util.find_spec('streamlit') is None, "Streamlit non installé")
+class WatchdogTests(unittest.TestCase):
+
+    def setUp(self):
+        from app_pages import watchdog
+
+        self.watchdog = watchdog
+        watchdog._flagged.clear()
+
+    def test_slow_rerun_reported_with_stack(self):
+        with mock.patch.object(self.watchdog, 'BUDGET', 0.05), \
+                self.assertLogs('neo_pir', 'WARNING') as logs:
+            with self.watchdog.watch_rerun() as rerun:
+                rerun.page = "show_slow_page"
+                slow_page(0.6)
+        during, after = logs.output[0], logs.output[-1]
+        self.assertIn("au-delà du budget (show_slow_page", during)
+        self.assertIn("in slow_page", during)
+        self.assertIn("Réexécution lente : show_slow_page", after)
+        self.assertEqual(self.watchdog._active, {})
+
+    def test_fast_rerun_silent(self):
+        with mock.patch.object(self.watchdog, 'BUDGET', 0.5), self.assertNoLogs('neo_pir', 'WARNING'):
+            with self.watchdog.watch_rerun() as rerun:
+                rerun.page = "show_home_page"
+
+    def test_blocking_calls_flagged_once(self):
+        with mock.patch.object(self.watchdog, 'BUDGET', 0.5):
+            with self.assertNoLogs('neo_pir', 'WARNING'):
+                self.watchdog._audit('time.sleep', (0.2,))  # hors réexécution
+            with self.assertLogs('neo_pir', 'WARNING') as logs, self.watchdog.watch_rerun() as rerun:
+                rerun.page = "show_test_page"
+                for _ in range(3):
+                    self.watchdog._audit('time.sleep', (0.2,))
+                self.watchdog._audit('open', ("/usr/lib/module.py", 'r'))
+                self.watchdog._audit('open', ("/srv/neo/state.db", 'r'))
+                self.watchdog._audit('sqlite3.connect', ("/srv/neo/state.db",))
+                self.watchdog._audit('os.listdir', ("/srv",))
+        self.assertEqual(len(logs.output), 3)
+        self.assertIn("time.sleep (0.2 s) depuis ", logs.output[0])
+        self.assertIn("test_watchdog.py", logs.output[0])
+        self.assertIn("open /srv/neo/state.db", logs.output[1])
+
+    def test_wrapped_primitive(self):
+        owner = types.SimpleNamespace(derive=lambda value: value * 2)
+        self.watchdog._wrap_blocking(owner, 'derive', "derive")
+        with mock.patch.object(self.watchdog, 'BUDGET', 0.5), \
+                self.assertLogs('neo_pir', 'WARNING') as logs, self.watchdog.watch_rerun():
+            self.assertEqual(owner.derive(21), 42)
+        self.assertIn("derive depuis", logs.output[0])
+        self.assertEqual(owner.derive.__wrapped__(1), 2)
+
+if __name__ == "__main__":
+    unittest.main()